@@ -9,20 +9,33 @@ dynamic tool binding based on active skills.
 from __future__ import annotations
 
 import time
-from typing import Any, List, Literal, Optional
+from typing import Any, Iterable, List, Literal, Optional
 
-from langchain_core.messages import AIMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.runnables import RunnableConfig
+from langgraph.constants import TAG_NOSTREAM
 from langgraph.graph import END, START, StateGraph
 from langgraph.prebuilt import ToolNode, tools_condition
 
 from mcp_client import mcp_manager
+from services.tool_result_store import tool_result_store
 from tools import get_local_tools
-from tools.tool_approval_helper import wrap_tools_for_approval
+from tools.tool_approval_helper import (
+    apply_tool_approval_mode,
+    get_tool_approval_mode,
+    wrap_tools_for_approval,
+)
+from tools.tool_memoization import build_memo_policies, tool_result_memo
 from utils.logging import get_logger, log_timing
 from utils.skill_manager import get_skill_manager
 
 from .chat_llm import create_chat_llm
+from .context_window import (
+    SUMMARIZER_INSTRUCTIONS,
+    build_context_window,
+    get_context_policy,
+    summary_section,
+)
 from .prompts import get_nova_system_prompt
 from .skill_aware_state import SkillAwareAgentState
 
@@ -31,6 +44,10 @@ logger = get_logger(__name__)
 
 # Cache for tools to avoid repeated fetching
 _cached_tools: Optional[List[Any]] = None
+# Unwrapped tools behind _cached_tools, kept so permission changes can be
+# re-applied per tool without rediscovering MCP tools
+_cached_raw_tools: Optional[List[Any]] = None
+_cached_tools_include_escalation: Optional[bool] = None
 
 # Cache for agent components (separate from checkpointer)
 _cached_llm = None
@@ -43,11 +60,14 @@ async def get_all_tools(use_cache=True, include_escalation=False) -> List[Any]:
         use_cache: If True, use cached tools; if False, reload tools
         include_escalation: If True, include ask_user tool (for task contexts)
     """
-    global _cached_tools
+    global _cached_tools, _cached_raw_tools, _cached_tools_include_escalation
     t0 = time.time()
 
-    if not use_cache or (include_escalation and _cached_tools is not None):
+    if not use_cache or (
+        _cached_tools is not None and _cached_tools_include_escalation != include_escalation
+    ):
         _cached_tools = None
+        _cached_raw_tools = None
         logger.info("Tools cache cleared for reload")
 
     if _cached_tools is not None:
@@ -71,12 +91,72 @@ async def get_all_tools(use_cache=True, include_escalation=False) -> List[Any]:
     all_tools = local_tools + mcp_tools
     t1 = time.time()
     _cached_tools = wrap_tools_for_approval(all_tools)
+    _cached_raw_tools = all_tools
+    _cached_tools_include_escalation = include_escalation
     log_timing("wrap_tools_for_approval", t1, {"count": len(_cached_tools)})
 
     logger.info("Tools loaded", extra={"data": {"local_tools": len(local_tools), "mcp_tools": len(mcp_tools), "total": len(_cached_tools)}})
     return _cached_tools
 
 
+def refresh_tool_permissions(tool_names: Optional[Iterable[str]] = None) -> int:
+    """Re-apply tool permissions to the cached tool set without reloading it.
+
+    Only the named tools (all cached tools if None) are re-evaluated, and only
+    tools whose approval mode actually changed get a new wrapper. The cached
+    list is updated in place, so agents already compiled against it pick up
+    the change on their next turn.
+
+    Args:
+        tool_names: Names of tools affected by the permission change
+
+    Returns:
+        Number of tools whose approval mode changed
+    """
+    if _cached_tools is None or _cached_raw_tools is None:
+        return 0
+
+    t0 = time.time()
+    names = set(tool_names) if tool_names is not None else None
+    current = {t.name: t for t in _cached_tools}
+
+    updated_tools = []
+    changed = 0
+    for raw_tool in _cached_raw_tools:
+        existing = current.get(raw_tool.name)
+        if names is not None and raw_tool.name not in names:
+            if existing is not None:
+                updated_tools.append(existing)
+            continue
+
+        if existing is None:
+            old_mode = "denied"
+        elif existing is raw_tool:
+            old_mode = "allowed"
+        else:
+            old_mode = "requires_approval"
+
+        new_mode = get_tool_approval_mode(raw_tool.name)
+        if new_mode == old_mode:
+            if existing is not None:
+                updated_tools.append(existing)
+            continue
+
+        changed += 1
+        logger.info(
+            "Tool approval mode changed",
+            extra={"data": {"name": raw_tool.name, "old_mode": old_mode, "new_mode": new_mode}},
+        )
+        new_tool = apply_tool_approval_mode(raw_tool, new_mode)
+        if new_tool is not None:
+            updated_tools.append(new_tool)
+
+    # Slice assignment keeps the list identity shared with compiled agents
+    _cached_tools[:] = updated_tools
+    log_timing("refresh_tool_permissions", t0, {"evaluated": len(names) if names is not None else len(_cached_raw_tools), "changed": changed})
+    return changed
+
+
 async def get_llm(use_cache=True):
     """Get cached LLM or create new one if not cached.
     
@@ -200,7 +280,16 @@ async def create_chat_agent(checkpointer=None, pg_pool=None, use_cache=True, inc
 
         return all_tools
 
-    async def agent_node(state: SkillAwareAgentState) -> dict:
+    async def summarize_history(previous_summary: Optional[str], transcript: str) -> str:
+        """Roll older turns into the conversation summary (not streamed to the client)."""
+        prompt = f"Existing summary:\n{previous_summary or '(none)'}\n\nNew messages:\n{transcript}"
+        response = await llm.ainvoke(
+            [SystemMessage(content=SUMMARIZER_INSTRUCTIONS), HumanMessage(content=prompt)],
+            config={"tags": [TAG_NOSTREAM]},
+        )
+        return str(response.content)
+
+    async def agent_node(state: SkillAwareAgentState, config: RunnableConfig) -> dict:
         """LLM node with per-turn dynamic tool binding."""
         node_start = time.time()
 
@@ -214,10 +303,31 @@ async def create_chat_agent(checkpointer=None, pg_pool=None, use_cache=True, inc
         llm_with_tools = llm.bind_tools(current_tools)
         log_timing("agent_node.bind_tools", t0, {"count": len(current_tools)})
 
-        # Prepend system prompt to messages if not already present
+        # Fit the history into this agent type's context budget
+        t0 = time.time()
+        thread_id = (config or {}).get("configurable", {}).get("thread_id")
         messages = list(state["messages"])
-        if not messages or not isinstance(messages[0], SystemMessage):
-            messages = [SystemMessage(content=system_prompt)] + messages
+        has_system_prompt = bool(messages) and isinstance(messages[0], SystemMessage)
+        window = await build_context_window(
+            messages[1:] if has_system_prompt else messages,
+            state,
+            get_context_policy(thread_id),
+            summarize=summarize_history,
+        )
+        log_timing("agent_node.context_window", t0, {"thread_id": thread_id, **window.stats()})
+
+        # Prepend system prompt to messages if not already present
+        if has_system_prompt:
+            messages = [SystemMessage(content=str(messages[0].content) + summary_section(window.summary))] + window.messages
+        else:
+            # Re-render per turn: the static prefix is cached, so this only
+            # refreshes the user context and clock at the end of the prompt
+            try:
+                turn_prompt = await get_nova_system_prompt()
+            except Exception as e:
+                logger.warning("Failed to refresh system prompt, using agent's prompt", extra={"data": {"error": str(e)}})
+                turn_prompt = system_prompt
+            messages = [SystemMessage(content=turn_prompt + summary_section(window.summary))] + window.messages
 
         # Calculate approximate prompt size for logging
         prompt_chars = sum(len(str(m.content)) for m in messages)
@@ -243,8 +353,11 @@ async def create_chat_agent(checkpointer=None, pg_pool=None, use_cache=True, inc
             }
             logger.debug("Attached Phoenix trace to response", extra={"data": {"trace_id": str(trace_id)}})
 
+        # Record context savings with the turn (response_metadata is not shown in the UI)
+        response.response_metadata = {**(response.response_metadata or {}), "context_window": window.stats()}
+
         log_timing("agent_node.total", node_start)
-        return {"messages": [response]}
+        return {"messages": [response], **window.state_update}
 
     def should_continue(state: SkillAwareAgentState) -> Literal["tools", "__end__"]:
         """Determine whether to continue to tools or end."""
@@ -259,6 +372,7 @@ async def create_chat_agent(checkpointer=None, pg_pool=None, use_cache=True, inc
 
     async def tool_node_with_skill_state(
         state: SkillAwareAgentState,
+        config: RunnableConfig,
     ) -> dict:
         """Execute tool calls and handle skill state updates."""
         messages = state["messages"]
@@ -270,11 +384,46 @@ async def create_chat_agent(checkpointer=None, pg_pool=None, use_cache=True, inc
         # Get current tools (including skill tools)
         current_tools = await get_tools_for_state(state)
 
-        # Create tool node with current tools
-        tool_node = ToolNode(current_tools)
-
-        # Execute tools
-        result = await tool_node.ainvoke(state)
+        # Answer repeated read-only calls in this thread from the memo
+        thread_id = (config or {}).get("configurable", {}).get("thread_id")
+        memo_policies = build_memo_policies(current_tools)
+        plan = tool_result_memo.plan(thread_id, last_message.tool_calls, memo_policies)
+
+        result: dict = {"messages": []}
+        if plan.to_run:
+            # Create tool node with current tools
+            tool_node = ToolNode(current_tools)
+
+            # Execute tools
+            run_state = state
+            if len(plan.to_run) < len(last_message.tool_calls):
+                run_state = {
+                    **state,
+                    "messages": list(messages[:-1]) + [last_message.model_copy(update={"tool_calls": plan.to_run})],
+                }
+            result = await tool_node.ainvoke(run_state)
+
+            # Keep oversized results out of the checkpoint: store once, reference by digest
+            if result.get("messages"):
+                result["messages"] = await tool_result_store.offload_messages(result["messages"], thread_id)
+
+            executed = {m.tool_call_id: m for m in result.get("messages", []) if isinstance(m, ToolMessage)}
+            tool_result_memo.record(thread_id, plan.to_run, executed, memo_policies)
+        else:
+            executed = {}
+
+        if plan.cached or plan.duplicates:
+            # Reply to every tool call, in the order the model made them
+            answers = {**executed, **plan.cached}
+            for duplicate_id, original_id in plan.duplicates.items():
+                if original_id in executed:
+                    answers[duplicate_id] = executed[original_id].model_copy(
+                        update={"tool_call_id": duplicate_id, "id": None}
+                    )
+            other = [m for m in result.get("messages", []) if not isinstance(m, ToolMessage)]
+            result["messages"] = [
+                answers[call["id"]] for call in last_message.tool_calls if call["id"] in answers
+            ] + other
 
         # Check for skill activation/deactivation in tool calls
         # and update active_skills state accordingly
@@ -357,8 +506,10 @@ async def create_chat_agent(checkpointer=None, pg_pool=None, use_cache=True, inc
 
 def clear_chat_agent_cache():
     """Clear all component caches to force reload with updated tools/prompts."""
-    global _cached_tools, _cached_llm
+    global _cached_tools, _cached_raw_tools, _cached_tools_include_escalation, _cached_llm
     _cached_tools = None
+    _cached_raw_tools = None
+    _cached_tools_include_escalation = None
     _cached_llm = None
     
     # Also clear the system prompt cache
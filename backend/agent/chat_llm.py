@@ -104,6 +104,9 @@ def create_chat_llm(config: Optional[RunnableConfig] = None) -> NovaChatOpenAI:
         base_url=f"{llm_config['base_url']}/v1",
         temperature=llm_config["temperature"],
         max_tokens=llm_config["max_tokens"],
+        # Keep usage metadata on messages produced via token streaming, so they
+        # persist the same as non-streamed responses
+        stream_usage=True,
         default_headers={
             "user": "nova-user",
             "team_id": "nova-team",
@@ -0,0 +1,277 @@
+"""
+Conversation context window management.
+
+Builds the message list sent to the LLM on each agent turn so that long chats
+and long-running core agent task threads stay within a token budget:
+
+- The most recent turns are never summarized, and the results of the latest
+  AI tool-call step are always sent verbatim.
+- Other tool results, newest first, are replaced by a short stub (tool_call_id
+  and name kept, so every tool call still has its result) once the tool result
+  budget is used up. This includes tool results inside the recent turns: a core
+  agent task thread is two HumanMessages followed by one long tool loop, so its
+  recent window is usually the whole thread.
+- When the history still exceeds the context budget, turns before the recent
+  window are folded into a rolling summary stored in graph state and appended
+  to the system prompt.
+
+Turns start at a HumanMessage, so an AI tool call and its ToolMessages are
+always kept, elided or summarized together. The checkpointed message history
+itself is never modified; only the per-turn LLM view is.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+from config import settings
+from utils.langgraph_utils import TASK_THREAD_PREFIX
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Rough chars-per-token ratio used for budgeting; exact counts are model specific
+CHARS_PER_TOKEN = 4
+
+ELIDED_TOOL_RESULT_TEMPLATE = (
+    "[Earlier tool result elided to save context: {chars} chars. Preview: {preview}]"
+)
+
+SUMMARY_PROMPT_HEADER = "**Earlier conversation (summarized):**"
+
+SUMMARIZER_INSTRUCTIONS = """You maintain a running summary of a conversation between a user and the assistant Nova.
+Update the existing summary with the new messages below. Keep facts, decisions, commitments,
+names, IDs, open questions and the results of tool calls that later turns may rely on.
+Drop pleasantries and verbatim tool output. Reply with the updated summary only."""
+
+SummarizeFn = Callable[[Optional[str], str], Awaitable[str]]
+
+
+@dataclass
+class ContextPolicy:
+    """Context budget for one agent type."""
+    max_tokens: int
+    keep_recent_turns: int
+    tool_result_budget_tokens: int
+    preview_chars: int = 300
+    enabled: bool = True
+
+
+@dataclass
+class ContextWindow:
+    """LLM view of a thread plus the state updates and savings it implies."""
+    messages: List[BaseMessage]
+    summary: Optional[str] = None
+    state_update: Dict[str, Any] = field(default_factory=dict)
+    tokens_before: int = 0
+    tokens_after: int = 0
+    elided_tool_results: int = 0
+    summarized_messages: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.tokens_before - self.tokens_after)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "tokens_saved": self.tokens_saved,
+            "elided_tool_results": self.elided_tool_results,
+            "summarized_messages": self.summarized_messages,
+        }
+
+
+def get_context_policy(thread_id: Optional[str]) -> ContextPolicy:
+    """Return the context policy for a thread: core agent task threads or chats."""
+    if thread_id and thread_id.startswith(TASK_THREAD_PREFIX):
+        return ContextPolicy(
+            max_tokens=settings.CORE_AGENT_CONTEXT_MAX_TOKENS,
+            keep_recent_turns=settings.CORE_AGENT_CONTEXT_KEEP_RECENT_TURNS,
+            tool_result_budget_tokens=settings.CORE_AGENT_CONTEXT_TOOL_RESULT_BUDGET_TOKENS,
+            preview_chars=settings.CONTEXT_ELIDED_PREVIEW_CHARS,
+            enabled=settings.CONTEXT_WINDOW_ENABLED,
+        )
+    return ContextPolicy(
+        max_tokens=settings.CHAT_CONTEXT_MAX_TOKENS,
+        keep_recent_turns=settings.CHAT_CONTEXT_KEEP_RECENT_TURNS,
+        tool_result_budget_tokens=settings.CHAT_CONTEXT_TOOL_RESULT_BUDGET_TOKENS,
+        preview_chars=settings.CONTEXT_ELIDED_PREVIEW_CHARS,
+        enabled=settings.CONTEXT_WINDOW_ENABLED,
+    )
+
+
+def estimate_tokens(messages: Sequence[BaseMessage]) -> int:
+    """Approximate token count of messages, including tool call arguments."""
+    chars = 0
+    for message in messages:
+        chars += len(str(message.content))
+        for tool_call in getattr(message, "tool_calls", None) or []:
+            chars += len(str(tool_call.get("name", ""))) + len(str(tool_call.get("args", {})))
+    return chars // CHARS_PER_TOKEN
+
+
+def turn_starts(messages: Sequence[BaseMessage]) -> List[int]:
+    """Indexes where turns begin: the first message and every HumanMessage."""
+    starts = [0] if messages else []
+    starts.extend(i for i, m in enumerate(messages) if isinstance(m, HumanMessage) and i > 0)
+    return starts
+
+
+def recent_window_start(messages: Sequence[BaseMessage], keep_recent_turns: int) -> int:
+    """Index of the first message of the last ``keep_recent_turns`` turns."""
+    starts = turn_starts(messages)
+    if keep_recent_turns <= 0 or not starts:
+        return len(messages)
+    if len(starts) <= keep_recent_turns:
+        return 0
+    return starts[-keep_recent_turns]
+
+
+def latest_tool_step_start(messages: Sequence[BaseMessage]) -> int:
+    """Index just after the last AI message with tool calls (len if there is none)."""
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if isinstance(message, AIMessage) and message.tool_calls:
+            return index + 1
+    return len(messages)
+
+
+def elide_tool_results(
+    messages: Sequence[BaseMessage],
+    protected_from: int,
+    budget_tokens: int,
+    preview_chars: int,
+) -> tuple:
+    """Replace tool results with stubs, newest-first, once their budget is spent.
+
+    Results of the latest AI tool-call step at or after ``protected_from`` are
+    always kept, but count against the budget. Every other tool result, in the
+    recent window or before it, is kept newest-first while the budget lasts.
+
+    Returns:
+        (messages, number of elided tool results)
+    """
+    result = list(messages)
+    kept_from = max(protected_from, latest_tool_step_start(result))
+    used = sum(
+        estimate_tokens([m]) for m in result[kept_from:] if isinstance(m, ToolMessage)
+    )
+    elided = 0
+    for index in range(min(kept_from, len(result)) - 1, -1, -1):
+        message = result[index]
+        if not isinstance(message, ToolMessage):
+            continue
+        tokens = estimate_tokens([message])
+        if used + tokens <= budget_tokens:
+            used += tokens
+            continue
+        content = str(message.content)
+        preview = content[:preview_chars].replace("\n", " ")
+        stub = ELIDED_TOOL_RESULT_TEMPLATE.format(chars=len(content), preview=preview)
+        if len(stub) >= len(content):
+            continue
+        result[index] = ToolMessage(
+            content=stub,
+            tool_call_id=message.tool_call_id,
+            name=getattr(message, "name", None),
+            id=message.id,
+        )
+        elided += 1
+    return result, elided
+
+
+def render_transcript(messages: Sequence[BaseMessage], preview_chars: int) -> str:
+    """Plain-text transcript of messages for the summarizer, with tool output truncated."""
+    lines = []
+    for message in messages:
+        content = str(message.content).strip()
+        if isinstance(message, HumanMessage):
+            lines.append(f"User: {content}")
+        elif isinstance(message, AIMessage):
+            if content:
+                lines.append(f"Assistant: {content}")
+            for tool_call in message.tool_calls or []:
+                lines.append(f"Assistant called {tool_call.get('name')}({tool_call.get('args', {})})")
+        elif isinstance(message, ToolMessage):
+            lines.append(f"Tool result ({getattr(message, 'name', None) or 'tool'}): {content[:preview_chars]}")
+    return "\n".join(lines)
+
+
+def summary_section(summary: Optional[str]) -> str:
+    """System prompt section carrying the rolling summary."""
+    return f"\n\n---\n\n{SUMMARY_PROMPT_HEADER}\n{summary}" if summary else ""
+
+
+def _summary_cutoff(messages: Sequence[BaseMessage], state: Dict[str, Any]) -> int:
+    """Number of leading messages covered by the stored summary (0 if none or stale)."""
+    through_id = state.get("context_summary_through")
+    if not state.get("context_summary") or not through_id:
+        return 0
+    for index, message in enumerate(messages):
+        if getattr(message, "id", None) == through_id:
+            return index + 1
+    return 0
+
+
+async def build_context_window(
+    messages: Sequence[BaseMessage],
+    state: Dict[str, Any],
+    policy: ContextPolicy,
+    summarize: Optional[SummarizeFn] = None,
+) -> ContextWindow:
+    """Build the LLM view of a thread within the policy's budget.
+
+    Args:
+        messages: Full message history from graph state (no system prompt)
+        state: Graph state holding ``context_summary``/``context_summary_through``
+        policy: Budget for this agent type
+        summarize: Async (previous_summary, transcript) -> summary; no summary is
+            produced when omitted or when it fails
+
+    Returns:
+        ContextWindow with the messages to send, the summary to append to the
+        system prompt, and state updates for a newly rolled summary
+    """
+    messages = list(messages)
+    tokens_before = estimate_tokens(messages)
+    if not policy.enabled or not messages:
+        return ContextWindow(messages=messages, tokens_before=tokens_before, tokens_after=tokens_before)
+
+    recent_start = recent_window_start(messages, policy.keep_recent_turns)
+    summary = state.get("context_summary")
+    covered = min(_summary_cutoff(messages, state), recent_start)
+    if covered == 0:
+        summary = None
+
+    view, elided = elide_tool_results(
+        messages[covered:], recent_start - covered, policy.tool_result_budget_tokens, policy.preview_chars
+    )
+    window = ContextWindow(messages=view, summary=summary, tokens_before=tokens_before, elided_tool_results=elided)
+
+    tokens = estimate_tokens(view) + len(summary or "") // CHARS_PER_TOKEN
+    if tokens > policy.max_tokens and recent_start > covered and summarize is not None:
+        # Fold everything before the recent window into the rolling summary
+        transcript = render_transcript(messages[covered:recent_start], policy.preview_chars)
+        try:
+            new_summary = (await summarize(summary, transcript)).strip()
+        except Exception as e:
+            logger.warning("Failed to summarize conversation history", extra={"data": {"error": str(e)}})
+            new_summary = ""
+        if new_summary:
+            window.summary = new_summary
+            window.messages = view[recent_start - covered:]
+            window.elided_tool_results = sum(
+                1 for m in window.messages if isinstance(m, ToolMessage)
+                and str(m.content).startswith("[Earlier tool result elided")
+            )
+            window.state_update = {
+                "context_summary": new_summary,
+                "context_summary_through": messages[recent_start - 1].id,
+            }
+            covered = recent_start
+
+    window.summarized_messages = covered
+    window.tokens_after = estimate_tokens(window.messages) + len(window.summary or "") // CHARS_PER_TOKEN
+    return window
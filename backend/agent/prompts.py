@@ -4,11 +4,11 @@ Agent Prompts
 Centralized location for all Nova agent prompts.
 """
 
-from utils.prompt_loader import load_nova_system_prompt
+from utils.prompt_loader import clear_prompt_cache, load_nova_system_prompt
 
 # System Prompt - Universal guidelines and capabilities (same for chat and core agent)
-# Now loaded from markdown file with hot-reload support (lazy-loaded)
-NOVA_SYSTEM_PROMPT = None  # Will be loaded on first access
+# Loaded from markdown file with hot-reload support; the static prefix is cached
+# in utils.prompt_loader and only the user/clock suffix is rendered per call.
 
 # Task Context Template - Clean content without header (metadata provides title)
 TASK_CONTEXT_TEMPLATE = """**Task ID:** {task_id}
@@ -33,23 +33,19 @@ CURRENT_TASK_TEMPLATE = """**Current Task:**
 {description}"""
 
 # Function to get the current system prompt (for dynamic reloading)
-async def get_nova_system_prompt(use_cache: bool = False) -> str:
+async def get_nova_system_prompt(use_cache: bool = True) -> str:
     """Get the current Nova system prompt with live reload support.
     
+    The static prefix is reused while the prompt file and skills are
+    unchanged; the user context and current time are always current.
+    
     Args:
-        use_cache: If True, use cached prompt; if False, reload from file
-        Default is False to ensure current time is always fresh
+        use_cache: If False, re-render the static prefix as well
     """
-    global NOVA_SYSTEM_PROMPT
-    
     if not use_cache:
-        NOVA_SYSTEM_PROMPT = None
-    
-    if NOVA_SYSTEM_PROMPT is None:
-        NOVA_SYSTEM_PROMPT = await load_nova_system_prompt()
-    return NOVA_SYSTEM_PROMPT
+        clear_prompt_cache()
+    return await load_nova_system_prompt()
 
 def clear_system_prompt_cache():
-    """Clear the cached system prompt to force reload on next access."""
-    global NOVA_SYSTEM_PROMPT
-    NOVA_SYSTEM_PROMPT = None
+    """Clear the cached system prompt prefix to force reload on next access."""
+    clear_prompt_cache()
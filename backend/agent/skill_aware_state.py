@@ -28,3 +28,8 @@ class SkillAwareAgentState(TypedDict):
     # Active skills: skill_name -> activation metadata
     # Updated by enable_skill/disable_skill tools via the tool node
     active_skills: dict[str, SkillActivation]
+
+    # Rolling summary of turns no longer sent verbatim to the LLM, and the id
+    # of the last message it covers (see agent/context_window.py)
+    context_summary: str
+    context_summary_through: str
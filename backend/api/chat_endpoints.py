@@ -6,14 +6,17 @@ Thin HTTP handlers that delegate to services for business logic.
 """
 
 import asyncio
-import json
+import time
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 
+from config import settings
 from models.chat import (
+    BulkDeleteChatsRequest,
+    ChatHistoryPage,
     ChatMessageDetail,
     ChatRequest,
     ChatSummary,
@@ -22,8 +25,10 @@ from models.chat import (
 )
 from services.chat_service import chat_service
 from services.conversation_service import conversation_service
+from services.tool_result_store import normalize_reference, tool_result_store
 from utils.checkpointer_utils import get_checkpointer_from_service_manager
-from utils.logging import get_logger
+from utils.logging import get_logger, log_timing
+from utils.sse import SSEStreamStats, sse_stream
 
 logger = get_logger(__name__)
 
@@ -39,27 +44,31 @@ async def stream_chat(chat_request: ChatRequest):
 
         checkpointer = await get_checkpointer_from_service_manager()
 
-        # Get chat agent with specific checkpointer
-        logger.info("Getting chat agent with checkpointer...")
-        try:
-            from agent.chat_agent import create_chat_agent
+        # Start acquiring the chat agent; stream_chat awaits it while it loads
+        # the thread snapshot and first-turn memory context concurrently.
+        # Creation errors are reported as an SSE error event.
+        from agent.chat_agent import create_chat_agent
 
-            chat_agent = await create_chat_agent(
-                checkpointer=checkpointer, include_escalation=True
-            )
-            logger.info("Chat agent ready", extra={"data": {"checkpointer_type": type(checkpointer).__name__}})
-        except Exception as agent_error:
-            logger.error("Failed to create chat agent", extra={"data": {"error": str(agent_error)}})
-            raise HTTPException(
-                status_code=500, detail=f"Failed to create chat agent: {str(agent_error)}"
-            )
+        logger.info("Getting chat agent with checkpointer...", extra={"data": {"checkpointer_type": type(checkpointer).__name__}})
+        chat_agent = asyncio.ensure_future(
+            create_chat_agent(checkpointer=checkpointer, include_escalation=True)
+        )
 
         async def generate_response():
             """Generate SSE (Server-Sent Events) response stream."""
-            async for event in chat_service.stream_chat(
-                chat_request, checkpointer, chat_agent
-            ):
-                yield f"data: {json.dumps(event)}\n\n"
+            t0 = time.time()
+            stats = SSEStreamStats()
+            try:
+                async for chunk in sse_stream(
+                    chat_service.stream_chat(chat_request, checkpointer, chat_agent),
+                    coalesce_ms=settings.CHAT_STREAM_COALESCE_MS,
+                    max_batch_bytes=settings.CHAT_STREAM_MAX_BATCH_BYTES,
+                    heartbeat_seconds=settings.CHAT_STREAM_HEARTBEAT_SECONDS,
+                    stats=stats,
+                ):
+                    yield chunk
+            finally:
+                log_timing("chat_stream_sse", t0, {"thread_id": chat_request.thread_id, **stats.to_dict()})
 
         return StreamingResponse(
             generate_response(),
@@ -106,6 +115,26 @@ async def get_available_tools():
         raise HTTPException(status_code=500, detail=f"Tools error: {str(e)}")
 
 
+@router.get("/tool-results/{reference}")
+async def get_tool_result(reference: str, offset: int = 0, limit: Optional[int] = None):
+    """Get the full content of an offloaded tool result, optionally a slice of it.
+
+    Args:
+        reference: Digest from a tool call's result_ref
+        offset: Character offset to start from
+        limit: Maximum number of characters (default: TOOL_RESULT_READ_PAGE_CHARS)
+    """
+    if normalize_reference(reference) is None:
+        raise HTTPException(status_code=400, detail="Invalid tool result reference")
+    try:
+        page = await tool_result_store.read(reference, offset=offset, limit=limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error reading tool result: {str(e)}")
+    if page is None:
+        raise HTTPException(status_code=404, detail="Tool result not found")
+    return page.to_dict()
+
+
 # Chat Management Endpoints
 
 
@@ -123,20 +152,8 @@ async def list_chats(limit: int = 5, offset: int = 0):
         checkpointer = await get_checkpointer_from_service_manager()
         thread_ids = await conversation_service.list_threads(checkpointer)
 
-        # Fetch summaries concurrently
-        async def safe_get_summary(thread_id: str):
-            try:
-                return await conversation_service.get_summary(
-                    thread_id, checkpointer
-                )
-            except Exception as msg_error:
-                logger.warning("Error processing chat", extra={"data": {"thread_id": thread_id, "error": str(msg_error)}})
-                return None
-
-        results = await asyncio.gather(
-            *[safe_get_summary(tid) for tid in thread_ids]
-        )
-        chat_summaries = [s for s in results if s is not None]
+        # Metadata and task lookups are batched across all threads
+        chat_summaries = await conversation_service.get_summaries(thread_ids, checkpointer)
 
         # Sort by last activity (most recent first)
         chat_summaries.sort(key=lambda x: x.updated_at, reverse=True)
@@ -178,6 +195,22 @@ async def get_chat_messages(chat_id: str):
         raise HTTPException(status_code=500, detail=f"Error getting chat messages: {str(e)}")
 
 
+@router.get("/conversations/{chat_id}/history", response_model=ChatHistoryPage)
+async def get_chat_history_page(chat_id: str, limit: int = 50, before: Optional[int] = None):
+    """Get a page of chat messages, newest first.
+
+    Args:
+        limit: Number of messages to return (default: 50)
+        before: Cursor from a previous page's next_before, to load older messages
+    """
+    try:
+        checkpointer = await get_checkpointer_from_service_manager()
+        return await conversation_service.get_history_page(chat_id, checkpointer, limit=limit, before=before)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting chat history: {str(e)}")
+
+
 @router.get("/conversations/{chat_id}/task-data", response_model=TaskChatResponse)
 async def get_task_chat_data(chat_id: str):
     """Get task chat messages with escalation information.
@@ -222,6 +255,44 @@ async def delete_chat(chat_id: str):
         raise HTTPException(status_code=500, detail=f"Error deleting chat: {str(e)}")
 
 
+@router.post("/conversations/bulk-delete")
+async def bulk_delete_chats(body: BulkDeleteChatsRequest):
+    """Delete checkpoints, writes, blobs and metadata of many threads in batches.
+
+    Unlike DELETE /conversations/{chat_id}, backing tasks are left untouched.
+    """
+    from services.bulk_thread_deletion import ThreadDeletionFilter, bulk_delete_threads
+
+    thread_filter = ThreadDeletionFilter(
+        thread_ids=body.thread_ids,
+        prefix=body.prefix,
+        exclude_prefixes=body.exclude_prefixes,
+        older_than_days=body.older_than_days,
+        task_statuses=body.task_statuses,
+    )
+    if thread_filter.is_empty():
+        raise HTTPException(
+            status_code=400,
+            detail="At least one of thread_ids, prefix, older_than_days or task_statuses is required",
+        )
+
+    try:
+        checkpointer = await get_checkpointer_from_service_manager()
+        progress = await bulk_delete_threads(
+            checkpointer.conn,
+            thread_filter,
+            batch_size=body.batch_size,
+            dry_run=body.dry_run,
+        )
+        return progress.to_dict()
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("Bulk chat deletion failed", extra={"data": {"error": str(e)}})
+        raise HTTPException(status_code=500, detail=f"Error deleting chats: {str(e)}")
+
+
 @router.post("/conversations/{chat_id}/escalation-response")
 async def respond_to_escalation(chat_id: str, response: dict):
     """Respond to an escalation (user question or tool approval) and resume conversation.
@@ -4,12 +4,14 @@ Input Hooks API Endpoints
 Provides API endpoints for viewing, configuring, and triggering input hooks.
 """
 
+import hmac
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException
 from pydantic import BaseModel, Field
 
+from config import settings
 from utils.logging import get_logger
 from utils.redis_manager import get_sync_redis
 
@@ -62,6 +64,8 @@ class HookResponse(BaseModel):
     display_name: str  # Human-readable name for UI display
     enabled: bool
     polling_interval: int
+    effective_polling_interval: Optional[int] = None  # Interval currently in use (adaptive or push-relaxed)
+    adaptive_polling: bool = False
     status: str = "idle"  # "idle", "running", "error", "disabled"
     last_run: Optional[str] = None
     next_run: Optional[str] = None
@@ -75,6 +79,11 @@ class HooksListResponse(BaseModel):
     hooks: List[HookResponse]
 
 
+class HooksHealthResponse(BaseModel):
+    """Response model for hook health checks."""
+    hooks: Dict[str, Dict[str, Any]]  # hook name -> latest result, with checked_at (epoch seconds)
+
+
 class HookConfigUpdate(BaseModel):
     """Request model for updating hook configuration."""
     enabled: Optional[bool] = None
@@ -89,6 +98,59 @@ class TriggerResponse(BaseModel):
     queued_at: str
 
 
+class DeadLetterItemResponse(BaseModel):
+    """Response model for a dead-lettered hook item."""
+    id: str
+    hook_name: str
+    source_id: str
+    error: Optional[str] = None
+    attempts: int = 0
+    status: str  # "dead", "replaying", "resolved"
+    first_failed_at: Optional[str] = None
+    last_failed_at: Optional[str] = None
+    replayed_at: Optional[str] = None
+    replay_task_id: Optional[str] = None
+    item_data: Optional[Dict[str, Any]] = None  # Only included when inspecting a single item
+
+
+class DeadLetterListResponse(BaseModel):
+    """Response model for listing dead-lettered items."""
+    items: List[DeadLetterItemResponse]
+
+
+class DeadLetterReplayRequest(BaseModel):
+    """Request model for a bulk replay; all dead items of the hook when ids is omitted."""
+    ids: Optional[List[str]] = None
+
+
+class DeadLetterReplayResponse(BaseModel):
+    """Response model for replaying dead-lettered items."""
+    hook_name: str
+    queued: Dict[str, str] = Field(default_factory=dict)  # dead-letter id -> replay task id
+    queued_at: str
+
+
+class NotifyResponse(BaseModel):
+    """Response model for a push notification."""
+    hook_name: str
+    status: str  # "queued" (new run) or "coalesced" (joined a pending run)
+    task_id: str
+    run_after_seconds: int
+
+
+def _verify_notify_token(authorization: Optional[str], x_nova_hook_token: Optional[str]) -> None:
+    """Check the notifier's shared secret (Bearer token or X-Nova-Hook-Token header)."""
+    if settings.HOOK_NOTIFY_TOKEN is None:
+        raise HTTPException(status_code=503, detail="Hook notifications are not configured")
+
+    presented = x_nova_hook_token
+    if presented is None and authorization and authorization.lower().startswith("bearer "):
+        presented = authorization[7:].strip()
+    expected = settings.HOOK_NOTIFY_TOKEN.get_secret_value()
+    if not presented or not hmac.compare_digest(presented.encode(), expected.encode()):
+        raise HTTPException(status_code=401, detail="Invalid hook notification token")
+
+
 def _ensure_hooks_initialized():
     """Ensure the hook registry is initialized and return it."""
     from input_hooks.hook_registry import input_hook_registry, initialize_hooks
@@ -109,6 +171,19 @@ def _get_hook_status(hook, stats: dict) -> str:
     return "idle"
 
 
+def _effective_schedule(hook_name: str, config) -> tuple:
+    """Effective polling interval and adaptive next run time (if known) of a hook."""
+    from input_hooks.adaptive_polling import adaptive_config, adaptive_poller
+
+    interval = adaptive_poller.effective_interval(hook_name, config)
+    next_run = None
+    if config.enabled and adaptive_config(config) is not None:
+        state = adaptive_poller.get_state(hook_name)
+        if state is not None:
+            next_run = datetime.fromtimestamp(state.next_run_at, tz=timezone.utc).isoformat()
+    return interval, next_run
+
+
 def _calculate_next_run(last_run: Optional[datetime], interval: int, enabled: bool) -> Optional[str]:
     """Calculate next scheduled run time."""
     if not enabled:
@@ -149,15 +224,19 @@ async def list_hooks():
                 except (ValueError, AttributeError):
                     pass
 
+            effective_interval, adaptive_next_run = _effective_schedule(hook_name, config)
+
             hook_response = HookResponse(
                 name=hook_name,
                 hook_type=config.hook_type,
                 display_name=config.display_name or hook_name,
                 enabled=config.enabled,
                 polling_interval=config.polling_interval,
+                effective_polling_interval=effective_interval,
+                adaptive_polling=config.adaptive_polling is not None and config.adaptive_polling.enabled,
                 status=_get_hook_status(hook, stats),
                 last_run=last_run_str,
-                next_run=_calculate_next_run(last_run_dt, config.polling_interval, config.enabled),
+                next_run=adaptive_next_run or _calculate_next_run(last_run_dt, effective_interval, config.enabled),
                 stats=HookStatsResponse(
                     total_runs=stats.get("total_runs", 0),
                     successful_runs=stats.get("successful_runs", 0),
@@ -178,6 +257,26 @@ async def list_hooks():
         raise HTTPException(status_code=500, detail=f"Failed to list hooks: {str(e)}")
 
 
+@router.get("/health", response_model=HooksHealthResponse)
+async def get_hooks_health(refresh: bool = False):
+    """
+    Health of all hooks.
+
+    Serves results cached within HOOK_HEALTH_CACHE_TTL_SECONDS (refreshed in
+    the background by beat) and checks the remaining hooks concurrently.
+    Pass refresh=true to check every hook now.
+    """
+    try:
+        input_hook_registry = _ensure_hooks_initialized()
+
+        max_age = None if refresh else settings.HOOK_HEALTH_CACHE_TTL_SECONDS
+        return HooksHealthResponse(hooks=await input_hook_registry.health_check_all(max_age=max_age))
+
+    except Exception as e:
+        logger.error("Failed to check hook health", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to check hook health: {str(e)}")
+
+
 @router.get("/{hook_name}", response_model=HookResponse)
 async def get_hook(hook_name: str):
     """
@@ -203,15 +302,19 @@ async def get_hook(hook_name: str):
             except (ValueError, AttributeError):
                 pass
 
+        effective_interval, adaptive_next_run = _effective_schedule(hook_name, config)
+
         return HookResponse(
             name=hook_name,
             hook_type=config.hook_type,
             display_name=config.display_name or hook_name,
             enabled=config.enabled,
             polling_interval=config.polling_interval,
+            effective_polling_interval=effective_interval,
+            adaptive_polling=config.adaptive_polling is not None and config.adaptive_polling.enabled,
             status=_get_hook_status(hook, stats),
             last_run=last_run_str,
-            next_run=_calculate_next_run(last_run_dt, config.polling_interval, config.enabled),
+            next_run=adaptive_next_run or _calculate_next_run(last_run_dt, effective_interval, config.enabled),
             stats=HookStatsResponse(
                 total_runs=stats.get("total_runs", 0),
                 successful_runs=stats.get("successful_runs", 0),
@@ -328,3 +431,155 @@ async def trigger_hook(hook_name: str):
     except Exception as e:
         logger.error("Failed to trigger hook", exc_info=True, extra={"data": {"hook_name": hook_name}})
         raise HTTPException(status_code=500, detail=f"Failed to trigger hook: {str(e)}")
+
+
+@router.post("/{hook_name}/notify", response_model=NotifyResponse, status_code=202)
+async def notify_hook(
+    hook_name: str,
+    source: Optional[str] = None,
+    authorization: Optional[str] = Header(default=None),
+    x_nova_hook_token: Optional[str] = Header(default=None),
+):
+    """
+    Inbound change notification from an MCP server or mail provider.
+
+    Schedules a run of the hook shortly after the notification. Bursts of
+    notifications are coalesced into a single run.
+    """
+    _verify_notify_token(authorization, x_nova_hook_token)
+
+    try:
+        from input_hooks.push_notifications import request_hook_run
+
+        input_hook_registry = _ensure_hooks_initialized()
+
+        hook = input_hook_registry.get_hook(hook_name)
+        if not hook:
+            raise HTTPException(status_code=404, detail=f"Hook '{hook_name}' not found")
+        if not hook.config.enabled:
+            raise HTTPException(status_code=409, detail=f"Hook '{hook_name}' is disabled")
+
+        outcome = request_hook_run(hook_name, queue=hook.config.queue_name or "hooks", source=source)
+
+        return NotifyResponse(
+            hook_name=hook_name,
+            status=outcome.status,
+            task_id=outcome.task_id,
+            run_after_seconds=settings.HOOK_NOTIFY_COALESCE_SECONDS,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to handle hook notification", exc_info=True, extra={"data": {"hook_name": hook_name}})
+        raise HTTPException(status_code=500, detail=f"Failed to handle hook notification: {str(e)}")
+
+
+async def _replay_dead_letters(hook_name: str, items: List[Dict[str, Any]]) -> DeadLetterReplayResponse:
+    """Queue process_single_item for each dead-lettered item."""
+    from input_hooks.dead_letter import dead_letter_store
+    from tasks.hook_tasks import process_single_item
+
+    queued = {}
+    for item in items:
+        result = process_single_item.delay(hook_name, item["item_data"], dead_letter_id=item["id"])
+        await dead_letter_store.mark_replaying(item["id"], result.id)
+        queued[item["id"]] = result.id
+
+    logger.info(
+        "Dead-lettered hook items replayed",
+        extra={"data": {"hook_name": hook_name, "count": len(queued)}}
+    )
+
+    return DeadLetterReplayResponse(
+        hook_name=hook_name,
+        queued=queued,
+        queued_at=datetime.now(timezone.utc).isoformat(),
+    )
+
+
+async def _get_dead_letter(hook_name: str, item_id: str) -> Dict[str, Any]:
+    from input_hooks.dead_letter import dead_letter_store
+
+    try:
+        item = await dead_letter_store.get(item_id)
+    except ValueError:
+        item = None
+    if not item or item["hook_name"] != hook_name:
+        raise HTTPException(status_code=404, detail=f"Dead-letter item '{item_id}' not found for hook '{hook_name}'")
+    return item
+
+
+@router.get("/{hook_name}/dead-letter", response_model=DeadLetterListResponse)
+async def list_dead_letters(hook_name: str, status: Optional[str] = "dead", limit: int = 100):
+    """
+    List items of a hook that were moved to the dead-letter store.
+
+    Filters by status ("dead" by default); pass an empty status for all.
+    """
+    try:
+        from input_hooks.dead_letter import dead_letter_store
+
+        items = await dead_letter_store.list(hook_name, status=status or None, limit=limit)
+        return DeadLetterListResponse(
+            items=[DeadLetterItemResponse(**{**item, "item_data": None}) for item in items]
+        )
+
+    except Exception as e:
+        logger.error("Failed to list dead-lettered items", exc_info=True, extra={"data": {"hook_name": hook_name}})
+        raise HTTPException(status_code=500, detail=f"Failed to list dead-lettered items: {str(e)}")
+
+
+@router.get("/{hook_name}/dead-letter/{item_id}", response_model=DeadLetterItemResponse)
+async def get_dead_letter(hook_name: str, item_id: str):
+    """
+    Inspect a dead-lettered item, including the raw item data.
+    """
+    try:
+        return DeadLetterItemResponse(**await _get_dead_letter(hook_name, item_id))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to get dead-lettered item", exc_info=True, extra={"data": {"hook_name": hook_name}})
+        raise HTTPException(status_code=500, detail=f"Failed to get dead-lettered item: {str(e)}")
+
+
+@router.post("/{hook_name}/dead-letter/replay", response_model=DeadLetterReplayResponse)
+async def replay_dead_letters(hook_name: str, request: Optional[DeadLetterReplayRequest] = None):
+    """
+    Replay dead-lettered items of a hook in bulk.
+
+    Replays the given ids, or every item still in the "dead" status.
+    """
+    try:
+        from input_hooks.dead_letter import dead_letter_store
+
+        if request and request.ids:
+            items = [await _get_dead_letter(hook_name, item_id) for item_id in request.ids]
+        else:
+            items = await dead_letter_store.list(hook_name, status="dead", limit=1000)
+
+        return await _replay_dead_letters(hook_name, items)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to replay dead-lettered items", exc_info=True, extra={"data": {"hook_name": hook_name}})
+        raise HTTPException(status_code=500, detail=f"Failed to replay dead-lettered items: {str(e)}")
+
+
+@router.post("/{hook_name}/dead-letter/{item_id}/replay", response_model=DeadLetterReplayResponse)
+async def replay_dead_letter(hook_name: str, item_id: str):
+    """
+    Replay a single dead-lettered item through the hook pipeline.
+    """
+    try:
+        item = await _get_dead_letter(hook_name, item_id)
+        return await _replay_dead_letters(hook_name, [item])
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Failed to replay dead-lettered item", exc_info=True, extra={"data": {"hook_name": hook_name}})
+        raise HTTPException(status_code=500, detail=f"Failed to replay dead-lettered item: {str(e)}")
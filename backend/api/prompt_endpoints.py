@@ -63,6 +63,13 @@ async def clear_prompt_cache():
     return {"message": "Chat agent cache cleared - will recreate with updated prompt"}
 
 
+@router.get("/stats")
+async def get_prompt_stats() -> Dict[str, Any]:
+    """Get system prompt assembly timings and static prefix stability counters."""
+    from utils.prompt_loader import get_prompt_build_stats
+    return get_prompt_build_stats()
+
+
 @router.get("", response_model=SystemPromptResponse)
 async def get_system_prompt():
     """Get the current system prompt content."""
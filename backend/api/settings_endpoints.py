@@ -95,6 +95,10 @@ async def get_user_settings(session: AsyncSession = Depends(get_db_session)):
             await session.commit()
             await session.refresh(settings)
 
+            # Other processes cached "no settings row" until now
+            from utils.user_settings_cache import notify_user_settings_changed
+            await notify_user_settings_changed(settings, source="settings-api")
+
         return UserSettingsModel.model_validate(settings)
 
     except Exception as e:
@@ -131,6 +135,10 @@ async def update_user_settings(
         await session.commit()
         await session.refresh(settings)  # Refresh to ensure all attributes are loaded
 
+        # Update this process's settings cache and notify other services
+        from utils.user_settings_cache import notify_user_settings_changed
+        await notify_user_settings_changed(settings, updated_fields=update_data.keys(), source="settings-api")
+
         # If LLM-related settings were updated, publish Redis event for chat agent cache clearing
         llm_fields = {
             "chat_llm_model", "chat_llm_temperature", "chat_llm_max_tokens",
@@ -220,6 +228,17 @@ async def complete_onboarding(
         settings.litellm_master_key = request.litellm_master_key
 
         await session.commit()
+        await session.refresh(settings)
+
+        from utils.user_settings_cache import notify_user_settings_changed
+        await notify_user_settings_changed(
+            settings,
+            updated_fields=[
+                "onboarding_complete", "chat_llm_model", "memory_llm_model", "memory_small_llm_model",
+                "embedding_model", "litellm_base_url",
+            ],
+            source="settings-api",
+        )
 
         logger.info("Onboarding completed", extra={"data": {"chat_llm_model": request.chat_llm_model, "memory_llm_model": request.memory_llm_model, "memory_small_llm_model": settings.memory_small_llm_model, "embedding_model": request.embedding_model, "litellm_base_url": request.litellm_base_url}})
 
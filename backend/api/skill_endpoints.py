@@ -48,6 +48,12 @@ class SkillsListResponse(BaseModel):
     timestamp: str
 
 
+class SkillLoadStatsResponse(BaseModel):
+    """Per-skill activation latency for this process."""
+    stats: dict[str, dict]
+    timestamp: str
+
+
 @router.get("/", response_model=SkillsListResponse)
 async def get_skills():
     """
@@ -91,6 +97,21 @@ async def get_skills():
         raise HTTPException(status_code=500, detail=f"Failed to retrieve skills: {str(e)}")
 
 
+@router.get("/stats", response_model=SkillLoadStatsResponse)
+async def get_skill_load_stats():
+    """
+    Get activation latency and cache statistics per skill.
+
+    Stats are per process (website, core agent) since each one keeps its own
+    loaded-skill cache.
+    """
+    skill_manager = get_skill_manager()
+    return SkillLoadStatsResponse(
+        stats=skill_manager.get_load_stats(),
+        timestamp=datetime.now(timezone.utc).isoformat(),
+    )
+
+
 def _get_skill_config_path(skill_name: str) -> Path:
     """
     Get the config.yaml path for a skill, validating skill exists.
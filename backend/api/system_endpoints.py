@@ -305,6 +305,37 @@ async def refresh_all_services():
         raise HTTPException(status_code=500, detail=f"Failed to refresh services: {str(e)}")
 
 
+@router.get("/checkpoint-retention")
+async def get_checkpoint_retention_status() -> Dict[str, Any]:
+    """Get checkpoint retention settings, the last pass report and reclaimed totals."""
+    from services.checkpoint_retention import checkpoint_retention
+    return checkpoint_retention.get_status()
+
+
+@router.post("/checkpoint-retention/run")
+async def run_checkpoint_retention() -> Dict[str, Any]:
+    """Run one checkpoint retention pass now and return its report."""
+    from services.checkpoint_retention import checkpoint_retention
+    from start_website import get_service_manager
+
+    try:
+        service_manager = get_service_manager()
+        if service_manager.pg_pool is None:
+            await service_manager.init_pg_pool()
+        report = await checkpoint_retention.run_once(service_manager.pg_pool)
+        return report.to_dict()
+    except Exception as e:
+        logger.error("Checkpoint retention run failed", exc_info=True, extra={"data": {"error": str(e)}})
+        raise HTTPException(status_code=500, detail=f"Checkpoint retention failed: {str(e)}")
+
+
+@router.get("/tool-memo")
+async def get_tool_memo_stats() -> Dict[str, Any]:
+    """Get duplicate tool call counts and memo savings for chats served by this process."""
+    from tools.tool_memoization import tool_result_memo
+    return tool_result_memo.get_stats()
+
+
 async def _get_health_history() -> List[Dict[str, Any]]:
     """Get recent health history for trends (placeholder for future implementation)."""
     # TODO: Implement health history retrieval from SystemHealthStatus table
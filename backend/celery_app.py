@@ -5,7 +5,13 @@ Hook-based task processing system supporting multiple input sources
 (email, calendar, etc.) through the hook registry system.
 """
 from celery import Celery
-from celery.signals import worker_ready, worker_shutdown, beat_init
+from celery.signals import (
+    beat_init,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_ready,
+    worker_shutdown,
+)
 from config import settings
 
 # Create Celery instance with hook tasks
@@ -25,6 +31,7 @@ celery_app.conf.update(
         "tasks.hook_tasks.process_single_item": {"queue": "hooks"},
         "tasks.hook_tasks.replay_failed_hook_task": {"queue": "hooks"},
         "tasks.hook_tasks.health_check_all_hooks": {"queue": "hooks"},
+        "tasks.hook_tasks.release_stabilized_thread_tasks": {"queue": "hooks"},
     },
     
     # Task serialization
@@ -105,6 +112,27 @@ def update_beat_schedule():
                 if hook:
                     interval = hook.config.polling_interval
                     print(f"  - {hook_name}: every {interval} seconds")
+            
+            # Keep cached hook health fresh for the API and fetch runs
+            if settings.HOOK_HEALTH_REFRESH_SECONDS > 0:
+                celery_app.conf.beat_schedule["health-check-hooks"] = {
+                    "task": "tasks.hook_tasks.health_check_all_hooks",
+                    "schedule": settings.HOOK_HEALTH_REFRESH_SECONDS,
+                    "options": {"queue": "hooks"}
+                }
+            
+            # Release email thread tasks once their stabilization window ends
+            celery_app.conf.beat_schedule["release-stabilized-threads"] = {
+                "task": "tasks.hook_tasks.release_stabilized_thread_tasks",
+                "schedule": settings.THREAD_STABILIZATION_RELEASE_SECONDS,
+                "options": {"queue": "hooks"}
+            }
+            celery_app.conf.beat_schedule["reconcile-stabilized-threads"] = {
+                "task": "tasks.hook_tasks.release_stabilized_thread_tasks",
+                "schedule": settings.THREAD_STABILIZATION_RECONCILE_SECONDS,
+                "kwargs": {"reconcile": True},
+                "options": {"queue": "hooks"}
+            }
         else:
             celery_app.conf.beat_schedule = {}
             print("No enabled hooks found - cleared beat schedule")
@@ -159,6 +187,36 @@ def worker_shutdown_handler(sender=None, **_kwargs):
         print("Hook system cleaned up successfully")
     except Exception as e:
         print(f"Error during hook system cleanup: {e}")
+    
+    # Solo and thread pools run tasks in this process and get no per-process signal
+    try:
+        from tasks.worker_runtime import worker_runtime
+        worker_runtime.stop()
+    except Exception as e:
+        print(f"Error stopping worker event loop: {e}")
+
+
+@worker_process_init.connect
+def worker_process_init_handler(**_kwargs):
+    """Start the persistent event loop in each pool process (after fork)."""
+    if not settings.CELERY_PERSISTENT_LOOP_ENABLED:
+        return
+    try:
+        from tasks.worker_runtime import worker_runtime
+        worker_runtime.start()
+    except Exception as e:
+        # Tasks start the loop lazily on first use
+        print(f"Failed to start worker event loop: {e}")
+
+
+@worker_process_shutdown.connect
+def worker_process_shutdown_handler(**_kwargs):
+    """Release the pool process's loop, connection pool and HTTP client."""
+    try:
+        from tasks.worker_runtime import worker_runtime
+        worker_runtime.stop()
+    except Exception as e:
+        print(f"Error stopping worker event loop: {e}")
 
 
 @beat_init.connect
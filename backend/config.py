@@ -103,8 +103,87 @@ class Settings(BaseSettings):
     LOG_FILE_MAX_SIZE_MB: int = 10  # Maximum size in MB before rotation
     LOG_FILE_BACKUP_COUNT: int = 5  # Number of backup files to keep
 
+    # Chat Turn Setup
+    CHAT_MEMORY_CONTEXT_BUDGET_SECONDS: float = 2.0  # First-turn memory search is skipped if slower than this
+
+    # Chat History
+    CHAT_HISTORY_CACHE_MAX_THREADS: int = 200  # Threads whose reconstructed history is kept in memory
+
+    # Chat Streaming (SSE)
+    CHAT_STREAM_COALESCE_MS: float = 5.0  # Events arriving within this window share one write (0 disables)
+    CHAT_STREAM_MAX_BATCH_BYTES: int = 65536  # Flush a coalesced batch early at this size
+    CHAT_STREAM_HEARTBEAT_SECONDS: float = 15.0  # Idle interval between heartbeat comment frames
+
+    # Conversation Context Window (per-turn LLM view of long threads)
+    CONTEXT_WINDOW_ENABLED: bool = True
+    CONTEXT_ELIDED_PREVIEW_CHARS: int = 300  # Preview kept from an elided tool result
+    CHAT_CONTEXT_MAX_TOKENS: int = 64000  # Summarize older turns above this estimate
+    CHAT_CONTEXT_KEEP_RECENT_TURNS: int = 6  # Turns always sent verbatim
+    CHAT_CONTEXT_TOOL_RESULT_BUDGET_TOKENS: int = 16000  # Older tool results beyond this are elided
+    CORE_AGENT_CONTEXT_MAX_TOKENS: int = 48000
+    CORE_AGENT_CONTEXT_KEEP_RECENT_TURNS: int = 4
+    CORE_AGENT_CONTEXT_TOOL_RESULT_BUDGET_TOKENS: int = 8000
+
+    # Tool Result Offloading (large results stored as artifacts, referenced from chat state)
+    TOOL_RESULT_OFFLOAD_ENABLED: bool = True
+    TOOL_RESULT_OFFLOAD_THRESHOLD_CHARS: int = 12000  # Results longer than this are offloaded
+    TOOL_RESULT_PREVIEW_CHARS: int = 2000  # Preview kept inline in the conversation
+    TOOL_RESULT_READ_PAGE_CHARS: int = 20000  # Default slice returned by read_tool_result
+
+    # Tool Result Memoization (idempotent tools, per thread)
+    TOOL_MEMO_ENABLED: bool = True
+    TOOL_MEMO_TTL_SECONDS: float = 300.0  # How long a memoized result may be reused
+    TOOL_MEMO_MAX_THREADS: int = 500
+    TOOL_MEMO_MAX_ENTRIES_PER_THREAD: int = 64
+
+    # Checkpoint Retention (LangGraph Postgres checkpointer)
+    CHECKPOINT_RETENTION_ENABLED: bool = True
+    CHECKPOINT_RETENTION_KEEP_LATEST: int = 20  # Checkpoints kept per thread
+    CHECKPOINT_RETENTION_IDLE_MINUTES: int = 30  # Only threads idle this long are compacted
+    CHECKPOINT_RETENTION_INTERVAL_SECONDS: int = 3600  # Pause between retention passes
+    CHECKPOINT_RETENTION_BATCH_SIZE: int = 50  # Threads per batch
+    CHECKPOINT_RETENTION_BATCH_PAUSE_SECONDS: float = 0.5  # Pause between batches
+    CHECKPOINT_RETENTION_PINNED_THREADS: str = ""  # Comma-separated thread ids that keep full history
+
+    # System Prompt Assembly
+    SYSTEM_PROMPT_CLOCK_GRANULARITY_SECONDS: int = 60  # Rounding of "Current Time" in the prompt's volatile suffix
+
+    # Celery Worker Runtime (persistent event loop per worker process)
+    CELERY_PERSISTENT_LOOP_ENABLED: bool = True  # False restores a fresh event loop per task run
+    CELERY_WORKER_DB_POOL_SIZE: int = 5  # Warm database connections per worker process
+    CELERY_WORKER_DB_MAX_OVERFLOW: int = 5
+
+    # Input Hook Sync Cursors (incremental mailbox polling)
+    HOOK_SYNC_CURSOR_ENABLED: bool = True
+    HOOK_SYNC_FULL_RESYNC_HOURS: float = 24.0  # Cursors older than this fall back to a full listing
+    HOOK_SYNC_MAX_SEEN_IDS: int = 5000  # Message ids remembered per hook
+
+    # Input Hook Push Notifications (POST /api/hooks/{hook_name}/notify)
+    HOOK_NOTIFY_TOKEN: Optional[SecretStr] = None  # Shared secret for notifiers; endpoint disabled when unset
+    HOOK_NOTIFY_COALESCE_SECONDS: int = 5  # Notifications within this window trigger a single run
+    HOOK_NOTIFY_PENDING_TTL_SECONDS: int = 300  # Pending marker expiry if the queued run never starts
+
+    # Input Hook Item Checkpoints and Dead Letters
+    HOOK_ITEM_MAX_ATTEMPTS: int = 3  # Failed attempts before an item moves to the dead-letter store
+    HOOK_CHECKPOINT_TTL_HOURS: float = 24.0  # Unfinished run checkpoints expire after this
+    HOOK_RUN_LEASE_SECONDS: int = 900  # Run lease expiry if a run dies without releasing it; renewed per item
+    HOOK_RUN_BUSY_RETRY_SECONDS: int = 30  # Push and manual runs that find another run in progress retry after this
+
+    # Input Hook Health Checks
+    HOOK_HEALTH_CHECK_TIMEOUT_SECONDS: float = 10.0  # Per-hook limit; slower hooks are reported unhealthy
+    HOOK_HEALTH_CACHE_TTL_SECONDS: int = 300  # Cached results younger than this are reused
+    HOOK_HEALTH_REFRESH_SECONDS: int = 120  # Beat interval of the background refresh (0 disables)
+
+    # Email Thread Stabilization (ADR-019 delayed activation)
+    THREAD_STABILIZATION_RELEASE_SECONDS: int = 15  # How often held thread tasks are checked for release
+    THREAD_STABILIZATION_RECONCILE_SECONDS: int = 600  # How often held tasks are re-registered from the database
+    EMAIL_THREAD_RECENT_MESSAGES: int = 10  # Newest thread messages rendered in full in a thread task
+    EMAIL_THREAD_DIGEST_ENTRIES: int = 50  # Older messages kept as one-line digest entries beyond that
+
     # Email Integration Configuration
     EMAIL_ENABLED: bool = True  # Master toggle for email processing (Tier 1: infrastructure available)
+    EMAIL_PART_MAX_BYTES: int = 512_000  # Bytes decoded from a single MIME body part
+    EMAIL_CONTENT_MAX_CHARS: int = 20_000  # Normalized email text kept for tasks, prompts and memory
 
     # LiteLLM Configuration (Tier 2: Deployment Environment)
     # LiteLLM is the single source of truth for LLMs and MCP servers (ADR-011, ADR-015)
@@ -2,9 +2,10 @@
 Database configuration and session management for Nova Kanban MCP.
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
@@ -13,28 +14,78 @@ from models.models import Base
 from config import settings
 
 
+def _llm_settings_dict(settings) -> dict:
+    """Extract LLM-related fields from a settings row or snapshot."""
+    if not settings:
+        return {}
+    
+    return {
+        "chat_llm_model": settings.chat_llm_model,
+        "chat_llm_temperature": settings.chat_llm_temperature,
+        "chat_llm_max_tokens": settings.chat_llm_max_tokens,
+        "memory_llm_model": settings.memory_llm_model,
+        "memory_llm_temperature": settings.memory_llm_temperature,
+        "memory_llm_max_tokens": settings.memory_llm_max_tokens,
+        "embedding_model": settings.embedding_model,
+    }
+
+
+def _memory_settings_dict(settings) -> dict:
+    """Extract memory-related fields from a settings row or snapshot."""
+    if not settings:
+        return {}
+    
+    return {
+        "memory_search_limit": settings.memory_search_limit,
+        "memory_token_limit": settings.memory_token_limit,
+    }
+
+
 class UserSettingsService:
     """Centralized service for all user settings operations."""
     
     @staticmethod
     async def get_user_settings(session: AsyncSession = None):
-        """Get user settings object from database.
+        """Get user settings from database.
         
         Args:
-            session: Optional database session. If not provided, creates a new one.
+            session: Optional database session. If provided, the tracked ORM
+                object is returned so callers can modify and commit it. If not,
+                a cached read-only snapshot (UserSettingsModel) is returned.
         """
         from models.user_settings import UserSettings
         from sqlalchemy import select
+        from utils.user_settings_cache import user_settings_cache
         
         if session:
             # Use provided session
             result = await session.execute(select(UserSettings).limit(1))
             return result.scalar_one_or_none()
-        else:
-            # Create new session
-            async with db_manager.get_session() as new_session:
-                result = await new_session.execute(select(UserSettings).limit(1))
-                return result.scalar_one_or_none()
+        
+        found, snapshot = user_settings_cache.peek()
+        if found:
+            return snapshot
+        
+        return await UserSettingsService._load_user_settings()
+    
+    @staticmethod
+    async def _load_user_settings():
+        """Load the settings row in a new session and store its snapshot in the cache.
+        
+        The current snapshot is replaced only once the new one is stored, so
+        readers keep getting the previous one while the load runs.
+        """
+        from models.user_settings import UserSettings
+        from sqlalchemy import select
+        from utils.user_settings_cache import to_snapshot, user_settings_cache
+        
+        version = user_settings_cache.begin_load()
+        async with db_manager.get_session() as new_session:
+            result = await new_session.execute(select(UserSettings).limit(1))
+            settings = result.scalar_one_or_none()
+            snapshot = to_snapshot(settings)
+        user_settings_cache.store(snapshot, expected_version=version)
+        return snapshot
     
     @staticmethod
     async def get_user_settings_dict() -> dict:
@@ -73,82 +124,75 @@ class UserSettingsService:
     async def get_llm_settings() -> dict:
         """Get only LLM-related settings from database."""
         settings = await UserSettingsService.get_user_settings()
-        if not settings:
-            return {}
-        
-        return {
-            "chat_llm_model": settings.chat_llm_model,
-            "chat_llm_temperature": settings.chat_llm_temperature,
-            "chat_llm_max_tokens": settings.chat_llm_max_tokens,
-            "memory_llm_model": settings.memory_llm_model,
-            "memory_llm_temperature": settings.memory_llm_temperature,
-            "memory_llm_max_tokens": settings.memory_llm_max_tokens,
-            "embedding_model": settings.embedding_model,
-        }
+        return _llm_settings_dict(settings)
     
 
     @staticmethod
     async def get_memory_settings() -> dict:
         """Get only memory-related settings from database."""
         settings = await UserSettingsService.get_user_settings()
-        if not settings:
-            return {}
+        return _memory_settings_dict(settings)
+    
+    @staticmethod
+    def _get_user_settings_cached_sync():
+        """Read the settings snapshot without creating threads or event loops.
         
-        return {
-            "memory_search_limit": settings.memory_search_limit,
-            "memory_token_limit": settings.memory_token_limit,
-        }
+        Returns the cached snapshot when available. An expired snapshot is
+        still served inside a running loop while a background refresh runs.
+        Only a cold cache falls back to loading on a separate loop.
+        """
+        import asyncio
+        from utils.user_settings_cache import user_settings_cache
+        
+        found, snapshot = user_settings_cache.peek()
+        if found:
+            return snapshot
+        
+        found, snapshot = user_settings_cache.peek(allow_stale=True)
+        if found and user_settings_cache.schedule_refresh(UserSettingsService.refresh_user_settings):
+            return snapshot
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(UserSettingsService.get_user_settings())
+        
+        # Cold cache inside a running loop: load once on a helper thread
+        import concurrent.futures
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(asyncio.run, UserSettingsService.get_user_settings())
+            return future.result()
+    
+    @staticmethod
+    async def refresh_user_settings():
+        """Reload the settings snapshot from the database, bypassing the cache."""
+        return await UserSettingsService._load_user_settings()
     
     @staticmethod
     def get_user_settings_sync():
-        """Get user settings object from database synchronously."""
-        import asyncio
+        """Get user settings snapshot synchronously."""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an async context, we need to use a new event loop
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, UserSettingsService.get_user_settings())
-                    return future.result()
-            else:
-                return asyncio.run(UserSettingsService.get_user_settings())
+            return UserSettingsService._get_user_settings_cached_sync()
         except Exception as e:
             print(f"Warning: Could not get user settings, using None: {e}")
             return None
     
     @staticmethod
     def get_llm_settings_sync() -> dict:
-        """Get LLM settings from database synchronously."""
-        import asyncio
+        """Get LLM settings synchronously."""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an async context, we need to use a new event loop
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, UserSettingsService.get_llm_settings())
-                    return future.result()
-            else:
-                return asyncio.run(UserSettingsService.get_llm_settings())
+            settings = UserSettingsService._get_user_settings_cached_sync()
+            return _llm_settings_dict(settings)
         except Exception as e:
             print(f"Warning: Could not get user settings, using defaults: {e}")
             return {}
     
     @staticmethod
     def get_memory_settings_sync() -> dict:
-        """Get memory settings from database synchronously."""
-        import asyncio
+        """Get memory settings synchronously."""
         try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If we're already in an async context, we need to use a new event loop
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(asyncio.run, UserSettingsService.get_memory_settings())
-                    return future.result()
-            else:
-                return asyncio.run(UserSettingsService.get_memory_settings())
+            settings = UserSettingsService._get_user_settings_cached_sync()
+            return _memory_settings_dict(settings)
         except Exception as e:
             print(f"Warning: Could not get memory settings, using defaults: {e}")
             return {"memory_search_limit": 10, "memory_token_limit": 2048}  # Database defaults
@@ -174,6 +218,9 @@ class UserSettingsService:
         await session.commit()
         await session.refresh(settings)
         
+        from utils.user_settings_cache import notify_user_settings_changed
+        await notify_user_settings_changed(settings)
+        
         return settings
     
     @staticmethod
@@ -192,6 +239,9 @@ class UserSettingsService:
         await session.commit()
         await session.refresh(settings)
         
+        from utils.user_settings_cache import notify_user_settings_changed
+        await notify_user_settings_changed(settings)
+        
         return settings
 
 
@@ -207,6 +257,7 @@ class DatabaseManager:
         if database_url is None:
             # Use the SQLAlchemy-specific URL with +asyncpg driver
             database_url = settings.SQLALCHEMY_DATABASE_URL
+        self._database_url = database_url
         
         self.engine = create_async_engine(
             database_url,
@@ -219,6 +270,49 @@ class DatabaseManager:
             class_=AsyncSession,
             expire_on_commit=False
         )
+        
+        # Optional pooled engine owned by one long-lived event loop (Celery workers)
+        self._pooled_engine = None
+        self._pooled_session_maker = None
+        self._pooled_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def enable_loop_pool(self, loop: asyncio.AbstractEventLoop, pool_size: int = 5, max_overflow: int = 5):
+        """Serve sessions opened on ``loop`` from a warm connection pool.
+        
+        asyncpg connections belong to the loop that opened them, so sessions
+        opened on any other loop keep using the NullPool engine.
+        """
+        self._pooled_engine = create_async_engine(
+            self._database_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+            echo=bool(os.getenv("SQL_DEBUG", "false").lower() == "true")
+        )
+        self._pooled_session_maker = async_sessionmaker(
+            self._pooled_engine,
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+        self._pooled_loop = loop
+    
+    async def disable_loop_pool(self):
+        """Close the loop-owned connection pool (call on the owning loop)."""
+        engine = self._pooled_engine
+        self._pooled_engine = None
+        self._pooled_session_maker = None
+        self._pooled_loop = None
+        if engine is not None:
+            await engine.dispose()
+    
+    def _session_maker(self):
+        if self._pooled_loop is not None:
+            try:
+                if asyncio.get_running_loop() is self._pooled_loop:
+                    return self._pooled_session_maker
+            except RuntimeError:
+                pass
+        return self.async_session_maker
     
     async def create_tables(self):
         """Create all database tables."""
@@ -233,7 +327,7 @@ class DatabaseManager:
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get an async database session."""
-        async with self.async_session_maker() as session:
+        async with self._session_maker()() as session:
             try:
                 yield session
                 await session.commit()
@@ -0,0 +1,160 @@
+"""
+Adaptive polling intervals for input hooks.
+
+Celery beat schedules are fixed when beat starts, so a hook with
+``adaptive_polling`` gets a beat entry at its minimum interval. Each
+scheduled run first asks the poller whether the hook is due. After a run
+the poller picks the next interval:
+
+- a run that found new items drops back to ``min_interval``
+- a quiet or failed run multiplies the interval by ``backoff_factor``, up to
+  ``max_interval``
+- outside ``business_hours`` the interval is at least ``off_hours_interval``
+
+Poll state lives in Redis so beat, workers and the hooks API agree on it.
+Manual triggers and push notifications bypass the due check.
+"""
+
+import json
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from utils.logging import get_logger
+from utils.redis_manager import get_sync_redis
+from .models import AdaptivePollingConfig, BusinessHours, HookConfig
+
+logger = get_logger(__name__)
+
+# Redis key for a hook's adaptive poll state
+POLL_STATE_KEY = "hook:poll:{hook_name}"
+POLL_STATE_TTL = 86400 * 7  # 7 days
+
+
+@dataclass
+class PollState:
+    """Where a hook's adaptive schedule stands."""
+    interval: int
+    next_run_at: float  # epoch seconds
+    quiet_runs: int = 0
+    error_streak: int = 0
+    last_outcome: str = ""  # "items", "quiet" or "error"
+
+
+def adaptive_config(config: HookConfig) -> Optional[AdaptivePollingConfig]:
+    adaptive = config.adaptive_polling
+    return adaptive if adaptive is not None and adaptive.enabled else None
+
+
+def beat_interval(config: HookConfig) -> int:
+    """Interval of the hook's Celery beat entry."""
+    adaptive = adaptive_config(config)
+    interval = adaptive.min_interval if adaptive else config.polling_interval
+    if config.push_enabled:
+        # Notifications trigger runs; polling is only a safety net
+        interval = max(interval, config.push_safety_polling_interval)
+    return interval
+
+
+def _bounds(adaptive: AdaptivePollingConfig) -> Tuple[int, int]:
+    return adaptive.min_interval, max(adaptive.min_interval, adaptive.max_interval)
+
+
+def within_business_hours(hours: Optional[BusinessHours], now: datetime) -> bool:
+    """Whether ``now`` falls in the business hours window (always true without one)."""
+    if hours is None:
+        return True
+    local = now.astimezone(ZoneInfo(hours.timezone))
+    if local.weekday() not in hours.days:
+        return False
+    return hours.start <= local.strftime("%H:%M") < hours.end
+
+
+def next_interval(
+    adaptive: AdaptivePollingConfig,
+    current: int,
+    items_found: int,
+    error: bool,
+    now: datetime,
+) -> int:
+    """Interval until the next run after a run with the given outcome."""
+    low, high = _bounds(adaptive)
+    if error or items_found == 0:
+        interval = current * adaptive.backoff_factor
+    else:
+        interval = low
+    interval = min(max(interval, low), high)
+    if not within_business_hours(adaptive.business_hours, now):
+        interval = max(interval, adaptive.off_hours_interval or high)
+    return int(interval)
+
+
+class AdaptivePoller:
+    """Decides when adaptive hooks are due and records run outcomes."""
+
+    def get_state(self, hook_name: str) -> Optional[PollState]:
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return None
+        try:
+            data = redis_client.get(POLL_STATE_KEY.format(hook_name=hook_name))
+            return PollState(**json.loads(data)) if data else None
+        except Exception as e:
+            logger.warning("Failed to read hook poll state", extra={"data": {"hook_name": hook_name, "error": str(e)}})
+            return None
+
+    def is_due(self, hook_name: str, config: HookConfig, now: Optional[float] = None) -> bool:
+        """Whether a scheduled run should go ahead (always for non-adaptive hooks)."""
+        if adaptive_config(config) is None:
+            return True
+        state = self.get_state(hook_name)
+        return state is None or (now or time.time()) >= state.next_run_at
+
+    def record_run(self, hook_name: str, config: HookConfig, items_found: int, error: bool = False) -> Optional[PollState]:
+        """Schedule the next run of an adaptive hook from this run's outcome."""
+        adaptive = adaptive_config(config)
+        if adaptive is None:
+            return None
+
+        previous = self.get_state(hook_name)
+        low, high = _bounds(adaptive)
+        current = previous.interval if previous else min(max(config.polling_interval, low), high)
+        now = time.time()
+        interval = next_interval(adaptive, current, items_found, error, datetime.fromtimestamp(now, tz=timezone.utc))
+
+        state = PollState(
+            interval=interval,
+            next_run_at=now + interval,
+            quiet_runs=0 if error or items_found else (previous.quiet_runs + 1 if previous else 1),
+            error_streak=(previous.error_streak + 1 if previous else 1) if error else 0,
+            last_outcome="error" if error else ("items" if items_found else "quiet"),
+        )
+
+        redis_client = get_sync_redis()
+        if redis_client is not None:
+            try:
+                redis_client.setex(POLL_STATE_KEY.format(hook_name=hook_name), POLL_STATE_TTL, json.dumps(asdict(state)))
+            except Exception as e:
+                logger.warning("Failed to store hook poll state", extra={"data": {"hook_name": hook_name, "error": str(e)}})
+
+        logger.info(
+            "Adaptive poll interval updated",
+            extra={"data": {"hook_name": hook_name, "interval": interval, "previous_interval": current, "outcome": state.last_outcome}}
+        )
+        return state
+
+    def effective_interval(self, hook_name: str, config: HookConfig) -> int:
+        """Interval the hook currently runs at."""
+        if adaptive_config(config) is not None:
+            state = self.get_state(hook_name)
+            if state is not None:
+                return state.interval
+            low, high = _bounds(config.adaptive_polling)
+            return min(max(config.polling_interval, low), high)
+        return beat_interval(config)
+
+
+# Global instance
+adaptive_poller = AdaptivePoller()
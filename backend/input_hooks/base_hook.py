@@ -5,22 +5,36 @@ Provides the foundation for all input source hooks, extending Nova's proven
 BaseConfigManager pattern with hook-specific functionality.
 """
 
+import hashlib
+import json
 import time
+import uuid
 from abc import abstractmethod
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from sqlalchemy import select, and_
 
+from config import settings
 from utils.base_config_manager import BaseConfigManager
 from utils.logging import get_logger
 from database.database import db_manager
 from tools.task_tools import create_task_tool, update_task_tool
+from .dead_letter import dead_letter_store
+from .item_checkpoint import RunCheckpoint, item_checkpoint_store
 from .models import HookConfig, ProcessingResult, NormalizedItem, TaskTemplate
 
 logger = get_logger(__name__)
 
 
+class ItemsPendingRetry(Exception):
+    """Some items of a run failed and will be retried from the run checkpoint."""
+
+
+class HookRunInProgress(Exception):
+    """Another run of the hook holds its run lease; this run did not start."""
+
+
 class BaseInputHook(BaseConfigManager[HookConfig]):
     """
     Base class for all input source hooks.
@@ -125,28 +139,46 @@ class BaseInputHook(BaseConfigManager[HookConfig]):
         """
         return self.config.update_existing_tasks and item.should_update_existing
     
+    def item_key(self, raw_item: Dict[str, Any]) -> str:
+        """Stable key of a raw item, used for run checkpoints and dead letters."""
+        if isinstance(raw_item, dict) and raw_item.get("id"):
+            return str(raw_item["id"])
+        payload = json.dumps(raw_item, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+    
     # Main processing pipeline
-    async def process_items(self) -> ProcessingResult:
+    async def process_items(self, run_id: Optional[str] = None) -> ProcessingResult:
         """
         Main processing pipeline for the hook.
         
         This is the entry point called by Celery tasks. Follows the pattern:
-        1. Fetch items from source
+        1. Fetch items from source (a retry of the same run resumes its checkpoint instead)
         2. Normalize each item
         3. Check for existing tasks (deduplication)
         4. Create or update tasks as needed
         5. Record processing results
         
+        Progress is checkpointed per item. Items that fail are retried by
+        raising ItemsPendingRetry once the batch is through, and move to the
+        dead-letter store after HOOK_ITEM_MAX_ATTEMPTS failures. Only the run
+        holding the hook's run lease touches the checkpoint; any other run
+        raises HookRunInProgress before fetching.
+        
+        Args:
+            run_id: Celery task id of the run; retries of a task share it
+        
         Returns:
             ProcessingResult with statistics
         """
         start_time = time.time()
         result = ProcessingResult(hook_name=self.hook_name)
+        lease_id = run_id or uuid.uuid4().hex
+        leased = False
         
         try:
             logger.info(
                 "Starting hook processing",
-                extra={"data": {"hook_name": self.hook_name}}
+                extra={"data": {"hook_name": self.hook_name, "run_id": run_id}}
             )
             
             # Check if hook is enabled
@@ -154,33 +186,71 @@ class BaseInputHook(BaseConfigManager[HookConfig]):
                 logger.info("Hook is disabled, skipping", extra={"data": {"hook_name": self.hook_name}})
                 return result
             
-            # Fetch raw items from source
-            raw_items = await self.fetch_items()
-            logger.info(
-                "Fetched raw items from hook",
-                extra={"data": {"hook_name": self.hook_name, "item_count": len(raw_items)}}
-            )
+            leased = item_checkpoint_store.acquire_lease(self.hook_name, lease_id)
+            if not leased:
+                raise HookRunInProgress(f"Another run of hook '{self.hook_name}' is in progress")
+            
+            checkpoint = item_checkpoint_store.load(self.hook_name)
+            resumed = len(checkpoint.pending()) if checkpoint else 0
+            if checkpoint is None or run_id is None or checkpoint.run_id != run_id:
+                # Fetch raw items from source; unfinished items of an earlier run go first
+                raw_items = await self.fetch_items()
+                logger.info(
+                    "Fetched raw items from hook",
+                    extra={"data": {"hook_name": self.hook_name, "item_count": len(raw_items), "resumed_items": resumed}}
+                )
+                checkpoint = checkpoint or RunCheckpoint(hook_name=self.hook_name, run_id=run_id or "")
+                checkpoint.run_id = run_id or ""
+                checkpoint.add_items({self.item_key(raw_item): raw_item for raw_item in raw_items})
+            else:
+                logger.info(
+                    "Resuming hook run from checkpoint",
+                    extra={"data": {"hook_name": self.hook_name, "run_id": run_id, "pending_items": resumed}}
+                )
+            
+            pending = checkpoint.pending()
+            checkpointed = bool(pending) and item_checkpoint_store.save(checkpoint)
             
             # Process each item
-            for raw_item in raw_items:
+            retry_keys = []
+            for key, raw_item in pending.items():
                 try:
                     await self._process_single_item(raw_item, result)
+                    checkpoint.mark_done(key)
                 except Exception as e:
                     error_msg = f"Failed to process item: {str(e)}"
                     result.errors.append(error_msg)
+                    attempts = checkpoint.record_failure(key, str(e))
                     logger.error(
                         "Item processing error",
                         extra={"data": {
                             "hook_name": self.hook_name,
                             "error": error_msg,
+                            "item_key": key,
+                            "attempts": attempts,
                             "item_keys": list(raw_item.keys()) if isinstance(raw_item, dict) else "unknown"
                         }}
                     )
-                    continue
+                    # Without a checkpoint to resume from, a retry would redo the whole batch
+                    if checkpointed:
+                        if attempts >= settings.HOOK_ITEM_MAX_ATTEMPTS and await self._dead_letter_item(key, raw_item, str(e), attempts):
+                            checkpoint.mark_done(key)
+                        else:
+                            retry_keys.append(key)
+                if checkpointed:
+                    item_checkpoint_store.save(checkpoint)
+                    item_checkpoint_store.acquire_lease(self.hook_name, lease_id)
             
-            result.items_processed = len(raw_items)
+            result.items_processed = len(pending)
             result.processing_time_seconds = time.time() - start_time
             
+            if retry_keys:
+                raise ItemsPendingRetry(
+                    f"{len(retry_keys)} of {len(pending)} items failed and will be retried"
+                )
+            if checkpointed:
+                item_checkpoint_store.clear(self.hook_name)
+            
             # Update stats
             self._stats["runs"] += 1
             self._stats["successes"] += 1
@@ -199,6 +269,13 @@ class BaseInputHook(BaseConfigManager[HookConfig]):
             
             return result
             
+        except HookRunInProgress:
+            logger.info(
+                "Hook run already in progress, not starting",
+                extra={"data": {"hook_name": self.hook_name, "run_id": run_id}}
+            )
+            raise
+            
         except Exception as e:
             result.processing_time_seconds = time.time() - start_time
             result.errors.append(f"Hook processing failed: {str(e)}")
@@ -217,6 +294,22 @@ class BaseInputHook(BaseConfigManager[HookConfig]):
             )
             
             raise
+        
+        finally:
+            if leased:
+                item_checkpoint_store.release_lease(self.hook_name, lease_id)
+    
+    async def _dead_letter_item(self, key: str, raw_item: Dict[str, Any], error: str, attempts: int) -> bool:
+        """Move a persistently failing item to the dead-letter store."""
+        try:
+            await dead_letter_store.add(self.hook_name, key, raw_item, error, attempts)
+            return True
+        except Exception as e:
+            logger.error(
+                "Failed to dead-letter hook item",
+                extra={"data": {"hook_name": self.hook_name, "item_key": key, "error": str(e)}}
+            )
+            return False
     
     async def _process_single_item(self, raw_item: Dict[str, Any], result: ProcessingResult) -> None:
         """Process a single raw item through the pipeline."""
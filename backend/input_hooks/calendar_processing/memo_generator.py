@@ -5,6 +5,8 @@ Generates meeting preparation memos using Nova's memory system and AI agent.
 Creates plain text memos with context about attendees, projects, and talking points.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import List, Tuple
 import uuid
@@ -16,6 +18,9 @@ from ..models import CalendarMeetingInfo
 
 logger = get_logger(__name__)
 
+# Memory searches run at once while gathering attendee context
+MEMORY_SEARCH_CONCURRENCY = 5
+
 
 class MemoGenerator:
     """
@@ -23,6 +28,10 @@ class MemoGenerator:
     
     Uses Nova's memory system to gather context about attendees and projects,
     then generates a concise, actionable memo for meeting preparation.
+
+    Memos may be generated concurrently. Without a caller-provided pool they
+    share one PostgreSQL pool, opened by the first memo and closed when the
+    last concurrent memo finishes.
     """
     
     # Prompt template for memo generation
@@ -56,7 +65,10 @@ Keep the memo concise and practical for quick reference. Format it clearly with
 If no relevant context is found in memory, focus on the meeting title and description to suggest relevant discussion topics."""
 
     def __init__(self):
-        pass
+        self._service_manager = None  # Owns the shared pool while memos are in flight
+        self._pool_users = 0
+        self._pool_lock = None
+        self._pool_lock_loop = None
     
     async def generate_meeting_memo(self, meeting: CalendarMeetingInfo, pg_pool=None) -> Tuple[str, str]:
         """
@@ -80,8 +92,10 @@ If no relevant context is found in memory, focus on the meeting title and descri
             )
             
             # Gather context from memory system
-            attendee_context = await self._gather_attendee_context(meeting.attendee_emails)
-            project_context = await self._gather_project_context(meeting.title, meeting.description)
+            attendee_context, project_context = await asyncio.gather(
+                self._gather_attendee_context(meeting.attendee_emails),
+                self._gather_project_context(meeting.title, meeting.description)
+            )
             
             # Format meeting details
             meeting_time = meeting.start_time.strftime("%A, %B %d at %I:%M %p")
@@ -143,17 +157,18 @@ If no relevant context is found in memory, focus on the meeting title and descri
             return "**Attendee Context:** No attendees listed for this meeting."
         
         try:
-            attendee_contexts = []
+            semaphore = asyncio.Semaphore(MEMORY_SEARCH_CONCURRENCY)
             
-            for email in attendee_emails:
+            async def search_attendee(email: str) -> str:
                 # Search memory for information about this person
-                query = f"person {email} background role project"
-                context = await search_memory_tool(query)
+                async with semaphore:
+                    context = await search_memory_tool(f"person {email} background role project")
                 
                 if context and "No relevant memories found" not in context:
-                    attendee_contexts.append(f"**{email}:** {context}")
-                else:
-                    attendee_contexts.append(f"**{email}:** No background information available in memory.")
+                    return f"**{email}:** {context}"
+                return f"**{email}:** No background information available in memory."
+            
+            attendee_contexts = await asyncio.gather(*[search_attendee(email) for email in attendee_emails])
             
             if attendee_contexts:
                 context_text = "**Attendee Context:**\n" + "\n".join(attendee_contexts)
@@ -227,14 +242,40 @@ If no relevant context is found in memory, focus on the meeting title and descri
         """
         logger.debug("Generating memo with Nova chat agent")
         
-        # Use provided pool or create our own
+        # Use provided pool or the one shared by concurrent memos
         if pg_pool is None:
-            from utils.service_manager import ServiceManager
-            service_manager = ServiceManager("calendar-memo")
-            if service_manager.pg_pool is None:
+            async with self._shared_pg_pool() as shared_pool:
+                return await self._stream_memo(prompt, meeting_id, shared_pool)
+        return await self._stream_memo(prompt, meeting_id, pg_pool)
+    
+    @asynccontextmanager
+    async def _shared_pg_pool(self):
+        """Lease the shared memo pool, opening it for the first user and closing it after the last."""
+        loop = asyncio.get_running_loop()
+        if self._pool_lock is None or self._pool_lock_loop is not loop:
+            self._pool_lock = asyncio.Lock()
+            self._pool_lock_loop = loop
+        
+        async with self._pool_lock:
+            if self._service_manager is None:
+                from utils.service_manager import ServiceManager
+                service_manager = ServiceManager("calendar-memo")
                 await service_manager.init_pg_pool()
-            pg_pool = service_manager.pg_pool
+                self._service_manager = service_manager
+            self._pool_users += 1
+            service_manager = self._service_manager
         
+        try:
+            yield service_manager.pg_pool
+        finally:
+            async with self._pool_lock:
+                self._pool_users -= 1
+                if self._pool_users == 0:
+                    self._service_manager = None
+                    await service_manager.close_pg_pool()
+    
+    async def _stream_memo(self, prompt: str, meeting_id: str, pg_pool) -> Tuple[str, str]:
+        """Run the chat agent on the memo prompt and collect its answer."""
         chat_agent = await create_chat_agent(pg_pool=pg_pool)
         
         from langchain_core.messages import HumanMessage
@@ -5,6 +5,7 @@ Main orchestration pipeline that coordinates fetching, analyzing, memo generatio
 and prep meeting creation. Similar to EmailProcessor but for calendar events.
 """
 
+import asyncio
 import time
 from typing import List, Dict, Any
 from datetime import datetime, date
@@ -28,6 +29,11 @@ class CalendarProcessor:
     2. Analyze which meetings need preparation
     3. Generate AI memos for each meeting
     4. Create private prep meetings with memos
+
+    Calendars are fetched concurrently. Meetings are processed concurrently,
+    at most ``max_concurrent_meetings`` at a time, each under its own
+    ``meeting_timeout_seconds`` so one slow or failing memo does not hold up
+    or fail the others.
     """
     
     def __init__(self):
@@ -61,6 +67,7 @@ class CalendarProcessor:
             "prep_meetings_created": 0,
             "prep_meetings_updated": 0,
             "errors": [],
+            "meetings": [],  # Per-meeting outcome and latency
             "processing_time_seconds": 0.0
         }
         
@@ -91,31 +98,21 @@ class CalendarProcessor:
                 result["processing_time_seconds"] = time.time() - start_time
                 return result
             
-            # Step 3: Process each meeting that needs preparation
-            for meeting in meetings_needing_prep:
-                try:
-                    prep_result = await self._process_single_meeting(meeting, config)
-                    
-                    if prep_result["created"]:
-                        result["prep_meetings_created"] += 1
-                    elif prep_result["updated"]:
-                        result["prep_meetings_updated"] += 1
-                    
-                    if prep_result["error"]:
-                        result["errors"].append(prep_result["error"])
-                        
-                except Exception as e:
-                    result["errors"].append(f"Failed to process meeting {meeting.meeting_id}: {str(e)}")
-                    logger.error(
-                        "Error processing meeting",
-                        exc_info=True,
-                        extra={"data": {
-                            "meeting_id": meeting.meeting_id,
-                            "meeting_title": meeting.title,
-                            "error": str(e)
-                        }}
-                    )
-                    continue
+            # Step 3: Process the meetings that need preparation, a bounded number at a time
+            semaphore = asyncio.Semaphore(config.hook_settings.max_concurrent_meetings)
+            meeting_results = await asyncio.gather(*[
+                self._run_meeting(meeting, config, semaphore) for meeting in meetings_needing_prep
+            ])
+            
+            for meeting_result in meeting_results:
+                if meeting_result["status"] == "created":
+                    result["prep_meetings_created"] += 1
+                elif meeting_result["status"] == "updated":
+                    result["prep_meetings_updated"] += 1
+                
+                if meeting_result["error"]:
+                    result["errors"].append(meeting_result["error"])
+            result["meetings"] = meeting_results
             
             result["processing_time_seconds"] = time.time() - start_time
             
@@ -127,7 +124,9 @@ class CalendarProcessor:
                     "prep_meetings_created": result["prep_meetings_created"],
                     "prep_meetings_updated": result["prep_meetings_updated"],
                     "errors": len(result["errors"]),
-                    "processing_time": result["processing_time_seconds"]
+                    "processing_time": result["processing_time_seconds"],
+                    "max_concurrent_meetings": config.hook_settings.max_concurrent_meetings,
+                    "meetings": result["meetings"]
                 }}
             )
             
@@ -168,30 +167,33 @@ class CalendarProcessor:
             all_events = []
             fetch_errors = []
             
-            # Fetch events from each configured calendar
-            for calendar_id in calendar_ids:
-                try:
-                    events = await self.fetcher.fetch_todays_events(
-                        calendar_id=calendar_id,
-                        look_ahead_days=config.hook_settings.look_ahead_days
-                    )
-                    all_events.extend(events)
-                    
-                    logger.debug(
-                        "Fetched events from calendar",
-                        extra={"data": {
-                            "calendar_id": calendar_id,
-                            "event_count": len(events)
-                        }}
-                    )
-                    
-                except Exception as e:
+            # Fetch events from all configured calendars concurrently
+            fetch_results = await asyncio.gather(*[
+                self.fetcher.fetch_todays_events(
+                    calendar_id=calendar_id,
+                    look_ahead_days=config.hook_settings.look_ahead_days
+                )
+                for calendar_id in calendar_ids
+            ], return_exceptions=True)
+            
+            for calendar_id, events in zip(calendar_ids, fetch_results):
+                if isinstance(events, Exception):
                     logger.error(
                         "Failed to fetch from calendar",
-                        extra={"data": {"calendar_id": calendar_id, "error": str(e)}}
+                        extra={"data": {"calendar_id": calendar_id, "error": str(events)}}
                     )
-                    fetch_errors.append(f"Failed to fetch from calendar {calendar_id}: {e}")
+                    fetch_errors.append(f"Failed to fetch from calendar {calendar_id}: {events}")
                     continue
+                
+                all_events.extend(events)
+                
+                logger.debug(
+                    "Fetched events from calendar",
+                    extra={"data": {
+                        "calendar_id": calendar_id,
+                        "event_count": len(events)
+                    }}
+                )
             
             # If all calendars failed to fetch, raise an exception
             if fetch_errors and len(fetch_errors) == len(calendar_ids):
@@ -251,6 +253,61 @@ class CalendarProcessor:
             logger.error("Error analyzing meetings", extra={"data": {"error": str(e)}})
             return []
     
+    async def _run_meeting(self, meeting: CalendarMeetingInfo, config: GoogleCalendarHookConfig,
+                           semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        Process one meeting within the concurrency limit and its timeout.
+        
+        Never raises: timeouts and errors are reported in the returned summary
+        so the other meetings of the run are unaffected.
+        
+        Returns:
+            Summary with meeting_id, title, status (created, updated, skipped,
+            failed, timeout), error and latency_seconds
+        """
+        timeout = config.hook_settings.meeting_timeout_seconds
+        summary = {
+            "meeting_id": meeting.meeting_id,
+            "title": meeting.title,
+            "status": "skipped",
+            "error": None,
+            "latency_seconds": 0.0
+        }
+        
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                prep_result = await asyncio.wait_for(self._process_single_meeting(meeting, config), timeout)
+                if prep_result["created"]:
+                    summary["status"] = "created"
+                elif prep_result["updated"]:
+                    summary["status"] = "updated"
+                if prep_result["error"]:
+                    summary["status"] = "failed"
+                    summary["error"] = prep_result["error"]
+            except asyncio.TimeoutError:
+                summary["status"] = "timeout"
+                summary["error"] = f"Processing meeting {meeting.meeting_id} timed out after {timeout:g}s"
+                logger.error(
+                    "Meeting processing timed out",
+                    extra={"data": {"meeting_id": meeting.meeting_id, "meeting_title": meeting.title, "timeout": timeout}}
+                )
+            except Exception as e:
+                summary["status"] = "failed"
+                summary["error"] = f"Failed to process meeting {meeting.meeting_id}: {str(e)}"
+                logger.error(
+                    "Error processing meeting",
+                    exc_info=True,
+                    extra={"data": {
+                        "meeting_id": meeting.meeting_id,
+                        "meeting_title": meeting.title,
+                        "error": str(e)
+                    }}
+                )
+            summary["latency_seconds"] = round(time.monotonic() - started, 3)
+        
+        return summary
+    
     async def _process_single_meeting(self, meeting: CalendarMeetingInfo, 
                                     config: GoogleCalendarHookConfig) -> Dict[str, Any]:
         """
@@ -282,6 +339,11 @@ class CalendarProcessor:
             # Check if prep meeting already exists
             prep_exists = await self.meeting_creator.check_prep_meeting_exists(meeting)
             
+            if prep_exists and not config.update_existing_tasks:
+                # Nothing would be done with a memo - don't spend an LLM run on it
+                logger.info("Prep meeting exists, skipping", extra={"data": {"meeting_id": str(meeting.meeting_id)}})
+                return process_result
+            
             # Generate memo for the meeting (pass pg_pool to ensure same connection)
             memo_text, thread_id = await self.memo_generator.generate_meeting_memo(meeting, pg_pool=getattr(self, '_pg_pool', None))
             
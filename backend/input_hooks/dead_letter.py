@@ -0,0 +1,118 @@
+"""
+Persisted dead-letter store for hook items.
+
+Items that fail HOOK_ITEM_MAX_ATTEMPTS times are moved out of the run into
+the hook_dead_letter_items table instead of blocking the hook. From there
+they can be listed, inspected and replayed through the hooks API; a replay
+runs the stored item through the hook pipeline again (process_single_item).
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, select
+
+from database.database import db_manager
+from models.models import HookDeadLetterItem
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEAD = "dead"
+REPLAYING = "replaying"
+RESOLVED = "resolved"
+
+
+def _serialize(row: HookDeadLetterItem) -> Dict[str, Any]:
+    return {
+        "id": str(row.id),
+        "hook_name": row.hook_name,
+        "source_id": row.source_id,
+        "item_data": row.item_data,
+        "error": row.error,
+        "attempts": row.attempts,
+        "status": row.status,
+        "first_failed_at": row.first_failed_at.isoformat() if row.first_failed_at else None,
+        "last_failed_at": row.last_failed_at.isoformat() if row.last_failed_at else None,
+        "replayed_at": row.replayed_at.isoformat() if row.replayed_at else None,
+        "replay_task_id": row.replay_task_id,
+    }
+
+
+class DeadLetterStore:
+    """Reads and writes dead-lettered hook items."""
+
+    async def add(self, hook_name: str, source_id: str, item_data: Dict[str, Any], error: str, attempts: int) -> None:
+        """Dead-letter an item, or refresh the entry if it failed before."""
+        now = datetime.now(timezone.utc)
+        # Raw items may hold datetimes and other values JSONB cannot store
+        item_data = json.loads(json.dumps(item_data, default=str))
+
+        async with db_manager.get_session() as session:
+            result = await session.execute(
+                select(HookDeadLetterItem).where(and_(
+                    HookDeadLetterItem.hook_name == hook_name,
+                    HookDeadLetterItem.source_id == source_id,
+                ))
+            )
+            row = result.scalar_one_or_none()
+            if row is None:
+                row = HookDeadLetterItem(hook_name=hook_name, source_id=source_id, first_failed_at=now, attempts=0)
+                session.add(row)
+            row.item_data = item_data
+            row.error = error
+            row.attempts = (row.attempts or 0) + attempts
+            row.status = DEAD
+            row.last_failed_at = now
+
+        logger.warning(
+            "Hook item moved to dead-letter store",
+            extra={"data": {"hook_name": hook_name, "source_id": source_id, "attempts": attempts, "error": error}}
+        )
+
+    async def list(self, hook_name: str, status: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        async with db_manager.get_session() as session:
+            stmt = select(HookDeadLetterItem).where(HookDeadLetterItem.hook_name == hook_name)
+            if status:
+                stmt = stmt.where(HookDeadLetterItem.status == status)
+            stmt = stmt.order_by(HookDeadLetterItem.last_failed_at.desc()).limit(limit)
+            result = await session.execute(stmt)
+            return [_serialize(row) for row in result.scalars().all()]
+
+    async def get(self, item_id: str) -> Optional[Dict[str, Any]]:
+        async with db_manager.get_session() as session:
+            row = await session.get(HookDeadLetterItem, UUID(item_id))
+            return _serialize(row) if row else None
+
+    async def mark_replaying(self, item_id: str, replay_task_id: str) -> None:
+        async with db_manager.get_session() as session:
+            row = await session.get(HookDeadLetterItem, UUID(item_id))
+            if row is not None:
+                row.status = REPLAYING
+                row.replayed_at = datetime.now(timezone.utc)
+                row.replay_task_id = replay_task_id
+
+    async def record_replay(self, item_id: str, success: bool, error: Optional[str] = None) -> None:
+        """Resolve an item after a successful replay, or return it to the store."""
+        async with db_manager.get_session() as session:
+            row = await session.get(HookDeadLetterItem, UUID(item_id))
+            if row is None:
+                return
+            if success:
+                row.status = RESOLVED
+            else:
+                row.status = DEAD
+                row.error = error
+                row.attempts = (row.attempts or 0) + 1
+                row.last_failed_at = datetime.now(timezone.utc)
+
+        logger.info(
+            "Dead-lettered hook item replayed",
+            extra={"data": {"dead_letter_id": item_id, "success": success, "error": error}}
+        )
+
+
+# Global instance
+dead_letter_store = DeadLetterStore()
@@ -0,0 +1,258 @@
+"""
+Bounded text extraction from email bodies.
+
+Raw email bodies can be megabytes of HTML and quoted history, while tasks,
+prompts and memory episodes only need the new message. These helpers keep
+the text small from the first step on:
+
+- body data is decoded only up to EMAIL_PART_MAX_BYTES per MIME part
+- HTML is converted to text incrementally and parsing stops once the text
+  budget is reached; scripts, styles and blockquotes that follow an
+  "On ... wrote:" reply header are skipped
+- quoted reply chains and signatures are cut from plain text
+
+- attachments are described by file name, type and size only
+
+Forwarded messages are content, not quoted history: a forwarded email is
+usually the work being handed over, so forward headers ("Forwarded
+message", "Begin forwarded message:", an Outlook header block with a
+"Subject: FW:" line) never start a cut.
+"""
+
+import base64
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+# HTML is fed to the parser in chunks of this many characters
+HTML_CHUNK_CHARS = 16 * 1024
+
+TRUNCATION_MARKER = "\n\n[... content truncated]"
+
+_BLOCK_TAGS = {
+    "address", "article", "aside", "div", "dl", "dt", "dd", "footer", "form", "h1", "h2", "h3",
+    "h4", "h5", "h6", "header", "hr", "li", "ol", "p", "pre", "section", "table", "tr", "ul",
+}
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+_SKIPPED_TAGS = {"head", "script", "style", "title"}
+
+_WROTE_HEADER_PATTERNS = [
+    re.compile(r"^On .+ wrote:$", re.IGNORECASE | re.DOTALL),
+    re.compile(r"^Am .+ schrieb .+:$", re.IGNORECASE | re.DOTALL),
+]
+_REPLY_HEADER_PATTERNS = _WROTE_HEADER_PATTERNS + [
+    re.compile(r"^-{2,}\s*(Original Message|Ursprüngliche Nachricht)\s*-{2,}$", re.IGNORECASE),
+]
+_FORWARD_HEADER = re.compile(r"^(-{2,}\s*Forwarded message\s*-{2,}|Begin forwarded message:)$", re.IGNORECASE)
+_OUTLOOK_SEPARATOR = re.compile(r"^_{10,}$")
+_OUTLOOK_HEADER = re.compile(r"^(From|Von):\s", re.IGNORECASE)
+_OUTLOOK_HEADER_FIELD = re.compile(r"^(Sent|Gesendet|Date|Datum):\s", re.IGNORECASE)
+_FORWARD_SUBJECT = re.compile(r"^(Subject|Betreff):\s*(FW|FWD|WG)\s*:", re.IGNORECASE)
+# Reply headers end in ":" and are short; only this much of the preceding text is checked
+_WROTE_TAIL_CHARS = 400
+_MOBILE_FOOTERS = re.compile(r"^(Sent from my \w+|Get Outlook for (iOS|Android)|Von meinem \w+ gesendet)", re.IGNORECASE)
+# A signature delimiter further up than this is taken to be part of the message
+SIGNATURE_MAX_LINES = 15
+
+
+def decode_body_data(data: str, max_bytes: int) -> bytes:
+    """Decode base64url body data, decoding no more than ``max_bytes`` bytes."""
+    chunk = data[:((max_bytes + 2) // 3) * 4]
+    chunk += "=" * (-len(chunk) % 4)
+    return base64.urlsafe_b64decode(chunk)[:max_bytes]
+
+
+def charset_of(part: Dict[str, Any]) -> str:
+    """Charset from a Gmail part's Content-Type header (default utf-8)."""
+    for header in part.get("headers", []):
+        if header.get("name", "").lower() == "content-type":
+            match = re.search(r'charset="?([\w-]+)"?', header.get("value", ""), re.IGNORECASE)
+            if match:
+                return match.group(1)
+    return "utf-8"
+
+
+def decode_text(raw: bytes, charset: str = "utf-8") -> str:
+    try:
+        return raw.decode(charset, errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
+
+def looks_like_html(text: str) -> bool:
+    head = text[:2048].lower()
+    return "<html" in head or "<body" in head or "<div" in head or "<p>" in head or "<br" in head
+
+
+def _follows_wrote_header(text: str) -> bool:
+    """Whether ``text`` ends in an "On ... wrote:" reply header."""
+    lines = [line.strip() for line in text[-_WROTE_TAIL_CHARS:].splitlines() if line.strip()]
+    candidates = lines[-1:] + [" ".join(lines[-2:])] if lines else []
+    return any(p.match(c) for p in _WROTE_HEADER_PATTERNS for c in candidates)
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collects the visible text of an HTML body, up to ``limit`` characters."""
+
+    def __init__(self, limit: int, skip_quotes: bool = True):
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.skip_quotes = skip_quotes
+        self.parts: List[str] = []
+        self.size = 0
+        self.full = False
+        self._skip_stack: List[str] = []
+
+    def _emit(self, text: str) -> None:
+        if self.full:
+            return
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.limit:
+            self.full = True
+
+    def handle_starttag(self, tag, attrs):
+        if self._skip_stack:
+            if tag not in _VOID_TAGS:
+                self._skip_stack.append(tag)
+            return
+        # Quoted history of a reply; a forwarded message's blockquote is kept
+        quoted = tag == "blockquote" and self.skip_quotes and _follows_wrote_header("".join(self.parts[-50:]))
+        if tag in _SKIPPED_TAGS or quoted:
+            self._skip_stack.append(tag)
+            return
+        if tag == "br" or tag in _BLOCK_TAGS:
+            self._emit("\n")
+        if tag == "li":
+            self._emit("- ")
+
+    def handle_endtag(self, tag):
+        if self._skip_stack:
+            # Tolerate unclosed tags inside the skipped element
+            if tag in self._skip_stack:
+                while self._skip_stack and self._skip_stack.pop() != tag:
+                    pass
+            return
+        if tag in _BLOCK_TAGS:
+            self._emit("\n")
+
+    def handle_data(self, data):
+        if self._skip_stack:
+            return
+        text = re.sub(r"\s+", " ", data)
+        if text.strip():
+            self._emit(text)
+
+    def text(self) -> str:
+        lines = [line.strip() for line in "".join(self.parts).splitlines()]
+        return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def html_to_text(html: str, limit: int, skip_quotes: bool = True) -> str:
+    """Visible text of an HTML body; parsing stops once ``limit`` characters are collected.
+
+    With ``skip_quotes`` blockquotes that follow a reply header are left out.
+    """
+    parser = _HTMLTextExtractor(limit, skip_quotes)
+    for start in range(0, len(html), HTML_CHUNK_CHARS):
+        parser.feed(html[start:start + HTML_CHUNK_CHARS])
+        if parser.full:
+            break
+    else:
+        parser.close()
+    return parser.text()
+
+
+def _is_reply_header(lines: List[str], i: int, in_forward: bool = False) -> bool:
+    line = lines[i].strip()
+    # "On <date>, <name> <address> wrote:" is often wrapped over two lines
+    candidates = [line]
+    if i + 1 < len(lines):
+        candidates.append(f"{line} {lines[i + 1].strip()}")
+    if any(p.match(c) for p in _REPLY_HEADER_PATTERNS for c in candidates):
+        return True
+    # Outlook plain-text header block: "From: ..." followed by "Sent: ...",
+    # possibly below a "____" separator; a forwarded one is content
+    if in_forward:
+        return False
+    start = i + 1 if _OUTLOOK_SEPARATOR.match(line) else i
+    if start < len(lines) and _OUTLOOK_HEADER.match(lines[start].strip()):
+        block = [following.strip() for following in lines[start + 1:start + 6]]
+        if any(_OUTLOOK_HEADER_FIELD.match(field) for field in block[:3]):
+            return not any(_FORWARD_SUBJECT.match(field) for field in block)
+    return False
+
+
+def _cut_quoted_text(text: str) -> str:
+    lines = text.splitlines()
+    kept = []
+    in_forward = False
+    for i, line in enumerate(lines):
+        if _is_reply_header(lines, i, in_forward):
+            break
+        if line.lstrip().startswith(">"):
+            continue
+        # The header block below a forward marker belongs to the forwarded message
+        in_forward = in_forward or bool(_FORWARD_HEADER.match(line.strip()))
+        kept.append(line)
+    return "\n".join(kept).strip()
+
+
+def strip_quoted_text(text: str) -> str:
+    """Drop quoted reply chains: everything from the first reply header, and "> " lines.
+
+    Forward headers are not reply headers, so forwarded content is kept.
+    """
+    # A message that is nothing but quoted text keeps it
+    return _cut_quoted_text(text) or text.strip()
+
+
+def strip_signature(text: str) -> str:
+    """Drop a trailing signature ("-- " delimiter) and mobile client footers."""
+    lines = text.splitlines()
+    for i in range(len(lines) - 1, max(len(lines) - SIGNATURE_MAX_LINES, 0) - 1, -1):
+        if lines[i].rstrip() == "--" or _MOBILE_FOOTERS.match(lines[i].strip()):
+            if "\n".join(lines[:i]).strip():
+                lines = lines[:i]
+    return "\n".join(lines).strip()
+
+
+def truncate_text(text: str, limit: int) -> str:
+    """Cut text to ``limit`` characters, at a word boundary where possible."""
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    boundary = cut.rfind(" ", max(limit - 200, 0))
+    return (cut[:boundary] if boundary > 0 else cut).rstrip() + TRUNCATION_MARKER
+
+
+def clean_body_text(text: str, limit: int, is_html: Optional[bool] = None) -> str:
+    """Bounded message text of a body: HTML to text, quotes and signature removed."""
+    if is_html is None:
+        is_html = looks_like_html(text)
+    body = html_to_text(text, limit) if is_html else text
+    cleaned = strip_signature(_cut_quoted_text(body))
+    if not cleaned:
+        # Nothing but quoted text: keep it rather than returning an empty body
+        cleaned = (html_to_text(text, limit, skip_quotes=False) if is_html else text).strip()
+    return truncate_text(cleaned, limit)
+
+
+def _format_size(size: Optional[int]) -> Optional[str]:
+    if not size:
+        return None
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def summarize_attachments(attachments: List[Dict[str, Any]]) -> str:
+    """One-line attachment summary, e.g. "report.pdf (application/pdf, 1.2 MB)"."""
+    entries = []
+    for attachment in attachments:
+        details = [d for d in (attachment.get("mime_type"), _format_size(attachment.get("size"))) if d]
+        name = attachment.get("filename") or "unnamed"
+        entries.append(f"{name} ({', '.join(details)})" if details else name)
+    return ", ".join(entries)
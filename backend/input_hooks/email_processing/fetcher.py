@@ -3,9 +3,13 @@ Email fetching and MCP communication for Nova.
 
 Handles all MCP tool interactions for email retrieval.
 """
+from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from config import settings
 from mcp_client import mcp_manager
+from ..datetime_utils import parse_datetime
+from ..health_cache import hook_health_cache
+from ..sync_cursor import SyncCursor, sync_cursor_store
 from utils.logging import get_logger
 from utils.phoenix_integration import disable_phoenix_tracing
 
@@ -34,8 +38,9 @@ class EmailFetcher:
                 logger.info("Email hook is disabled")
                 return []
 
-            # Test MCP connection health - return empty if tools unavailable
-            if not await self._health_check():
+            # Test MCP connection health - return empty if tools unavailable.
+            # A recent healthy result from the hook health checks stands in for the probe.
+            if not hook_health_cache.is_healthy(hook_config.name) and not await self._health_check():
                 logger.info(
                     "Email hook skipped - MCP tools not available",
                     extra={"data": {"hook_name": hook_config.name}}
@@ -55,24 +60,62 @@ class EmailFetcher:
                 }}
             )
             
+            # Resume from the hook's sync cursor (None when cursors are off or unavailable)
+            cursor = await self._load_cursor(hook_config.name)
+            token_param = await self._sync_token_parameter() if cursor else None
+            if cursor and cursor.full_sync_due:
+                cursor.reset()
+            if cursor and cursor.pending_ids:
+                await self._confirm_processed(cursor)
+            incremental = bool(cursor and cursor.token and token_param)
+
             # Call email list_emails interface via MCP
-            result = await self._call_email_tool("list_emails")
+            list_kwargs = {token_param: cursor.token} if incremental else {}
+            result = await self._call_email_tool("list_emails", **list_kwargs)
+            if incremental and self._is_error_response(result):
+                logger.info(
+                    "Email sync token rejected by provider, running full resync",
+                    extra={"data": {"hook_name": hook_config.name, "response": str(result)[:200]}}
+                )
+                cursor.reset()
+                incremental = False
+                result = await self._call_email_tool("list_emails")
             
-            if not result:
+            if result is None or (not result and not cursor) or self._is_error_response(result):
                 logger.info("No messages found or invalid response from email API")
                 return []
             
             # Handle different response formats from MCP tools
             messages = self._parse_message_list(result)
+            if incremental and cursor.pending_ids:
+                # A token listing does not repeat earlier changes; read unprocessed ones again by id
+                listed = {str(m.get("id")) for m in messages}
+                messages = messages + [{"id": i} for i in cursor.pending_ids if i not in listed]
+            unseen = cursor.unseen(messages) if cursor else messages
             
             logger.info(
                 "Fetched message list from email provider via hook system",
-                extra={"data": {"message_count": len(messages)}}
+                extra={"data": {
+                    "message_count": len(messages),
+                    "unseen_count": len(unseen),
+                    "incremental": incremental
+                }}
             )
             
+            # Limit reads based on hook configuration; the rest stay unseen for the next poll
+            max_emails = hook_config.hook_settings.max_per_fetch
+            to_read = unseen[:max_emails]
+            truncated = len(to_read) < len(unseen)
+            if truncated:
+                logger.info(
+                    "Limiting emails to configured max",
+                    extra={"data": {"hook_name": hook_config.name, "limit": max_emails, "found": len(unseen)}}
+                )
+            
             # Get full message details for new messages
             emails = []
-            for message_info in messages:
+            fetched_ids = []
+            for message_info in to_read:
                 try:
                     message_id = message_info.get("id")
                     if not message_id:
@@ -85,6 +128,8 @@ class EmailFetcher:
                     
                     if message_result:
                         emails.append(message_result)
+                        if not self._is_error_response(message_result):
+                            fetched_ids.append(str(message_id))
                         
                 except Exception as e:
                     logger.error(
@@ -97,14 +142,18 @@ class EmailFetcher:
                     )
                     continue
             
-            # Limit results based on hook configuration
-            max_emails = hook_config.hook_settings.max_per_fetch
-            if len(emails) > max_emails:
-                logger.info(
-                    "Limiting emails to configured max",
-                    extra={"data": {"hook_name": hook_config.name, "limit": max_emails, "found": len(emails)}}
+            if cursor:
+                # A truncated incremental page keeps the old token so skipped changes are listed again
+                next_token = None if truncated else self._extract_sync_token(result)
+                cursor.advance(
+                    fetched_ids,
+                    listed_ids=None if incremental else [str(m.get("id")) for m in messages],
+                    token=next_token,
+                    newest_at=self._newest_date(emails),
+                    # Without task creation nothing records the emails as processed
+                    processed=not hook_config.create_tasks
                 )
-                emails = emails[:max_emails]
+                await self._save_cursor(cursor)
             
             logger.info(
                 "Successfully fetched emails via hook system",
@@ -255,6 +304,70 @@ class EmailFetcher:
             )
             raise
     
+    async def _load_cursor(self, hook_name: str) -> Optional[SyncCursor]:
+        """Load the hook's sync cursor; None disables incremental sync for this poll."""
+        if not settings.HOOK_SYNC_CURSOR_ENABLED:
+            return None
+        try:
+            return await sync_cursor_store.load(hook_name)
+        except Exception as e:
+            logger.warning(
+                "Failed to load email sync cursor, listing without it",
+                extra={"data": {"hook_name": hook_name, "error": str(e)}}
+            )
+            return None
+    
+    async def _confirm_processed(self, cursor: SyncCursor) -> None:
+        """Mark pending ids that were processed since the last poll as seen."""
+        try:
+            processed = await sync_cursor_store.processed_ids(cursor.hook_name, "email", cursor.pending_ids)
+        except Exception as e:
+            logger.warning(
+                "Failed to check processed emails, reading pending ones again",
+                extra={"data": {"hook_name": cursor.hook_name, "pending": len(cursor.pending_ids), "error": str(e)}}
+            )
+            return
+        cursor.confirm(processed)
+    
+    async def _save_cursor(self, cursor: SyncCursor) -> None:
+        try:
+            await sync_cursor_store.save(cursor)
+        except Exception as e:
+            logger.warning(
+                "Failed to save email sync cursor",
+                extra={"data": {"hook_name": cursor.hook_name, "error": str(e)}}
+            )
+    
+    async def _sync_token_parameter(self) -> Optional[str]:
+        """Argument name under which the list tool accepts a sync token, if any."""
+        from .interface import EMAIL_SYNC_TOKEN_PARAMETERS
+        
+        tool = (await self._get_email_tools()).get("list_emails")
+        tool_args = getattr(tool, "args", None) or {}
+        return next((name for name in EMAIL_SYNC_TOKEN_PARAMETERS if name in tool_args), None)
+    
+    def _extract_sync_token(self, result: Any) -> Optional[str]:
+        """Next sync token returned alongside a message list, if any."""
+        from .interface import EMAIL_SYNC_TOKEN_RESPONSE_KEYS
+        
+        if not isinstance(result, dict):
+            return None
+        for key in EMAIL_SYNC_TOKEN_RESPONSE_KEYS:
+            if result.get(key):
+                return str(result[key])
+        return None
+    
+    def _is_error_response(self, result: Any) -> bool:
+        return isinstance(result, dict) and (result.get("status") == "error" or "error" in result)
+    
+    def _newest_date(self, emails: List[Dict[str, Any]]) -> Optional[datetime]:
+        dates = [
+            parse_datetime(email.get("date"), "email", fallback_to_now=False)
+            for email in emails if isinstance(email, dict) and email.get("date")
+        ]
+        dates = [d if d.tzinfo else d.replace(tzinfo=timezone.utc) for d in dates if d]
+        return max(dates) if dates else None
+    
     def _parse_message_list(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Parse message list from different MCP response formats."""
         if isinstance(result, list):
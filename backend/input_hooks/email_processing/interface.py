@@ -66,3 +66,9 @@ EMAIL_TOOL_PARAMETERS = {
     "outlook_mac-send_email": {},
     "outlook_mac-create_draft": {},
 }
+
+# Incremental sync (see input_hooks/sync_cursor.py)
+# Argument names under which a list_emails tool accepts the previous sync token
+EMAIL_SYNC_TOKEN_PARAMETERS = ["sync_token", "start_history_id", "history_id", "delta_link"]
+# Response keys under which a list_emails tool returns the next sync token
+EMAIL_SYNC_TOKEN_RESPONSE_KEYS = ["next_sync_token", "sync_token", "history_id", "historyId", "delta_link", "@odata.deltaLink"]
@@ -3,10 +3,16 @@ Email format normalization for Nova.
 
 Handles conversion of various email formats (Gmail API, simplified MCP, etc.) 
 to a unified internal format.
+
+Content is kept small from the start (see body_text.py): MIME parts are
+decoded only up to EMAIL_PART_MAX_BYTES, HTML is reduced to text, quoted
+replies and signatures are dropped, the result is capped at
+EMAIL_CONTENT_MAX_CHARS and attachments are described by metadata only.
 """
-import base64
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+from config import settings
 from utils.logging import get_logger
+from .body_text import charset_of, clean_body_text, decode_body_data, decode_text
 
 logger = get_logger(__name__)
 
@@ -23,7 +29,8 @@ class EmailNormalizer:
         - Simplified MCP format (direct fields)
         - Any other email provider formats
         
-        Returns a standardized email dict with: id, thread_id, subject, from, to, date, content, has_attachments, labels
+        Returns a standardized email dict with: id, thread_id, subject, from, to, date, content,
+        has_attachments, attachments (filename, mime_type, size), labels
         """
         # Detect format and extract accordingly
         if self._is_gmail_api_format(email_data):
@@ -56,9 +63,11 @@ class EmailNormalizer:
         normalized["to"] = headers.get("to", "")
         normalized["date"] = headers.get("date", "")
         
-        # Extract content and check attachments
-        normalized["content"] = self._extract_gmail_content(payload)
-        normalized["has_attachments"] = self._check_gmail_attachments(payload)
+        # Extract content and attachment metadata in one pass over the parts
+        plain_part, html_part, attachments = self._scan_gmail_parts(payload)
+        normalized["content"] = self._extract_gmail_content(plain_part, html_part)
+        normalized["attachments"] = attachments
+        normalized["has_attachments"] = bool(attachments)
         
         return normalized
     
@@ -97,47 +106,85 @@ class EmailNormalizer:
                 }
                 normalized[target_field] = defaults.get(target_field, "")
         
+        normalized["content"] = self._clean_simple_content(normalized["content"])
+
         # Simple formats rarely have attachments info
-        normalized["has_attachments"] = False
+        attachments = self._simple_attachments(email_data.get("attachments"))
+        normalized["attachments"] = attachments
+        normalized["has_attachments"] = bool(
+            attachments or email_data.get("has_attachments") or email_data.get("hasAttachments")
+        )
         
         return normalized
-    
-    def _extract_gmail_content(self, payload: Dict[str, Any]) -> str:
-        """Extract content from Gmail payload structure."""
-        # Try to get plain text first
-        content = self._extract_text_from_gmail_payload(payload, "text/plain")
-        
-        # If no plain text, try HTML
+
+    def _clean_simple_content(self, content: Any) -> str:
+        """Bounded text of a simple-format body (string, or Graph-style {contentType, content})."""
+        is_html = None
+        if isinstance(content, dict):
+            is_html = str(content.get("contentType", "")).lower() == "html"
+            content = content.get("content", "")
+        if not isinstance(content, str):
+            content = str(content or "")
         if not content:
-            content = self._extract_text_from_gmail_payload(payload, "text/html")
-        
-        # If still no content, return fallback
-        return content if content else "Content could not be extracted"
+            return ""
+        # Providers hand over whole bodies; only the budget is looked at
+        content = content[:settings.EMAIL_PART_MAX_BYTES]
+        return clean_body_text(content, settings.EMAIL_CONTENT_MAX_CHARS, is_html=is_html)
+
+    def _simple_attachments(self, attachments: Any) -> List[Dict[str, Any]]:
+        if not isinstance(attachments, list):
+            return []
+        summaries = []
+        for attachment in attachments:
+            if isinstance(attachment, dict):
+                summaries.append({
+                    "filename": attachment.get("filename") or attachment.get("name") or "",
+                    "mime_type": attachment.get("mimeType") or attachment.get("contentType") or attachment.get("mime_type") or "",
+                    "size": attachment.get("size"),
+                })
+            elif attachment:
+                summaries.append({"filename": str(attachment), "mime_type": "", "size": None})
+        return summaries
     
-    def _extract_text_from_gmail_payload(self, payload: Dict[str, Any], mime_type: str) -> str:
-        """Extract text from Gmail payload by MIME type."""
-        # Check if this payload matches the desired MIME type
-        if payload.get("mimeType") == mime_type:
-            if "body" in payload and "data" in payload["body"]:
-                try:
-                    decoded = base64.urlsafe_b64decode(payload["body"]["data"])
-                    return decoded.decode("utf-8")
-                except Exception:
-                    pass
-        
-        # Check parts recursively
-        if "parts" in payload:
-            for part in payload["parts"]:
-                text = self._extract_text_from_gmail_payload(part, mime_type)
-                if text:
-                    return text
+    def _scan_gmail_parts(
+        self, payload: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Find the first text/plain and text/html body parts and list attachments, without decoding."""
+        plain_part = html_part = None
+        attachments = []
+        stack = [payload]
+        while stack:
+            part = stack.pop()
+            filename = (part.get("filename") or "").strip()
+            mime_type = part.get("mimeType", "")
+            if filename:
+                attachments.append({
+                    "filename": filename,
+                    "mime_type": mime_type,
+                    "size": part.get("body", {}).get("size"),
+                })
+            elif mime_type == "text/plain" and plain_part is None and part.get("body", {}).get("data"):
+                plain_part = part
+            elif mime_type == "text/html" and html_part is None and part.get("body", {}).get("data"):
+                html_part = part
+            # Depth-first in document order
+            stack.extend(reversed(part.get("parts", [])))
+        return plain_part, html_part, attachments
+
+    def _extract_gmail_content(
+        self, plain_part: Optional[Dict[str, Any]], html_part: Optional[Dict[str, Any]]
+    ) -> str:
+        """Extract bounded content, preferring plain text over HTML."""
+        for part, is_html in ((plain_part, False), (html_part, True)):
+            if part is None:
+                continue
+            try:
+                raw = decode_body_data(part["body"]["data"], settings.EMAIL_PART_MAX_BYTES)
+            except Exception:
+                continue
+            content = clean_body_text(decode_text(raw, charset_of(part)), settings.EMAIL_CONTENT_MAX_CHARS, is_html=is_html)
+            if content:
+                return content
         
-        return ""
-    
-    def _check_gmail_attachments(self, payload: Dict[str, Any]) -> bool:
-        """Check if Gmail payload has attachments."""
-        if "parts" in payload:
-            for part in payload["parts"]:
-                if part.get("filename") and part["filename"].strip():
-                    return True
-        return False
\ No newline at end of file
+        # If still no content, return fallback
+        return "Content could not be extracted"
@@ -15,6 +15,7 @@ from .normalizer import EmailNormalizer
 from .fetcher import EmailFetcher
 from .task_creator import EmailTaskCreator
 from .thread_consolidator import EmailThreadConsolidator
+from .thread_aggregate import ThreadAggregate
 
 logger = get_logger(__name__)
 
@@ -186,10 +187,14 @@ class EmailProcessor:
         Process email with thread-based consolidation.
 
         Handles different scenarios based on existing task state:
-        - No task: Create new task with stabilization window
+        - No task: Create new task, held until its stabilization window ends
         - NEW/USER_INPUT_RECEIVED: Supersede with consolidated version
         - DONE/FAILED: Create continuation task with summary
         - IN_PROGRESS: Skip (will be handled on next poll)
+        - WAITING (held) and others: Append email and extend the window
+
+        Every handled email is first added to the thread's stored aggregate,
+        from which thread tasks are rendered, so prior emails are never reloaded.
 
         Args:
             normalized_email: Email data in normalized format
@@ -212,10 +217,14 @@ class EmailProcessor:
 
         if existing_task is None:
             # No existing task - create new thread task
+            aggregate = await self.thread_consolidator.record_thread_message(
+                thread_id, normalized_email, subject
+            )
             task_id = await self.thread_consolidator.create_thread_task(
                 thread_id=thread_id,
                 emails=[normalized_email],
-                subject=subject
+                subject=subject,
+                aggregate=aggregate
             )
 
             if task_id:
@@ -235,14 +244,16 @@ class EmailProcessor:
             )
             return False
 
+        aggregate = await self.thread_consolidator.record_thread_message(
+            thread_id, normalized_email, subject, existing_task=existing_task
+        )
+
         if task_status in [TaskStatus.NEW, TaskStatus.USER_INPUT_RECEIVED]:
             # Nova hasn't processed yet - supersede with consolidated version
-            all_thread_emails = await self._get_all_thread_emails(thread_id, normalized_email)
-
             new_task_id = await self.thread_consolidator.supersede_unprocessed_task(
                 existing_task=existing_task,
                 new_emails=[normalized_email],
-                all_thread_emails=all_thread_emails
+                aggregate=aggregate
             )
 
             if new_task_id:
@@ -264,50 +275,54 @@ class EmailProcessor:
                 return True
             return False
 
-        # NEEDS_REVIEW or other status - reset stabilization and add to thread
+        # Held (WAITING) - restart the stabilization window; parked WAITING and
+        # NEEDS_REVIEW tasks only get the email added
         await self.thread_consolidator.reset_stabilization_window(existing_task)
         metadata = await self.task_creator._create_metadata(normalized_email)
         await self._mark_email_processed(email_id, metadata, str(existing_task.id))
 
         # Update existing task with new email count
-        await self._append_email_to_task(existing_task, normalized_email)
+        await self._append_email_to_task(existing_task, normalized_email, aggregate)
         return True
 
-    async def _get_all_thread_emails(
+    async def _append_email_to_task(
         self,
-        thread_id: str,
-        new_email: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """
-        Get all emails in a thread, including the new one.
-
-        Args:
-            thread_id: Email thread ID
-            new_email: The newly arrived email
-
-        Returns:
-            List of all email dictionaries in the thread
+        task: Task,
+        email: Dict[str, Any],
+        aggregate: Optional[ThreadAggregate] = None
+    ) -> None:
         """
-        # Get previously processed emails from database
-        existing_emails = await self.thread_consolidator.get_thread_emails_from_processed_items(thread_id)
-
-        # Add the new email
-        all_emails = existing_emails + [new_email]
+        Add a new email to an existing thread task.
 
-        return all_emails
-
-    async def _append_email_to_task(self, task: Task, email: Dict[str, Any]) -> None:
-        """
-        Append a new email to an existing thread task's description.
+        Thread tasks are re-rendered from the thread aggregate, which keeps
+        their description bounded. Continuation tasks (and calls without an
+        aggregate) only hold the messages since the previous task, so the
+        email is appended to their description.
 
         Args:
             task: Existing task to update
-            email: New email to append
+            email: New email to add
+            aggregate: Thread aggregate, already including the new email
         """
         from tools.task_tools import update_task_tool
 
-        # Get current email count
         metadata = task.task_metadata or {}
+        if aggregate is not None and not metadata.get('previous_task_id'):
+            subject = task.title.replace("Email Thread: ", "").split(" (")[0]
+            email_count = aggregate.message_count
+            await update_task_tool(
+                task_id=str(task.id),
+                title=aggregate.render_title(subject),
+                description=aggregate.render_description()
+            )
+            await self.thread_consolidator._update_task_metadata(
+                task_id=str(task.id),
+                metadata={"email_count": email_count, "email_ids": aggregate.email_ids},
+                merge=True
+            )
+            return
+
+        # Get current email count
         email_count = metadata.get('email_count', 1) + 1
 
         # Update title with new count
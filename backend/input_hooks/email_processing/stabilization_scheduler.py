@@ -0,0 +1,145 @@
+"""
+Delayed activation of email thread tasks (ADR-019 stabilization windows).
+
+A thread task is created while its thread may still be receiving replies,
+so it is held in WAITING until its stabilization window ends. Release times
+live in a Redis sorted set scored by window end:
+
+- holding or extending a window is a single ZADD, however many tasks wait
+- the release_stabilized_thread_tasks beat task reads the due members and
+  claims each with ZREM, so every task is released exactly once (back to NEW)
+- reconcile() re-registers held tasks missing from the set (Redis flush,
+  crash between claim and release) from their task metadata
+
+The core agent therefore only ever sees thread tasks whose window is over.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, select
+from sqlalchemy.orm.attributes import flag_modified
+
+from database.database import db_manager
+from models.models import Task, TaskStatus
+from utils.logging import get_logger
+from utils.redis_manager import get_sync_redis
+
+logger = get_logger(__name__)
+
+# Sorted set of held thread task ids, scored by window end (epoch seconds)
+STABILIZATION_SCHEDULE_KEY = "thread:stabilization:schedule"
+
+
+def _parse_window_end(value: Optional[str]) -> Optional[datetime]:
+    """Parse a thread_stabilization_ends_at value ("...Z", naive UTC) to naive UTC."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+    except (ValueError, TypeError):
+        return None
+
+
+def _score(ends_at: datetime) -> float:
+    # Windows are naive UTC throughout the consolidator
+    return (ends_at - datetime(1970, 1, 1)).total_seconds()
+
+
+class StabilizationScheduler:
+    """Holds thread tasks until their stabilization window ends."""
+
+    def schedule(self, task_id: str, ends_at: datetime) -> bool:
+        """Register or move a task's release time; False if Redis is unavailable."""
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return False
+        try:
+            redis_client.zadd(STABILIZATION_SCHEDULE_KEY, {task_id: _score(ends_at)})
+            return True
+        except Exception as e:
+            logger.warning(
+                "Failed to schedule thread task release",
+                extra={"data": {"task_id": task_id, "error": str(e)}}
+            )
+            return False
+
+    async def release_due(self, now: Optional[datetime] = None) -> List[str]:
+        """Release every held task whose window has ended; returns released ids."""
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return []
+        now = now or datetime.utcnow()
+        released = []
+        for task_id in redis_client.zrangebyscore(STABILIZATION_SCHEDULE_KEY, "-inf", _score(now)):
+            # Only the caller whose ZREM removes the member releases the task
+            if not redis_client.zrem(STABILIZATION_SCHEDULE_KEY, task_id):
+                continue
+            try:
+                if await self._activate(task_id):
+                    released.append(task_id)
+            except Exception as e:
+                # Put it back so the next tick retries the release
+                redis_client.zadd(STABILIZATION_SCHEDULE_KEY, {task_id: _score(now)})
+                logger.error(
+                    "Failed to release thread task",
+                    extra={"data": {"task_id": task_id, "error": str(e)}}
+                )
+
+        if released:
+            logger.info(
+                "Released stabilized thread tasks",
+                extra={"data": {"count": len(released), "task_ids": released}}
+            )
+        return released
+
+    async def reconcile(self) -> int:
+        """Re-register held thread tasks missing from the schedule."""
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return 0
+
+        async with db_manager.get_session() as session:
+            result = await session.execute(
+                select(Task).where(and_(
+                    Task.status.in_([TaskStatus.WAITING, TaskStatus.NEW]),
+                    Task.task_metadata['is_thread_stabilizing'].astext == 'true',
+                ))
+            )
+            tasks = result.scalars().all()
+
+            restored = 0
+            for task in tasks:
+                # Tasks stamped before delayed activation existed are still NEW
+                if task.status == TaskStatus.NEW:
+                    task.status = TaskStatus.WAITING
+                ends_at = _parse_window_end((task.task_metadata or {}).get('thread_stabilization_ends_at'))
+                score = _score(ends_at or datetime.utcnow())
+                if redis_client.zadd(STABILIZATION_SCHEDULE_KEY, {str(task.id): score}, nx=True):
+                    restored += 1
+
+        if restored:
+            logger.info("Restored thread task releases", extra={"data": {"count": restored}})
+        return restored
+
+    async def _activate(self, task_id: str) -> bool:
+        """Move a held task to NEW and clear its stabilization metadata."""
+        async with db_manager.get_session() as session:
+            task = await session.get(Task, UUID(task_id))
+            if task is None or task.status != TaskStatus.WAITING:
+                # Deleted, or moved on by a user in the meantime
+                return False
+            metadata = dict(task.task_metadata or {})
+            if not metadata.get('is_thread_stabilizing'):
+                return False
+            metadata.update({"is_thread_stabilizing": False, "thread_stabilization_ends_at": None})
+            task.task_metadata = metadata
+            flag_modified(task, 'task_metadata')
+            task.status = TaskStatus.NEW
+            task.updated_at = datetime.utcnow()
+            return True
+
+
+# Global instance
+stabilization_scheduler = StabilizationScheduler()
@@ -10,6 +10,7 @@ from models.email import EmailMetadata
 from tools.task_tools import create_task_tool
 from utils.logging import get_logger
 from ..datetime_utils import parse_datetime
+from .body_text import summarize_attachments
 
 logger = get_logger(__name__)
 
@@ -150,7 +151,10 @@ class EmailTaskCreator:
                 # If they're the same, the agent should use the Email ID field
                 description_parts.append(f"**Gmail Message ID:** {original_gmail_id}\n")
         
-        if metadata.has_attachments:
+        attachments = (normalized_email or {}).get("attachments")
+        if attachments:
+            description_parts.append(f"**Attachments:** {summarize_attachments(attachments)}\n")
+        elif metadata.has_attachments:
             description_parts.append("**Attachments:** Yes\n")
         
         description_parts.extend([
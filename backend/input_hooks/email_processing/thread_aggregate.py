@@ -0,0 +1,238 @@
+"""
+Incremental email thread aggregates (ADR-019 thread tasks).
+
+Thread tasks used to be rebuilt from the whole thread whenever a message
+arrived: every prior email was reloaded from ProcessedItem and the full
+description was assembled and rewritten again. A thread now has one
+email_thread_aggregates row that each new message updates in place:
+
+- message count, participants and first/last dates are maintained as
+  messages arrive
+- the newest EMAIL_THREAD_RECENT_MESSAGES messages are kept in full
+- older messages are folded into a one-line digest of at most
+  EMAIL_THREAD_DIGEST_ENTRIES entries; anything older is only counted
+
+Thread task titles and descriptions are rendered from the aggregate, so
+their size is bounded however long the thread grows.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+
+from config import settings
+from database.database import db_manager
+from models.models import EmailThreadAggregate
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Length of the content excerpt in a digest entry
+DIGEST_EXCERPT_CHARS = 160
+
+
+def _addresses(value: Any) -> List[str]:
+    """Split a from/to header value (string or list) into addresses."""
+    if not value:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [part.strip() for part in str(value).split(",") if part.strip()]
+
+
+def _digest_entry(message: Dict[str, Any]) -> str:
+    """One-line summary of a message that is no longer rendered in full."""
+    excerpt = re.sub(r"\s+", " ", message.get("content") or "").strip()
+    if len(excerpt) > DIGEST_EXCERPT_CHARS:
+        excerpt = excerpt[:DIGEST_EXCERPT_CHARS].rstrip() + "..."
+    return f"- Message {message.get('number')} ({message.get('date', '')}) from {message.get('from', 'Unknown')}: {excerpt}"
+
+
+@dataclass
+class ThreadAggregate:
+    """Running view of an email thread."""
+    thread_id: str
+    subject: Optional[str] = None
+    message_count: int = 0
+    participants: List[str] = field(default_factory=list)
+    recent_messages: List[Dict[str, Any]] = field(default_factory=list)
+    digest: List[str] = field(default_factory=list)
+    first_message_date: Optional[str] = None
+    last_message_date: Optional[str] = None
+
+    @classmethod
+    def from_emails(cls, thread_id: str, subject: str, emails: List[Dict[str, Any]]) -> "ThreadAggregate":
+        """Build an aggregate from a list of emails (oldest first once sorted)."""
+        aggregate = cls(thread_id=thread_id, subject=subject)
+        for email in sorted(emails, key=lambda e: e.get('date', '')):
+            aggregate.add_message(email)
+        return aggregate
+
+    @property
+    def email_ids(self) -> List[str]:
+        """Ids of the messages rendered in full."""
+        return [m["id"] for m in self.recent_messages if m.get("id")]
+
+    def add_message(
+        self,
+        email: Dict[str, Any],
+        recent_limit: Optional[int] = None,
+        digest_limit: Optional[int] = None
+    ) -> bool:
+        """
+        Fold a message into the aggregate.
+
+        Returns:
+            False if the message was already recorded, True otherwise
+        """
+        if recent_limit is None:
+            recent_limit = settings.EMAIL_THREAD_RECENT_MESSAGES
+        if digest_limit is None:
+            digest_limit = settings.EMAIL_THREAD_DIGEST_ENTRIES
+
+        email_id = email.get('id')
+        if email_id and email_id in self.email_ids:
+            return False
+
+        self.message_count += 1
+        if not self.subject:
+            self.subject = email.get('subject')
+
+        known = {p.lower() for p in self.participants}
+        for address in _addresses(email.get('from')) + _addresses(email.get('to')):
+            if address.lower() not in known:
+                known.add(address.lower())
+                self.participants.append(address)
+
+        date = email.get('date') or ''
+        if date:
+            if not self.first_message_date or date < self.first_message_date:
+                self.first_message_date = date
+            if not self.last_message_date or date > self.last_message_date:
+                self.last_message_date = date
+
+        self.recent_messages.append({
+            "id": email_id,
+            "number": self.message_count,
+            "from": email.get('from', 'Unknown'),
+            "to": email.get('to', ''),
+            "date": date,
+            "content": email.get('content', ''),
+        })
+        while len(self.recent_messages) > max(recent_limit, 1):
+            self.digest.append(_digest_entry(self.recent_messages.pop(0)))
+        if len(self.digest) > digest_limit:
+            self.digest = self.digest[len(self.digest) - digest_limit:] if digest_limit > 0 else []
+        return True
+
+    def render_title(self, subject: Optional[str] = None) -> str:
+        count = self.message_count
+        return f"Email Thread: {subject or self.subject or 'No Subject'} ({count} message{'s' if count != 1 else ''})"
+
+    def render_description(self) -> str:
+        """Task description: thread header, digest of older messages, newest messages in full."""
+        parts = [
+            f"**Thread ID:** {self.thread_id}",
+            f"**Messages:** {self.message_count}",
+        ]
+        if self.participants:
+            parts.append(f"**Participants:** {', '.join(self.participants)}")
+        if self.first_message_date and self.last_message_date and self.first_message_date != self.last_message_date:
+            parts.append(f"**Period:** {self.first_message_date} - {self.last_message_date}")
+        parts.extend(["", "---", ""])
+
+        older = self.message_count - len(self.recent_messages)
+        if older > 0:
+            parts.extend(["## Earlier Messages", ""])
+            unlisted = older - len(self.digest)
+            if unlisted > 0:
+                parts.append(f"{unlisted} earlier message{'s' if unlisted != 1 else ''} not listed.")
+            parts.extend(self.digest)
+            parts.extend(["", "---", ""])
+
+        for message in self.recent_messages:
+            parts.extend([
+                f"### Message {message.get('number')}",
+                f"**From:** {message.get('from', 'Unknown')}",
+                f"**To:** {message.get('to', '')}",
+                f"**Date:** {message.get('date', '')}",
+                "",
+                message.get('content', ''),
+                "",
+                "---",
+                ""
+            ])
+        return "\n".join(parts)
+
+
+def _from_row(row: EmailThreadAggregate) -> ThreadAggregate:
+    return ThreadAggregate(
+        thread_id=row.thread_id,
+        subject=row.subject,
+        message_count=row.message_count or 0,
+        participants=list(row.participants or []),
+        recent_messages=list(row.recent_messages or []),
+        digest=list(row.digest or []),
+        first_message_date=row.first_message_date,
+        last_message_date=row.last_message_date,
+    )
+
+
+class ThreadAggregateStore:
+    """Reads and updates thread aggregates."""
+
+    async def get(self, thread_id: str) -> Optional[ThreadAggregate]:
+        async with db_manager.get_session() as session:
+            row = await session.get(EmailThreadAggregate, thread_id)
+            return _from_row(row) if row else None
+
+    async def append(
+        self,
+        thread_id: str,
+        email: Dict[str, Any],
+        subject: Optional[str] = None,
+        prior_count: int = 0
+    ) -> ThreadAggregate:
+        """
+        Record a new message on a thread and return the updated aggregate.
+
+        Args:
+            thread_id: Email thread ID
+            email: Normalized email
+            subject: Thread subject, used when the aggregate is created
+            prior_count: Messages the thread already had before it got an
+                aggregate (threads started before aggregates existed); they
+                are counted but not listed
+        """
+        async with db_manager.get_session() as session:
+            result = await session.execute(
+                select(EmailThreadAggregate)
+                .where(EmailThreadAggregate.thread_id == thread_id)
+                .with_for_update()
+            )
+            row = result.scalar_one_or_none()
+            if row is None:
+                row = EmailThreadAggregate(thread_id=thread_id, subject=subject, message_count=prior_count)
+                session.add(row)
+
+            aggregate = _from_row(row)
+            if aggregate.add_message(email):
+                row.subject = aggregate.subject
+                row.message_count = aggregate.message_count
+                row.participants = aggregate.participants
+                row.recent_messages = aggregate.recent_messages
+                row.digest = aggregate.digest
+                row.first_message_date = aggregate.first_message_date
+                row.last_message_date = aggregate.last_message_date
+
+        logger.debug(
+            "Updated email thread aggregate",
+            extra={"data": {"thread_id": thread_id, "message_count": aggregate.message_count}}
+        )
+        return aggregate
+
+
+# Global instance
+thread_aggregate_store = ThreadAggregateStore()
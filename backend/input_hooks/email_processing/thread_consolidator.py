@@ -16,9 +16,11 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import flag_modified
 
 from database.database import db_manager
-from models.models import Task, TaskStatus, ProcessedItem
+from models.models import Task, TaskStatus
 from tools.task_tools import create_task_tool, update_task_tool
 from utils.logging import get_logger
+from .stabilization_scheduler import stabilization_scheduler
+from .thread_aggregate import ThreadAggregate, thread_aggregate_store
 
 logger = get_logger(__name__)
 
@@ -140,7 +142,8 @@ class EmailThreadConsolidator:
         self,
         thread_id: str,
         emails: List[Dict[str, Any]],
-        subject: str
+        subject: str,
+        aggregate: Optional[ThreadAggregate] = None
     ) -> Optional[str]:
         """
         Create a new task for an email thread with stabilization window.
@@ -149,44 +152,19 @@ class EmailThreadConsolidator:
             thread_id: Email thread ID
             emails: List of normalized emails in the thread
             subject: Thread subject line
+            aggregate: Stored thread aggregate; when given, the task is
+                rendered from it and ``emails`` is not used
 
         Returns:
             Created task ID if successful, None otherwise
         """
-        # Sort emails by date
-        sorted_emails = sorted(
-            emails,
-            key=lambda e: e.get('date', ''),
-            reverse=False  # Oldest first
-        )
-
-        # Build consolidated task description
-        email_count = len(sorted_emails)
-        task_title = f"Email Thread: {subject} ({email_count} message{'s' if email_count > 1 else ''})"
-
-        description_parts = [
-            f"**Thread ID:** {thread_id}",
-            f"**Messages:** {email_count}",
-            "",
-            "---",
-            ""
-        ]
-
-        # Add each email to description
-        for i, email in enumerate(sorted_emails, 1):
-            description_parts.extend([
-                f"### Message {i}",
-                f"**From:** {email.get('from', 'Unknown')}",
-                f"**To:** {email.get('to', '')}",
-                f"**Date:** {email.get('date', '')}",
-                "",
-                email.get('content', ''),
-                "",
-                "---",
-                ""
-            ])
+        if aggregate is None:
+            aggregate = ThreadAggregate.from_emails(thread_id, subject, emails)
 
-        task_description = "\n".join(description_parts)
+        # Bounded rendering: newest messages in full, older ones as a digest
+        email_count = aggregate.message_count
+        task_title = aggregate.render_title(subject)
+        task_description = aggregate.render_description()
 
         # Calculate stabilization end time
         stabilization_ends = datetime.utcnow() + timedelta(minutes=self.stabilization_minutes)
@@ -204,6 +182,7 @@ class EmailThreadConsolidator:
 
             if task_id:
                 # Update task metadata with thread consolidation fields
+                # Hold the task until the thread settles
                 await self._update_task_metadata(
                     task_id=task_id,
                     metadata={
@@ -211,9 +190,11 @@ class EmailThreadConsolidator:
                         "email_count": email_count,
                         "is_thread_stabilizing": True,
                         "thread_stabilization_ends_at": stabilization_ends.isoformat() + "Z",
-                        "email_ids": [e.get('id') for e in sorted_emails]
-                    }
+                        "email_ids": aggregate.email_ids
+                    },
+                    status=TaskStatus.WAITING
                 )
+                stabilization_scheduler.schedule(task_id, stabilization_ends)
 
                 logger.info(
                     "Created thread task with stabilization",
@@ -238,7 +219,8 @@ class EmailThreadConsolidator:
         self,
         existing_task: Task,
         new_emails: List[Dict[str, Any]],
-        all_thread_emails: List[Dict[str, Any]]
+        all_thread_emails: Optional[List[Dict[str, Any]]] = None,
+        aggregate: Optional[ThreadAggregate] = None
     ) -> Optional[str]:
         """
         Supersede an unprocessed task with a new consolidated version.
@@ -250,7 +232,9 @@ class EmailThreadConsolidator:
         Args:
             existing_task: The current task for this thread (NEW or USER_INPUT_RECEIVED)
             new_emails: Newly arrived emails to add
-            all_thread_emails: All emails in the thread (including new ones)
+            all_thread_emails: All emails in the thread (including new ones),
+                used when no aggregate is given
+            aggregate: Stored thread aggregate, already including the new emails
 
         Returns:
             New task ID if successful, None otherwise
@@ -266,8 +250,9 @@ class EmailThreadConsolidator:
         # Create new consolidated task
         new_task_id = await self.create_thread_task(
             thread_id=thread_id,
-            emails=all_thread_emails,
-            subject=subject
+            emails=all_thread_emails or new_emails,
+            subject=subject,
+            aggregate=aggregate
         )
 
         if new_task_id:
@@ -293,7 +278,7 @@ class EmailThreadConsolidator:
                     "old_task_id": str(existing_task.id),
                     "new_task_id": new_task_id,
                     "thread_id": thread_id,
-                    "total_emails": len(all_thread_emails)
+                    "total_emails": aggregate.message_count if aggregate else len(all_thread_emails or new_emails)
                 }}
             )
 
@@ -388,8 +373,10 @@ class EmailThreadConsolidator:
                         "previous_task_id": str(completed_task.id),
                         "previous_task_summary": previous_summary,
                         "email_ids": [e.get('id') for e in sorted_emails]
-                    }
+                    },
+                    status=TaskStatus.WAITING
                 )
+                stabilization_scheduler.schedule(task_id, stabilization_ends)
 
                 logger.info(
                     "Created continuation task",
@@ -414,13 +401,23 @@ class EmailThreadConsolidator:
         """
         Reset the stabilization window for a task.
 
-        Called when new emails arrive in an already-stabilizing thread.
+        Called when new emails arrive in an already-stabilizing thread. A
+        held task's release moves to the new window end. Tasks that are not
+        held (parked WAITING, NEEDS_REVIEW) are left as they are: a new email
+        does not re-activate them, it is only added to the task.
 
         Args:
             task: Task to reset stabilization for
         """
-        new_stabilization_ends = datetime.utcnow() + timedelta(minutes=self.stabilization_minutes)
+        is_held = task.status == TaskStatus.WAITING and (task.task_metadata or {}).get('is_thread_stabilizing')
+        if not is_held:
+            logger.info(
+                "Task not held for stabilization, window not reset",
+                extra={"data": {"task_id": str(task.id), "status": str(task.status)}}
+            )
+            return
 
+        new_stabilization_ends = datetime.utcnow() + timedelta(minutes=self.stabilization_minutes)
         await self._update_task_metadata(
             task_id=str(task.id),
             metadata={
@@ -429,6 +426,7 @@ class EmailThreadConsolidator:
             },
             merge=True
         )
+        stabilization_scheduler.schedule(str(task.id), new_stabilization_ends)
 
         logger.info(
             "Reset stabilization window",
@@ -459,36 +457,37 @@ class EmailThreadConsolidator:
             extra={"data": {"task_id": task_id}}
         )
 
-    async def get_thread_emails_from_processed_items(self, thread_id: str) -> List[Dict[str, Any]]:
+    async def record_thread_message(
+        self,
+        thread_id: str,
+        email: Dict[str, Any],
+        subject: str,
+        existing_task: Optional[Task] = None
+    ) -> ThreadAggregate:
         """
-        Retrieve all processed emails for a thread from the database.
+        Add a newly arrived email to the thread's stored aggregate.
 
         Args:
             thread_id: Email thread ID
+            email: The newly arrived email
+            subject: Thread subject line
+            existing_task: Current task for the thread; its email count seeds
+                the aggregate of threads that predate aggregates
 
         Returns:
-            List of email metadata dictionaries
+            The updated thread aggregate
         """
-        async with db_manager.get_session() as session:
-            result = await session.execute(
-                select(ProcessedItem)
-                .where(
-                    and_(
-                        ProcessedItem.source_type == "email",
-                        ProcessedItem.source_metadata['thread_id'].astext == thread_id
-                    )
-                )
-                .order_by(ProcessedItem.processed_at.asc())
-            )
-
-            items = result.scalars().all()
-            return [item.source_metadata for item in items]
+        prior_count = 0
+        if existing_task is not None:
+            prior_count = (existing_task.task_metadata or {}).get('email_count', 0)
+        return await thread_aggregate_store.append(thread_id, email, subject=subject, prior_count=prior_count)
 
     async def _update_task_metadata(
         self,
         task_id: str,
         metadata: Dict[str, Any],
-        merge: bool = False
+        merge: bool = False,
+        status: Optional[TaskStatus] = None
     ) -> None:
         """
         Update task metadata in the database.
@@ -497,6 +496,7 @@ class EmailThreadConsolidator:
             task_id: Task ID to update
             metadata: Metadata dictionary to set/merge
             merge: If True, merge with existing metadata; if False, replace
+            status: New task status, set in the same transaction
         """
         async with db_manager.get_session() as session:
             result = await session.execute(
@@ -512,6 +512,8 @@ class EmailThreadConsolidator:
                     updated_metadata = metadata
 
                 task.task_metadata = updated_metadata
+                if status is not None:
+                    task.status = status
                 task.updated_at = datetime.utcnow()
                 await session.commit()
 
@@ -280,14 +280,15 @@ class GmailInputHook(BaseInputHook):
             self._ensure_email_components()
             
             # Perform basic health check via existing email fetcher
-            await self._email_fetcher._health_check()
+            mcp_healthy = await self._email_fetcher._health_check()
             
             # Get base health info
             health = await super().health_check()
             
             # Add email-specific health info
             health.update({
-                "mcp_tools_available": True,  # If health_check passed
+                "healthy": health.get("healthy", True) and mcp_healthy,
+                "mcp_tools_available": mcp_healthy,
                 "email_processor_ready": self._email_processor is not None,
                 "hook_type": "gmail"
             })
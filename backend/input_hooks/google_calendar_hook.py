@@ -6,7 +6,7 @@ Creates private preparation meetings instead of Nova tasks to keep the task list
 Uses Google Calendar API via MCP integration.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from utils.logging import get_logger
@@ -164,12 +164,13 @@ class GoogleCalendarInputHook(BaseInputHook):
         """
         return False
     
-    async def process_items(self) -> "ProcessingResult":
+    async def process_items(self, run_id: Optional[str] = None) -> "ProcessingResult":
         """
         Override the base processing to handle calendar-specific flow.
         
         Calendar hook processes meetings directly rather than following
-        the standard fetch -> normalize -> create tasks flow.
+        the standard fetch -> normalize -> create tasks flow, and keeps no
+        run checkpoint.
         
         Returns:
             ProcessingResult with calendar-specific statistics
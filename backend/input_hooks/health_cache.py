@@ -0,0 +1,70 @@
+"""
+Cached hook health results.
+
+Hook health checks call upstream MCP tools, so results are kept in Redis for
+HOOK_HEALTH_CACHE_TTL_SECONDS and shared by the API, beat and workers. The
+health_check_all_hooks beat task refreshes them in the background, the hooks
+health endpoint serves them, and email fetches skip their own probe while a
+recent result says the hook is healthy.
+"""
+
+import json
+import time
+from typing import Any, Dict, Optional
+
+from config import settings
+from utils.logging import get_logger
+from utils.redis_manager import get_sync_redis
+
+logger = get_logger(__name__)
+
+# Redis key for a hook's latest health check result
+HEALTH_CACHE_KEY = "hook:health:{hook_name}"
+
+
+class HookHealthCache:
+    """Reads and writes hook health results (no-op without Redis)."""
+
+    def get(self, hook_name: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Latest result if it is at most ``max_age`` seconds old (default: the cache TTL)."""
+        if max_age is None:
+            max_age = settings.HOOK_HEALTH_CACHE_TTL_SECONDS
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return None
+        try:
+            data = redis_client.get(HEALTH_CACHE_KEY.format(hook_name=hook_name))
+        except Exception as e:
+            logger.warning("Failed to read cached hook health", extra={"data": {"hook_name": hook_name, "error": str(e)}})
+            return None
+        if not data:
+            return None
+        result = json.loads(data)
+        if time.time() - result.get("checked_at", 0) > max_age:
+            return None
+        return result
+
+    def set(self, hook_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a health check result, stamped with ``checked_at``."""
+        result = {**result, "checked_at": time.time()}
+        redis_client = get_sync_redis()
+        if redis_client is not None:
+            try:
+                redis_client.setex(
+                    HEALTH_CACHE_KEY.format(hook_name=hook_name),
+                    # Keep stale results around for display; freshness is judged by checked_at
+                    int(settings.HOOK_HEALTH_CACHE_TTL_SECONDS * 10),
+                    json.dumps(result, default=str),
+                )
+            except Exception as e:
+                logger.warning("Failed to cache hook health", extra={"data": {"hook_name": hook_name, "error": str(e)}})
+        return result
+
+    def is_healthy(self, hook_name: str) -> bool:
+        """Whether a result within the TTL says the hook is healthy."""
+        cached = self.get(hook_name)
+        return bool(cached and cached.get("healthy"))
+
+
+# Global instance
+hook_health_cache = HookHealthCache()
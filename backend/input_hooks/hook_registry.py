@@ -7,12 +7,16 @@ of all input hooks with dynamic configuration and lifecycle management.
 
 from typing import Dict, Type, Optional, Any, List
 from pathlib import Path
+import asyncio
 import importlib
 import inspect
 
+from config import settings
 from utils.config_registry import ConfigRegistry  
 from utils.logging import get_logger
+from .adaptive_polling import beat_interval
 from .base_hook import BaseInputHook
+from .health_cache import hook_health_cache
 from .models import InputHooksConfig, HookConfig, AnyHookConfig, GmailHookConfig, GoogleCalendarHookConfig, OutlookEmailHookConfig
 
 logger = get_logger("input_hook_registry")
@@ -295,8 +299,10 @@ class InputHookRegistry(ConfigRegistry):
             if hook.config.enabled and hook.config.polling_interval > 0:
                 schedules[f"process-{hook_name}"] = {
                     "task": "tasks.hook_tasks.process_hook_items",
-                    "schedule": hook.config.polling_interval,
+                    "schedule": beat_interval(hook.config),
                     "args": [hook_name],
+                    # Scheduled runs of adaptive hooks skip themselves until due
+                    "kwargs": {"scheduled": True},
                     "options": {"queue": hook.config.queue_name or "hooks"}
                 }
         
@@ -320,22 +326,51 @@ class InputHookRegistry(ConfigRegistry):
         return routes
     
     # Health and monitoring methods
-    async def health_check_all(self) -> Dict[str, Dict[str, Any]]:
-        """Perform health check on all hooks."""
+    async def health_check_all(self, max_age: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Perform health check on all hooks concurrently.
+        
+        Args:
+            max_age: Serve cached results up to this many seconds old and only
+                check hooks without one; None checks every hook
+        """
         health_results = {}
+        to_check = {}
         
         for hook_name, hook in self._hook_instances.items():
-            try:
-                health_results[hook_name] = await hook.health_check()
-            except Exception as e:
-                health_results[hook_name] = {
-                    "hook_name": hook_name,
-                    "healthy": False,
-                    "error": str(e)
-                }
+            cached = hook_health_cache.get(hook_name, max_age) if max_age is not None else None
+            if cached is not None:
+                health_results[hook_name] = cached
+            else:
+                to_check[hook_name] = hook
+        
+        if to_check:
+            checked = await asyncio.gather(*(
+                self._check_hook_health(hook_name, hook) for hook_name, hook in to_check.items()
+            ))
+            health_results.update(zip(to_check.keys(), checked))
         
         return health_results
     
+    async def _check_hook_health(self, hook_name: str, hook: BaseInputHook) -> Dict[str, Any]:
+        """Run one hook's health check under a timeout and cache the result."""
+        timeout = settings.HOOK_HEALTH_CHECK_TIMEOUT_SECONDS
+        try:
+            result = await asyncio.wait_for(hook.health_check(), timeout=timeout)
+        except asyncio.TimeoutError:
+            result = {
+                "hook_name": hook_name,
+                "healthy": False,
+                "error": f"Health check timed out after {timeout}s"
+            }
+        except Exception as e:
+            result = {
+                "hook_name": hook_name,
+                "healthy": False,
+                "error": str(e)
+            }
+        return hook_health_cache.set(hook_name, result)
+    
     def get_hook_stats(self, hook_name: str) -> Optional[Dict[str, Any]]:
         """Get statistics for a specific hook."""
         hook = self.get_hook(hook_name)
@@ -0,0 +1,146 @@
+"""
+Item-level checkpoints for hook runs.
+
+A hook run used to be all or nothing: when the Celery task retried, every
+item was fetched and evaluated again, repeating LLM and MCP work for items
+that had already gone through. The base pipeline now keeps a checkpoint per
+hook in Redis while a run is in progress:
+
+- ``items``: the fetched batch, so a retry does not fetch again (sync cursors
+  have already moved past it)
+- ``done``: keys of items that finished or were dead-lettered
+- ``attempts`` / ``errors``: failed attempts per item
+
+A retry of the same task resumes from the first unfinished item. A later run
+picks up items an earlier run left unfinished before its own fetch. The
+checkpoint is cleared once every item is done.
+
+Beat, push-triggered and manual runs of a hook can be queued at the same
+time, so a run holds a per-hook lease while it works on the checkpoint. A
+run that finds the lease held by another run does not start; the lease
+expires after HOOK_RUN_LEASE_SECONDS if its run dies without releasing it.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from config import settings
+from utils.logging import get_logger
+from utils.redis_manager import get_sync_redis
+
+logger = get_logger(__name__)
+
+# Redis key for a hook's in-progress run checkpoint
+RUN_CHECKPOINT_KEY = "hook:checkpoint:{hook_name}"
+# Redis key holding the run id of the run currently processing a hook
+RUN_LEASE_KEY = "hook:run-lease:{hook_name}"
+
+
+@dataclass
+class RunCheckpoint:
+    """Progress of a hook run through its fetched items."""
+    hook_name: str
+    run_id: str
+    items: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # item key -> raw item
+    done: List[str] = field(default_factory=list)
+    attempts: Dict[str, int] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+
+    def add_items(self, items: Dict[str, Dict[str, Any]]) -> None:
+        """Add fetched items, keeping the pending copy of any already present."""
+        for key, raw_item in items.items():
+            self.items.setdefault(key, raw_item)
+
+    def pending(self) -> Dict[str, Dict[str, Any]]:
+        done = set(self.done)
+        return {key: raw_item for key, raw_item in self.items.items() if key not in done}
+
+    def mark_done(self, key: str) -> None:
+        if key not in self.done:
+            self.done.append(key)
+
+    def record_failure(self, key: str, error: str) -> int:
+        """Count a failed attempt at an item and return its attempts so far."""
+        self.attempts[key] = self.attempts.get(key, 0) + 1
+        self.errors[key] = error
+        return self.attempts[key]
+
+
+class ItemCheckpointStore:
+    """Loads and saves run checkpoints in Redis (no-op without Redis)."""
+
+    def load(self, hook_name: str) -> Optional[RunCheckpoint]:
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return None
+        try:
+            data = redis_client.get(RUN_CHECKPOINT_KEY.format(hook_name=hook_name))
+            return RunCheckpoint(**json.loads(data)) if data else None
+        except Exception as e:
+            logger.warning("Failed to load hook run checkpoint", extra={"data": {"hook_name": hook_name, "error": str(e)}})
+            return None
+
+    def save(self, checkpoint: RunCheckpoint) -> bool:
+        """Store a checkpoint; False when it could not be stored."""
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return False
+        try:
+            redis_client.setex(
+                RUN_CHECKPOINT_KEY.format(hook_name=checkpoint.hook_name),
+                int(settings.HOOK_CHECKPOINT_TTL_HOURS * 3600),
+                json.dumps(asdict(checkpoint), default=str),
+            )
+            return True
+        except Exception as e:
+            logger.warning(
+                "Failed to save hook run checkpoint",
+                extra={"data": {"hook_name": checkpoint.hook_name, "error": str(e)}}
+            )
+            return False
+
+    def clear(self, hook_name: str) -> None:
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return
+        try:
+            redis_client.delete(RUN_CHECKPOINT_KEY.format(hook_name=hook_name))
+        except Exception as e:
+            logger.warning("Failed to clear hook run checkpoint", extra={"data": {"hook_name": hook_name, "error": str(e)}})
+
+    def acquire_lease(self, hook_name: str, run_id: str) -> bool:
+        """Take or renew a hook's run lease; False while another run holds it.
+
+        Without Redis there is no checkpoint to share and every run proceeds.
+        """
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return True
+        key = RUN_LEASE_KEY.format(hook_name=hook_name)
+        try:
+            if redis_client.set(key, run_id, nx=True, ex=settings.HOOK_RUN_LEASE_SECONDS):
+                return True
+            if redis_client.get(key) == run_id:
+                redis_client.expire(key, settings.HOOK_RUN_LEASE_SECONDS)
+                return True
+            return False
+        except Exception as e:
+            logger.warning("Failed to acquire hook run lease", extra={"data": {"hook_name": hook_name, "error": str(e)}})
+            return True
+
+    def release_lease(self, hook_name: str, run_id: str) -> None:
+        """Release a hook's run lease if ``run_id`` still holds it."""
+        redis_client = get_sync_redis()
+        if redis_client is None:
+            return
+        key = RUN_LEASE_KEY.format(hook_name=hook_name)
+        try:
+            if redis_client.get(key) == run_id:
+                redis_client.delete(key)
+        except Exception as e:
+            logger.warning("Failed to release hook run lease", extra={"data": {"hook_name": hook_name, "error": str(e)}})
+
+
+# Global instance
+item_checkpoint_store = ItemCheckpointStore()
@@ -44,6 +44,24 @@ class TaskTemplate(BaseModel):
     status: str = "todo"
 
 
+class BusinessHours(BaseModel):
+    """Window in which a hook's source is expected to be busy."""
+    start: str = "08:00"  # HH:MM, local to timezone
+    end: str = "18:00"
+    days: List[int] = [0, 1, 2, 3, 4]  # Monday = 0
+    timezone: str = "UTC"
+
+
+class AdaptivePollingConfig(BaseModel):
+    """Adaptive polling bounds (see input_hooks/adaptive_polling.py)."""
+    enabled: bool = True
+    min_interval: int = Field(default=30, gt=0)  # seconds; used right after a run that found items
+    max_interval: int = Field(default=3600, gt=0)  # seconds; ceiling for quiet or failing sources
+    backoff_factor: float = Field(default=2.0, ge=1.0)
+    business_hours: Optional[BusinessHours] = None
+    off_hours_interval: Optional[int] = Field(default=None, gt=0)  # defaults to max_interval
+
+
 class HookConfig(BaseModel):
     """Base configuration for all input hooks."""
     name: str
@@ -53,6 +71,13 @@ class HookConfig(BaseModel):
     polling_interval: int = Field(default=300, gt=0)  # seconds
     queue_name: Optional[str] = None  # defaults to hook name
     
+    # Push notifications (see input_hooks/push_notifications.py)
+    push_enabled: bool = False
+    push_safety_polling_interval: int = Field(default=3600, gt=0)  # seconds; beat interval while push is on
+    
+    # Adaptive polling (polling_interval is the starting interval)
+    adaptive_polling: Optional[AdaptivePollingConfig] = None
+    
     # Task creation settings
     create_tasks: bool = True
     update_existing_tasks: bool = False
@@ -120,6 +145,8 @@ class GoogleCalendarHookSettings(BaseModel):
     include_recurring_events: bool = True
     min_meeting_duration: int = Field(default=15, gt=0)  # Minimum minutes for prep
     prep_time_minutes: int = Field(default=15, gt=0)  # Minutes before meeting for prep
+    max_concurrent_meetings: int = Field(default=3, gt=0)  # Meetings analyzed and memoed at once
+    meeting_timeout_seconds: float = Field(default=300.0, gt=0)  # Per-meeting limit incl. memo generation
 
 
 class GoogleCalendarHookConfig(HookConfig):
@@ -6,7 +6,7 @@ Uses the "Nova Processed" category in Outlook to track which emails
 have been processed, preventing duplicates.
 """
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from utils.logging import get_logger
 from .base_hook import BaseInputHook
@@ -135,12 +135,14 @@ class OutlookEmailHook(BaseInputHook):
         """Outlook emails don't support task updates."""
         return False
 
-    async def process_items(self) -> ProcessingResult:
+    async def process_items(self, run_id: Optional[str] = None) -> ProcessingResult:
         """
         Process Outlook emails and create Nova tasks.
 
         Overrides base class to use OutlookProcessor directly,
         which handles the full pipeline including marking emails.
+        Emails that fail stay unmarked and are picked up by the next run,
+        so no run checkpoint is kept.
         """
         start_time = time.time()
         result = ProcessingResult(hook_name=self.hook_name)
@@ -162,7 +164,8 @@ class OutlookEmailHook(BaseInputHook):
             processing_result = await processor.process_emails(
                 max_emails=self.config.hook_settings.max_per_fetch,
                 folder=self.config.hook_settings.folder,
-                since_date=since_date
+                since_date=since_date,
+                hook_name=self.hook_name
             )
 
             # Map OutlookProcessingResult to ProcessingResult
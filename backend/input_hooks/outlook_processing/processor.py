@@ -11,8 +11,11 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+from config import settings
 from tools.task_tools import create_task_tool
 from utils.logging import get_logger
+from ..datetime_utils import parse_datetime
+from ..sync_cursor import SyncCursor, sync_cursor_store
 from .fetcher import OutlookFetcher
 
 logger = get_logger(__name__)
@@ -50,7 +53,8 @@ class OutlookProcessor:
         self,
         max_emails: int = 50,
         folder: str = "inbox",
-        since_date: Optional[str] = None
+        since_date: Optional[str] = None,
+        hook_name: Optional[str] = None
     ) -> OutlookProcessingResult:
         """
         Process unprocessed Outlook emails and create Nova tasks.
@@ -59,6 +63,8 @@ class OutlookProcessor:
             max_emails: Maximum number of emails to process
             folder: Outlook folder to process
             since_date: Only process emails from this date onwards (YYYY-MM-DD)
+            hook_name: Hook whose sync cursor narrows the listing to recent
+                mail (no cursor when omitted)
 
         Returns:
             OutlookProcessingResult with processing statistics
@@ -72,16 +78,24 @@ class OutlookProcessor:
                 extra={"data": {"max_emails": max_emails, "folder": folder, "since_date": since_date}}
             )
 
+            # Narrow the listing to mail since the previous poll's watermark
+            cursor = await self._load_cursor(hook_name)
+            full_sync = cursor is None or cursor.full_sync_due
+            if cursor and full_sync:
+                cursor.reset()
+            listing_since = since_date if full_sync else cursor.since_date(since_date)
+
             emails = await self.fetcher.fetch_unprocessed_emails(
                 max_emails=max_emails,
                 folder=folder,
-                since_date=since_date
+                since_date=listing_since
             )
 
             result.emails_fetched = len(emails)
 
             if not emails:
                 logger.info("No unprocessed Outlook emails found")
+                await self._advance_cursor(cursor, emails, max_emails, result)
                 return result
 
             logger.info(
@@ -132,6 +146,8 @@ class OutlookProcessor:
                         extra={"data": {"email_id": email_id}}
                     )
 
+            await self._advance_cursor(cursor, emails, max_emails, result)
+
             logger.info(
                 "Outlook email processing completed",
                 extra={"data": result.to_dict()}
@@ -148,6 +164,47 @@ class OutlookProcessor:
             )
             raise
 
+    async def _load_cursor(self, hook_name: Optional[str]) -> Optional[SyncCursor]:
+        """Load the hook's sync cursor; None lists with the configured since-date only."""
+        if not hook_name or not settings.HOOK_SYNC_CURSOR_ENABLED:
+            return None
+        try:
+            return await sync_cursor_store.load(hook_name)
+        except Exception as e:
+            logger.warning(
+                "Failed to load Outlook sync cursor, listing without it",
+                extra={"data": {"hook_name": hook_name, "error": str(e)}}
+            )
+            return None
+
+    async def _advance_cursor(
+        self,
+        cursor: Optional[SyncCursor],
+        emails: List[Dict[str, Any]],
+        max_emails: int,
+        result: OutlookProcessingResult
+    ) -> None:
+        """Move the watermark past this poll.
+
+        The watermark only advances when every listed email was handled and
+        the listing was not cut off at max_emails, so older unprocessed mail
+        is never skipped.
+        """
+        if cursor is None:
+            return
+        newest_at = None
+        if not result.errors and len(emails) < max_emails:
+            dates = [parse_datetime(e.get("date"), "email", fallback_to_now=False) for e in emails if e.get("date")]
+            newest_at = max((d for d in dates if d), default=None, key=lambda d: d.replace(tzinfo=None))
+        cursor.advance([], newest_at=newest_at)
+        try:
+            await sync_cursor_store.save(cursor)
+        except Exception as e:
+            logger.warning(
+                "Failed to save Outlook sync cursor",
+                extra={"data": {"hook_name": cursor.hook_name, "error": str(e)}}
+            )
+
     async def _create_task_from_email(self, email: Dict[str, Any]) -> Optional[str]:
         """
         Create a Nova task from an Outlook email.
@@ -0,0 +1,103 @@
+"""
+Push-triggered hook runs.
+
+MCP servers and mail providers can tell Nova that a hook's source changed
+(POST /api/hooks/{hook_name}/notify) instead of waiting for the next beat
+poll. A notification schedules one run of the hook after
+HOOK_NOTIFY_COALESCE_SECONDS, and further notifications in the meantime are
+folded into that pending run. The run clears the pending marker when it
+starts, so a change that arrives mid-run schedules another run.
+
+Hooks with ``push_enabled`` keep a slower beat schedule
+(``push_safety_polling_interval``) as a safety net for missed notifications.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+from uuid import uuid4
+
+from config import settings
+from utils.logging import get_logger
+from utils.redis_manager import get_sync_redis
+
+logger = get_logger(__name__)
+
+# Redis key holding the task id of a hook's pending push-triggered run
+PENDING_RUN_KEY = "hook:notify:pending:{hook_name}"
+
+
+@dataclass
+class NotifyOutcome:
+    """What a notification did: queued a new run or joined a pending one."""
+    status: str  # "queued" or "coalesced"
+    task_id: str
+
+
+def request_hook_run(hook_name: str, queue: str = "hooks", source: Optional[str] = None) -> NotifyOutcome:
+    """Schedule a coalesced run of a hook in response to a push notification.
+
+    Without Redis every notification queues its own run.
+    """
+    key = PENDING_RUN_KEY.format(hook_name=hook_name)
+    delay = settings.HOOK_NOTIFY_COALESCE_SECONDS
+    task_id = str(uuid4())
+
+    redis_client = get_sync_redis()
+    claimed = False
+    if redis_client is not None:
+        try:
+            claimed = bool(redis_client.set(
+                key, task_id, nx=True, ex=int(delay + settings.HOOK_NOTIFY_PENDING_TTL_SECONDS)
+            ))
+            if not claimed:
+                pending = redis_client.get(key)
+                if pending:
+                    logger.info(
+                        "Hook notification coalesced into pending run",
+                        extra={"data": {"hook_name": hook_name, "task_id": pending, "source": source}}
+                    )
+                    return NotifyOutcome(status="coalesced", task_id=pending)
+        except Exception as e:
+            logger.warning(
+                "Hook notification coalescing unavailable",
+                extra={"data": {"hook_name": hook_name, "error": str(e)}}
+            )
+
+    try:
+        _queue_run(hook_name, task_id, delay, queue)
+    except Exception:
+        if claimed:
+            redis_client.delete(key)
+        raise
+
+    logger.info(
+        "Hook run queued by notification",
+        extra={"data": {"hook_name": hook_name, "task_id": task_id, "source": source, "countdown": delay}}
+    )
+    return NotifyOutcome(status="queued", task_id=task_id)
+
+
+def _queue_run(hook_name: str, task_id: str, countdown: int, queue: str) -> None:
+    from tasks.hook_tasks import process_hook_items
+
+    process_hook_items.apply_async(args=[hook_name], task_id=task_id, countdown=countdown, queue=queue)
+
+
+def clear_pending_run(hook_name: str, task_id: str) -> None:
+    """Release the pending marker when the push-triggered run starts.
+
+    Only the run that owns the marker clears it; beat and manual runs leave
+    a pending notification alone.
+    """
+    redis_client = get_sync_redis()
+    if redis_client is None:
+        return
+    key = PENDING_RUN_KEY.format(hook_name=hook_name)
+    try:
+        if redis_client.get(key) == task_id:
+            redis_client.delete(key)
+    except Exception as e:
+        logger.warning(
+            "Failed to clear pending hook notification",
+            extra={"data": {"hook_name": hook_name, "error": str(e)}}
+        )
@@ -0,0 +1,202 @@
+"""
+Incremental sync cursors for polling input hooks.
+
+Mailbox hooks used to list recent messages on every beat interval, read each
+one in full and only then drop the ones already in ProcessedItem, so the cost
+of an idle poll grew with mailbox size and lookback. A cursor persisted per
+hook records where the previous poll stopped:
+
+- ``token``: provider sync token (history id, delta link) for list tools that
+  return one and accept it back (see EMAIL_SYNC_TOKEN_PARAMETERS)
+- ``last_seen_at``: newest message time seen, a since-date watermark for list
+  tools that filter by date
+- ``seen_ids``: ids already read and processed, so listings that cannot be
+  narrowed (the unread inbox) only cost a read for messages that are new
+- ``pending_ids``: ids read but not yet known to be processed. The next poll
+  moves the ones that have a ProcessedItem row (or were dead-lettered) to
+  ``seen_ids`` and reads the others again, so an email whose task creation
+  failed is retried
+
+A cursor is reset and the hook falls back to a full listing every
+HOOK_SYNC_FULL_RESYNC_HOURS, counted from its last reset, or when the
+provider rejects its token. ProcessedItem deduplication still runs behind
+the cursor.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from config import settings
+from sqlalchemy import and_, select
+
+from database.database import db_manager
+from models.models import HookDeadLetterItem, HookSyncCursor, ProcessedItem
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SyncCursorExpired(Exception):
+    """The provider no longer accepts the stored sync token."""
+
+
+@dataclass
+class SyncCursor:
+    """Where a hook's previous poll stopped."""
+    hook_name: str
+    token: Optional[str] = None
+    last_seen_at: Optional[datetime] = None
+    seen_ids: List[str] = field(default_factory=list)
+    pending_ids: List[str] = field(default_factory=list)
+    full_sync_at: Optional[datetime] = None
+
+    @property
+    def full_sync_due(self) -> bool:
+        if self.full_sync_at is None:
+            return True
+        age = datetime.now(timezone.utc) - self.full_sync_at
+        return age > timedelta(hours=settings.HOOK_SYNC_FULL_RESYNC_HOURS)
+
+    def reset(self) -> None:
+        """Forget the sync position; the next listing is a full one."""
+        self.token = None
+        self.last_seen_at = None
+        self.seen_ids = []
+        self.pending_ids = []
+        self.full_sync_at = None
+
+    def unseen(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Listed messages that were not read and processed by an earlier poll."""
+        seen = set(self.seen_ids)
+        return [message for message in messages if str(message.get("id")) not in seen]
+
+    def since_date(self, configured: Optional[str] = None) -> Optional[str]:
+        """The later of the configured since-date and the watermark (YYYY-MM-DD).
+
+        The watermark keeps one day of margin for time zones and late delivery.
+        """
+        if self.last_seen_at is None:
+            return configured
+        watermark = (self.last_seen_at - timedelta(days=1)).strftime("%Y-%m-%d")
+        return max(configured, watermark) if configured else watermark
+
+    def confirm(self, processed_ids: Iterable[str]) -> None:
+        """Move pending ids that have been processed to the seen ids."""
+        processed = {str(i) for i in processed_ids}
+        confirmed = [i for i in self.pending_ids if i in processed]
+        self.pending_ids = [i for i in self.pending_ids if i not in processed]
+        self.seen_ids = list(dict.fromkeys(self.seen_ids + confirmed))[-settings.HOOK_SYNC_MAX_SEEN_IDS:]
+
+    def advance(
+        self,
+        fetched_ids: Iterable[str],
+        listed_ids: Optional[Iterable[str]] = None,
+        token: Optional[str] = None,
+        newest_at: Optional[datetime] = None,
+        processed: bool = False,
+    ) -> None:
+        """Move the cursor past a completed poll.
+
+        A new or reset cursor records this poll as its full sync.
+
+        Args:
+            fetched_ids: Ids read in full this poll
+            listed_ids: Every id in a complete listing, used to drop ids the
+                provider no longer returns; None for an incremental listing
+            token: New provider sync token, if the listing returned one
+            newest_at: Newest message time seen this poll
+            processed: Whether the fetched ids need no processing (they go
+                straight to the seen ids instead of waiting as pending)
+        """
+        fetched = [str(i) for i in fetched_ids]
+        seen = list(dict.fromkeys(self.seen_ids + (fetched if processed else [])))
+        pending = [i for i in dict.fromkeys(self.pending_ids + ([] if processed else fetched)) if i not in set(seen)]
+        if listed_ids is not None:
+            listed = {str(i) for i in listed_ids}
+            seen = [i for i in seen if i in listed]
+            pending = [i for i in pending if i in listed]
+        self.seen_ids = seen[-settings.HOOK_SYNC_MAX_SEEN_IDS:]
+        self.pending_ids = pending[-settings.HOOK_SYNC_MAX_SEEN_IDS:]
+
+        if token is not None:
+            self.token = token
+        if newest_at is not None:
+            if newest_at.tzinfo is None:
+                newest_at = newest_at.replace(tzinfo=timezone.utc)
+            if self.last_seen_at is None or newest_at > self.last_seen_at:
+                self.last_seen_at = newest_at
+        if self.full_sync_at is None:
+            self.full_sync_at = datetime.now(timezone.utc)
+
+
+class SyncCursorStore:
+    """Loads and saves hook sync cursors (hook_sync_cursors table)."""
+
+    async def load(self, hook_name: str) -> SyncCursor:
+        """Stored cursor for a hook, or an empty one (full sync due)."""
+        async with db_manager.get_session() as session:
+            row = await session.get(HookSyncCursor, hook_name)
+            if row is None:
+                return SyncCursor(hook_name=hook_name)
+            return SyncCursor(
+                hook_name=hook_name,
+                token=row.token,
+                last_seen_at=row.last_seen_at,
+                seen_ids=list(row.seen_ids or []),
+                pending_ids=list(row.pending_ids or []),
+                full_sync_at=row.full_sync_at,
+            )
+
+    async def save(self, cursor: SyncCursor) -> None:
+        async with db_manager.get_session() as session:
+            row = await session.get(HookSyncCursor, cursor.hook_name)
+            if row is None:
+                row = HookSyncCursor(hook_name=cursor.hook_name)
+                session.add(row)
+            row.token = cursor.token
+            row.last_seen_at = cursor.last_seen_at
+            row.seen_ids = cursor.seen_ids
+            row.pending_ids = cursor.pending_ids
+            row.full_sync_at = cursor.full_sync_at
+
+        logger.debug(
+            "Saved hook sync cursor",
+            extra={"data": {
+                "hook_name": cursor.hook_name,
+                "has_token": cursor.token is not None,
+                "seen_ids": len(cursor.seen_ids),
+                "pending_ids": len(cursor.pending_ids),
+                "last_seen_at": cursor.last_seen_at.isoformat() if cursor.last_seen_at else None,
+            }}
+        )
+
+    async def processed_ids(self, hook_name: str, source_type: str, ids: List[str]) -> List[str]:
+        """Ids among ``ids`` that have a ProcessedItem row or were dead-lettered by the hook."""
+        if not ids:
+            return []
+        async with db_manager.get_session() as session:
+            processed = await session.execute(
+                select(ProcessedItem.source_id).where(and_(
+                    ProcessedItem.source_type == source_type,
+                    ProcessedItem.source_id.in_(ids),
+                ))
+            )
+            dead = await session.execute(
+                select(HookDeadLetterItem.source_id).where(and_(
+                    HookDeadLetterItem.hook_name == hook_name,
+                    HookDeadLetterItem.source_id.in_(ids),
+                ))
+            )
+            return [row[0] for row in processed.all()] + [row[0] for row in dead.all()]
+
+    async def reset(self, hook_name: str) -> None:
+        """Drop a hook's cursor so its next poll is a full sync."""
+        async with db_manager.get_session() as session:
+            row = await session.get(HookSyncCursor, hook_name)
+            if row is not None:
+                await session.delete(row)
+
+
+# Global instance
+sync_cursor_store = SyncCursorStore()
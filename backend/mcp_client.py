@@ -5,11 +5,13 @@ Per ADR-015, LiteLLM is the single source of truth for MCP servers and tools.
 Nova queries LiteLLM's /mcp-rest/tools/list endpoint for tool discovery.
 """
 
+import asyncio
 import json
 import time
+from contextlib import asynccontextmanager
 
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from langchain_core.tools import StructuredTool
 from pydantic import create_model
 from config import settings
@@ -42,6 +44,32 @@ class MCPClientManager:
         self._tools_cache_timestamp: float = 0
         # Cache for server_name -> server_id mapping
         self._server_id_cache: Dict[str, str] = {}
+        # Optional keep-alive HTTP client owned by one long-lived loop (Celery workers)
+        self._shared_client: Optional[httpx.AsyncClient] = None
+        self._shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def open_shared_client(self) -> None:
+        """Reuse one keep-alive HTTP client for gateway calls made on the current loop."""
+        if self._shared_client is None:
+            self._shared_client = httpx.AsyncClient()
+            self._shared_client_loop = asyncio.get_running_loop()
+
+    async def close_shared_client(self) -> None:
+        """Close the shared HTTP client (call on the loop that opened it)."""
+        client = self._shared_client
+        self._shared_client = None
+        self._shared_client_loop = None
+        if client is not None:
+            await client.aclose()
+
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Shared client on its owning loop, otherwise a short-lived one."""
+        if self._shared_client is not None and self._shared_client_loop is asyncio.get_running_loop():
+            yield self._shared_client
+        else:
+            async with httpx.AsyncClient() as client:
+                yield client
 
     async def list_tools_from_litellm(self, timeout: float = 10.0) -> Dict[str, Any]:
         """
@@ -53,7 +81,7 @@ class MCPClientManager:
         url = f"{self._litellm_base_url}/mcp-rest/tools/list"
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     url,
                     headers={"Authorization": f"Bearer {self._litellm_api_key}"},
@@ -218,7 +246,7 @@ class MCPClientManager:
         url = f"{self._litellm_base_url}/v1/mcp/server"
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._http_client() as client:
                 response = await client.get(
                     url,
                     headers={"Authorization": f"Bearer {self._litellm_api_key}"},
@@ -262,7 +290,7 @@ class MCPClientManager:
         server_id: str,
     ) -> Any:
         """Execute a single MCP tool call and return the parsed result."""
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             response = await client.post(
                 url,
                 headers={
@@ -25,6 +25,7 @@ class ChatRequest(BaseModel):
     messages: List[ChatMessage] = Field(..., description="List of chat messages")
     thread_id: Optional[str] = Field(None, description="Thread identifier for conversation continuity")
     stream: bool = Field(True, description="Whether to stream the response")
+    stream_tokens: bool = Field(False, description="Also stream LLM tokens, tool-call argument deltas and tool start/end events")
 
 
 class ChatResponse(BaseModel):
@@ -56,6 +57,14 @@ class ChatMessageDetail(BaseModel):
     tool_calls: Optional[List[Dict[str, Any]]] = Field(None, description="Tool calls associated with this message")
 
 
+class ChatHistoryPage(BaseModel):
+    """One page of chat history, walking backwards from the newest message."""
+    messages: List[ChatMessageDetail] = Field(..., description="Messages in this page, oldest first")
+    total: int = Field(0, description="Total number of messages in the chat")
+    has_more: bool = Field(False, description="Whether older messages exist before this page")
+    next_before: Optional[int] = Field(None, description="Cursor for the next (older) page")
+
+
 class TaskChatResponse(BaseModel):
     """Response model for task chat data including escalation info."""
     messages: List[ChatMessageDetail] = Field(..., description="Chat messages")
@@ -101,6 +110,22 @@ class BackupListResponse(BaseModel):
     total_count: int = Field(..., description="Total number of backup files")
 
 
+class BulkDeleteChatsRequest(BaseModel):
+    """Request model for deleting many chat/task threads at once.
+
+    All given criteria must match. At least one of thread_ids, prefix,
+    older_than_days or task_statuses is required; exclude_prefixes alone is
+    rejected.
+    """
+    thread_ids: Optional[List[str]] = Field(None, description="Explicit thread IDs to delete")
+    prefix: Optional[str] = Field(None, description="Only threads whose ID starts with this prefix")
+    exclude_prefixes: List[str] = Field(default_factory=list, description="Skip threads whose ID starts with any of these")
+    older_than_days: Optional[float] = Field(None, ge=0, description="Only threads whose latest checkpoint is older than this")
+    task_statuses: Optional[List[str]] = Field(None, description="Only task threads whose task has one of these statuses")
+    dry_run: bool = Field(False, description="Only count matching threads")
+    batch_size: Optional[int] = Field(None, ge=1, le=1000, description="Threads deleted per batch")
+
+
 class ChatTitleUpdateRequest(BaseModel):
     """Request model for updating a chat conversation title."""
     title: str = Field(..., min_length=1, max_length=255, description="New title for the chat")
\ No newline at end of file
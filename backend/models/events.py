@@ -4,7 +4,7 @@ Defines consistent event types and WebSocket message formats.
 """
 
 from datetime import datetime
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -25,6 +25,7 @@ class NovaEvent(BaseModel):
         "config_changed",
         "user_profile_updated",
         "llm_settings_updated",
+        "user_settings_updated",
         "hook_processing_started",
         "hook_processing_completed", 
         "hook_processing_failed",
@@ -109,6 +110,11 @@ class LLMSettingsUpdatedEventData(BaseModel):
     max_tokens: int
 
 
+class UserSettingsUpdatedEventData(BaseModel):
+    """Data structure for user settings update events."""
+    updated_fields: List[str] = Field(default_factory=list)
+
+
 class HookProcessingStartedEventData(BaseModel):
     """Data structure for hook processing started events."""
     hook_name: str
@@ -274,6 +280,20 @@ def create_llm_settings_updated_event(
     )
 
 
+def create_user_settings_updated_event(
+    updated_fields: Optional[List[str]] = None,
+    source: str = "settings-service"
+) -> NovaEvent:
+    """Create a typed user settings update event."""
+    return NovaEvent(
+        type="user_settings_updated",
+        data=UserSettingsUpdatedEventData(
+            updated_fields=updated_fields or []
+        ).model_dump(),
+        source=source
+    )
+
+
 def create_hook_processing_started_event(
     hook_name: str,
     task_id: str,
@@ -137,6 +137,70 @@ class ProcessedItem(Base):
     task: Mapped[Optional["Task"]] = relationship("Task")
 
 
+class HookSyncCursor(Base):
+    """
+    Incremental sync position of a polling input hook (one row per hook).
+
+    Lets mailbox hooks ask only for changes since their previous poll
+    (see input_hooks/sync_cursor.py).
+    """
+    __tablename__ = 'hook_sync_cursors'
+
+    hook_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+    token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Provider sync token (history id, delta link)
+    last_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    seen_ids: Mapped[List[str]] = mapped_column(JSONB, default=list)
+    pending_ids: Mapped[List[str]] = mapped_column(JSONB, default=list)  # Read, not yet processed
+    full_sync_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class EmailThreadAggregate(Base):
+    """
+    Running view of an email thread (one row per thread).
+
+    Updated once per arriving message so thread tasks can be rendered without
+    reloading the thread (see input_hooks/email_processing/thread_aggregate.py).
+    """
+    __tablename__ = 'email_thread_aggregates'
+
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True)
+    subject: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    message_count: Mapped[int] = mapped_column(Integer, default=0)
+    participants: Mapped[List[str]] = mapped_column(JSONB, default=list)
+    recent_messages: Mapped[List[dict]] = mapped_column(JSONB, default=list)  # Newest messages, in full
+    digest: Mapped[List[str]] = mapped_column(JSONB, default=list)  # One line per older message
+    first_message_date: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    last_message_date: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class HookDeadLetterItem(Base):
+    """
+    Input hook item that kept failing and was set aside for manual review.
+
+    Written by the hook pipeline once an item exhausts HOOK_ITEM_MAX_ATTEMPTS
+    and replayed through the hooks API (see input_hooks/dead_letter.py).
+    """
+    __tablename__ = 'hook_dead_letter_items'
+
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    hook_name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    source_id: Mapped[str] = mapped_column(String(500), nullable=False)
+    item_data: Mapped[dict] = mapped_column(JSONB, nullable=False)  # Raw item as fetched, for replay
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    status: Mapped[str] = mapped_column(String(20), default="dead", index=True)  # 'dead', 'replaying', 'resolved'
+    first_failed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_failed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    replayed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    replay_task_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint('hook_name', 'source_id', name='uq_hook_dead_letter_items_source'),
+    )
+
+
 class AgentStatusEnum(str, Enum):
     """Core agent status enumeration."""
     IDLE = "idle"
@@ -187,6 +251,33 @@ class ChatMetadata(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
+class ToolResult(Base):
+    """
+    Oversized tool result offloaded from a conversation, stored once per content.
+
+    Keyed by the SHA-256 digest of the content (see services/tool_result_store.py).
+    """
+    __tablename__ = 'tool_results'
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    tool_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class ToolResultThread(Base):
+    """
+    Thread that references a stored tool result.
+
+    A result is deleted together with the last thread referencing it.
+    """
+    __tablename__ = 'tool_result_threads'
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    thread_id: Mapped[str] = mapped_column(String(255), primary_key=True, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
 class LLMModel(Base):
     """
     Model to store LLM model configurations for LiteLLM gateway.
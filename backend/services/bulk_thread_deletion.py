@@ -0,0 +1,221 @@
+"""
+Bulk Thread Deletion
+
+Deletes LangGraph checkpoints, writes, blobs, chat metadata and offloaded tool
+results for many chat or task threads at once, selected either by explicit
+thread ids or by a filter (thread id prefix, age of the latest checkpoint,
+status of the backing task).
+
+Threads are selected and purged in keyset-paginated batches of set-based
+statements, so thousands of threads are removed with a handful of round trips
+per batch and a single pooled connection at a time.
+"""
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from config import settings
+from services.checkpoint_retention import (
+    DELETE_CHAT_METADATA_SQL,
+    DELETE_TOOL_RESULTS_SQL,
+    fetch_all,
+    fetch_counts,
+    purge_threads,
+)
+from utils.langgraph_utils import TASK_THREAD_PREFIX
+from utils.logging import get_logger, log_timing
+
+logger = get_logger("bulk-thread-deletion")
+
+
+@dataclass
+class ThreadDeletionFilter:
+    """Selects threads to delete; all given criteria must match."""
+    thread_ids: Optional[List[str]] = None
+    prefix: Optional[str] = None
+    exclude_prefixes: List[str] = field(default_factory=list)
+    older_than_days: Optional[float] = None
+    task_statuses: Optional[List[str]] = None  # TaskStatus values, e.g. "done"
+    all_threads: bool = False  # Explicitly select every thread (still narrowed by the other criteria)
+
+    def is_empty(self) -> bool:
+        """True when no criterion selects threads.
+
+        exclude_prefixes only narrows a selection; on its own it would
+        match every other thread, so it does not count. Selecting every
+        thread takes an explicit all_threads.
+        """
+        return not (
+            self.all_threads
+            or self.thread_ids
+            or self.prefix
+            or self.older_than_days is not None
+            or self.task_statuses
+        )
+
+
+@dataclass
+class BulkDeletionProgress:
+    """Running totals of a bulk deletion, reported after every batch."""
+    dry_run: bool = False
+    threads_matched: int = 0
+    threads_deleted: int = 0
+    checkpoints_deleted: int = 0
+    writes_deleted: int = 0
+    blobs_deleted: int = 0
+    metadata_deleted: int = 0
+    tool_results_deleted: int = 0
+    bytes_reclaimed: int = 0
+    batches: int = 0
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+ProgressCallback = Callable[[BulkDeletionProgress], Optional[Awaitable[None]]]
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", r"\%").replace("_", r"\_")
+
+
+def build_selection_query(thread_filter: ThreadDeletionFilter) -> tuple:
+    """Build the keyset-paginated thread selection query for a filter.
+
+    Returns:
+        (sql, params) expecting ``after`` and ``limit`` to be filled in per batch
+    """
+    conditions = ["c.thread_id > %(after)s"]
+    having = []
+    params: Dict[str, Any] = {}
+
+    if thread_filter.thread_ids:
+        conditions.append("c.thread_id = ANY(%(thread_ids)s)")
+        params["thread_ids"] = list(thread_filter.thread_ids)
+    if thread_filter.prefix:
+        conditions.append("c.thread_id LIKE %(prefix_pattern)s")
+        params["prefix_pattern"] = _escape_like(thread_filter.prefix) + "%"
+    for index, excluded in enumerate(thread_filter.exclude_prefixes):
+        conditions.append(f"c.thread_id NOT LIKE %(exclude_{index})s")
+        params[f"exclude_{index}"] = _escape_like(excluded) + "%"
+    if thread_filter.task_statuses:
+        from models.models import TaskStatus
+
+        # SQLAlchemy stores the enum member name, e.g. NEEDS_REVIEW
+        conditions.append(
+            "EXISTS (SELECT 1 FROM tasks t"
+            " WHERE c.thread_id LIKE %(task_prefix_pattern)s"
+            " AND t.id::text = substring(c.thread_id FROM %(task_id_offset)s)"
+            " AND t.status::text = ANY(%(task_statuses)s))"
+        )
+        params["task_prefix_pattern"] = _escape_like(TASK_THREAD_PREFIX) + "%"
+        params["task_id_offset"] = len(TASK_THREAD_PREFIX) + 1
+        params["task_statuses"] = [TaskStatus(status).name for status in thread_filter.task_statuses]
+    if thread_filter.older_than_days is not None:
+        having.append(
+            "max((c.checkpoint->>'ts')::timestamptz) < now() - make_interval(secs => %(older_than_seconds)s)"
+        )
+        params["older_than_seconds"] = float(thread_filter.older_than_days) * 86400
+
+    sql = (
+        "SELECT c.thread_id FROM checkpoints c"
+        f" WHERE {' AND '.join(conditions)}"
+        " GROUP BY c.thread_id"
+        + (f" HAVING {' AND '.join(having)}" if having else "")
+        + " ORDER BY c.thread_id LIMIT %(limit)s"
+    )
+    return sql, params
+
+
+async def bulk_delete_threads(
+    pool,
+    thread_filter: ThreadDeletionFilter,
+    batch_size: Optional[int] = None,
+    dry_run: bool = False,
+    on_progress: Optional[ProgressCallback] = None,
+) -> BulkDeletionProgress:
+    """Delete all checkpoint data and chat metadata of the matching threads.
+
+    Args:
+        pool: psycopg AsyncConnectionPool of the checkpointer database
+        thread_filter: Which threads to delete; an empty filter is rejected
+        batch_size: Threads per batch (defaults to CHECKPOINT_RETENTION_BATCH_SIZE)
+        dry_run: Only count matching threads
+        on_progress: Called (and awaited if it returns an awaitable) after each batch
+
+    Returns:
+        Final BulkDeletionProgress totals
+
+    Raises:
+        ValueError: If the filter has no criteria
+    """
+    if thread_filter.is_empty():
+        raise ValueError(
+            "Bulk deletion requires thread_ids, prefix, older_than_days or task_statuses"
+        )
+
+    t0 = time.time()
+    batch_size = max(1, batch_size or settings.CHECKPOINT_RETENTION_BATCH_SIZE)
+    progress = BulkDeletionProgress(dry_run=dry_run)
+    sql, params = build_selection_query(thread_filter)
+    after = ""
+
+    while True:
+        rows = await fetch_all(pool, sql, {**params, "after": after, "limit": batch_size})
+        if not rows:
+            break
+        thread_ids = [row[0] for row in rows]
+        after = thread_ids[-1]
+        progress.threads_matched += len(thread_ids)
+
+        if not dry_run:
+            counts = await purge_threads(pool, thread_ids)
+            progress.threads_deleted += len(thread_ids)
+            progress.checkpoints_deleted += counts["checkpoints"]
+            progress.writes_deleted += counts["writes"]
+            progress.blobs_deleted += counts["blobs"]
+            progress.metadata_deleted += counts["metadata"]
+            progress.tool_results_deleted += counts["tool_results"]
+            progress.bytes_reclaimed += counts["bytes"]
+            _invalidate_history(thread_ids)
+
+        progress.batches += 1
+        progress.duration_ms = round((time.time() - t0) * 1000, 2)
+        logger.info("Bulk thread deletion batch", extra={"data": progress.to_dict()})
+        if on_progress is not None:
+            result = on_progress(progress)
+            if result is not None:
+                await result
+
+    # Explicitly named threads may have chat metadata or tool results without any checkpoint
+    if thread_filter.thread_ids and not dry_run and not _has_other_criteria(thread_filter):
+        params = {"thread_ids": list(thread_filter.thread_ids)}
+        metadata, _ = await fetch_counts(pool, DELETE_CHAT_METADATA_SQL, params)
+        tool_results, tool_result_bytes = await fetch_counts(pool, DELETE_TOOL_RESULTS_SQL, params)
+        progress.metadata_deleted += metadata
+        progress.tool_results_deleted += tool_results
+        progress.bytes_reclaimed += tool_result_bytes
+        _invalidate_history(thread_filter.thread_ids)
+
+    progress.duration_ms = round((time.time() - t0) * 1000, 2)
+    log_timing("bulk_thread_deletion", t0, progress.to_dict())
+    return progress
+
+
+def _has_other_criteria(thread_filter: ThreadDeletionFilter) -> bool:
+    return bool(
+        thread_filter.all_threads
+        or thread_filter.prefix
+        or thread_filter.exclude_prefixes
+        or thread_filter.older_than_days is not None
+        or thread_filter.task_statuses
+    )
+
+
+def _invalidate_history(thread_ids: List[str]) -> None:
+    from services.conversation_service import conversation_service
+
+    for thread_id in thread_ids:
+        conversation_service.invalidate_history(thread_id)
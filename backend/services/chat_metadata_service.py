@@ -1,6 +1,6 @@
 """Service for managing chat conversation metadata (titles, tool approvals)."""
 
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from sqlalchemy import select
 
@@ -22,6 +22,20 @@ class ChatMetadataService:
             )
             return result.scalar_one_or_none()
 
+    async def get_metadata_bulk(self, thread_ids: Iterable[str]) -> Dict[str, ChatMetadata]:
+        """Get metadata for many threads in one query, keyed by thread_id.
+
+        Threads without a metadata row are absent from the result.
+        """
+        ids = list(dict.fromkeys(thread_ids))
+        if not ids:
+            return {}
+        async with db_manager.get_session() as session:
+            result = await session.execute(
+                select(ChatMetadata).where(ChatMetadata.thread_id.in_(ids))
+            )
+            return {metadata.thread_id: metadata for metadata in result.scalars().all()}
+
     async def get_title(self, thread_id: str) -> Optional[str]:
         """Get custom title for a thread, or None if not set."""
         metadata = await self.get_metadata(thread_id)
@@ -5,9 +5,12 @@ Service for chat streaming, LangGraph interaction, and message handling.
 Handles chat streaming orchestration, message conversion, and memory injection.
 """
 
+import asyncio
+import inspect
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 
@@ -46,6 +49,22 @@ class CheckpointerProtocol(Protocol):
         """List checkpoints matching config."""
         ...
 
+    async def aget_tuple(self, config: Dict[str, Any]) -> Optional[Any]:
+        """Get checkpoint tuple (checkpoint, metadata, pending writes) for a config."""
+        ...
+
+
+@dataclass
+class TurnSetup:
+    """Result of the pre-stream setup pipeline for one chat turn."""
+    chat_agent: Any
+    resume_from_interrupt: bool = False
+    user_response: Optional[str] = None
+    pending_approval_tool_call_id: Optional[str] = None
+    is_first_turn: bool = False
+    memory_tool_messages: List = field(default_factory=list)
+    timings_ms: Dict[str, Any] = field(default_factory=dict)
+
 
 class ChatService:
     """Service for chat streaming and LangGraph interactions."""
@@ -143,91 +162,204 @@ class ChatService:
             logger.warning("Failed to search memory for tool injection", extra={"data": {"memory_error": str(memory_error)}})
             return []
 
-    async def stream_chat(
+    async def _load_thread_snapshot(
+        self, checkpointer: CheckpointerProtocol, config: Dict[str, Any]
+    ) -> Tuple[bool, bool]:
+        """Read the thread's latest checkpoint once.
+
+        Returns:
+            (has_messages, has_pending_writes). Pending writes are left behind
+            when a run stopped mid-step, which is how interrupts are stored.
+            On read errors both are True: skip memory injection and fall back
+            to a full interrupt check.
+        """
+        try:
+            snapshot = await checkpointer.aget_tuple(config)
+            if not snapshot:
+                return False, False
+            messages = snapshot.checkpoint.get("channel_values", {}).get("messages", [])
+            return bool(messages), bool(snapshot.pending_writes)
+        except Exception as e:
+            logger.warning("Could not load thread snapshot", extra={"data": {"error": str(e)}})
+            return True, True
+
+    def _resolve_interrupt(self, state: Any, chat_request: ChatRequest, setup: "TurnSetup") -> None:
+        """Fill resume fields on setup when the thread has an active interrupt."""
+        logger.info(
+            "Checking for interrupts in thread",
+            extra={"data": {"thread_id": chat_request.thread_id, "has_state": state is not None, "interrupts": state.interrupts if state else None}},
+        )
+        if not (state and state.interrupts):
+            return
+
+        logger.info(
+            "Found active interrupt, resuming with user response",
+            extra={"data": {"thread_id": chat_request.thread_id}},
+        )
+        setup.resume_from_interrupt = True
+        setup.user_response = chat_request.messages[-1].content
+
+        # Extract tool_call_id for approval persistence
+        for interrupt in state.interrupts:
+            if hasattr(interrupt, "value") and isinstance(interrupt.value, dict):
+                if interrupt.value.get("type") == "tool_approval_request":
+                    # Try interrupt value first, then resolve from messages
+                    pending_approval_tool_call_id = interrupt.value.get("tool_call_id")
+                    if not pending_approval_tool_call_id:
+                        tool_name = interrupt.value.get("tool_name")
+                        tool_args = interrupt.value.get("tool_args", {})
+                        if tool_name and state.values:
+                            for msg in reversed(state.values.get("messages", [])):
+                                if hasattr(msg, "tool_calls") and msg.tool_calls:
+                                    # Match by name AND args for disambiguation
+                                    match = next(
+                                        (tc for tc in msg.tool_calls
+                                         if tc.get("name") == tool_name
+                                         and tc.get("args", {}) == tool_args),
+                                        None,
+                                    )
+                                    # Fall back to name-only if args don't match
+                                    if not match:
+                                        match = next(
+                                            (tc for tc in msg.tool_calls
+                                             if tc.get("name") == tool_name),
+                                            None,
+                                        )
+                                    if match:
+                                        pending_approval_tool_call_id = match.get("id")
+                                        break
+                    setup.pending_approval_tool_call_id = pending_approval_tool_call_id
+                    break
+
+    async def prepare_turn(
         self,
         chat_request: ChatRequest,
         checkpointer: CheckpointerProtocol,
-        chat_agent: Any,  # CompiledStateGraph - imported lazily to avoid circular deps
-    ) -> AsyncGenerator[Dict[str, Any], None]:
-        """Core streaming logic - yields SSE events.
+        chat_agent: Any,
+    ) -> "TurnSetup":
+        """Run the pre-stream setup pipeline for one chat turn.
+
+        The thread checkpoint is read once and drives both decisions: a thread
+        without messages is a first turn (and cannot be interrupted), and only
+        a checkpoint with pending writes needs the agent's interrupt state.
+        On a first turn, memory retrieval starts right away and runs while the
+        agent is still being acquired, bounded by
+        settings.CHAT_MEMORY_CONTEXT_BUDGET_SECONDS.
 
         Args:
             chat_request: The chat request with messages and thread_id
             checkpointer: The checkpointer for conversation state
-            chat_agent: The LangGraph chat agent
+            chat_agent: The LangGraph chat agent, or an awaitable resolving to it
 
-        Yields:
-            Dict events for SSE streaming (start, message, tool_call, tool_result, complete, error)
+        Returns:
+            TurnSetup with the agent, resume/interrupt info, memory messages
+            and per-phase timings in milliseconds
         """
-        request_start = time.time()
+        from config import settings
+
         config = create_langgraph_config(chat_request.thread_id)
+        setup = TurnSetup(chat_agent=chat_agent)
 
-        # Check if there's an active interrupt that needs to be resumed
-        resume_from_interrupt = False
-        user_response = None
-        pending_approval_tool_call_id = None
-        try:
+        async def timed(phase: str, awaitable):
             t0 = time.time()
-            state = await chat_agent.aget_state(config)
-            log_timing("check_interrupts", t0)
-            logger.info(
-                "Checking for interrupts in thread",
-                extra={"data": {"thread_id": chat_request.thread_id, "has_state": state is not None, "interrupts": state.interrupts if state else None}},
+            try:
+                return await awaitable
+            finally:
+                setup.timings_ms[phase] = round((time.time() - t0) * 1000, 2)
+                log_timing(f"stream_setup.{phase}", t0, {"thread_id": chat_request.thread_id})
+
+        # Start agent acquisition first so it overlaps everything below
+        agent_future = asyncio.ensure_future(chat_agent) if inspect.isawaitable(chat_agent) else None
+        memory_task = None
+
+        try:
+            has_messages, has_pending_writes = await timed(
+                "load_snapshot", self._load_thread_snapshot(checkpointer, config)
             )
-            if state and state.interrupts:
-                logger.info(
-                    "Found active interrupt, resuming with user response",
-                    extra={"data": {"thread_id": chat_request.thread_id}},
+            setup.is_first_turn = not has_messages and not has_pending_writes
+
+            memory_started = time.time()
+            if setup.is_first_turn:
+                logger.info("First turn in conversation - injecting memory search tool call")
+                memory_task = asyncio.ensure_future(
+                    timed("memory_context", self.inject_memory_context(chat_request.messages[0].content))
                 )
-                resume_from_interrupt = True
-                user_response = chat_request.messages[-1].content
+            else:
+                logger.debug("Not first turn - skipping memory search tool injection")
 
-                # Extract tool_call_id for approval persistence
-                for interrupt in state.interrupts:
-                    if hasattr(interrupt, "value") and isinstance(interrupt.value, dict):
-                        if interrupt.value.get("type") == "tool_approval_request":
-                            # Try interrupt value first, then resolve from messages
-                            pending_approval_tool_call_id = interrupt.value.get("tool_call_id")
-                            if not pending_approval_tool_call_id:
-                                tool_name = interrupt.value.get("tool_name")
-                                tool_args = interrupt.value.get("tool_args", {})
-                                if tool_name and state.values:
-                                    for msg in reversed(state.values.get("messages", [])):
-                                        if hasattr(msg, "tool_calls") and msg.tool_calls:
-                                            # Match by name AND args for disambiguation
-                                            match = next(
-                                                (tc for tc in msg.tool_calls
-                                                 if tc.get("name") == tool_name
-                                                 and tc.get("args", {}) == tool_args),
-                                                None,
-                                            )
-                                            # Fall back to name-only if args don't match
-                                            if not match:
-                                                match = next(
-                                                    (tc for tc in msg.tool_calls
-                                                     if tc.get("name") == tool_name),
-                                                    None,
-                                                )
-                                            if match:
-                                                pending_approval_tool_call_id = match.get("id")
-                                                break
-                            break
+            if agent_future is not None:
+                setup.chat_agent = await timed("agent_acquire", agent_future)
+        except BaseException:
+            for task in (agent_future, memory_task):
+                if task is not None:
+                    task.cancel()
+            raise
+
+        try:
+            if has_pending_writes:
+                state = await timed("interrupt_state", setup.chat_agent.aget_state(config))
+                self._resolve_interrupt(state, chat_request, setup)
         except Exception as state_error:
             logger.warning("Could not check for interrupts", extra={"data": {"state_error": str(state_error)}})
 
-        # Inject memory search tool call on first turn (skip if resuming from interrupt)
-        memory_tool_messages = []
-        t0 = time.time()
-        is_first = await self.is_first_turn(chat_request.thread_id, checkpointer)
-        log_timing("is_first_turn_check", t0)
+        if memory_task is not None:
+            # The budget counts from when the search started, not from here
+            budget = settings.CHAT_MEMORY_CONTEXT_BUDGET_SECONDS
+            remaining = max(0.0, budget - (time.time() - memory_started))
+            done, _ = await asyncio.wait({memory_task}, timeout=remaining)
+            if done:
+                setup.memory_tool_messages = memory_task.result()
+            else:
+                memory_task.cancel()
+                setup.timings_ms["memory_timed_out"] = True
+                logger.warning(
+                    "Memory context exceeded time budget, continuing without it",
+                    extra={"data": {"thread_id": chat_request.thread_id, "budget_seconds": budget}},
+                )
 
-        if is_first and not resume_from_interrupt:
-            logger.info("First turn in conversation - injecting memory search tool call")
-            memory_tool_messages = await self.inject_memory_context(
-                chat_request.messages[0].content
-            )
-        else:
-            logger.debug("Not first turn - skipping memory search tool injection")
+        logger.info(
+            "Pre-stream setup phases",
+            extra={"data": {"thread_id": chat_request.thread_id, "phases_ms": setup.timings_ms, "first_turn": setup.is_first_turn}},
+        )
+        return setup
+
+    async def stream_chat(
+        self,
+        chat_request: ChatRequest,
+        checkpointer: CheckpointerProtocol,
+        chat_agent: Any,  # CompiledStateGraph - imported lazily to avoid circular deps
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Core streaming logic - yields SSE events.
+
+        Args:
+            chat_request: The chat request with messages and thread_id
+            checkpointer: The checkpointer for conversation state
+            chat_agent: The LangGraph chat agent, or an awaitable resolving to it
+                (lets agent acquisition overlap the rest of the setup)
+
+        Yields:
+            Dict events for SSE streaming (start, message, tool_call, tool_result, complete, error).
+            With chat_request.stream_tokens, also token, tool_call_delta, tool_start
+            and tool_end events; the final message events are unchanged.
+        """
+        request_start = time.time()
+        config = create_langgraph_config(chat_request.thread_id)
+
+        try:
+            setup = await self.prepare_turn(chat_request, checkpointer, chat_agent)
+        except Exception as setup_error:
+            logger.error("Failed to prepare chat turn", extra={"data": {"error": str(setup_error)}})
+            yield {
+                "type": "error",
+                "data": {"error": str(setup_error), "timestamp": datetime.now().isoformat()},
+            }
+            return
+
+        chat_agent = setup.chat_agent
+        resume_from_interrupt = setup.resume_from_interrupt
+        user_response = setup.user_response
+        pending_approval_tool_call_id = setup.pending_approval_tool_call_id
+        memory_tool_messages = setup.memory_tool_messages
 
         # Convert Pydantic models to LangChain messages (skip if resuming from interrupt)
         messages = []
@@ -242,7 +374,7 @@ class ChatService:
 
             logger.debug("Converted messages to LangChain format", extra={"data": {"messages_count": len(messages)}})
 
-        log_timing("total_pre_stream_setup", request_start)
+        log_timing("total_pre_stream_setup", request_start, {"phases_ms": setup.timings_ms})
         logger.debug(
             "Starting stream",
             extra={"data": {"thread_id": chat_request.thread_id, "resume_from_interrupt": resume_from_interrupt}},
@@ -320,11 +452,35 @@ class ChatService:
                 stream_input = {"messages": messages}
                 logger.info("Starting new conversation with messages", extra={"data": {"messages_count": len(messages)}})
 
-            async for chunk in chat_agent.astream(
-                stream_input, config=config, stream_mode="updates"
+            # Token mode adds LangGraph's "messages" stream (LLM chunks) next to the
+            # node updates; the updates still drive the complete message events.
+            stream_tokens = chat_request.stream_tokens
+            stream_mode = ["updates", "messages"] if stream_tokens else "updates"
+            token_count = 0
+            tool_started_at: Dict[str, float] = {}
+
+            async for stream_item in chat_agent.astream(
+                stream_input, config=config, stream_mode=stream_mode
             ):
+                if stream_tokens:
+                    mode, chunk = stream_item
+                else:
+                    mode, chunk = "updates", stream_item
+
+                if mode == "messages":
+                    for event in self._token_events(chunk):
+                        if first_token_time is None:
+                            first_token_time = time.time()
+                            logger.info(
+                                "First token received",
+                                extra={"data": {"first_token_ms": round((first_token_time - stream_start) * 1000, 2)}},
+                            )
+                        token_count += 1
+                        yield event
+                    continue
+
                 stream_count += 1
-                if stream_count == 1:
+                if first_token_time is None:
                     first_token_time = time.time()
                     first_token_ms = (first_token_time - stream_start) * 1000
                     logger.info(
@@ -406,6 +562,17 @@ class ChatService:
                                                 "timestamp": timestamp,
                                             },
                                         }
+                                        if stream_tokens:
+                                            # The tools node runs next
+                                            tool_started_at[tool_call.get("id")] = time.time()
+                                            yield {
+                                                "type": "tool_start",
+                                                "data": {
+                                                    "tool": tool_call["name"],
+                                                    "tool_call_id": tool_call.get("id"),
+                                                    "timestamp": timestamp,
+                                                },
+                                            }
 
                             # Handle tool results
                             elif isinstance(message, ToolMessage):
@@ -420,12 +587,32 @@ class ChatService:
                                         "timestamp": timestamp,
                                     },
                                 }
+                                if stream_tokens:
+                                    tool_call_id = getattr(message, "tool_call_id", None)
+                                    started = tool_started_at.pop(tool_call_id, None)
+                                    yield {
+                                        "type": "tool_end",
+                                        "data": {
+                                            "tool": getattr(message, "name", "unknown"),
+                                            "tool_call_id": tool_call_id,
+                                            "status": getattr(message, "status", "success"),
+                                            "duration_ms": round((time.time() - started) * 1000, 2) if started else None,
+                                            "timestamp": timestamp,
+                                        },
+                                    }
 
             total_stream_ms = (time.time() - stream_start) * 1000
+            stream_metrics = {
+                "mode": "tokens" if stream_tokens else "updates",
+                "time_to_first_token_ms": round((first_token_time - stream_start) * 1000, 2) if first_token_time else None,
+                "total_stream_ms": round(total_stream_ms, 2),
+                "token_events": token_count,
+            }
             logger.info(
                 "Streaming completed",
-                extra={"data": {"total_stream_ms": round(total_stream_ms, 2), "stream_count": stream_count, "thread_id": chat_request.thread_id}},
+                extra={"data": {**stream_metrics, "stream_count": stream_count, "thread_id": chat_request.thread_id}},
             )
+            log_timing("chat_stream", request_start, {**stream_metrics, "thread_id": chat_request.thread_id})
 
             # Verify checkpoints were saved and check for pending interrupts
             try:
@@ -468,7 +655,7 @@ class ChatService:
                     logger.warning("Failed to record approval metadata in stream_chat", extra={"data": {"error": str(e)}})
 
             # Send completion signal
-            yield {"type": "complete", "data": {"timestamp": datetime.now().isoformat()}}
+            yield {"type": "complete", "data": {"timestamp": datetime.now().isoformat(), "metrics": stream_metrics}}
 
         except Exception as e:
             logger.error("Error during streaming", extra={"data": {"error": str(e)}})
@@ -477,6 +664,58 @@ class ChatService:
                 "data": {"error": str(e), "timestamp": datetime.now().isoformat()},
             }
 
+    def _token_events(self, chunk: Any) -> List[Dict[str, Any]]:
+        """Convert one LangGraph "messages" stream item into token-level SSE events.
+
+        Only chunks produced by the chat agent's LLM node are forwarded; LLM calls
+        made inside tools are ignored. Complete messages (node outputs) are
+        skipped because the "updates" stream already reports them.
+
+        Args:
+            chunk: (message_chunk, metadata) tuple from stream_mode="messages"
+
+        Returns:
+            List of token and tool_call_delta events (possibly empty)
+        """
+        from langchain_core.messages import AIMessageChunk
+
+        message, metadata = chunk
+        node = (metadata or {}).get("langgraph_node")
+        if node != "agent" or not isinstance(message, AIMessageChunk):
+            return []
+
+        events = []
+        timestamp = datetime.now().isoformat()
+        content = message.content
+        if isinstance(content, list):
+            content = "".join(
+                part.get("text", "") if isinstance(part, dict) else str(part) for part in content
+            )
+        if content:
+            events.append({
+                "type": "token",
+                "data": {
+                    "content": content,
+                    "message_id": message.id,
+                    "node": node,
+                    "timestamp": timestamp,
+                },
+            })
+
+        for tool_chunk in message.tool_call_chunks or []:
+            events.append({
+                "type": "tool_call_delta",
+                "data": {
+                    "index": tool_chunk.get("index"),
+                    "tool_call_id": tool_chunk.get("id"),
+                    "tool": tool_chunk.get("name"),
+                    "args_delta": tool_chunk.get("args") or "",
+                    "message_id": message.id,
+                    "timestamp": timestamp,
+                },
+            })
+        return events
+
     async def check_interrupts(
         self,
         thread_id: str,
@@ -0,0 +1,419 @@
+"""
+Checkpoint Retention Service
+
+Background service that bounds the size of the LangGraph Postgres checkpointer
+tables (checkpoints, checkpoint_writes, checkpoint_blobs).
+
+Each pass walks threads in small keyset-paginated batches and:
+1. Keeps the latest CHECKPOINT_RETENTION_KEEP_LATEST checkpoints per thread
+   (pinned threads keep their full history)
+2. Removes writes of deleted checkpoints and blobs no remaining checkpoint
+   references
+3. Purges all checkpoint data of task threads whose task no longer exists,
+   along with offloaded tool results no remaining thread references
+
+Only threads idle for CHECKPOINT_RETENTION_IDLE_MINUTES are compacted, and
+every statement runs in its own short autocommit transaction, so live
+conversations are never blocked or raced.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set
+
+from config import settings
+from utils.langgraph_utils import TASK_THREAD_PREFIX
+from utils.logging import get_logger, log_timing
+
+logger = get_logger("checkpoint-retention")
+
+
+# Threads with more than the retained number of checkpoints, idle long enough
+SELECT_COMPACTION_CANDIDATES_SQL = """
+SELECT thread_id
+FROM checkpoints
+WHERE thread_id > %(after)s
+GROUP BY thread_id
+HAVING count(*) > %(keep)s
+   AND max((checkpoint->>'ts')::timestamptz) < now() - make_interval(mins => %(idle_minutes)s)
+ORDER BY thread_id
+LIMIT %(limit)s
+"""
+
+DELETE_OLD_CHECKPOINTS_SQL = """
+WITH ranked AS (
+    SELECT thread_id, checkpoint_ns, checkpoint_id,
+           row_number() OVER (
+               PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+           ) AS rn
+    FROM checkpoints
+    WHERE thread_id = ANY(%(thread_ids)s)
+), deleted AS (
+    DELETE FROM checkpoints c
+    USING ranked r
+    WHERE c.thread_id = r.thread_id
+      AND c.checkpoint_ns = r.checkpoint_ns
+      AND c.checkpoint_id = r.checkpoint_id
+      AND r.rn > %(keep)s
+    RETURNING pg_column_size(c.checkpoint) + pg_column_size(c.metadata) AS bytes
+)
+SELECT count(*), coalesce(sum(bytes), 0) FROM deleted
+"""
+
+DELETE_ORPHAN_WRITES_SQL = """
+WITH deleted AS (
+    DELETE FROM checkpoint_writes w
+    WHERE w.thread_id = ANY(%(thread_ids)s)
+      AND NOT EXISTS (
+          SELECT 1 FROM checkpoints c
+          WHERE c.thread_id = w.thread_id
+            AND c.checkpoint_ns = w.checkpoint_ns
+            AND c.checkpoint_id = w.checkpoint_id
+      )
+    RETURNING pg_column_size(w.blob) AS bytes
+)
+SELECT count(*), coalesce(sum(bytes), 0) FROM deleted
+"""
+
+# A blob is live while some checkpoint's channel_versions points at it
+DELETE_ORPHAN_BLOBS_SQL = """
+WITH deleted AS (
+    DELETE FROM checkpoint_blobs b
+    WHERE b.thread_id = ANY(%(thread_ids)s)
+      AND NOT EXISTS (
+          SELECT 1 FROM checkpoints c
+          WHERE c.thread_id = b.thread_id
+            AND c.checkpoint_ns = b.checkpoint_ns
+            AND c.checkpoint->'channel_versions'->>b.channel = b.version
+      )
+    RETURNING coalesce(pg_column_size(b.blob), 0) AS bytes
+)
+SELECT count(*), coalesce(sum(bytes), 0) FROM deleted
+"""
+
+SELECT_DELETED_TASK_THREADS_SQL = """
+SELECT DISTINCT c.thread_id
+FROM checkpoints c
+WHERE c.thread_id LIKE %(prefix_pattern)s
+  AND c.thread_id > %(after)s
+  AND NOT EXISTS (
+      SELECT 1 FROM tasks t
+      WHERE t.id::text = substring(c.thread_id FROM %(id_offset)s)
+  )
+ORDER BY c.thread_id
+LIMIT %(limit)s
+"""
+
+PURGE_THREAD_SQL = {
+    "checkpoints": """
+        WITH deleted AS (
+            DELETE FROM checkpoints WHERE thread_id = ANY(%(thread_ids)s)
+            RETURNING pg_column_size(checkpoint) + pg_column_size(metadata) AS bytes
+        )
+        SELECT count(*), coalesce(sum(bytes), 0) FROM deleted
+    """,
+    "writes": """
+        WITH deleted AS (
+            DELETE FROM checkpoint_writes WHERE thread_id = ANY(%(thread_ids)s)
+            RETURNING pg_column_size(blob) AS bytes
+        )
+        SELECT count(*), coalesce(sum(bytes), 0) FROM deleted
+    """,
+    "blobs": """
+        WITH deleted AS (
+            DELETE FROM checkpoint_blobs WHERE thread_id = ANY(%(thread_ids)s)
+            RETURNING coalesce(pg_column_size(blob), 0) AS bytes
+        )
+        SELECT count(*), coalesce(sum(bytes), 0) FROM deleted
+    """,
+}
+
+DELETE_CHAT_METADATA_SQL = """
+WITH deleted AS (
+    DELETE FROM chat_metadata WHERE thread_id = ANY(%(thread_ids)s)
+    RETURNING 1
+)
+SELECT count(*), 0 FROM deleted
+"""
+
+# Drops the threads' tool result references, then every result no other
+# thread still references. Both CTEs see the same snapshot, so the other
+# references are found by excluding the purged threads.
+DELETE_TOOL_RESULTS_SQL = """
+WITH refs AS (
+    DELETE FROM tool_result_threads WHERE thread_id = ANY(%(thread_ids)s)
+    RETURNING digest
+),
+deleted AS (
+    DELETE FROM tool_results r
+    WHERE r.digest IN (SELECT digest FROM refs)
+      AND NOT EXISTS (
+          SELECT 1 FROM tool_result_threads o
+          WHERE o.digest = r.digest AND NOT (o.thread_id = ANY(%(thread_ids)s))
+      )
+    RETURNING pg_column_size(content) AS bytes
+)
+SELECT count(*), coalesce(sum(bytes), 0) FROM deleted
+"""
+
+
+@dataclass
+class RetentionReport:
+    """Outcome of one retention pass."""
+    started_at: str = ""
+    duration_ms: float = 0.0
+    threads_compacted: int = 0
+    task_threads_purged: int = 0
+    checkpoints_deleted: int = 0
+    writes_deleted: int = 0
+    blobs_deleted: int = 0
+    bytes_reclaimed: int = 0
+    batches: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def get_pinned_threads() -> Set[str]:
+    """Thread ids whose full checkpoint history is always kept."""
+    return {
+        thread_id.strip()
+        for thread_id in settings.CHECKPOINT_RETENTION_PINNED_THREADS.split(",")
+        if thread_id.strip()
+    }
+
+
+class CheckpointRetentionService:
+    """Background service that compacts and purges LangGraph checkpoint data."""
+
+    def __init__(self):
+        self.is_running = False
+        self.retention_task: Optional[asyncio.Task] = None
+        self.last_report: Optional[RetentionReport] = None
+        self.totals = RetentionReport()
+        self._pool = None
+        self._run_lock = asyncio.Lock()
+
+    async def start(self, pg_pool) -> None:
+        """Start periodic retention passes using the shared psycopg pool."""
+        if self.is_running:
+            logger.warning("Checkpoint retention already running")
+            return
+        if not settings.CHECKPOINT_RETENTION_ENABLED:
+            logger.info("Checkpoint retention disabled")
+            return
+
+        self._pool = pg_pool
+        self.is_running = True
+        self.retention_task = asyncio.create_task(self._retention_loop())
+        logger.info("Checkpoint retention service started", extra={"data": {
+            "keep_latest": settings.CHECKPOINT_RETENTION_KEEP_LATEST,
+            "interval_seconds": settings.CHECKPOINT_RETENTION_INTERVAL_SECONDS,
+        }})
+
+    async def stop(self) -> None:
+        """Stop periodic retention passes."""
+        self.is_running = False
+
+        if self.retention_task:
+            self.retention_task.cancel()
+            try:
+                await self.retention_task
+            except asyncio.CancelledError:
+                pass
+
+        logger.info("Checkpoint retention service stopped")
+
+    async def _retention_loop(self) -> None:
+        """Run a pass, then sleep for the configured interval."""
+        try:
+            while self.is_running:
+                try:
+                    await self.run_once()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    logger.error("Error in checkpoint retention loop", exc_info=True, extra={"data": {"error": str(e)}})
+                await asyncio.sleep(settings.CHECKPOINT_RETENTION_INTERVAL_SECONDS)
+        except asyncio.CancelledError:
+            logger.info("Checkpoint retention loop cancelled")
+
+    async def run_once(self, pg_pool=None) -> RetentionReport:
+        """Run one full retention pass over all threads.
+
+        Args:
+            pg_pool: psycopg AsyncConnectionPool; defaults to the pool given to start()
+
+        Returns:
+            RetentionReport for this pass
+        """
+        pool = pg_pool or self._pool
+        if pool is None:
+            raise RuntimeError("Checkpoint retention requires a PostgreSQL pool")
+
+        async with self._run_lock:
+            t0 = time.time()
+            report = RetentionReport(started_at=datetime.now(timezone.utc).isoformat())
+
+            try:
+                await self._compact_threads(pool, report)
+            except Exception as e:
+                logger.error("Checkpoint compaction failed", extra={"data": {"error": str(e)}})
+                report.errors.append(f"compaction: {e}")
+
+            try:
+                await self._purge_deleted_task_threads(pool, report)
+            except Exception as e:
+                logger.error("Deleted task thread purge failed", extra={"data": {"error": str(e)}})
+                report.errors.append(f"task purge: {e}")
+
+            report.duration_ms = round((time.time() - t0) * 1000, 2)
+            self.last_report = report
+            self._add_to_totals(report)
+
+            log_timing("checkpoint_retention", t0, {
+                "threads_compacted": report.threads_compacted,
+                "task_threads_purged": report.task_threads_purged,
+                "checkpoints_deleted": report.checkpoints_deleted,
+                "writes_deleted": report.writes_deleted,
+                "blobs_deleted": report.blobs_deleted,
+                "bytes_reclaimed": report.bytes_reclaimed,
+            })
+            return report
+
+    def get_status(self) -> Dict[str, Any]:
+        """Return configuration, the last pass report and cumulative totals."""
+        return {
+            "enabled": settings.CHECKPOINT_RETENTION_ENABLED,
+            "running": self.is_running,
+            "keep_latest": settings.CHECKPOINT_RETENTION_KEEP_LATEST,
+            "idle_minutes": settings.CHECKPOINT_RETENTION_IDLE_MINUTES,
+            "pinned_threads": sorted(get_pinned_threads()),
+            "last_run": self.last_report.to_dict() if self.last_report else None,
+            "totals": self.totals.to_dict(),
+        }
+
+    async def _compact_threads(self, pool, report: RetentionReport) -> None:
+        """Trim old checkpoints of idle threads batch by batch."""
+        keep = max(1, settings.CHECKPOINT_RETENTION_KEEP_LATEST)
+        pinned = get_pinned_threads()
+        after = ""
+
+        while True:
+            rows = await fetch_all(pool, SELECT_COMPACTION_CANDIDATES_SQL, {
+                "after": after,
+                "keep": keep,
+                "idle_minutes": settings.CHECKPOINT_RETENTION_IDLE_MINUTES,
+                "limit": settings.CHECKPOINT_RETENTION_BATCH_SIZE,
+            })
+            if not rows:
+                return
+            after = rows[-1][0]
+
+            thread_ids = [row[0] for row in rows if row[0] not in pinned]
+            if thread_ids:
+                params = {"thread_ids": thread_ids, "keep": keep}
+                checkpoints, checkpoint_bytes = await fetch_counts(pool, DELETE_OLD_CHECKPOINTS_SQL, params)
+                writes, write_bytes = await fetch_counts(pool, DELETE_ORPHAN_WRITES_SQL, params)
+                blobs, blob_bytes = await fetch_counts(pool, DELETE_ORPHAN_BLOBS_SQL, params)
+
+                report.threads_compacted += len(thread_ids)
+                report.checkpoints_deleted += checkpoints
+                report.writes_deleted += writes
+                report.blobs_deleted += blobs
+                report.bytes_reclaimed += checkpoint_bytes + write_bytes + blob_bytes
+                report.batches += 1
+
+            await asyncio.sleep(settings.CHECKPOINT_RETENTION_BATCH_PAUSE_SECONDS)
+
+    async def _purge_deleted_task_threads(self, pool, report: RetentionReport) -> None:
+        """Remove every checkpoint row of task threads whose task was deleted."""
+        pinned = get_pinned_threads()
+        after = ""
+
+        while True:
+            rows = await fetch_all(pool, SELECT_DELETED_TASK_THREADS_SQL, {
+                "prefix_pattern": TASK_THREAD_PREFIX.replace("_", r"\_") + "%",
+                "id_offset": len(TASK_THREAD_PREFIX) + 1,
+                "after": after,
+                "limit": settings.CHECKPOINT_RETENTION_BATCH_SIZE,
+            })
+            if not rows:
+                return
+            after = rows[-1][0]
+
+            thread_ids = [row[0] for row in rows if row[0] not in pinned]
+            if thread_ids:
+                counts = await purge_threads(pool, thread_ids)
+                checkpoints = counts["checkpoints"]
+
+                report.task_threads_purged += len(thread_ids)
+                report.checkpoints_deleted += checkpoints
+                report.writes_deleted += counts["writes"]
+                report.blobs_deleted += counts["blobs"]
+                report.bytes_reclaimed += counts["bytes"]
+                report.batches += 1
+
+                logger.info("Purged checkpoint threads of deleted tasks", extra={"data": {
+                    "thread_count": len(thread_ids),
+                    "checkpoints_deleted": checkpoints,
+                }})
+
+            await asyncio.sleep(settings.CHECKPOINT_RETENTION_BATCH_PAUSE_SECONDS)
+
+    def _add_to_totals(self, report: RetentionReport) -> None:
+        for name in (
+            "threads_compacted", "task_threads_purged", "checkpoints_deleted",
+            "writes_deleted", "blobs_deleted", "bytes_reclaimed", "batches",
+        ):
+            setattr(self.totals, name, getattr(self.totals, name) + getattr(report, name))
+        self.totals.duration_ms = round(self.totals.duration_ms + report.duration_ms, 2)
+
+
+async def fetch_all(pool, sql: str, params: Dict[str, Any]) -> List[tuple]:
+    """Run a query on its own pooled connection and return all rows."""
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(sql, params)
+            return await cur.fetchall()
+
+
+async def fetch_counts(pool, sql: str, params: Dict[str, Any]) -> tuple:
+    """Run a counting DELETE statement and return (rows, bytes)."""
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute(sql, params)
+            row = await cur.fetchone()
+    return (int(row[0]), int(row[1])) if row else (0, 0)
+
+
+async def purge_threads(pool, thread_ids: List[str]) -> Dict[str, int]:
+    """Delete every checkpoint, write, blob, chat_metadata and tool result row of the given threads.
+
+    Uses one set-based statement per table. Checkpoints go last: threads are
+    found through them, so an interrupted purge is picked up again.
+
+    Returns:
+        Row counts per table plus reclaimed bytes
+    """
+    params = {"thread_ids": list(thread_ids)}
+    writes, write_bytes = await fetch_counts(pool, PURGE_THREAD_SQL["writes"], params)
+    blobs, blob_bytes = await fetch_counts(pool, PURGE_THREAD_SQL["blobs"], params)
+    metadata, _ = await fetch_counts(pool, DELETE_CHAT_METADATA_SQL, params)
+    tool_results, tool_result_bytes = await fetch_counts(pool, DELETE_TOOL_RESULTS_SQL, params)
+    checkpoints, checkpoint_bytes = await fetch_counts(pool, PURGE_THREAD_SQL["checkpoints"], params)
+    return {
+        "checkpoints": checkpoints,
+        "writes": writes,
+        "blobs": blobs,
+        "metadata": metadata,
+        "tool_results": tool_results,
+        "bytes": checkpoint_bytes + write_bytes + blob_bytes + tool_result_bytes,
+    }
+
+
+# Global retention service instance
+checkpoint_retention = CheckpointRetentionService()
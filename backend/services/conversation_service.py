@@ -5,13 +5,20 @@ Service for conversation/thread management and history retrieval.
 Handles chat history reconstruction, thread listing, and conversation CRUD.
 """
 
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Protocol, runtime_checkable, AsyncIterator
+from uuid import UUID
 
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 
-from models.chat import ChatMessageDetail, ChatSummary
-from utils.logging import get_logger
+from config import settings
+from models.chat import ChatHistoryPage, ChatMessageDetail, ChatSummary
+from services.tool_result_store import OFFLOADED_METADATA_KEY
+from utils.logging import get_logger, log_timing
 from utils.langgraph_utils import create_langgraph_config, TASK_THREAD_PREFIX, TOOL_PLACEHOLDER_TEMPLATE
 
 logger = get_logger(__name__)
@@ -40,9 +47,45 @@ class CheckpointerProtocol(Protocol):
         ...
 
 
+@dataclass
+class _HistoryTurn:
+    """One reconstructed turn: raw message span and its display message (if any)."""
+    start: int
+    end: int
+    message: Optional[ChatMessageDetail]
+
+
+@dataclass
+class _HistoryCacheEntry:
+    """Reconstructed history for one thread at a given checkpoint."""
+    checkpoint_id: Optional[str]
+    message_ids: List[Optional[str]]
+    turns: List[_HistoryTurn]
+
+    def messages(self) -> List[ChatMessageDetail]:
+        """Display messages in chronological order."""
+        return [turn.message for turn in self.turns if turn.message is not None]
+
+    def is_prefix_of(self, messages: List[Any]) -> bool:
+        """Whether the cached messages are unchanged at the start of ``messages``."""
+        if not self.turns or len(messages) < len(self.message_ids):
+            return False
+        # Every cached message must still be in place: a removal or
+        # replacement anywhere (e.g. a trimmed or summarized middle) shifts the
+        # turns. Message ids are assigned once by LangGraph's add_messages.
+        return all(
+            cached_id is not None and getattr(message, "id", None) == cached_id
+            for cached_id, message in zip(self.message_ids, messages)
+        )
+
+
 class ConversationService:
     """Service for conversation management and history retrieval."""
 
+    def __init__(self) -> None:
+        self._history_cache: "OrderedDict[str, _HistoryCacheEntry]" = OrderedDict()
+        self._history_stats = {"hits": 0, "incremental_builds": 0, "full_builds": 0}
+
     async def list_threads(self, checkpointer: CheckpointerProtocol) -> List[str]:
         """List all conversation thread IDs from the checkpointer.
 
@@ -89,6 +132,11 @@ class ConversationService:
     ) -> List[ChatMessageDetail]:
         """Get chat history from a checkpointer, reconstructing message display.
 
+        Reconstructed turns are cached per thread, keyed by checkpoint id. When
+        the checkpoint has moved on, only the turns appended since the cached
+        checkpoint (plus the last cached turn, which may have been incomplete)
+        are rebuilt.
+
         Args:
             thread_id: Chat thread identifier
             checkpointer: Checkpointer instance to use
@@ -97,177 +145,293 @@ class ConversationService:
             List of chat messages (reconstructed to match streaming experience)
         """
         try:
-            config = create_langgraph_config(thread_id)
-            state = await checkpointer.aget(config)
+            entry = await self._load_history(thread_id, checkpointer)
+            return entry.messages() if entry else []
 
-            logger.debug("Getting chat history", extra={"data": {"thread_id": thread_id, "state_type": type(state).__name__}})
+        except Exception as e:
+            logger.error("Error getting chat history", extra={"data": {"thread_id": thread_id, "error": str(e)}})
+            return []
 
-            if not state:
-                logger.debug("No state found for thread", extra={"data": {"thread_id": thread_id}})
-                return []
+    async def get_history_page(
+        self,
+        thread_id: str,
+        checkpointer: CheckpointerProtocol,
+        limit: int = 50,
+        before: Optional[int] = None,
+    ) -> ChatHistoryPage:
+        """Get one page of chat history, newest messages first.
 
-            channel_values = state.get("channel_values", {})
-            if "messages" not in channel_values:
-                logger.debug("No messages in state for thread", extra={"data": {"thread_id": thread_id, "available_keys": list(channel_values.keys())}})
-                return []
+        Pages walk backwards through the conversation: the first page holds the
+        ``limit`` most recent messages, and ``next_before`` is the cursor for the
+        page preceding it. Messages inside a page stay in chronological order.
+        Cursors are message positions, which stay stable as the chat grows.
 
-            messages = channel_values["messages"]
-            chat_messages = []
+        Args:
+            thread_id: Chat thread identifier
+            checkpointer: Checkpointer instance to use
+            limit: Maximum number of messages in the page
+            before: Only return messages positioned before this cursor
 
-            checkpoint_timestamp = state.get("ts", datetime.now().isoformat())
-            logger.debug("Found raw messages in state", extra={"data": {"message_count": len(messages), "checkpoint_timestamp": checkpoint_timestamp}})
+        Returns:
+            ChatHistoryPage with the messages and the cursor for older messages
+        """
+        messages = await self.get_history(thread_id, checkpointer)
+        total = len(messages)
+        end = total if before is None else max(0, min(before, total))
+        start = max(0, end - max(1, limit))
+
+        return ChatHistoryPage(
+            messages=messages[start:end],
+            total=total,
+            has_more=start > 0,
+            next_before=start if start > 0 else None,
+        )
 
-            if not messages:
-                return []
+    def invalidate_history(self, thread_id: Optional[str] = None) -> None:
+        """Drop cached history for one thread, or for all threads."""
+        if thread_id is None:
+            self._history_cache.clear()
+        else:
+            self._history_cache.pop(thread_id, None)
 
-            # First pass: collect all tool results by tool_call_id
-            tool_results = {}
-            for msg in messages:
-                if isinstance(msg, ToolMessage):
-                    if hasattr(msg, "tool_call_id") and msg.tool_call_id:
-                        tool_results[msg.tool_call_id] = {
-                            "content": str(msg.content),
-                            "name": getattr(msg, "name", "unknown"),
-                            "tool_call_id": msg.tool_call_id,
-                        }
+    def get_history_cache_stats(self) -> Dict[str, Any]:
+        """Return history cache counters (hits, incremental and full rebuilds)."""
+        return {**self._history_stats, "cached_threads": len(self._history_cache)}
 
-            logger.debug("Collected tool results", extra={"data": {"tool_results_count": len(tool_results)}})
+    async def _load_history(
+        self,
+        thread_id: str,
+        checkpointer: CheckpointerProtocol,
+        approved_tool_call_ids: Optional[set] = None,
+    ) -> Optional["_HistoryCacheEntry"]:
+        """Return reconstructed turns for the thread's latest checkpoint.
+
+        ``approved_tool_call_ids`` may be passed in by callers that already
+        fetched approvals for many threads at once.
+        """
+        t0 = time.time()
+        config = create_langgraph_config(thread_id)
+        state = await checkpointer.aget(config)
+
+        logger.debug("Getting chat history", extra={"data": {"thread_id": thread_id, "state_type": type(state).__name__}})
+
+        if not state:
+            logger.debug("No state found for thread", extra={"data": {"thread_id": thread_id}})
+            self.invalidate_history(thread_id)
+            return None
+
+        checkpoint_id = state.get("id")
+        cached = self._history_cache.get(thread_id)
+        if cached is not None and checkpoint_id and cached.checkpoint_id == checkpoint_id:
+            self._history_cache.move_to_end(thread_id)
+            self._history_stats["hits"] += 1
+            return cached
+
+        channel_values = state.get("channel_values", {})
+        if "messages" not in channel_values:
+            logger.debug("No messages in state for thread", extra={"data": {"thread_id": thread_id, "available_keys": list(channel_values.keys())}})
+            return None
 
+        messages = channel_values["messages"]
+        checkpoint_timestamp = state.get("ts", datetime.now().isoformat())
+        logger.debug("Found raw messages in state", extra={"data": {"message_count": len(messages), "checkpoint_timestamp": checkpoint_timestamp}})
+
+        if not messages:
+            return None
+
+        # Reuse every cached turn except the last one, which may have gained
+        # AI messages or tool results since it was cached.
+        kept_turns: List[_HistoryTurn] = []
+        if cached is not None and cached.is_prefix_of(messages):
+            kept_turns = cached.turns[:-1]
+        rebuild_from = kept_turns[-1].end if kept_turns else 0
+
+        if approved_tool_call_ids is None:
             # Fetch approved tool call IDs from metadata
             from services.chat_metadata_service import chat_metadata_service
             approved_tool_call_ids = await chat_metadata_service.get_approved_tool_calls(thread_id)
 
-            # Group messages by turn (separated by HumanMessage)
-            turns = []
-            current_turn = []
-
-            for msg in messages:
-                if isinstance(msg, HumanMessage):
-                    if current_turn:
-                        turns.append(current_turn)
-                        current_turn = []
-                    turns.append([msg])
-                else:
-                    current_turn.append(msg)
-
-            if current_turn:
-                turns.append(current_turn)
-
-            # Process each turn
-            msg_index = 0
-            for turn in turns:
-                if not turn:
-                    continue
+        msg_index = sum(1 for turn in kept_turns if turn.message is not None)
+        new_turns = self._build_turns(
+            thread_id,
+            messages,
+            rebuild_from,
+            msg_index,
+            checkpoint_timestamp,
+            approved_tool_call_ids,
+        )
+
+        entry = _HistoryCacheEntry(
+            checkpoint_id=checkpoint_id,
+            message_ids=[getattr(msg, "id", None) for msg in messages],
+            turns=kept_turns + new_turns,
+        )
+        if checkpoint_id:
+            self._history_cache[thread_id] = entry
+            self._history_cache.move_to_end(thread_id)
+            while len(self._history_cache) > max(0, settings.CHAT_HISTORY_CACHE_MAX_THREADS):
+                self._history_cache.popitem(last=False)
+
+        self._history_stats["incremental_builds" if kept_turns else "full_builds"] += 1
+        log_timing(
+            "chat_history_build",
+            t0,
+            {
+                "thread_id": thread_id,
+                "raw_message_count": len(messages),
+                "reused_turns": len(kept_turns),
+                "rebuilt_turns": len(new_turns),
+            },
+        )
+        return entry
 
-                first_msg = turn[0]
-
-                if isinstance(first_msg, HumanMessage):
-                    metadata = None
-                    if hasattr(first_msg, "additional_kwargs") and first_msg.additional_kwargs.get(
-                        "metadata"
-                    ):
-                        metadata = first_msg.additional_kwargs["metadata"]
-
-                    chat_messages.append(
-                        ChatMessageDetail(
-                            id=f"{thread_id}-msg-{msg_index}",
-                            sender="user",
-                            content=str(first_msg.content),
-                            created_at=checkpoint_timestamp,
-                            needs_decision=False,
-                            metadata=metadata,
-                        )
+    def _build_turns(
+        self,
+        thread_id: str,
+        messages: List[Any],
+        start: int,
+        msg_index: int,
+        checkpoint_timestamp: str,
+        approved_tool_call_ids: set,
+    ) -> List["_HistoryTurn"]:
+        """Reconstruct display messages for ``messages[start:]``, one per turn."""
+        # First pass: collect tool results by tool_call_id
+        tool_results = {}
+        for msg in messages[start:]:
+            if isinstance(msg, ToolMessage):
+                if hasattr(msg, "tool_call_id") and msg.tool_call_id:
+                    tool_results[msg.tool_call_id] = {
+                        "content": str(msg.content),
+                        "name": getattr(msg, "name", "unknown"),
+                        "tool_call_id": msg.tool_call_id,
+                        "offloaded": (getattr(msg, "response_metadata", None) or {}).get(OFFLOADED_METADATA_KEY),
+                    }
+
+        logger.debug("Collected tool results", extra={"data": {"tool_results_count": len(tool_results)}})
+
+        # Group messages by turn (separated by HumanMessage)
+        spans = []
+        turn_start = start
+        for position in range(start, len(messages)):
+            if isinstance(messages[position], HumanMessage):
+                if position > turn_start:
+                    spans.append((turn_start, position))
+                spans.append((position, position + 1))
+                turn_start = position + 1
+        if turn_start < len(messages):
+            spans.append((turn_start, len(messages)))
+
+        # Process each turn
+        turns = []
+        for span_start, span_end in spans:
+            turn = messages[span_start:span_end]
+            first_msg = turn[0]
+            message = None
+
+            if isinstance(first_msg, HumanMessage):
+                metadata = None
+                if hasattr(first_msg, "additional_kwargs") and first_msg.additional_kwargs.get(
+                    "metadata"
+                ):
+                    metadata = first_msg.additional_kwargs["metadata"]
+
+                message = ChatMessageDetail(
+                    id=f"{thread_id}-msg-{msg_index}",
+                    sender="user",
+                    content=str(first_msg.content),
+                    created_at=checkpoint_timestamp,
+                    needs_decision=False,
+                    metadata=metadata,
+                )
+            else:
+                # AI turn - merge all AI messages
+                merged_content_parts = []
+                all_tool_calls = []
+                first_timestamp = None
+                turn_metadata = None
+
+                for msg in turn:
+                    if isinstance(msg, AIMessage):
+                        if first_timestamp is None:
+                            first_timestamp = checkpoint_timestamp
+
+                        ai_content = str(msg.content).strip()
+
+                        # Check for metadata
+                        if hasattr(msg, "additional_kwargs") and msg.additional_kwargs.get(
+                            "metadata"
+                        ):
+                            turn_metadata = msg.additional_kwargs["metadata"]
+                        elif thread_id.startswith(
+                            TASK_THREAD_PREFIX
+                        ) and "**Current Task:**" in ai_content:
+                            turn_metadata = {"type": "task_introduction"}
+
+                        # Add content if present
+                        if ai_content and ai_content not in ["", "null", "None"]:
+                            merged_content_parts.append(ai_content)
+
+                        # Add tool call markers after content
+                        if hasattr(msg, "tool_calls") and msg.tool_calls:
+                            for tool_call in msg.tool_calls:
+                                tool_name = (
+                                    tool_call.get("name", "unknown")
+                                    if isinstance(tool_call, dict)
+                                    else getattr(tool_call, "name", "unknown")
+                                )
+                                tool_args = (
+                                    tool_call.get("args", {})
+                                    if isinstance(tool_call, dict)
+                                    else getattr(tool_call, "args", {})
+                                )
+                                tool_call_id = (
+                                    tool_call.get("id")
+                                    if isinstance(tool_call, dict)
+                                    else getattr(tool_call, "id", None)
+                                )
+
+                                tool_call_obj = {
+                                    "tool": tool_name,
+                                    "args": tool_args,
+                                    "timestamp": checkpoint_timestamp,
+                                    "tool_call_id": tool_call_id,
+                                }
+
+                                if tool_call_id and tool_call_id in tool_results:
+                                    tool_call_obj["result"] = tool_results[tool_call_id][
+                                        "content"
+                                    ]
+                                    # Full content is fetched on demand via the tool results API
+                                    if tool_results[tool_call_id]["offloaded"]:
+                                        tool_call_obj["result_ref"] = tool_results[tool_call_id]["offloaded"]
+
+                                if tool_call_id and tool_call_id in approved_tool_call_ids:
+                                    tool_call_obj["approved"] = True
+
+                                tool_index = len(all_tool_calls)
+                                merged_content_parts.append(TOOL_PLACEHOLDER_TEMPLATE.format(index=tool_index))
+                                all_tool_calls.append(tool_call_obj)
+
+                # Create merged message if there's anything to show
+                if merged_content_parts or all_tool_calls:
+                    merged_content = "\n\n".join(merged_content_parts)
+
+                    message = ChatMessageDetail(
+                        id=f"{thread_id}-msg-{msg_index}",
+                        sender="assistant",
+                        content=merged_content,
+                        created_at=first_timestamp or checkpoint_timestamp,
+                        needs_decision=False,
+                        metadata=turn_metadata,
+                        tool_calls=all_tool_calls if all_tool_calls else None,
                     )
-                    msg_index += 1
-                else:
-                    # AI turn - merge all AI messages
-                    merged_content_parts = []
-                    all_tool_calls = []
-                    first_timestamp = None
-                    turn_metadata = None
-
-                    for msg in turn:
-                        if isinstance(msg, AIMessage):
-                            if first_timestamp is None:
-                                first_timestamp = checkpoint_timestamp
-
-                            ai_content = str(msg.content).strip()
-
-                            # Check for metadata
-                            if hasattr(msg, "additional_kwargs") and msg.additional_kwargs.get(
-                                "metadata"
-                            ):
-                                turn_metadata = msg.additional_kwargs["metadata"]
-                            elif thread_id.startswith(
-                                TASK_THREAD_PREFIX
-                            ) and "**Current Task:**" in ai_content:
-                                turn_metadata = {"type": "task_introduction"}
-
-                            # Add content if present
-                            if ai_content and ai_content not in ["", "null", "None"]:
-                                merged_content_parts.append(ai_content)
-
-                            # Add tool call markers after content
-                            if hasattr(msg, "tool_calls") and msg.tool_calls:
-                                for tool_call in msg.tool_calls:
-                                    tool_name = (
-                                        tool_call.get("name", "unknown")
-                                        if isinstance(tool_call, dict)
-                                        else getattr(tool_call, "name", "unknown")
-                                    )
-                                    tool_args = (
-                                        tool_call.get("args", {})
-                                        if isinstance(tool_call, dict)
-                                        else getattr(tool_call, "args", {})
-                                    )
-                                    tool_call_id = (
-                                        tool_call.get("id")
-                                        if isinstance(tool_call, dict)
-                                        else getattr(tool_call, "id", None)
-                                    )
-
-                                    tool_call_obj = {
-                                        "tool": tool_name,
-                                        "args": tool_args,
-                                        "timestamp": checkpoint_timestamp,
-                                        "tool_call_id": tool_call_id,
-                                    }
-
-                                    if tool_call_id and tool_call_id in tool_results:
-                                        tool_call_obj["result"] = tool_results[tool_call_id][
-                                            "content"
-                                        ]
-
-                                    if tool_call_id and tool_call_id in approved_tool_call_ids:
-                                        tool_call_obj["approved"] = True
-
-                                    tool_index = len(all_tool_calls)
-                                    merged_content_parts.append(TOOL_PLACEHOLDER_TEMPLATE.format(index=tool_index))
-                                    all_tool_calls.append(tool_call_obj)
-
-                    # Create merged message if there's anything to show
-                    if merged_content_parts or all_tool_calls:
-                        merged_content = "\n\n".join(merged_content_parts)
-
-                        chat_messages.append(
-                            ChatMessageDetail(
-                                id=f"{thread_id}-msg-{msg_index}",
-                                sender="assistant",
-                                content=merged_content,
-                                created_at=first_timestamp or checkpoint_timestamp,
-                                needs_decision=False,
-                                metadata=turn_metadata,
-                                tool_calls=all_tool_calls if all_tool_calls else None,
-                            )
-                        )
-                        msg_index += 1
-
-            logger.debug("Returning chat messages", extra={"data": {"chat_message_count": len(chat_messages), "raw_message_count": len(messages)}})
-            return chat_messages
 
-        except Exception as e:
-            logger.error("Error getting chat history", extra={"data": {"thread_id": thread_id, "error": str(e)}})
-            return []
+            if message is not None:
+                msg_index += 1
+            turns.append(_HistoryTurn(start=span_start, end=span_end, message=message))
+
+        logger.debug("Rebuilt chat turns", extra={"data": {"turn_count": len(turns), "raw_message_count": len(messages) - start}})
+        return turns
 
     async def get_title(
         self, thread_id: str, messages: List[ChatMessageDetail]
@@ -289,10 +453,7 @@ class ConversationService:
                     result = await session.execute(select(Task.title).where(Task.id == task_id))
                     task_title = result.scalar_one_or_none()
 
-                    if task_title:
-                        return f"Task: {task_title}"
-                    else:
-                        return f"Task Chat (ID: {task_id[:8]}...)"
+                    return self._task_title(task_id, task_title)
 
             except Exception as e:
                 logger.warning("Error fetching task title", extra={"data": {"thread_id": thread_id, "error": str(e)}})
@@ -383,6 +544,119 @@ class ConversationService:
                 logger.warning("Error checking task status", extra={"data": {"task_id": task_id, "error": str(task_error)}})
 
         title = await self.get_title(thread_id, messages)
+        return self._build_summary(thread_id, title, messages)
+
+    async def get_summaries(
+        self, thread_ids: List[str], checkpointer: CheckpointerProtocol
+    ) -> List[ChatSummary]:
+        """Build conversation summaries for many threads.
+
+        Chat metadata (titles and tool approvals) and task titles/statuses are
+        fetched with one query each for the whole set, so the number of database
+        round trips does not grow with the number of threads; only the
+        checkpoint reads remain per thread. Threads without messages and task
+        chats with NEEDS_REVIEW status are omitted, as in get_summary().
+
+        Args:
+            thread_ids: Chat thread identifiers
+            checkpointer: Checkpointer instance to use
+
+        Returns:
+            Summaries in the order of ``thread_ids``
+        """
+        from services.chat_metadata_service import chat_metadata_service
+
+        async def load_metadata() -> Optional[Dict[str, Any]]:
+            try:
+                return await chat_metadata_service.get_metadata_bulk(thread_ids)
+            except Exception as e:
+                # Histories fall back to per-thread approval lookups
+                logger.warning("Error fetching chat metadata", extra={"data": {"thread_count": len(thread_ids), "error": str(e)}})
+                return None
+
+        metadata_by_thread, tasks_by_id = await asyncio.gather(
+            load_metadata(),
+            self._get_task_info_bulk(thread_ids),
+        )
+
+        async def load_messages(thread_id: str) -> List[ChatMessageDetail]:
+            approved = None
+            if metadata_by_thread is not None:
+                metadata = metadata_by_thread.get(thread_id)
+                approved = set(metadata.approved_tool_calls or []) if metadata else set()
+            try:
+                entry = await self._load_history(thread_id, checkpointer, approved_tool_call_ids=approved)
+                return entry.messages() if entry else []
+            except Exception as e:
+                logger.warning("Error processing chat", extra={"data": {"thread_id": thread_id, "error": str(e)}})
+                return []
+
+        histories = await asyncio.gather(*[load_messages(tid) for tid in thread_ids])
+
+        from models.models import TaskStatus
+
+        summaries = []
+        for thread_id, messages in zip(thread_ids, histories):
+            if not messages:
+                continue
+
+            if thread_id.startswith(TASK_THREAD_PREFIX):
+                task_id = thread_id.replace(TASK_THREAD_PREFIX, "")
+                task = tasks_by_id.get(task_id)
+                if task and task[1] == TaskStatus.NEEDS_REVIEW:
+                    continue  # Skip - belongs in "Needs decision" only
+                title = self._task_title(task_id, task[0] if task else None)
+            else:
+                metadata = (metadata_by_thread or {}).get(thread_id)
+                custom_title = metadata.custom_title if metadata else None
+                first_user_msg = next((msg for msg in messages if msg.sender == "user"), None)
+                title = custom_title or (
+                    self._truncate_title(first_user_msg.content) if first_user_msg else "New Chat"
+                )
+
+            summaries.append(self._build_summary(thread_id, title, messages))
+
+        logger.debug("Built chat summaries", extra={"data": {"thread_count": len(thread_ids), "summary_count": len(summaries)}})
+        return summaries
+
+    async def _get_task_info_bulk(self, thread_ids: List[str]) -> Dict[str, tuple]:
+        """Fetch (title, status) for the tasks behind task threads in one query."""
+        task_ids = []
+        for thread_id in thread_ids:
+            if thread_id.startswith(TASK_THREAD_PREFIX):
+                try:
+                    task_ids.append(UUID(thread_id.replace(TASK_THREAD_PREFIX, "")))
+                except ValueError:
+                    continue
+        if not task_ids:
+            return {}
+
+        from database.database import db_manager
+        from models.models import Task
+        from sqlalchemy import select
+
+        try:
+            async with db_manager.get_session() as session:
+                result = await session.execute(
+                    select(Task.id, Task.title, Task.status).where(Task.id.in_(task_ids))
+                )
+                return {str(task_id): (title, status) for task_id, title, status in result.all()}
+        except Exception as e:
+            logger.warning("Error fetching task info for chats", extra={"data": {"task_count": len(task_ids), "error": str(e)}})
+            return {}
+
+    @staticmethod
+    def _task_title(task_id: str, task_title: Optional[str]) -> str:
+        """Display title for a task chat."""
+        if task_title:
+            return f"Task: {task_title}"
+        return f"Task Chat (ID: {task_id[:8]}...)"
+
+    @staticmethod
+    def _build_summary(
+        thread_id: str, title: str, messages: List[ChatMessageDetail]
+    ) -> ChatSummary:
+        """Assemble a ChatSummary from reconstructed messages."""
         last_message = messages[-1] if messages else None
 
         # Get last message content, fallback to tool calls if content is empty
@@ -422,6 +696,7 @@ class ConversationService:
         """
         is_task_chat = thread_id.startswith(TASK_THREAD_PREFIX)
         task_id = thread_id.replace(TASK_THREAD_PREFIX, "") if is_task_chat else None
+        self.invalidate_history(thread_id)
 
         if is_task_chat and task_id:
             from database.database import db_manager
@@ -500,6 +775,7 @@ async def cleanup_task_chat_data(task_id: str) -> None:
 
     try:
         thread_id = create_task_thread_id(task_id)
+        conversation_service.invalidate_history(thread_id)
         checkpointer = await get_checkpointer_from_service_manager()
         await checkpointer.adelete_thread(thread_id)
         logger.info("Deleted LangGraph thread", extra={"data": {"thread_id": thread_id}})
@@ -0,0 +1,210 @@
+"""
+Tool Result Store
+
+Offloads oversized tool results (emails, event lists, Drive/GitLab searches)
+out of LangGraph state. The full content is stored once, content-addressed by
+its SHA-256 digest, in the ``tool_results`` table; the conversation keeps only
+a compact reference plus a truncated preview. The full text can be read back
+page by page with the ``read_tool_result`` tool or the chat API.
+
+Each thread that received a result is recorded in ``tool_result_threads``.
+When threads are purged (checkpoint retention, bulk deletion) their rows go
+too, and results no other thread references are deleted with them.
+
+Results live in Postgres rather than on local disk because the chat
+backend and the core agent run in separate containers.
+"""
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import ToolMessage
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from config import settings
+from database.database import db_manager
+from models.models import ToolResult, ToolResultThread
+from utils.logging import get_logger
+
+logger = get_logger("tool-result-store")
+
+# Key under ToolMessage.response_metadata describing an offloaded result
+OFFLOADED_METADATA_KEY = "offloaded_tool_result"
+
+OFFLOADED_RESULT_TEMPLATE = (
+    "[Full result of {tool} stored as tool result {digest} ({chars} chars). "
+    "Preview of the first {preview_chars} chars below; call read_tool_result "
+    "with this reference to read more.]\n{preview}"
+)
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+# Tools whose output is already read back from the store and must stay inline
+_NEVER_OFFLOAD = {"read_tool_result"}
+
+
+@dataclass
+class ToolResultPage:
+    """A slice of a stored tool result."""
+    digest: str
+    content: str
+    offset: int
+    total_chars: int
+
+    @property
+    def has_more(self) -> bool:
+        return self.offset + len(self.content) < self.total_chars
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "digest": self.digest,
+            "content": self.content,
+            "offset": self.offset,
+            "total_chars": self.total_chars,
+            "has_more": self.has_more,
+        }
+
+
+def content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def normalize_reference(reference: str) -> Optional[str]:
+    """Accept a bare digest or ``sha256:<digest>``."""
+    digest = reference.strip().lower()
+    if digest.startswith("sha256:"):
+        digest = digest[len("sha256:"):]
+    return digest if _DIGEST_RE.match(digest) else None
+
+
+class ToolResultStore:
+    """Content-addressed store for large tool results backed by the tool_results table."""
+
+    def __init__(self, max_known_digests: int = 1024):
+        # (digest, thread_id) pairs known to be stored, so repeated results skip the inserts
+        self._known: "OrderedDict[tuple, None]" = OrderedDict()
+        self._max_known = max_known_digests
+
+    def should_offload(self, message: Any) -> bool:
+        return (
+            settings.TOOL_RESULT_OFFLOAD_ENABLED
+            and isinstance(message, ToolMessage)
+            and message.name not in _NEVER_OFFLOAD
+            and isinstance(message.content, str)
+            and len(message.content) > settings.TOOL_RESULT_OFFLOAD_THRESHOLD_CHARS
+            and OFFLOADED_METADATA_KEY not in (message.response_metadata or {})
+        )
+
+    async def offload_messages(self, messages: List[Any], thread_id: Optional[str] = None) -> List[Any]:
+        """Replace oversized ToolMessages with a reference and preview.
+
+        Messages that are small, not tool results, or fail to store are
+        returned unchanged.
+
+        Args:
+            messages: Messages returned by the tool node
+            thread_id: Conversation the results belong to; its purge deletes them
+        """
+        result = []
+        for message in messages:
+            if self.should_offload(message):
+                message = await self.offload_message(message, thread_id)
+            result.append(message)
+        return result
+
+    async def offload_message(self, message: ToolMessage, thread_id: Optional[str] = None) -> ToolMessage:
+        content = message.content
+        tool_name = getattr(message, "name", None) or "tool"
+        try:
+            digest = await self.put(content, tool_name, thread_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to offload tool result, keeping it inline",
+                extra={"data": {"tool": tool_name, "chars": len(content), "error": str(e)}},
+            )
+            return message
+
+        preview_chars = settings.TOOL_RESULT_PREVIEW_CHARS
+        stub = OFFLOADED_RESULT_TEMPLATE.format(
+            tool=tool_name,
+            digest=digest,
+            chars=len(content),
+            preview_chars=min(preview_chars, len(content)),
+            preview=content[:preview_chars],
+        )
+        logger.info(
+            "Offloaded tool result",
+            extra={"data": {"tool": tool_name, "digest": digest, "chars": len(content), "inline_chars": len(stub)}},
+        )
+        return message.model_copy(update={
+            "content": stub,
+            "response_metadata": {
+                **(message.response_metadata or {}),
+                OFFLOADED_METADATA_KEY: {"digest": digest, "chars": len(content)},
+            },
+        })
+
+    async def put(self, content: str, tool_name: str, thread_id: Optional[str] = None) -> str:
+        """Store content once, record the thread referencing it, and return its digest.
+
+        Inserts skip existing rows, so concurrent writers of the same content
+        (chat backend and core agent) never create duplicates.
+        """
+        digest = content_digest(content)
+        key = (digest, thread_id)
+        if key in self._known:
+            self._known.move_to_end(key)
+            return digest
+
+        async with db_manager.get_session() as session:
+            await session.execute(
+                insert(ToolResult)
+                .values(digest=digest, tool_name=tool_name[:255], content=content)
+                .on_conflict_do_nothing(index_elements=[ToolResult.digest])
+            )
+            if thread_id:
+                await session.execute(
+                    insert(ToolResultThread)
+                    .values(digest=digest, thread_id=thread_id)
+                    .on_conflict_do_nothing(index_elements=[ToolResultThread.digest, ToolResultThread.thread_id])
+                )
+
+        self._remember(key)
+        return digest
+
+    async def get(self, reference: str) -> Optional[str]:
+        """Full content for a reference, or None if unknown."""
+        digest = normalize_reference(reference)
+        if digest is None:
+            return None
+        async with db_manager.get_session() as session:
+            result = await session.execute(select(ToolResult.content).where(ToolResult.digest == digest))
+            return result.scalar_one_or_none()
+
+    async def read(self, reference: str, offset: int = 0, limit: Optional[int] = None) -> Optional[ToolResultPage]:
+        """A slice of a stored result, or None if unknown."""
+        content = await self.get(reference)
+        if content is None:
+            return None
+        offset = max(0, offset)
+        limit = limit if limit and limit > 0 else settings.TOOL_RESULT_READ_PAGE_CHARS
+        return ToolResultPage(
+            digest=normalize_reference(reference),
+            content=content[offset:offset + limit],
+            offset=offset,
+            total_chars=len(content),
+        )
+
+    def _remember(self, key: tuple) -> None:
+        self._known[key] = None
+        self._known.move_to_end(key)
+        while len(self._known) > self._max_known:
+            self._known.popitem(last=False)
+
+
+# Global instance
+tool_result_store = ToolResultStore()
@@ -459,6 +459,13 @@ async def fill_client_timesheet(project_id: str, start_date: str, end_date: str)
     })
 
 
+# Memoization declarations (see tools/tool_memoization.py)
+get_logged_hours.metadata = {"idempotent": True, "memo_domain": "time_tracking"}
+list_projects.metadata = {"idempotent": True, "memo_domain": "time_tracking"}
+log_hours.metadata = {"mutates": ["time_tracking"]}
+configure_project.metadata = {"mutates": ["time_tracking"]}
+
+
 def get_tools():
     """Return all tools provided by this skill."""
     return [
@@ -99,6 +99,10 @@ async def lifespan(app: FastAPI):
         from services.health_monitor import health_monitor
         await health_monitor.start()
         service_manager.logger.info("Health monitor service started")
+
+        # Start checkpoint retention on the shared checkpointer pool
+        from services.checkpoint_retention import checkpoint_retention
+        await checkpoint_retention.start(service_manager.pg_pool)
         
         # Create event handler for WebSocket broadcasting and agent reloading
         event_handler = await create_website_event_handler()
@@ -142,6 +146,10 @@ async def lifespan(app: FastAPI):
     from services.health_monitor import health_monitor
     await health_monitor.stop()
     service_manager.logger.info("Health monitor service stopped")
+
+    # Stop checkpoint retention
+    from services.checkpoint_retention import checkpoint_retention
+    await checkpoint_retention.stop()
     
     # Cleanup resources
     await service_manager.cleanup_redis()
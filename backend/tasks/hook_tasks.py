@@ -5,16 +5,20 @@ Provides centralized task processing for all hook types, replacing the
 email-specific tasks with a generic, extensible approach.
 """
 
-import asyncio
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 from celery import current_task
 from celery.exceptions import Retry
 
 from celery_app import celery_app
+from config import settings
 from utils.logging import get_logger
 from utils.redis_manager import publish_sync, get_sync_redis
 from input_hooks.hook_registry import input_hook_registry
+from input_hooks.push_notifications import clear_pending_run
+from input_hooks.adaptive_polling import adaptive_poller
+from input_hooks.dead_letter import dead_letter_store
+from tasks.worker_runtime import worker_runtime
 from models.events import (
     create_hook_processing_started_event,
     create_hook_processing_completed_event,
@@ -22,6 +26,7 @@ from models.events import (
     create_hook_task_dead_letter_event
 )
 from input_hooks.models import ProcessingResult
+from input_hooks.base_hook import HookRunInProgress
 
 logger = get_logger(__name__)
 
@@ -86,7 +91,7 @@ def _update_hook_stats_in_redis(hook_name: str, result: Dict[str, Any], success:
     retry_backoff_max=300,  # Max 5 minutes between retries
     retry_jitter=True
 )
-def process_hook_items(self, hook_name: str) -> Dict[str, Any]:
+def process_hook_items(self, hook_name: str, scheduled: bool = False) -> Dict[str, Any]:
     """
     Generic task to process items from any input hook.
     
@@ -95,12 +100,25 @@ def process_hook_items(self, hook_name: str) -> Dict[str, Any]:
     
     Args:
         hook_name: Name of the hook to process (e.g., "email", "calendar")
+        scheduled: True for beat runs, which adaptive hooks skip until due
+        
+    A run that finds another run of the hook in progress does not start:
+    beat runs are skipped, push-triggered and manual runs retry later so
+    the change they were queued for is still fetched.
         
     Returns:
         Dict with processing results and statistics
     """
     task_id = current_task.request.id if current_task else "unknown"
     
+    hook = input_hook_registry.get_hook(hook_name)
+    if scheduled and hook and self.request.retries == 0 and not adaptive_poller.is_due(hook_name, hook.config):
+        logger.debug("Skipping scheduled hook run, not due yet", extra={"data": {"hook_name": hook_name, "task_id": task_id}})
+        return {"hook_name": hook_name, "task_id": task_id, "skipped": True, "reason": "not_due"}
+    
+    # Notifications arriving from now on need a new run (see input_hooks/push_notifications.py)
+    clear_pending_run(hook_name, task_id)
+    
     logger.info(
         "Starting hook processing task",
         extra={"data": {
@@ -111,24 +129,8 @@ def process_hook_items(self, hook_name: str) -> Dict[str, Any]:
     )
     
     try:
-        # Run async hook processing in sync context
-        # Check if we're already in an async context (e.g., pytest)
-        try:
-            asyncio.get_running_loop()
-            # We're in an event loop, use a different approach
-            # Create a new thread to run the async function
-            import concurrent.futures
-            import threading
-            
-            def run_in_new_thread():
-                return asyncio.run(_process_hook_items_async(hook_name, task_id))
-                
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(run_in_new_thread)
-                result = future.result()
-        except RuntimeError:
-            # No event loop running, safe to use asyncio.run()
-            result = asyncio.run(_process_hook_items_async(hook_name, task_id))
+        # Run async hook processing on the worker's persistent event loop
+        result = worker_runtime.run(_process_hook_items_async(hook_name, task_id), name=f"process_hook_items:{hook_name}")
         
         logger.info(
             "Hook processing task completed",
@@ -144,12 +146,23 @@ def process_hook_items(self, hook_name: str) -> Dict[str, Any]:
             }}
         )
         
+        if hook:
+            adaptive_poller.record_run(hook_name, hook.config, items_found=result.get("items_processed", 0))
+        
         return result
         
+    except HookRunInProgress:
+        if scheduled:
+            return {"hook_name": hook_name, "task_id": task_id, "skipped": True, "reason": "run_in_progress"}
+        raise self.retry(countdown=settings.HOOK_RUN_BUSY_RETRY_SECONDS, max_retries=None)
+        
     except Exception as e:
         retry_count = self.request.retries
         max_retries = self.max_retries
         
+        if hook:
+            adaptive_poller.record_run(hook_name, hook.config, items_found=0, error=True)
+        
         logger.error(
             "Hook processing task failed",
             exc_info=True,
@@ -193,7 +206,7 @@ def process_hook_items(self, hook_name: str) -> Dict[str, Any]:
             )
             
             try:
-                asyncio.run(_store_failed_hook_task_info(hook_name, task_id, str(e), retry_count))
+                worker_runtime.run(_store_failed_hook_task_info(hook_name, task_id, str(e), retry_count), name="store_failed_hook_task")
             except Exception as store_error:
                 logger.error(
                     "Failed to store dead letter queue information",
@@ -231,7 +244,7 @@ async def _process_hook_items_async(hook_name: str, task_id: str) -> Dict[str, A
         publish_sync(event)
         
         # Process items using the hook's pipeline
-        result = await hook.process_items()
+        result = await hook.process_items(run_id=task_id)
         
         logger.info(
             "Hook items processed successfully",
@@ -275,6 +288,9 @@ async def _process_hook_items_async(hook_name: str, task_id: str) -> Dict[str, A
 
         return result_dict
         
+    except HookRunInProgress:
+        raise
+        
     except Exception as e:
         # Update stats in Redis with failure
         _update_hook_stats_in_redis(hook_name, {}, success=False, error=str(e))
@@ -296,13 +312,14 @@ async def _process_hook_items_async(hook_name: str, task_id: str) -> Dict[str, A
     autoretry_for=(Exception,),
     retry_kwargs={'max_retries': 2, 'countdown': 30}
 )
-def process_single_item(self, hook_name: str, item_data: Dict[str, Any]) -> Dict[str, Any]:
+def process_single_item(self, hook_name: str, item_data: Dict[str, Any], dead_letter_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Process a single item from any hook (for manual processing or retries).
     
     Args:
         hook_name: Name of the hook
         item_data: Raw item data to process
+        dead_letter_id: Dead-letter entry being replayed, resolved on success
         
     Returns:
         Dict with processing result
@@ -320,7 +337,13 @@ def process_single_item(self, hook_name: str, item_data: Dict[str, Any]) -> Dict
     )
     
     try:
-        result = asyncio.run(_process_single_item_async(hook_name, task_id, item_data))
+        result = worker_runtime.run(_process_single_item_async(hook_name, task_id, item_data), name=f"process_single_item:{hook_name}")
+        
+        if dead_letter_id:
+            worker_runtime.run(
+                dead_letter_store.record_replay(dead_letter_id, result.get("success", False), result.get("error")),
+                name="record_dead_letter_replay"
+            )
         
         logger.info(
             "Single item processing completed",
@@ -459,7 +482,7 @@ def health_check_all_hooks() -> Dict[str, Any]:
     
     try:
         # Run async health check
-        health_results = asyncio.run(input_hook_registry.health_check_all())
+        health_results = worker_runtime.run(input_hook_registry.health_check_all(), name="health_check_all_hooks")
         
         # Add summary information
         total_hooks = len(health_results)
@@ -497,6 +520,31 @@ def health_check_all_hooks() -> Dict[str, Any]:
         raise
 
 
+@celery_app.task(name="tasks.hook_tasks.release_stabilized_thread_tasks")
+def release_stabilized_thread_tasks(reconcile: bool = False) -> Dict[str, Any]:
+    """
+    Release email thread tasks whose stabilization window has ended (ADR-019).
+    
+    Args:
+        reconcile: Also re-register held tasks missing from the schedule
+        
+    Returns:
+        Dict with released task ids and restored schedule entries
+    """
+    from input_hooks.email_processing.stabilization_scheduler import stabilization_scheduler
+    
+    restored = 0
+    if reconcile:
+        restored = worker_runtime.run(stabilization_scheduler.reconcile(), name="reconcile_thread_stabilization")
+    released = worker_runtime.run(stabilization_scheduler.release_due(), name="release_stabilized_thread_tasks")
+    
+    return {
+        "released_task_ids": released,
+        "restored": restored,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+
 async def _store_failed_hook_task_info(hook_name: str, task_id: str, error: str, retry_count: int) -> None:
     """
     Store information about failed hook tasks for dead letter queue handling.
@@ -0,0 +1,210 @@
+"""
+Persistent event loop and warm resources for Celery worker processes.
+
+Celery tasks are synchronous, so every hook run used to wrap its async body in
+``asyncio.run``. That created and tore down an event loop per run together
+with everything bound to it. A worker process now hosts one long-lived loop on
+a background thread. Tasks submit their coroutines to it, and shared resources
+stay warm between runs:
+
+- a pooled database engine (the NullPool engine is kept for other loops);
+- a keep-alive HTTP client for the LiteLLM MCP gateway;
+- the MCP tool catalog;
+- the user settings snapshot.
+
+Fork safety: the loop is created in the process that runs tasks. It is
+started from ``worker_process_init`` (after fork) or lazily on first use. A
+loop inherited across a fork is never reused, because the owning pid is
+checked on every submission. Each child of ``max_tasks_per_child`` recycling
+starts its own loop and cleans it up from ``worker_process_shutdown``.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Awaitable, Dict, Optional
+
+from config import settings
+from utils.logging import get_logger, log_timing
+
+logger = get_logger(__name__)
+
+
+class WorkerRuntime:
+    """One long-lived event loop per worker process with warm shared resources."""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "runs": 0,
+            "startup_ms": 0.0,
+            "dispatch_ms_total": 0.0,
+            "last_dispatch_ms": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._pid == os.getpid() and self._loop.is_running()
+
+    def start(self) -> None:
+        """Start the loop thread and warm shared resources (idempotent per process)."""
+        with self._lock:
+            if self.running:
+                return
+            if self._pid is not None and self._pid != os.getpid():
+                # Inherited from the parent across fork: the thread did not survive
+                self._loop = None
+                self._thread = None
+
+            t0 = time.time()
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run_loop():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=run_loop, name="celery-worker-loop", daemon=True)
+            thread.start()
+            ready.wait()
+            self._loop, self._thread, self._pid = loop, thread, os.getpid()
+
+        asyncio.run_coroutine_threadsafe(self._warm_up(), loop).result()
+        self._stats["startup_ms"] = round((time.time() - t0) * 1000, 2)
+        log_timing("worker_runtime.start", t0, {"pid": self._pid})
+
+    def stop(self) -> None:
+        """Release shared resources and stop the loop (no-op if not running here)."""
+        with self._lock:
+            if not self.running:
+                return
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._pid = None
+
+        t0 = time.time()
+        try:
+            asyncio.run_coroutine_threadsafe(self._shut_down(), loop).result(timeout=30)
+        except Exception as e:
+            logger.warning("Worker runtime cleanup failed", extra={"data": {"error": str(e)}})
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+        if not loop.is_running():
+            loop.close()
+        log_timing("worker_runtime.stop", t0, self.get_stats())
+
+    def run(self, coro: Awaitable[Any], name: str = "task") -> Any:
+        """Run a coroutine on the worker loop and wait for its result.
+
+        Falls back to a fresh event loop per call when the persistent loop
+        is disabled.
+        """
+        if not settings.CELERY_PERSISTENT_LOOP_ENABLED:
+            return _run_in_fresh_loop(coro)
+        if not self.running:
+            self.start()
+
+        submitted = time.perf_counter()
+        dispatch: Dict[str, float] = {}
+
+        async def timed():
+            dispatch["ms"] = (time.perf_counter() - submitted) * 1000
+            return await coro
+
+        future = asyncio.run_coroutine_threadsafe(timed(), self._loop)
+        try:
+            result = future.result()
+        except BaseException:
+            # Time limits and worker shutdown interrupt the waiting thread; stop the run too
+            future.cancel()
+            raise
+        finally:
+            self._record_run(name, submitted, dispatch.get("ms", 0.0))
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        runs = self._stats["runs"]
+        return {
+            "pid": self._pid,
+            "running": self.running,
+            "runs": runs,
+            "startup_ms": self._stats["startup_ms"],
+            "last_dispatch_ms": round(self._stats["last_dispatch_ms"], 3),
+            "avg_dispatch_ms": round(self._stats["dispatch_ms_total"] / runs, 3) if runs else 0.0,
+        }
+
+    def _record_run(self, name: str, submitted: float, dispatch_ms: float) -> None:
+        self._stats["runs"] += 1
+        self._stats["dispatch_ms_total"] += dispatch_ms
+        self._stats["last_dispatch_ms"] = dispatch_ms
+        logger.info(
+            "Worker loop run finished",
+            extra={"data": {
+                "task": name,
+                "dispatch_ms": round(dispatch_ms, 3),
+                "elapsed_ms": round((time.perf_counter() - submitted) * 1000, 2),
+                "loop_runs": self._stats["runs"],
+            }},
+        )
+
+    async def _warm_up(self) -> None:
+        from database.database import UserSettingsService, db_manager
+        from mcp_client import mcp_manager
+
+        db_manager.enable_loop_pool(
+            asyncio.get_running_loop(),
+            pool_size=settings.CELERY_WORKER_DB_POOL_SIZE,
+            max_overflow=settings.CELERY_WORKER_DB_MAX_OVERFLOW,
+        )
+        await mcp_manager.open_shared_client()
+
+        # Best effort: hooks still load these lazily if the services are down
+        for label, warm in (
+            ("user_settings", UserSettingsService.get_user_settings),
+            ("mcp_tools", mcp_manager.get_tools),
+        ):
+            try:
+                t0 = time.time()
+                await warm()
+                log_timing(f"worker_runtime.warm.{label}", t0)
+            except Exception as e:
+                logger.warning("Worker warm-up step failed", extra={"data": {"step": label, "error": str(e)}})
+
+    async def _shut_down(self) -> None:
+        from database.database import db_manager
+        from mcp_client import mcp_manager
+        from utils.redis_manager import close_redis
+
+        await mcp_manager.close_shared_client()
+        await close_redis()
+
+        current = asyncio.current_task()
+        pending = [task for task in asyncio.all_tasks() if task is not current]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        await db_manager.disable_loop_pool()
+        await asyncio.get_running_loop().shutdown_asyncgens()
+
+
+def _run_in_fresh_loop(coro: Awaitable[Any]) -> Any:
+    """Previous behaviour: a new event loop per call (on a helper thread inside a running loop)."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    import concurrent.futures
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+# Global instance (one loop per worker process)
+worker_runtime = WorkerRuntime()
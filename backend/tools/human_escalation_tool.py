@@ -61,4 +61,8 @@ def ask_user(question: str) -> str:
     
     logger.info("Received user response", extra={"data": {"response": response}})
     
-    return response 
\ No newline at end of file
+    return response 
+
+
+# Every question goes to the user (see tools/tool_memoization.py)
+ask_user.metadata = {"mutates": []}
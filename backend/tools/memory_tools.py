@@ -70,11 +70,13 @@ def get_memory_tools() -> List[StructuredTool]:
         StructuredTool.from_function(
             func=search_memory_tool,
             name="search_memory",
+            metadata={"idempotent": True, "memo_domain": "memory"},
             coroutine=search_memory_tool
         ),
         StructuredTool.from_function(
             func=add_memory_tool,
             name="add_memory",
+            metadata={"mutates": ["memory"]},
             coroutine=add_memory_tool
         )
     ] 
\ No newline at end of file
@@ -115,6 +115,11 @@ async def disable_skill(skill_name: str) -> str:
     return f"Skill '{skill_name}' deactivated. Its tools are no longer available."
 
 
+# Skill state changes are applied by the tool node on every call (see tools/tool_memoization.py)
+enable_skill.metadata = {"mutates": []}
+disable_skill.metadata = {"mutates": []}
+
+
 def get_skill_tools():
     """Return all skill management tools."""
     return [enable_skill, disable_skill]
@@ -318,21 +318,25 @@ def get_task_tools() -> List[StructuredTool]:
         StructuredTool.from_function(
             func=create_task_tool,
             name="create_task",
+            metadata={"mutates": ["tasks"]},
             coroutine=create_task_tool
         ),
         StructuredTool.from_function(
             func=update_task_tool,
             name="update_task", 
+            metadata={"mutates": ["tasks"]},
             coroutine=update_task_tool
         ),
         StructuredTool.from_function(
             func=get_tasks_tool,
             name="get_tasks",
+            metadata={"idempotent": True, "memo_domain": "tasks"},
             coroutine=get_tasks_tool
         ),
         StructuredTool.from_function(
             func=get_task_by_id_tool,
             name="get_task_by_id",
+            metadata={"idempotent": True, "memo_domain": "tasks"},
             coroutine=get_task_by_id_tool
         ),
     ] 
\ No newline at end of file
@@ -2,7 +2,7 @@
 Tool approval helper implementing LangGraph's add_human_in_the_loop pattern.
 Based on official LangGraph documentation: https://langchain-ai.github.io/langgraph/how-tos/human_in_the_loop/add-human-in-the-loop/
 """
-from typing import Callable, Dict, Any, TypedDict
+from typing import Callable, Dict, Any, Literal, Optional, TypedDict
 from langchain_core.tools import BaseTool, tool as create_tool
 from langchain_core.runnables import RunnableConfig
 from langgraph.types import interrupt
@@ -94,11 +94,11 @@ def add_human_in_the_loop(
             try:
                 await permission_config.add_permission(tool.name, tool_input)
                 logger.info("Added always allow permission", extra={"data": {"name": tool.name}})
-                # Clear the chat agent cache so the permission takes effect immediately
-                # Without this, the current chat would still use the old cached wrapped tools
-                from agent.chat_agent import clear_chat_agent_cache
-                clear_chat_agent_cache()
-                logger.info("Cleared chat agent cache for immediate permission effect")
+                # Re-apply permissions to this tool only so the change takes effect
+                # immediately without reloading the whole cached tool set
+                from agent.chat_agent import refresh_tool_permissions
+                changed = refresh_tool_permissions([tool.name])
+                logger.info("Refreshed cached tool permissions", extra={"data": {"name": tool.name, "changed": changed}})
             except Exception as e:
                 logger.error("Failed to add permission", extra={"data": {"name": tool.name, "error": str(e)}})
             # Still execute the tool this time
@@ -111,6 +111,8 @@ def add_human_in_the_loop(
         logger.info("Tool execution completed", extra={"data": {"tool_name": tool.name, "response_preview": str(tool_response)[:100]}})
         return tool_response
 
+    # Keep declarations such as memoization metadata on the wrapper
+    call_tool_with_interrupt.metadata = tool.metadata
     return call_tool_with_interrupt
 
 
@@ -138,6 +140,29 @@ def request_tool_approval(tool_name: str, tool_args: Dict[str, Any]) -> str:
     return response
 
 
+ToolApprovalMode = Literal["denied", "requires_approval", "allowed"]
+
+
+def get_tool_approval_mode(tool_name: str) -> ToolApprovalMode:
+    """Evaluate the permission config (allow/deny lists, default_secure) for one tool."""
+    from utils.tool_permissions_manager import permission_config
+
+    if permission_config.is_tool_denied(tool_name):
+        return "denied"
+    if not permission_config.is_tool_allowed(tool_name):
+        return "requires_approval"
+    return "allowed"
+
+
+def apply_tool_approval_mode(tool: BaseTool, mode: ToolApprovalMode) -> Optional[BaseTool]:
+    """Return the tool as the agent should see it: None if denied, wrapped if it needs approval."""
+    if mode == "denied":
+        return None
+    if mode == "requires_approval":
+        return add_human_in_the_loop(tool)
+    return tool
+
+
 def wrap_tools_for_approval(tools: list[BaseTool]) -> list[BaseTool]:
     """
     Wrap tools that require approval with the human-in-the-loop pattern.
@@ -146,22 +171,21 @@ def wrap_tools_for_approval(tools: list[BaseTool]) -> list[BaseTool]:
     Tools explicitly denied are removed entirely (the agent never sees them).
     Tools not explicitly allowed will be wrapped with approval requirement.
     """
-    from utils.tool_permissions_manager import permission_config
-
     wrapped_tools = []
     wrapped_count = 0
     denied_count = 0
 
     for tool in tools:
-        if permission_config.is_tool_denied(tool.name):
+        mode = get_tool_approval_mode(tool.name)
+        if mode == "denied":
             logger.info("Excluding denied tool", extra={"data": {"name": tool.name}})
             denied_count += 1
-        elif not permission_config.is_tool_allowed(tool.name):
+        elif mode == "requires_approval":
             logger.info("Wrapping tool for approval", extra={"data": {"name": tool.name}})
-            wrapped_tools.append(add_human_in_the_loop(tool))
+            wrapped_tools.append(apply_tool_approval_mode(tool, mode))
             wrapped_count += 1
         else:
             wrapped_tools.append(tool)
 
     logger.info("Tool approval wrapping complete", extra={"data": {"available_count": len(wrapped_tools), "wrapped_count": wrapped_count, "denied_count": denied_count}})
-    return wrapped_tools
\ No newline at end of file
+    return wrapped_tools
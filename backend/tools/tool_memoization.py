@@ -0,0 +1,278 @@
+"""
+Per-thread memoization of read-only tool results.
+
+Within one chat or core agent run the model often repeats the same read-only
+call (get_tasks, search_memory, calendar list_events, get_logged_hours). Tools
+that declare themselves idempotent have their results memoized per thread for
+TOOL_MEMO_TTL_SECONDS; a cached result is cleared as soon as a mutating tool
+in the same domain runs in that thread.
+
+Tools declare their behaviour through ``BaseTool.metadata``:
+
+- ``{"idempotent": True, "memo_domain": "tasks"}``: results may be reused
+- ``{"mutates": ["tasks"]}``: invalidates those domains (``[]`` for none)
+
+MCP tools cannot carry metadata, so they are classified by tool name in
+MCP_TOOL_MEMO_RULES. A tool with no declaration is treated as mutating
+everything, which clears the thread's memo.
+"""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
+
+from config import settings
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+MEMOIZED_METADATA_KEY = "memoized"
+
+# MCP tool name (without the "server-" prefix) -> (kind, domain)
+MCP_TOOL_MEMO_RULES: Dict[str, Tuple[str, str]] = {
+    # Calendar (google_workspace, ms_graph)
+    "list_events": ("read", "calendar"),
+    "get_event": ("read", "calendar"),
+    "list_calendars": ("read", "calendar"),
+    "list_calendar_events": ("read", "calendar"),
+    "create_event": ("write", "calendar"),
+    "create_quick_event": ("write", "calendar"),
+    "update_event": ("write", "calendar"),
+    "delete_event": ("write", "calendar"),
+    # Email (gmail, ms_graph)
+    "list_messages": ("read", "email"),
+    "get_message": ("read", "email"),
+    "search_messages": ("read", "email"),
+    "get_unread_emails": ("read", "email"),
+    "list_labels": ("read", "email"),
+    "search_by_label": ("read", "email"),
+    "list_drafts": ("read", "email"),
+    "list_emails": ("read", "email"),
+    "read_email": ("read", "email"),
+    "search_emails": ("read", "email"),
+    "list_folders": ("read", "email"),
+    "send_message": ("write", "email"),
+    "send_email": ("write", "email"),
+    "create_draft": ("write", "email"),
+    "apply_label": ("write", "email"),
+    "remove_label": ("write", "email"),
+    "archive_email": ("write", "email"),
+    "batch_archive": ("write", "email"),
+    "trash_email": ("write", "email"),
+    "restore_to_inbox": ("write", "email"),
+    "mark_as_read": ("write", "email"),
+    "mark_email_as_read": ("write", "email"),
+    "move_to_folder": ("write", "email"),
+    # Directory (ms_graph)
+    "lookup_contact": ("read", "directory"),
+    "search_people": ("read", "directory"),
+    "get_user_profile": ("read", "directory"),
+}
+
+
+@dataclass
+class ToolMemoPolicy:
+    """How a tool interacts with the memo."""
+    idempotent: bool = False
+    domain: Optional[str] = None
+    # Domains cleared when the tool runs; None means all domains
+    mutates: Optional[List[str]] = None
+
+
+# Calls to tools that are not bound (the tool node answers them with an error)
+_UNKNOWN_TOOL_POLICY = ToolMemoPolicy(mutates=[])
+
+
+@dataclass
+class _MemoEntry:
+    expires_at: float
+    domain: Optional[str]
+    message: ToolMessage
+
+
+@dataclass
+class MemoPlan:
+    """Split of one batch of tool calls into cached answers and calls to execute."""
+    cached: Dict[str, ToolMessage] = field(default_factory=dict)  # tool_call_id -> answer
+    to_run: List[Dict[str, Any]] = field(default_factory=list)
+    # tool_call_id of a duplicate in the same batch -> tool_call_id that is executed
+    duplicates: Dict[str, str] = field(default_factory=dict)
+
+
+def get_memo_policy(tool: Optional[BaseTool], tool_name: str) -> ToolMemoPolicy:
+    """Read a tool's memo declaration from its metadata or the MCP rules."""
+    metadata = (getattr(tool, "metadata", None) or {}) if tool is not None else {}
+    if metadata.get("idempotent"):
+        return ToolMemoPolicy(idempotent=True, domain=metadata.get("memo_domain"), mutates=[])
+    if "mutates" in metadata:
+        return ToolMemoPolicy(mutates=list(metadata["mutates"] or []))
+
+    base_name = tool_name.split("-", 1)[1] if "-" in tool_name else None
+    rule = MCP_TOOL_MEMO_RULES.get(base_name) if base_name else None
+    if rule is not None:
+        kind, domain = rule
+        if kind == "read":
+            return ToolMemoPolicy(idempotent=True, domain=domain, mutates=[])
+        return ToolMemoPolicy(mutates=[domain])
+    return ToolMemoPolicy()
+
+
+def build_memo_policies(tools: List[BaseTool]) -> Dict[str, ToolMemoPolicy]:
+    """Memo policies for the tools bound this turn.
+
+    Tools that need approval are never answered from the memo, so the user
+    still sees every call they have to approve.
+    """
+    from tools.tool_approval_helper import get_tool_approval_mode
+
+    policies = {}
+    for tool in tools:
+        policy = get_memo_policy(tool, tool.name)
+        if policy.idempotent and get_tool_approval_mode(tool.name) != "allowed":
+            policy = ToolMemoPolicy(mutates=[])
+        policies[tool.name] = policy
+    return policies
+
+
+def memo_key(tool_name: str, args: Any) -> str:
+    return f"{tool_name}:{json.dumps(args, sort_keys=True, default=str)}"
+
+
+def _mutated_domains(tool_calls: List[Dict[str, Any]], policies: Dict[str, ToolMemoPolicy]) -> Optional[set]:
+    """Domains written by a batch of calls; None if a call may write anything."""
+    mutated: set = set()
+    for tool_call in tool_calls:
+        policy = policies.get(tool_call["name"], _UNKNOWN_TOOL_POLICY)
+        if policy.idempotent:
+            continue
+        if policy.mutates is None:
+            return None
+        mutated.update(policy.mutates)
+    return mutated
+
+
+class ToolResultMemo:
+    """Bounded per-thread memo of idempotent tool results with duplicate-call stats."""
+
+    def __init__(self):
+        self._threads: "OrderedDict[str, OrderedDict[str, _MemoEntry]]" = OrderedDict()
+        self._stats = {"calls": 0, "memo_hits": 0, "batch_duplicates": 0, "executed": 0, "invalidations": 0}
+
+    def plan(self, thread_id: Optional[str], tool_calls: List[Dict[str, Any]], policies: Dict[str, ToolMemoPolicy]) -> MemoPlan:
+        """Answer repeated idempotent calls from the memo; return the rest to execute."""
+        plan = MemoPlan()
+        entries = self._entries(thread_id) if thread_id and settings.TOOL_MEMO_ENABLED else None
+        first_in_batch: Dict[str, str] = {}
+        mutated = _mutated_domains(tool_calls, policies)
+        now = time.monotonic()
+
+        for tool_call in tool_calls:
+            self._stats["calls"] += 1
+            policy = policies.get(tool_call["name"], _UNKNOWN_TOOL_POLICY)
+            if entries is None or not policy.idempotent or mutated is None or policy.domain in mutated:
+                plan.to_run.append(tool_call)
+                continue
+
+            key = memo_key(tool_call["name"], tool_call.get("args", {}))
+            entry = entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                entries.move_to_end(key)
+                plan.cached[tool_call["id"]] = entry.message.model_copy(update={
+                    "tool_call_id": tool_call["id"],
+                    "id": None,
+                    "response_metadata": {**(entry.message.response_metadata or {}), MEMOIZED_METADATA_KEY: True},
+                })
+                self._stats["memo_hits"] += 1
+                logger.info("Tool result served from memo", extra={"data": {"thread_id": thread_id, "tool": tool_call["name"]}})
+            elif key in first_in_batch:
+                plan.duplicates[tool_call["id"]] = first_in_batch[key]
+                self._stats["batch_duplicates"] += 1
+            else:
+                first_in_batch[key] = tool_call["id"]
+                plan.to_run.append(tool_call)
+
+        self._stats["executed"] += len(plan.to_run)
+        return plan
+
+    def record(
+        self,
+        thread_id: Optional[str],
+        tool_calls: List[Dict[str, Any]],
+        results: Dict[str, ToolMessage],
+        policies: Dict[str, ToolMemoPolicy],
+    ) -> None:
+        """Apply invalidations for executed calls, then memoize successful idempotent results."""
+        if not thread_id or not settings.TOOL_MEMO_ENABLED:
+            return
+
+        mutated = _mutated_domains(tool_calls, policies)
+        for tool_call in tool_calls:
+            policy = policies.get(tool_call["name"], _UNKNOWN_TOOL_POLICY)
+            if not policy.idempotent:
+                self.invalidate(thread_id, policy.mutates)
+
+        entries = self._entries(thread_id)
+        expires_at = time.monotonic() + settings.TOOL_MEMO_TTL_SECONDS
+        for tool_call in tool_calls:
+            policy = policies.get(tool_call["name"], _UNKNOWN_TOOL_POLICY)
+            message = results.get(tool_call["id"])
+            if not policy.idempotent or message is None or getattr(message, "status", "success") == "error":
+                continue
+            # Calls in a batch run concurrently, so a read next to a write in
+            # the same domain may have seen either state
+            if mutated is None or policy.domain in mutated:
+                continue
+            entries[memo_key(tool_call["name"], tool_call.get("args", {}))] = _MemoEntry(expires_at, policy.domain, message)
+            while len(entries) > settings.TOOL_MEMO_MAX_ENTRIES_PER_THREAD:
+                entries.popitem(last=False)
+
+    def invalidate(self, thread_id: str, domains: Optional[List[str]] = None) -> None:
+        """Drop a thread's memoized results in ``domains`` (all when None)."""
+        entries = self._threads.get(thread_id)
+        if not entries or domains == []:
+            return
+        if domains is None:
+            removed = len(entries)
+            entries.clear()
+        else:
+            stale = [key for key, entry in entries.items() if entry.domain in domains]
+            for key in stale:
+                del entries[key]
+            removed = len(stale)
+        if removed:
+            self._stats["invalidations"] += removed
+
+    def clear(self, thread_id: Optional[str] = None) -> None:
+        if thread_id is None:
+            self._threads.clear()
+        else:
+            self._threads.pop(thread_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        calls = self._stats["calls"]
+        saved = self._stats["memo_hits"] + self._stats["batch_duplicates"]
+        return {
+            **self._stats,
+            "duplicate_rate": round(saved / calls, 4) if calls else 0.0,
+            "threads": len(self._threads),
+            "entries": sum(len(entries) for entries in self._threads.values()),
+        }
+
+    def _entries(self, thread_id: str) -> "OrderedDict[str, _MemoEntry]":
+        entries = self._threads.get(thread_id)
+        if entries is None:
+            entries = self._threads[thread_id] = OrderedDict()
+            while len(self._threads) > settings.TOOL_MEMO_MAX_THREADS:
+                self._threads.popitem(last=False)
+        else:
+            self._threads.move_to_end(thread_id)
+        return entries
+
+
+# Global instance
+tool_result_memo = ToolResultMemo()
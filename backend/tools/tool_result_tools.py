@@ -0,0 +1,55 @@
+"""
+Tool result retrieval tools.
+
+Large tool results are offloaded out of the conversation and replaced by a
+reference plus preview (see services/tool_result_store.py). These tools let
+the agent read the full content back when the preview is not enough.
+"""
+
+from langchain_core.tools import tool
+
+from services.tool_result_store import tool_result_store
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@tool
+async def read_tool_result(reference: str, offset: int = 0, limit: int = 0) -> str:
+    """
+    Read the full content of an earlier tool result that was stored by reference.
+
+    Use this when a tool result in the conversation says it was stored as a
+    tool result reference and the preview does not contain what you need.
+
+    Args:
+        reference: The tool result reference (64-character hex digest)
+        offset: Character offset to start reading from
+        limit: Maximum number of characters to return (0 for the default page size)
+
+    Returns:
+        The requested slice of the stored result, or an error message if the
+        reference is unknown.
+    """
+    try:
+        page = await tool_result_store.read(reference, offset=offset, limit=limit or None)
+    except Exception as e:
+        logger.error("Failed to read stored tool result", extra={"data": {"reference": reference, "error": str(e)}})
+        return "Stored tool results are currently unavailable."
+
+    if page is None:
+        return f"No stored tool result found for reference '{reference}'."
+
+    end = page.offset + len(page.content)
+    header = f"[Characters {page.offset}-{end} of {page.total_chars}"
+    header += f"; call again with offset={end} to continue]" if page.has_more else "]"
+    return f"{header}\n{page.content}"
+
+
+# Stored results are content-addressed and never change (see tools/tool_memoization.py)
+read_tool_result.metadata = {"idempotent": True, "memo_domain": "tool_results"}
+
+
+def get_tool_result_tools():
+    """Return tool result retrieval tools."""
+    return [read_tool_result]
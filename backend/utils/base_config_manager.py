@@ -54,6 +54,7 @@ class BaseConfigManager(ABC, Generic[ConfigType]):
         self.debounce_seconds = debounce_seconds
         self._config_cache: Optional[ConfigType] = None
         self._load_timestamp: Optional[float] = None
+        self._version = 0  # Bumped on every load/save so consumers can cache derived state
         self._lock = threading.RLock()
         self._observer: Optional[Observer] = None
         self._pending_reload: Optional[threading.Timer] = None
@@ -98,6 +99,7 @@ class BaseConfigManager(ABC, Generic[ConfigType]):
             with self._lock:
                 self._config_cache = config
                 self._load_timestamp = time.time()
+                self._version += 1
             
             logger.info(
                 "Configuration loaded",
@@ -201,6 +203,7 @@ class BaseConfigManager(ABC, Generic[ConfigType]):
             with self._lock:
                 self._config_cache = config
                 self._load_timestamp = time.time()
+                self._version += 1
             
             logger.info(
                 "Configuration saved",
@@ -432,4 +435,8 @@ class BaseConfigManager(ABC, Generic[ConfigType]):
     
     def get_load_timestamp(self) -> Optional[float]:
         """Get the timestamp when configuration was last loaded."""
-        return self._load_timestamp 
\ No newline at end of file
+        return self._load_timestamp
+
+    def get_version(self) -> int:
+        """Get a counter that changes whenever the configuration is loaded or saved."""
+        return self._version
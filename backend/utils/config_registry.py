@@ -87,6 +87,13 @@ class ConfigRegistry:
             raise ValueError(f"Configuration manager not found: {config_name}")
         return manager.restore_backup(backup_id)
     
+    def get_config_version(self, config_name: str) -> Optional[int]:
+        """Get the load/save version of a configuration, or None if not registered."""
+        manager = self.get_manager(config_name)
+        if manager is None:
+            return None
+        return manager.get_version()
+
     def reload_config(self, config_name: str) -> None:
         """Reload configuration by name."""
         manager = self.get_manager(config_name)
@@ -376,6 +383,11 @@ def reload_config(config_name: str) -> None:
     config_registry.reload_config(config_name)
 
 
+def get_config_version(config_name: str) -> Optional[int]:
+    """Get the load/save version of a configuration."""
+    return config_registry.get_config_version(config_name)
+
+
 def initialize_configs() -> None:
     """Initialize standard Nova configurations."""
     config_registry.initialize_standard_configs()
@@ -6,6 +6,7 @@ Provides DRY event handling functions for chat agent and core agent services.
 
 from typing import Callable, Optional
 from utils.logging import get_logger
+from utils.user_settings_cache import handle_settings_event
 
 logger = get_logger("event-handlers")
 
@@ -35,6 +36,13 @@ def create_unified_event_handler(
             if websocket_broadcast_func:
                 await websocket_broadcast_func(event)
             
+            # Refresh cached user settings before any agent rebuild reads them
+            if await handle_settings_event(event):
+                logger.info(
+                    "User settings cache refreshed",
+                    extra={"data": {"event_id": event.id, "service": service_name, "type": event.type}}
+                )
+            
             if event.type == "prompt_updated":
                 logger.info(
                     "Prompt updated, reloading agent",
@@ -1,40 +1,112 @@
 """
 Prompt loader with hot-reload capabilities.
 UPDATED: Now uses database-based user settings instead of config files.
+
+The system prompt is assembled from two segments:
+- A static prefix (persona, guidelines, available skills) that is cached and
+  kept byte-identical until the prompt file or skill registry changes, so
+  provider-side prompt prefix caching keeps hitting.
+- A volatile suffix holding the user context and current time, starting at
+  the first line that references a user/clock template variable. The clock is
+  rounded to SYSTEM_PROMPT_CLOCK_GRANULARITY_SECONDS.
 """
 
+import hashlib
+import re
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Optional
 
 import pytz
 
+from config import settings
 from database.database import db_manager
 from models.user_settings import UserSettings
-from utils.config_registry import config_registry
-from utils.logging import get_logger
+from utils.config_registry import config_registry, get_config_version
+from utils.logging import get_logger, log_timing
 from utils.skill_manager import get_skill_manager
 
 logger = get_logger("prompt_loader")
 
+# Template variables that change per user or per minute; everything before the
+# first line using one of them is treated as the static prefix.
+VOLATILE_TEMPLATE_VARIABLES = (
+    "user_full_name",
+    "user_email",
+    "user_timezone",
+    "current_time_user_tz",
+    "user_notes_section",
+)
+
+_VOLATILE_FIELD_RE = re.compile(
+    r"(?<!\{)\{(?:" + "|".join(VOLATILE_TEMPLATE_VARIABLES) + r")(?:[!:][^{}]*)?\}"
+)
+
+
+@dataclass
+class PromptBuildStats:
+    """Counters for system prompt assembly and prefix stability."""
+    builds: int = 0
+    prefix_builds: int = 0
+    prefix_cache_hits: int = 0
+    prefix_changes: int = 0
+    last_build_ms: float = 0.0
+    total_build_ms: float = 0.0
+    prefix_hash: Optional[str] = None
+    prefix_chars: int = 0
+    suffix_chars: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "builds": self.builds,
+            "prefix_builds": self.prefix_builds,
+            "prefix_cache_hits": self.prefix_cache_hits,
+            "prefix_changes": self.prefix_changes,
+            "last_build_ms": round(self.last_build_ms, 2),
+            "avg_build_ms": round(self.total_build_ms / self.builds, 2) if self.builds else 0.0,
+            "prefix_hash": self.prefix_hash,
+            "prefix_chars": self.prefix_chars,
+            "suffix_chars": self.suffix_chars,
+        }
+
+
+@dataclass
+class _PromptSegments:
+    """Static prefix rendered for one (template version, skills) combination."""
+    key: tuple
+    prefix: str
+    suffix_template: str
+    static_vars: dict
+
+
+_segments: Optional[_PromptSegments] = None
+_segments_lock = threading.Lock()
+_stats = PromptBuildStats()
+
 
 async def load_nova_system_prompt() -> str:
     """
     Load Nova system prompt from markdown file with user context injection.
     Now uses database-based user settings instead of config files.
-    
+
     FAIL-FAST: This function will raise exceptions if configuration is missing
     or invalid. This is intentional - the system should not start without
     proper configuration.
     """
+    t0 = time.time()
+
     # Get prompt manager - will raise if not initialized
     prompt_manager = config_registry.get_manager("system_prompt")
-    
+
     if prompt_manager is None:
         raise RuntimeError("System prompt manager not initialized in config registry")
-    
-    # Get user profile from database
+
+    # Get user profile from database (served from the user settings cache)
     from database.database import UserSettingsService
     user_settings = await UserSettingsService.get_user_settings()
-    
+
     # Use defaults if no user settings found
     if user_settings is None:
         logger.error("No user settings found in database, using defaults")
@@ -43,58 +115,153 @@ async def load_nova_system_prompt() -> str:
         user_timezone = "UTC"
         user_notes = None
     else:
-        user_full_name = user_settings.full_name 
-        user_email = user_settings.email 
+        user_full_name = user_settings.full_name
+        user_email = user_settings.email
         user_timezone = user_settings.timezone
         user_notes = user_settings.notes
-    
+
+    volatile_vars = dict(
+        user_full_name=user_full_name,
+        user_email=user_email,
+        user_timezone=user_timezone,
+        current_time_user_tz=_format_current_time(user_timezone),
+        user_notes_section=user_notes,
+    )
+
+    segments = _get_prompt_segments(prompt_manager)
+    try:
+        suffix = segments.suffix_template.format(**segments.static_vars, **volatile_vars)
+        prompt = segments.prefix + suffix
+    except Exception:
+        # Same fallback behaviour as unsegmented template processing
+        prompt = prompt_manager.get_processed_config(**segments.static_vars, **volatile_vars)
+        suffix = ""
+
+    elapsed_ms = (time.time() - t0) * 1000
+    _stats.builds += 1
+    _stats.last_build_ms = elapsed_ms
+    _stats.total_build_ms += elapsed_ms
+    _stats.suffix_chars = len(suffix)
+    log_timing(
+        "system_prompt_build",
+        t0,
+        {"prefix_hash": _stats.prefix_hash, "prefix_chars": _stats.prefix_chars, "suffix_chars": len(suffix)},
+    )
+
+    return prompt
+
+
+def _format_current_time(user_timezone: str) -> str:
+    """Format the current time in the user's timezone, rounded down to the configured granularity."""
+    granularity = max(1, settings.SYSTEM_PROMPT_CLOCK_GRANULARITY_SECONDS)
+    now_ts = int(time.time()) // granularity * granularity
+    time_format = "%Y-%m-%d %H:%M:%S %Z" if granularity < 60 else "%Y-%m-%d %H:%M %Z"
+
     # Get current time in user's timezone
     try:
         user_tz = pytz.timezone(user_timezone)
-        current_time = datetime.now(user_tz)
-        current_time_str = current_time.strftime("%Y-%m-%d %H:%M:%S %Z")
+        return datetime.fromtimestamp(now_ts, user_tz).strftime(time_format)
     except pytz.UnknownTimeZoneError:
         # Fallback to UTC if timezone is invalid
         logger.warning("Invalid timezone, using UTC", extra={"data": {"user_timezone": user_timezone}})
-        current_time_str = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-    
+        return datetime.fromtimestamp(now_ts, pytz.utc).strftime(time_format)
+
+
+def _get_prompt_segments(prompt_manager) -> _PromptSegments:
+    """Return the cached static prefix, rebuilding it when its inputs change."""
+    global _segments
+
     # Build available skills section
-    available_skills_section = _build_available_skills_section()
+    skill_summaries = _get_skill_summaries()
+    key = (
+        id(prompt_manager),
+        get_config_version("system_prompt"),
+        tuple(sorted(skill_summaries.items())),
+    )
 
-    # Use the unified system's template processing - will raise if template is invalid
-    prompt = prompt_manager.get_processed_config(
-        user_full_name=user_full_name,
-        user_email=user_email,
-        user_timezone=user_timezone,
-        current_time_user_tz=current_time_str,
-        user_notes_section=user_notes,
-        available_skills_section=available_skills_section,
+    with _segments_lock:
+        if _segments is not None and _segments.key == key:
+            _stats.prefix_cache_hits += 1
+            return _segments
+
+    template = prompt_manager.get_config()
+    static_vars = {"available_skills_section": _build_available_skills_section(skill_summaries)}
+
+    match = _VOLATILE_FIELD_RE.search(template)
+    split_at = template.rfind("\n", 0, match.start()) + 1 if match else len(template)
+    prefix_template, suffix_template = template[:split_at], template[split_at:]
+    try:
+        prefix = prefix_template.format(**static_vars)
+    except Exception as e:
+        # Let the whole template go through the fallback path below
+        logger.warning(
+            "Failed to render static prompt prefix",
+            extra={"data": {"error": str(e)}},
+        )
+        prefix, suffix_template = "", template
+
+    segments = _PromptSegments(key=key, prefix=prefix, suffix_template=suffix_template, static_vars=static_vars)
+    prefix_hash = hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:16]
+
+    with _segments_lock:
+        _segments = segments
+        _stats.prefix_builds += 1
+        if _stats.prefix_hash is not None and _stats.prefix_hash != prefix_hash:
+            _stats.prefix_changes += 1
+        _stats.prefix_hash = prefix_hash
+        _stats.prefix_chars = len(prefix)
+
+    logger.info(
+        "System prompt prefix rebuilt",
+        extra={"data": {"prefix_hash": prefix_hash, "prefix_chars": len(prefix), "skills": len(skill_summaries)}},
     )
+    return segments
+
+
+def clear_prompt_cache() -> None:
+    """Drop the cached static prefix so the next build re-renders it."""
+    global _segments
+    with _segments_lock:
+        _segments = None
 
-    return prompt
 
+def get_prompt_build_stats() -> dict:
+    """Return prompt assembly counters (build time, prefix hash and stability)."""
+    return _stats.to_dict()
 
-def _build_available_skills_section() -> str:
+
+def _get_skill_summaries() -> dict[str, str]:
+    """Return skill name -> description, or an empty mapping on failure."""
+    try:
+        return get_skill_manager().get_skill_summaries()
+    except Exception as e:
+        logger.warning(
+            "Failed to build available skills section",
+            extra={"data": {"error": str(e)}},
+        )
+        return {}
+
+
+def _build_available_skills_section(skill_summaries: Optional[dict[str, str]] = None) -> str:
     """
     Build the available skills section for the system prompt.
 
     Returns an empty string if no skills are available, otherwise
     returns a formatted section listing available skills.
     """
-    try:
-        skill_manager = get_skill_manager()
-        skill_summaries = skill_manager.get_skill_summaries()
+    if skill_summaries is None:
+        skill_summaries = _get_skill_summaries()
 
-        if not skill_summaries:
-            return ""
+    if not skill_summaries:
+        return ""
 
-        # Format skills as a bullet list
-        skills_list = "\n".join(
-            f"- **{name}**: {description}"
-            for name, description in sorted(skill_summaries.items())
-        )
+    # Format skills as a bullet list
+    skills_list = "\n".join(
+        f"- **{name}**: {description}"
+        for name, description in sorted(skill_summaries.items())
+    )
 
-        return f"""
+    return f"""
 
 **Available Skills:**
 The following specialized skills are available. If a user request matches
@@ -102,9 +269,3 @@ one of these domains, use the `enable_skill` tool to load it.
 
 {skills_list}
 """
-    except Exception as e:
-        logger.warning(
-            "Failed to build available skills section",
-            extra={"data": {"error": str(e)}},
-        )
-        return "" 
\ No newline at end of file
@@ -5,6 +5,7 @@ Handles pub/sub for broadcasting events to WebSocket clients.
 
 import asyncio
 import json
+import os
 from typing import AsyncIterator, Optional
 
 import redis.asyncio as redis
@@ -17,6 +18,8 @@ logger = get_logger("redis_manager")
 
 # Global Redis client instance
 _redis_client: Optional[Redis] = None
+_sync_redis_client = None
+_sync_redis_pid: Optional[int] = None
 
 
 async def get_redis() -> Redis:
@@ -80,7 +83,16 @@ async def get_redis() -> Redis:
 
 
 def get_sync_redis():
-    """Get a synchronous Redis client for use in Celery workers."""
+    """Get a synchronous Redis client for use in Celery workers.
+    
+    The client (and its connection pool) is reused for the lifetime of the
+    process; a forked child creates its own.
+    """
+    global _sync_redis_client, _sync_redis_pid
+    
+    if _sync_redis_client is not None and _sync_redis_pid == os.getpid():
+        return _sync_redis_client
+    
     try:
         from config import settings
         redis_url = settings.REDIS_URL
@@ -89,7 +101,7 @@ def get_sync_redis():
         import redis as sync_redis
         
         # Create synchronous Redis client
-        return sync_redis.Redis.from_url(
+        _sync_redis_client = sync_redis.Redis.from_url(
             redis_url,
             decode_responses=True,
             health_check_interval=30,
@@ -98,6 +110,8 @@ def get_sync_redis():
             retry_on_timeout=True,
             retry_on_error=[sync_redis.ConnectionError, sync_redis.TimeoutError]
         )
+        _sync_redis_pid = os.getpid()
+        return _sync_redis_client
     except Exception as e:
         logger.error(
             "Failed to create sync Redis client",
@@ -8,6 +8,8 @@ rather than a single configuration file.
 
 import importlib.util
 import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
@@ -22,11 +24,40 @@ from models.skill_models import (
     SkillNotFoundError,
     SkillLoadError,
 )
-from utils.logging import get_logger
+from utils.logging import get_logger, log_timing
 
 logger = get_logger("skill_manager")
 
 
+@dataclass
+class _LoadedSkill:
+    """A loaded skill cached in-process, valid while its files are unchanged."""
+    fingerprint: tuple
+    definition: SkillDefinition
+    namespaced_tools: list[BaseTool]
+
+
+@dataclass
+class SkillLoadStats:
+    """Per-skill activation latency counters."""
+    loads: int = 0
+    cache_hits: int = 0
+    last_load_ms: float = 0.0
+    total_load_ms: float = 0.0
+    last_activation_ms: float = 0.0
+    last_loaded_at: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "loads": self.loads,
+            "cache_hits": self.cache_hits,
+            "last_load_ms": round(self.last_load_ms, 2),
+            "avg_load_ms": round(self.total_load_ms / self.loads, 2) if self.loads else 0.0,
+            "last_activation_ms": round(self.last_activation_ms, 2),
+            "last_loaded_at": self.last_loaded_at,
+        }
+
+
 class SkillManager:
     """
     Manages skill discovery and loading with hot-reload support.
@@ -34,6 +65,9 @@ class SkillManager:
     Scans the skills directory for valid skill packages (directories with manifest.yaml),
     maintains a lightweight registry of available skills, and loads full skill definitions
     (instructions + tools) on demand.
+
+    Loaded skills are cached for the lifetime of the process: each skill's tools.py is
+    executed once and re-executed only when a file under its directory changes.
     """
 
     def __init__(self, skills_path: Path, debounce_seconds: float = 0.5):
@@ -47,6 +81,8 @@ class SkillManager:
         self.skills_path = Path(skills_path)
         self.debounce_seconds = debounce_seconds
         self._registry: dict[str, SkillManifest] = {}
+        self._loaded: dict[str, _LoadedSkill] = {}
+        self._load_stats: dict[str, SkillLoadStats] = {}
         self._lock = threading.RLock()
         self._observer: Optional[Observer] = None
         self._pending_reload: Optional[threading.Timer] = None
@@ -141,10 +177,23 @@ class SkillManager:
                 raise SkillNotFoundError(f"Unknown skill: {skill_name}")
             return self._registry[skill_name]
 
+    def _skill_fingerprint(self, skill_path: Path) -> tuple:
+        """Fingerprint all files of a skill (path, mtime, size), ignoring bytecode caches."""
+        entries = []
+        for path in skill_path.rglob("*"):
+            if "__pycache__" in path.parts or not path.is_file():
+                continue
+            stat = path.stat()
+            entries.append((str(path.relative_to(skill_path)), stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(entries))
+
     async def load_skill(self, skill_name: str) -> SkillDefinition:
         """
         Load full skill definition including instructions and tools.
 
+        Returns the cached definition if none of the skill's files changed since
+        it was last loaded; otherwise re-reads instructions and re-imports tools.
+
         Args:
             skill_name: Name of the skill to load (directory name)
 
@@ -155,14 +204,51 @@ class SkillManager:
             SkillNotFoundError: If skill does not exist
             SkillLoadError: If skill fails to load
         """
+        return (await self._get_loaded_skill(skill_name)).definition
+
+    async def _get_loaded_skill(self, skill_name: str) -> _LoadedSkill:
+        """Get a loaded skill from the process-wide cache, (re)loading it if stale."""
+        t0 = time.time()
+
         with self._lock:
             if skill_name not in self._registry:
                 raise SkillNotFoundError(f"Unknown skill: {skill_name}")
 
             manifest = self._registry[skill_name]
+            cached = self._loaded.get(skill_name)
+            stats = self._load_stats.setdefault(skill_name, SkillLoadStats())
 
         skill_path = self.skills_path / skill_name
+        fingerprint = self._skill_fingerprint(skill_path)
 
+        if cached is not None and cached.fingerprint == fingerprint:
+            with self._lock:
+                stats.cache_hits += 1
+                stats.last_activation_ms = (time.time() - t0) * 1000
+            return cached
+
+        loaded = self._load_skill_from_disk(skill_name, manifest, skill_path, fingerprint)
+        elapsed_ms = (time.time() - t0) * 1000
+
+        with self._lock:
+            self._loaded[skill_name] = loaded
+            stats.loads += 1
+            stats.last_load_ms = elapsed_ms
+            stats.total_load_ms += elapsed_ms
+            stats.last_activation_ms = elapsed_ms
+            stats.last_loaded_at = time.time()
+
+        log_timing(
+            "skill_load",
+            t0,
+            {"skill": skill_name, "reload": cached is not None, "tools": len(loaded.namespaced_tools)},
+        )
+        return loaded
+
+    def _load_skill_from_disk(
+        self, skill_name: str, manifest: SkillManifest, skill_path: Path, fingerprint: tuple
+    ) -> _LoadedSkill:
+        """Read instructions and import tools for a skill."""
         # Load instructions
         instructions_path = skill_path / "instructions.md"
         if not instructions_path.exists():
@@ -182,7 +268,24 @@ class SkillManager:
             except Exception as e:
                 raise SkillLoadError(f"Failed to load tools for {skill_name}: {e}")
 
-        return SkillDefinition(manifest=manifest, instructions=instructions, tools=tools)
+        return _LoadedSkill(
+            fingerprint=fingerprint,
+            definition=SkillDefinition(manifest=manifest, instructions=instructions, tools=tools),
+            namespaced_tools=[self._namespace_tool(skill_name, tool) for tool in tools],
+        )
+
+    def invalidate(self, skill_name: Optional[str] = None) -> None:
+        """Drop cached loaded skill(s) so the next activation reloads from disk."""
+        with self._lock:
+            if skill_name is None:
+                self._loaded.clear()
+            else:
+                self._loaded.pop(skill_name, None)
+
+    def get_load_stats(self) -> dict[str, dict]:
+        """Return per-skill activation latency and cache statistics."""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._load_stats.items()}
 
     def _import_tools(self, tools_path: Path, skill_name: str) -> list[BaseTool]:
         """
@@ -233,18 +336,14 @@ class SkillManager:
         Returns:
             List of tools ready for use by the agent
         """
-        skill = await self.load_skill(skill_name)
+        loaded = await self._get_loaded_skill(skill_name)
 
         if namespace:
             # Namespace tools to avoid conflicts: skill_name__tool_name
-            namespaced_tools = []
-            for tool in skill.tools:
-                # Create a new tool with namespaced name
-                namespaced_tool = self._namespace_tool(skill_name, tool)
-                namespaced_tools.append(namespaced_tool)
-            tools = namespaced_tools
+            # (namespaced copies are built once per load and cached)
+            tools = list(loaded.namespaced_tools)
         else:
-            tools = skill.tools
+            tools = loaded.definition.tools
 
         # Apply approval wrappers (import here to avoid circular import)
         from tools.tool_approval_helper import wrap_tools_for_approval
@@ -266,6 +365,7 @@ class SkillManager:
                 name=namespaced_name,
                 description=tool.description,
                 args_schema=tool.args_schema if hasattr(tool, "args_schema") else None,
+                metadata=tool.metadata,
             )
         else:
             # Sync tool
@@ -274,11 +374,13 @@ class SkillManager:
                 name=namespaced_name,
                 description=tool.description,
                 args_schema=tool.args_schema if hasattr(tool, "args_schema") else None,
+                metadata=tool.metadata,
             )
 
     def reload(self) -> None:
-        """Manually reload skill registry."""
+        """Manually reload skill registry and drop all loaded skills."""
         logger.info("Reloading skill registry")
+        self.invalidate()
         self._scan_skills()
 
     def _debounced_reload(self) -> None:
@@ -314,10 +416,17 @@ class SkillManager:
                     "deleted",
                     "moved",
                 ):
+                    if "__pycache__" in Path(event.src_path).parts:
+                        return
                     logger.debug(
                         "Skills directory change detected",
                         extra={"data": {"event_type": event.event_type, "path": event.src_path}},
                     )
+                    try:
+                        relative = Path(event.src_path).relative_to(self.manager.skills_path)
+                        self.manager.invalidate(relative.parts[0])
+                    except (ValueError, IndexError):
+                        self.manager.invalidate()
                     self.manager._debounced_reload()
 
         self._observer = Observer()
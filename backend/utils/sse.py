@@ -0,0 +1,137 @@
+"""
+Server-Sent Events encoding for streaming endpoints.
+
+Events are serialized with orjson and bursts of small events (token deltas,
+tool updates) that arrive within a short window are coalesced into a single
+write. Heartbeat comment frames keep idle connections (long tool calls,
+approval waits) alive through proxies; clients ignore them.
+"""
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+import orjson
+
+HEARTBEAT_FRAME = b": heartbeat\n\n"
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    return str(value)
+
+
+def encode_event(event: Any) -> bytes:
+    """Encode one event as an SSE ``data:`` frame."""
+    return b"data: " + orjson.dumps(event, default=_default, option=_ORJSON_OPTIONS) + b"\n\n"
+
+
+@dataclass
+class SSEStreamStats:
+    """Per-response encoding and write statistics."""
+    events: int = 0
+    writes: int = 0
+    heartbeats: int = 0
+    bytes: int = 0
+    encode_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["encode_ms"] = round(self.encode_ms, 3)
+        data["events_per_write"] = round(self.events / self.writes, 2) if self.writes else 0.0
+        return data
+
+
+async def sse_stream(
+    events: AsyncIterator[Any],
+    coalesce_ms: float = 5.0,
+    max_batch_bytes: int = 64 * 1024,
+    heartbeat_seconds: Optional[float] = 15.0,
+    stats: Optional[SSEStreamStats] = None,
+) -> AsyncIterator[bytes]:
+    """Turn an async iterator of events into coalesced SSE writes.
+
+    Each write contains every event that arrived within ``coalesce_ms`` of the
+    first one in the batch (up to ``max_batch_bytes``). Events are pulled one
+    at a time, so the source still sees normal backpressure. If no event
+    arrives for ``heartbeat_seconds``, a heartbeat comment frame is written.
+
+    Args:
+        events: Source of JSON-serializable events
+        coalesce_ms: Batching window; 0 writes every event on its own
+        max_batch_bytes: Flush early once a batch reaches this size
+        heartbeat_seconds: Idle interval between heartbeats; None disables them
+        stats: Optional stats object updated in place
+    """
+    stats = stats if stats is not None else SSEStreamStats()
+    iterator = events.__aiter__()
+    pending: Optional[asyncio.Future] = None
+    coalesce_seconds = max(0.0, coalesce_ms) / 1000
+
+    async def next_event(timeout: Optional[float]):
+        """Wait for the next event without cancelling the source on timeout."""
+        nonlocal pending
+        if pending is None:
+            pending = asyncio.ensure_future(iterator.__anext__())
+        done, _ = await asyncio.wait({pending}, timeout=timeout)
+        if not done:
+            return False, None
+        future, pending = pending, None
+        return True, future.result()
+
+    def encode(event: Any) -> bytes:
+        t0 = time.perf_counter()
+        frame = encode_event(event)
+        stats.encode_ms += (time.perf_counter() - t0) * 1000
+        stats.events += 1
+        return frame
+
+    def flush(batch: bytearray) -> bytes:
+        stats.writes += 1
+        stats.bytes += len(batch)
+        return bytes(batch)
+
+    try:
+        while True:
+            try:
+                ready, event = await next_event(heartbeat_seconds)
+            except StopAsyncIteration:
+                return
+            if not ready:
+                stats.heartbeats += 1
+                stats.writes += 1
+                stats.bytes += len(HEARTBEAT_FRAME)
+                yield HEARTBEAT_FRAME
+                continue
+
+            batch = bytearray(encode(event))
+            deadline = time.monotonic() + coalesce_seconds
+            finished = False
+            while len(batch) < max_batch_bytes:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    ready, event = await next_event(remaining)
+                except StopAsyncIteration:
+                    finished = True
+                    break
+                if not ready:
+                    break
+                batch += encode(event)
+
+            yield flush(batch)
+            if finished:
+                return
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except (asyncio.CancelledError, StopAsyncIteration, Exception):
+                pass
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
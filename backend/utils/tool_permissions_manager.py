@@ -5,21 +5,178 @@ Handles loading, caching, and managing tool permissions configuration
 using Nova's ConfigRegistry system for proper path resolution and hot-reload.
 """
 
-from typing import Dict, List, Any
+import re
+from functools import cached_property
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 
-from utils.config_registry import get_config, save_config
+from utils.config_registry import get_config, save_config, get_config_version
 from models.tool_permissions_config import ToolPermissionsConfig
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def format_permission_pattern(tool_name: str, tool_args: Dict[str, Any] | None = None) -> str:
+    """Format tool call into permission pattern string."""
+    if not tool_args:
+        return tool_name
+
+    # Sort for consistent pattern matching
+    sorted_args = sorted(tool_args.items())
+    args_str = ",".join(f"{k}={v}" for k, v in sorted_args)
+    return f"{tool_name}({args_str})"
+
+
+class ToolNameIndex:
+    """Indexed tool-name matcher for a list of permission patterns.
+
+    Equivalent to testing every pattern with
+    ToolPermissionConfig._matches_tool_pattern, but exact names and
+    "tool(*)" wildcards are a set lookup and "prefix*" patterns are grouped
+    by prefix length, so a check costs one slice + lookup per distinct length.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.names: set[str] = set()
+        self.prefixes_by_length: Dict[int, set[str]] = {}
+
+        for pattern in patterns:
+            self.names.add(pattern)
+            if pattern.endswith("(*)"):
+                self.names.add(pattern[:-3])
+            if pattern.endswith("*"):
+                prefix = pattern[:-1]
+                self.prefixes_by_length.setdefault(len(prefix), set()).add(prefix)
+
+    def matches(self, tool_name: str) -> bool:
+        if tool_name in self.names:
+            return True
+        for length, prefixes in self.prefixes_by_length.items():
+            if tool_name[:length] in prefixes:
+                return True
+        return False
+
+
+class ToolCallIndex:
+    """Indexed tool-call matcher (name + arguments) for a list of permission patterns.
+
+    Equivalent to testing every pattern with
+    ToolApprovalInterceptor._matches_pattern: argument patterns such as
+    "update_task(status=done)" are parsed once and grouped by tool name, and
+    the legacy substring fallback runs as a single compiled regex.
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns: Tuple[str, ...] = tuple(patterns)
+        self.pattern_set: set[str] = set(patterns)
+        self.wildcard_names: set[str] = {p[:-3] for p in patterns if p.endswith("(*)")}
+        # tool name -> [(pattern, ((key, value), ...)), ...]
+        self.arg_patterns: Dict[str, List[Tuple[str, Tuple[Tuple[str, str], ...]]]] = {}
+
+        for pattern in patterns:
+            if "(" not in pattern:
+                continue
+            name = pattern.split("(", 1)[0]
+            args_content = pattern[len(name) + 1:-1]
+            pairs = []
+            # Note: values containing commas are not supported (same as the
+            # uncompiled matcher)
+            for pair in args_content.split(","):
+                if "=" not in pair:
+                    continue
+                k, v = pair.split("=", 1)
+                pairs.append((k.strip(), v.strip()))
+            self.arg_patterns.setdefault(name, []).append((pattern, tuple(pairs)))
+
+        self._fallback = self._compile_fallback(self.patterns)
+
+    @staticmethod
+    def _compile_fallback(patterns: Sequence[str]) -> Optional[re.Pattern]:
+        if not patterns:
+            return None
+        return re.compile("|".join(re.escape(p) for p in sorted(set(patterns))))
+
+    def _matches_fallback(self, tool_name: str, permission_string: str, own_patterns: set[str]) -> bool:
+        """Legacy substring match, ignoring this tool's own argument patterns."""
+        if self._fallback is None:
+            return False
+        match = self._fallback.search(permission_string)
+        if match is None:
+            return False
+        if match.group() not in own_patterns:
+            return True
+        # Rare: one of the tool's own argument patterns appears inside its
+        # permission string (e.g. nested in a value) - check the rest directly
+        return any(p in permission_string for p in self.patterns if p not in own_patterns)
+
+    def matches(self, tool_name: str, tool_args: Dict[str, Any] | None = None) -> bool:
+        permission_string = format_permission_pattern(tool_name, tool_args)
+        if permission_string in self.pattern_set or tool_name in self.pattern_set:
+            return True
+        if tool_name in self.wildcard_names:
+            return True
+
+        own = self.arg_patterns.get(tool_name, ())
+        if own:
+            tool_args_str = {k: str(v) for k, v in (tool_args or {}).items()}
+            for _, pairs in own:
+                if all(tool_args_str.get(k) == v for k, v in pairs):
+                    return True
+
+        return self._matches_fallback(tool_name, permission_string, {pattern for pattern, _ in own})
+
+
+class CompiledToolPermissions:
+    """Tool permission rules compiled once for a single config version.
+
+    Instances are immutable after construction; ToolPermissionConfig swaps in
+    a new instance when the underlying configuration changes.
+    """
+
+    def __init__(
+        self,
+        allow: Sequence[str],
+        deny: Sequence[str],
+        default_secure: bool = True,
+        version_key: Any = None,
+    ):
+        self.allow_patterns: Tuple[str, ...] = tuple(allow)
+        self.deny_patterns: Tuple[str, ...] = tuple(deny)
+        self.default_secure = default_secure
+        self.version_key = version_key
+        self.allow_names = ToolNameIndex(self.allow_patterns)
+        self.deny_names = ToolNameIndex(self.deny_patterns)
+
+    # Call-level indexes are only needed by ToolApprovalInterceptor, so they
+    # are built on first use rather than on every config reload.
+    @cached_property
+    def allow_calls(self) -> ToolCallIndex:
+        return ToolCallIndex(self.allow_patterns)
+
+    @cached_property
+    def deny_calls(self) -> ToolCallIndex:
+        return ToolCallIndex(self.deny_patterns)
+
+    def is_tool_denied(self, tool_name: str) -> bool:
+        return self.deny_names.matches(tool_name)
+
+    def is_tool_explicitly_allowed(self, tool_name: str) -> bool:
+        return self.allow_names.matches(tool_name)
+
+    def is_call_denied(self, tool_name: str, tool_args: Dict[str, Any] | None = None) -> bool:
+        return self.deny_calls.matches(tool_name, tool_args)
+
+    def is_call_allowed(self, tool_name: str, tool_args: Dict[str, Any] | None = None) -> bool:
+        return self.allow_calls.matches(tool_name, tool_args)
+
+
 class ToolPermissionConfig:
     """Tool permission configuration manager using Nova's ConfigRegistry."""
     
     def __init__(self):
         # No path handling needed - ConfigRegistry handles environment detection
-        pass
+        self._matcher: Optional[CompiledToolPermissions] = None
+        self._default_config: Optional[ToolPermissionsConfig] = None
         
     async def get_permissions(self, use_cache: bool = True) -> Dict[str, Any]:
         """Get permissions using Nova's ConfigRegistry."""
@@ -145,6 +302,7 @@ class ToolPermissionConfig:
             if pattern not in config.permissions.allow:
                 config.permissions.allow.append(pattern)
                 save_config("tool_permissions", config)
+                self._matcher = None
                 logger.info("Added tool permission", extra={"data": {"pattern": pattern}})
         except Exception as e:
             logger.error("Failed to add tool permission", extra={"data": {"pattern": pattern, "error": str(e)}})
@@ -158,10 +316,12 @@ class ToolPermissionConfig:
             if pattern in config.permissions.allow:
                 config.permissions.allow.remove(pattern)
                 save_config("tool_permissions", config)
+                self._matcher = None
                 logger.info("Removed allowed tool permission", extra={"data": {"pattern": pattern}})
             elif pattern in config.permissions.deny:
                 config.permissions.deny.remove(pattern)
                 save_config("tool_permissions", config)
+                self._matcher = None
                 logger.info("Removed denied tool permission", extra={"data": {"pattern": pattern}})
         except Exception as e:
             logger.error("Failed to remove tool permission", extra={"data": {"pattern": pattern, "error": str(e)}})
@@ -169,13 +329,47 @@ class ToolPermissionConfig:
     
     def _format_permission_pattern(self, tool_name: str, tool_args: Dict[str, Any] | None = None) -> str:
         """Format tool call into permission pattern string."""
-        if not tool_args:
-            return tool_name
-        
-        # Sort for consistent pattern matching
-        sorted_args = sorted(tool_args.items())
-        args_str = ",".join(f"{k}={v}" for k, v in sorted_args)
-        return f"{tool_name}({args_str})"
+        return format_permission_pattern(tool_name, tool_args)
+
+    def _get_config_model(self) -> ToolPermissionsConfig:
+        """Get the current config model, falling back to (cached) defaults."""
+        try:
+            return get_config("tool_permissions")
+        except Exception as e:
+            logger.error("Error loading tool permissions config, using defaults", extra={"data": {"error": str(e)}})
+            if self._default_config is None:
+                self._default_config = ToolPermissionsConfig.get_default_config()
+            return self._default_config
+
+    def get_matcher(self) -> CompiledToolPermissions:
+        """Get the compiled permission matcher for the current config version.
+
+        Rules are compiled once per config load/save and the new matcher
+        replaces the old one with a single attribute assignment, so concurrent
+        readers always see a complete matcher.
+        """
+        config = self._get_config_model()
+        version_key = (id(config), get_config_version("tool_permissions"))
+
+        matcher = self._matcher
+        if matcher is not None and matcher.version_key == version_key:
+            return matcher
+
+        matcher = CompiledToolPermissions(
+            allow=config.permissions.allow,
+            deny=config.permissions.deny,
+            default_secure=config.settings.default_secure,
+            version_key=version_key,
+        )
+        self._matcher = matcher
+        logger.debug(
+            "Compiled tool permission rules",
+            extra={"data": {
+                "allow_count": len(matcher.allow_patterns),
+                "deny_count": len(matcher.deny_patterns),
+            }}
+        )
+        return matcher
     
     def get_permissions_sync(self) -> Dict[str, Any]:
         """Get permissions synchronously for use in tool initialization."""
@@ -214,13 +408,9 @@ class ToolPermissionConfig:
         will never see or attempt to use them.
         """
         try:
-            permissions = self.get_permissions_sync()
-            deny_patterns = permissions["permissions"].get("deny", [])
-
-            for pattern in deny_patterns:
-                if self._matches_tool_pattern(tool_name, pattern):
-                    logger.debug("Tool is in deny list", extra={"data": {"tool_name": tool_name}})
-                    return True
+            if self.get_matcher().is_tool_denied(tool_name):
+                logger.debug("Tool is in deny list", extra={"data": {"tool_name": tool_name}})
+                return True
 
             return False
         except Exception as e:
@@ -238,18 +428,15 @@ class ToolPermissionConfig:
             if self.is_tool_denied(tool_name):
                 return False
 
-            permissions = self.get_permissions_sync()
-            allow_patterns = permissions["permissions"].get("allow", [])
-            default_secure = permissions["settings"].get("default_secure", True)
+            matcher = self.get_matcher()
 
             # Check allow list
-            for pattern in allow_patterns:
-                if self._matches_tool_pattern(tool_name, pattern):
-                    logger.debug("Tool is explicitly allowed", extra={"data": {"tool_name": tool_name}})
-                    return True
+            if matcher.is_tool_explicitly_allowed(tool_name):
+                logger.debug("Tool is explicitly allowed", extra={"data": {"tool_name": tool_name}})
+                return True
 
             # If default_secure is True, tools not in allow list require approval
-            if default_secure:
+            if matcher.default_secure:
                 logger.debug("Tool not in allow list, default_secure=True, requires approval", extra={"data": {"tool_name": tool_name}})
                 return False
 
@@ -268,6 +455,9 @@ class ToolPermissionConfig:
         - Exact match: "send_email"
         - Wildcard suffix: "mcp_tool(*)" matches any mcp_tool call
         - Prefix wildcard: "_example_skill__*" matches _example_skill__foo, _example_skill__bar
+
+        Single-pattern reference implementation; checks against the whole
+        config go through the compiled ToolNameIndex.
         """
         # Exact match
         if pattern == tool_name:
@@ -306,17 +496,15 @@ class ToolApprovalInterceptor:
     async def check_permission(self, tool_name: str, tool_args: Dict[str, Any] = None) -> bool:
         """Check if tool call is pre-approved in config."""
         permission_string = self.config._format_permission_pattern(tool_name, tool_args)
-        permissions = await self.config.get_permissions()
+        matcher = self.config.get_matcher()
         
         # Check deny rules first (they override allow rules)
-        deny_patterns = permissions["permissions"].get("deny", [])
-        if self._matches_any_pattern(tool_name, tool_args, deny_patterns):
+        if matcher.is_call_denied(tool_name, tool_args):
             logger.debug("Tool call denied by deny rule", extra={"data": {"permission_string": permission_string}})
             return False
             
         # Check allow rules
-        allow_patterns = permissions["permissions"].get("allow", [])
-        allowed = self._matches_any_pattern(tool_name, tool_args, allow_patterns)
+        allowed = matcher.is_call_allowed(tool_name, tool_args)
         
         if allowed:
             logger.debug("Tool call pre-approved", extra={"data": {"permission_string": permission_string}})
@@ -333,7 +521,11 @@ class ToolApprovalInterceptor:
         return False
     
     def _matches_pattern(self, tool_name: str, tool_args: Dict[str, Any], pattern: str) -> bool:
-        """Check if tool call matches a specific pattern."""
+        """Check if tool call matches a specific pattern.
+
+        Single-pattern reference implementation; check_permission uses the
+        compiled ToolCallIndex, which must stay equivalent to this.
+        """
         # 1. Exact match with formatted string
         permission_string = self.config._format_permission_pattern(tool_name, tool_args)
         if pattern == permission_string:
@@ -0,0 +1,195 @@
+"""
+In-process cache for the Tier 3 user settings row.
+
+Every service (website, core agent, Celery workers) reads the single
+``user_settings`` row many times per request: the system prompt needs the
+user's name and timezone, memory search needs its limits and every LLM
+factory call needs the model configuration. The cache keeps a detached
+``UserSettingsModel`` snapshot so async and sync callers share one copy and
+the sync read path never has to create a thread or event loop.
+
+Freshness:
+- Writers in this process prime the cache with the committed row and publish
+  a ``user_settings_updated`` event (see ``notify_user_settings_changed``).
+- Services running a Redis bridge refresh on that event and on the existing
+  ``llm_settings_updated`` / ``user_profile_updated`` events.
+- Processes without a bridge (Celery workers) rely on ``ttl_seconds``; an
+  expired snapshot is still served to sync callers inside a running loop
+  while a background refresh replaces it.
+
+Every store or invalidation bumps a local version number. A load that started
+before an invalidation is discarded rather than overwriting newer data.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from models.user_settings import UserSettingsModel
+from utils.logging import get_logger
+
+logger = get_logger("user_settings_cache")
+
+# Event types that mean the user_settings row changed in another process
+SETTINGS_EVENT_TYPES = frozenset({
+    "user_settings_updated",
+    "llm_settings_updated",
+    "user_profile_updated",
+})
+
+DEFAULT_TTL_SECONDS = 60.0
+
+
+class UserSettingsCache:
+    """Versioned, thread-safe holder for the current user settings snapshot."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._snapshot: Optional[UserSettingsModel] = None
+        self._loaded = False  # True once a load completed, even if no row exists
+        self._loaded_at = 0.0
+        self._version = 0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        """Local version, bumped on every store and invalidation."""
+        return self._version
+
+    def is_fresh(self) -> bool:
+        """Whether a loaded snapshot exists and is within its TTL."""
+        return self._loaded and (time.monotonic() - self._loaded_at) < self.ttl_seconds
+
+    def peek(self, allow_stale: bool = False) -> tuple[bool, Optional[UserSettingsModel]]:
+        """Return ``(found, snapshot)`` without touching the database.
+
+        ``found`` is False on a cold cache, or when the snapshot has expired
+        and ``allow_stale`` is False. ``snapshot`` may be None when the
+        database has no settings row yet.
+        """
+        with self._lock:
+            if self._loaded and (allow_stale or self.is_fresh()):
+                self.hits += 1
+                return True, self._snapshot
+            self.misses += 1
+            return False, None
+
+    def begin_load(self) -> int:
+        """Return the version a loader must pass back to ``store``."""
+        return self._version
+
+    def store(self, settings: Any, expected_version: Optional[int] = None) -> bool:
+        """Cache a snapshot of ``settings`` (ORM object, model or None).
+
+        When ``expected_version`` is given and the cache was invalidated since
+        the load began, the result is dropped and False is returned.
+        """
+        snapshot = to_snapshot(settings)
+        with self._lock:
+            if expected_version is not None and expected_version != self._version:
+                logger.debug(
+                    "Discarding stale user settings load",
+                    extra={"data": {"expected_version": expected_version, "version": self._version}},
+                )
+                return False
+            self._snapshot = snapshot
+            self._loaded = True
+            self._loaded_at = time.monotonic()
+            self._version += 1
+            return True
+
+    def invalidate(self, reason: str = "manual") -> None:
+        """Drop the cached snapshot so the next read goes to the database."""
+        with self._lock:
+            self._snapshot = None
+            self._loaded = False
+            self._version += 1
+        logger.debug("User settings cache invalidated", extra={"data": {"reason": reason, "version": self._version}})
+
+    def schedule_refresh(self, loader: Callable[[], Awaitable[Any]]) -> bool:
+        """Refresh in the background on the running loop, at most once at a time.
+
+        Returns False when no loop is running in this thread.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return True
+        self._refresh_task = loop.create_task(loader())
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return cache counters for diagnostics."""
+        age = time.monotonic() - self._loaded_at if self._loaded else None
+        return {
+            "version": self._version,
+            "loaded": self._loaded,
+            "age_seconds": round(age, 3) if age is not None else None,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def to_snapshot(settings: Any) -> Optional[UserSettingsModel]:
+    """Convert an ORM row (or an existing snapshot) into a detached snapshot."""
+    if settings is None or isinstance(settings, UserSettingsModel):
+        return settings
+    return UserSettingsModel.model_validate(settings)
+
+
+# Process-wide cache shared by async and sync callers
+user_settings_cache = UserSettingsCache()
+
+
+async def notify_user_settings_changed(
+    settings: Any,
+    updated_fields: Optional[Iterable[str]] = None,
+    source: str = "settings-service",
+) -> None:
+    """Prime the local cache with committed settings and tell other processes.
+
+    Call after the transaction that changed the user_settings row has
+    committed. Publishing is best-effort; processes that miss the event fall
+    back to the cache TTL.
+    """
+    user_settings_cache.store(settings)
+
+    try:
+        from models.events import create_user_settings_updated_event
+        from utils.redis_manager import publish
+
+        event = create_user_settings_updated_event(
+            updated_fields=sorted(updated_fields) if updated_fields else [],
+            source=source,
+        )
+        await publish(event)
+    except Exception as e:
+        logger.warning("Failed to publish user settings update event", extra={"data": {"error": str(e)}})
+
+
+async def handle_settings_event(event) -> bool:
+    """Reload the cache for settings-change events from any process.
+
+    Returns True when the event was a settings change. The reload happens
+    before callers rebuild agents, so they see the new values. Readers keep
+    getting the previous snapshot while it runs instead of all missing the
+    cache and loading the row themselves.
+    """
+    if event.type not in SETTINGS_EVENT_TYPES:
+        return False
+
+    try:
+        from database.database import UserSettingsService
+        await UserSettingsService.refresh_user_settings()
+    except Exception as e:
+        # Drop the outdated snapshot; the next reader loads it
+        user_settings_cache.invalidate(reason=event.type)
+        logger.warning("Failed to reload user settings after event", extra={"data": {"error": str(e)}})
+    return True
@@ -240,13 +240,19 @@ export function useChat() {
           throw new Error('No response reader available');
         }
 
+        // Writes may carry several coalesced events or end mid-event,
+        // so keep any trailing partial line for the next read
+        const decoder = new TextDecoder();
+        let pending = '';
+
         try {
           while (true) {
             const { done, value } = await reader.read();
             if (done) break;
 
-            const chunk = new TextDecoder().decode(value);
-            const lines = chunk.split('\n');
+            pending += decoder.decode(value, { stream: true });
+            const lines = pending.split('\n');
+            pending = lines.pop() ?? '';
 
             for (const line of lines) {
               if (line.startsWith('data: ')) {
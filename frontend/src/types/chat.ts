@@ -81,6 +81,8 @@ export interface StreamTraceData {
 }
 
 export interface StreamEvent {
-  type: 'start' | 'message' | 'tool_call' | 'tool_result' | 'complete' | 'error' | 'trace_info';
+  type: 'start' | 'message' | 'tool_call' | 'tool_result' | 'complete' | 'error' | 'trace_info'
+    // Token mode only (ChatRequest.stream_tokens)
+    | 'token' | 'tool_call_delta' | 'tool_start' | 'tool_end';
   data: StreamStartData | StreamMessageData | StreamToolData | StreamErrorData | StreamTraceData | Record<string, unknown>;
 }
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for EmailNormalizer
+
+Builds a corpus of large, real-world-shaped Gmail API messages (HTML
+newsletters, long quoted reply chains, messages with attachments) and
+reports how fast they are normalized and how much content is kept.
+
+Usage:
+    python scripts/benchmark_email_normalizer.py --messages 200 --size-kb 1024
+"""
+
+import argparse
+import base64
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+# Add backend to Python path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from input_hooks.email_processing.normalizer import EmailNormalizer  # noqa: E402
+
+WORDS = ("meeting budget review draft project customer quarter deadline update please thanks "
+         "schedule invoice contract proposal feedback release planning").split()
+
+
+def _b64(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 16))).capitalize() + "."
+
+
+def _newsletter_html(rng: random.Random, size: int) -> str:
+    blocks = ["<html><head><style>" + "td { padding: 4px; } " * 200 + "</style></head><body><table>"]
+    length = len(blocks[0])
+    while length < size:
+        block = f'<tr><td><a href="https://example.com/{rng.randint(0, 10**6)}">{_sentence(rng)}</a></td></tr>'
+        blocks.append(block)
+        length += len(block)
+    blocks.append("</table></body></html>")
+    return "".join(blocks)
+
+
+def _reply_chain(rng: random.Random, size: int) -> str:
+    parts = [_sentence(rng)]
+    length = 0
+    depth = 1
+    while length < size:
+        quote = "> " * depth
+        chunk = f"\n\nOn Mon, 12 Jan 2026 at 10:{depth % 60:02d}, Person {depth} <p{depth}@example.com> wrote:\n"
+        chunk += "\n".join(quote + _sentence(rng) for _ in range(20))
+        parts.append(chunk)
+        length += len(chunk)
+        depth += 1
+    parts.append("\n\n-- \nAlice Example\nHead of Things")
+    return "".join(parts)
+
+
+def build_corpus(count: int, size: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Messages in three shapes: HTML newsletter, reply chain, message with attachments."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        shape = i % 3
+        if shape == 0:
+            parts = [{"mimeType": "text/html", "body": {"data": _b64(_newsletter_html(rng, size))}}]
+        elif shape == 1:
+            chain = _reply_chain(rng, size // 2)
+            html = "<div>" + chain.replace("\n", "<br>") + "</div>"
+            parts = [{"mimeType": "multipart/alternative", "parts": [
+                {"mimeType": "text/plain", "body": {"data": _b64(chain)}},
+                {"mimeType": "text/html", "body": {"data": _b64(html)}},
+            ]}]
+        else:
+            parts = [
+                {"mimeType": "text/plain", "body": {"data": _b64(_sentence(rng))}},
+                {"mimeType": "application/pdf", "filename": f"report_{i}.pdf",
+                 "body": {"attachmentId": f"att_{i}", "size": size * 4}},
+            ]
+        corpus.append({
+            "id": f"msg_{i}",
+            "threadId": f"thread_{i // 5}",
+            "labelIds": ["INBOX"],
+            "payload": {
+                "mimeType": "multipart/mixed",
+                "headers": [
+                    {"name": "Subject", "value": f"Benchmark message {i}"},
+                    {"name": "From", "value": "alice@example.com"},
+                    {"name": "To", "value": "bob@example.com"},
+                    {"name": "Date", "value": "Mon, 12 Jan 2026 10:00:00 +0000"},
+                ],
+                "parts": parts,
+            },
+        })
+    return corpus
+
+
+def _payload_bytes(message: Dict[str, Any]) -> int:
+    total = 0
+    stack = [message["payload"]]
+    while stack:
+        part = stack.pop()
+        total += len(part.get("body", {}).get("data", ""))
+        stack.extend(part.get("parts", []))
+    return total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark EmailNormalizer throughput")
+    parser.add_argument("--messages", type=int, default=150, help="Number of messages in the corpus")
+    parser.add_argument("--size-kb", type=int, default=1024, help="Approximate body size per message (KB)")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.messages, args.size_kb * 1024)
+    input_bytes = sum(_payload_bytes(m) for m in corpus)
+    normalizer = EmailNormalizer()
+
+    start = time.perf_counter()
+    results = [normalizer.normalize(message) for message in corpus]
+    elapsed = time.perf_counter() - start
+
+    content_chars = [len(r["content"]) for r in results]
+    print(f"messages:        {len(corpus)}")
+    print(f"input (base64):  {input_bytes / 1024 / 1024:.1f} MB")
+    print(f"elapsed:         {elapsed:.2f} s")
+    print(f"throughput:      {len(corpus) / elapsed:.1f} msg/s, {input_bytes / 1024 / 1024 / elapsed:.1f} MB/s")
+    print(f"content chars:   avg {sum(content_chars) / len(content_chars):.0f}, max {max(content_chars)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
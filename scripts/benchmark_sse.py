@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Encoding benchmark for SSE streaming
+
+Streams a chat-shaped response (start, many token deltas, periodic tool
+calls, complete) through ``sse_stream`` and compares encode time and write
+count against the previous encoder, which wrote one ``json.dumps`` frame
+per event.
+
+Usage:
+    python scripts/benchmark_sse.py --tokens 2000 --runs 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import uuid4
+
+# Add backend to Python path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from utils.sse import SSEStreamStats, sse_stream  # noqa: E402
+
+
+def build_events(tokens: int) -> List[Dict[str, Any]]:
+    """A response shaped like a chat stream: start, token deltas, tool traffic, complete."""
+    events = [{"type": "start", "data": {"thread_id": "chat-1", "timestamp": datetime.now().isoformat()}}]
+    for i in range(tokens):
+        events.append({"type": "message", "data": {"role": "assistant", "content": f"token{i} ", "chunk": True}})
+        if i % 50 == 0:
+            events.append({"type": "tool_call", "data": {"tool": "search", "args": {"q": f"query {i}"}, "tool_call_id": str(uuid4())}})
+    events.append({"type": "complete", "data": {"timestamp": datetime.now().isoformat(), "metrics": {"tokens": tokens}}})
+    return events
+
+
+async def _source(events: List[Dict[str, Any]]):
+    for event in events:
+        yield event
+
+
+def run_baseline(events: List[Dict[str, Any]]) -> float:
+    """Encode time (ms) of the previous encoder: one json.dumps frame per event."""
+    start = time.perf_counter()
+    frames = [f"data: {json.dumps(event)}\n\n".encode() for event in events]
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    assert len(frames) == len(events)
+    return elapsed_ms
+
+
+async def run_sse(events: List[Dict[str, Any]], coalesce_ms: float) -> SSEStreamStats:
+    stats = SSEStreamStats()
+    async for _ in sse_stream(_source(events), coalesce_ms=coalesce_ms, heartbeat_seconds=None, stats=stats):
+        pass
+    return stats
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    events = build_events(args.tokens)
+    baseline_ms = [run_baseline(events) for _ in range(args.runs)]
+    runs = [await run_sse(events, args.coalesce_ms) for _ in range(args.runs)]
+
+    print(f"events:          {len(events)}")
+    print(f"runs:            {args.runs}")
+    print(f"json.dumps:      {statistics.median(baseline_ms):.2f} ms median, {len(events)} writes")
+    print(
+        f"sse_stream:      {statistics.median(s.encode_ms for s in runs):.2f} ms median, "
+        f"{runs[-1].writes} writes ({runs[-1].to_dict()['events_per_write']} events per write)"
+    )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SSE encoding and coalescing")
+    parser.add_argument("--tokens", type=int, default=2000, help="Token deltas per response")
+    parser.add_argument("--runs", type=int, default=20, help="Repetitions; medians are reported")
+    parser.add_argument("--coalesce-ms", type=float, default=5.0, help="Coalescing window of sse_stream")
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
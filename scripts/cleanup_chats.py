@@ -13,6 +13,8 @@ Usage:
   python scripts/cleanup_chats.py --database         # Clean only Nova database tables
   python scripts/cleanup_chats.py --list             # List current data counts
   python scripts/cleanup_chats.py --thread <id>      # Clean specific thread
+  python scripts/cleanup_chats.py --prefix chat- --older-than-days 30 [--dry-run]
+  python scripts/cleanup_chats.py --task-status done --task-status failed
 """
 
 import asyncio
@@ -32,6 +34,7 @@ from psycopg_pool import AsyncConnectionPool
 
 from database.database import db_manager
 from models.models import Chat, ChatMessage
+from services.bulk_thread_deletion import BulkDeletionProgress, ThreadDeletionFilter, bulk_delete_threads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -130,134 +133,68 @@ class ChatCleaner:
             logger.error(f"Error getting database stats: {e}")
             return {'total_chats': 0, 'total_messages': 0, 'chat_ids': []}
     
-    async def clean_checkpointer_data(self, thread_id: Optional[str] = None) -> bool:
-        """Clean checkpointer data for specific thread or all threads."""
+    async def clean_threads_bulk(
+        self,
+        thread_filter: ThreadDeletionFilter,
+        dry_run: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> Optional[BulkDeletionProgress]:
+        """Delete checkpoints, writes, blobs and chat metadata of matching threads in batches."""
+        def report(progress: BulkDeletionProgress) -> None:
+            action = "matched" if progress.dry_run else "deleted"
+            count = progress.threads_matched if progress.dry_run else progress.threads_deleted
+            logger.info(
+                f"  batch {progress.batches}: {count} threads {action}, "
+                f"{progress.checkpoints_deleted} checkpoints, {progress.bytes_reclaimed} bytes"
+            )
+
         try:
-            # Create connection pool for checkpointer
             pool = AsyncConnectionPool(
                 self.database_url.replace('+asyncpg', ''),
+                kwargs={"autocommit": True},
                 open=False
             )
             await pool.open()
-            
-            async with pool.connection() as conn:
-                checkpointer = AsyncPostgresSaver(conn)
-                
-                if thread_id:
-                    # Delete specific thread
-                    logger.info(f"Deleting checkpointer data for thread: {thread_id}")
-                    await checkpointer.adelete_thread(thread_id)
-                    logger.info(f"✅ Deleted thread {thread_id} from checkpointer")
-                else:
-                    # Get all thread IDs first
-                    thread_ids = set()
-                    async for checkpoint_tuple in checkpointer.alist(None):
-                        if checkpoint_tuple.config and checkpoint_tuple.config.get("configurable", {}).get("thread_id"):
-                            tid = checkpoint_tuple.config["configurable"]["thread_id"]
-                            if tid:
-                                thread_ids.add(tid)
-                    
-                    # Delete all threads
-                    logger.info(f"Found {len(thread_ids)} threads to delete from checkpointer")
-                    for tid in thread_ids:
-                        try:
-                            await checkpointer.adelete_thread(tid)
-                            logger.debug(f"Deleted thread {tid}")
-                        except Exception as e:
-                            logger.warning(f"Failed to delete thread {tid}: {e}")
-                    
-                    logger.info(f"✅ Deleted {len(thread_ids)} threads from checkpointer")
-            
-            await pool.close()
-            return True
-            
+            try:
+                progress = await bulk_delete_threads(
+                    pool, thread_filter, batch_size=batch_size, dry_run=dry_run, on_progress=report
+                )
+            finally:
+                await pool.close()
+
+            if dry_run:
+                logger.info(f"🔎 {progress.threads_matched} threads match (dry run, nothing deleted)")
+            else:
+                logger.info(
+                    f"✅ Deleted {progress.threads_deleted} threads: {progress.checkpoints_deleted} checkpoints, "
+                    f"{progress.writes_deleted} writes, {progress.blobs_deleted} blobs, "
+                    f"{progress.metadata_deleted} metadata rows, {progress.tool_results_deleted} tool results "
+                    f"in {progress.duration_ms:.0f} ms"
+                )
+            return progress
+
         except Exception as e:
-            logger.error(f"Error cleaning checkpointer data: {e}")
-            return False
-    
+            logger.error(f"Error deleting threads: {e}")
+            return None
+
+    async def clean_checkpointer_data(self, thread_id: Optional[str] = None) -> bool:
+        """Clean checkpointer data for specific thread or all threads."""
+        if thread_id:
+            logger.info(f"Deleting checkpointer data for thread: {thread_id}")
+            thread_filter = ThreadDeletionFilter(thread_ids=[thread_id])
+        else:
+            thread_filter = ThreadDeletionFilter(all_threads=True)
+        return await self.clean_threads_bulk(thread_filter) is not None
+
     async def clean_core_agent_threads(self) -> bool:
         """Clean only core agent threads from checkpointer."""
-        try:
-            # Create connection pool for checkpointer
-            pool = AsyncConnectionPool(
-                self.database_url.replace('+asyncpg', ''),
-                open=False
-            )
-            await pool.open()
-            
-            async with pool.connection() as conn:
-                checkpointer = AsyncPostgresSaver(conn)
-                
-                # Get core agent thread IDs
-                core_agent_threads = set()
-                async for checkpoint_tuple in checkpointer.alist(None):
-                    if checkpoint_tuple.config and checkpoint_tuple.config.get("configurable", {}).get("thread_id"):
-                        thread_id = checkpoint_tuple.config["configurable"]["thread_id"]
-                        if thread_id and thread_id.startswith('core_agent_'):
-                            core_agent_threads.add(thread_id)
-                
-                # Delete core agent threads
-                logger.info(f"Found {len(core_agent_threads)} core agent threads to delete")
-                for thread_id in core_agent_threads:
-                    try:
-                        await checkpointer.adelete_thread(thread_id)
-                        logger.debug(f"Deleted core agent thread {thread_id}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete core agent thread {thread_id}: {e}")
-                
-                logger.info(f"✅ Deleted {len(core_agent_threads)} core agent threads from checkpointer")
-            
-            await pool.close()
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error cleaning core agent threads: {e}")
-            return False
+        return await self.clean_threads_bulk(ThreadDeletionFilter(prefix='core_agent_')) is not None
 
     async def clean_checkpointer_data_selective(self, exclude_patterns: List[str] = None) -> bool:
         """Clean checkpointer data excluding threads matching certain patterns."""
-        if exclude_patterns is None:
-            exclude_patterns = []
-            
-        try:
-            # Create connection pool for checkpointer
-            pool = AsyncConnectionPool(
-                self.database_url.replace('+asyncpg', ''),
-                open=False
-            )
-            await pool.open()
-            
-            async with pool.connection() as conn:
-                checkpointer = AsyncPostgresSaver(conn)
-                
-                # Get thread IDs that don't match exclude patterns
-                threads_to_delete = set()
-                async for checkpoint_tuple in checkpointer.alist(None):
-                    if checkpoint_tuple.config and checkpoint_tuple.config.get("configurable", {}).get("thread_id"):
-                        thread_id = checkpoint_tuple.config["configurable"]["thread_id"]
-                        if thread_id:
-                            # Check if thread matches any exclude pattern
-                            should_exclude = any(thread_id.startswith(pattern) for pattern in exclude_patterns)
-                            if not should_exclude:
-                                threads_to_delete.add(thread_id)
-                
-                # Delete selected threads
-                logger.info(f"Found {len(threads_to_delete)} threads to delete (excluding patterns: {exclude_patterns})")
-                for thread_id in threads_to_delete:
-                    try:
-                        await checkpointer.adelete_thread(thread_id)
-                        logger.debug(f"Deleted thread {thread_id}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete thread {thread_id}: {e}")
-                
-                logger.info(f"✅ Deleted {len(threads_to_delete)} threads from checkpointer")
-            
-            await pool.close()
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error cleaning checkpointer data selectively: {e}")
-            return False
+        thread_filter = ThreadDeletionFilter(all_threads=True, exclude_prefixes=list(exclude_patterns or []))
+        logger.info(f"Deleting threads (excluding patterns: {thread_filter.exclude_prefixes})")
+        return await self.clean_threads_bulk(thread_filter) is not None
 
     async def clean_database_data(self, chat_id: Optional[str] = None) -> bool:
         """Clean Nova database chat data for specific chat or all chats."""
@@ -392,6 +329,11 @@ async def main():
     parser.add_argument('--list', action='store_true', help='List current data statistics')
     parser.add_argument('--thread', type=str, help='Clean specific thread ID')
     parser.add_argument('--chat', type=str, help='Clean specific chat ID from database')
+    parser.add_argument('--prefix', type=str, help='Bulk delete threads whose ID starts with this prefix')
+    parser.add_argument('--older-than-days', type=float, help='Bulk delete threads idle for more than N days')
+    parser.add_argument('--task-status', action='append', help='Bulk delete task threads with this task status (repeatable)')
+    parser.add_argument('--dry-run', action='store_true', help='With bulk filters: only count matching threads')
+    parser.add_argument('--batch-size', type=int, help='With bulk filters: threads deleted per batch')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
     
     args = parser.parse_args()
@@ -399,7 +341,13 @@ async def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    if not any([args.all, args.checkpointer, args.database, args.core_agent, args.chats_only, args.list, args.thread, args.chat]):
+    bulk_filter = ThreadDeletionFilter(
+        prefix=args.prefix,
+        older_than_days=args.older_than_days,
+        task_statuses=args.task_status,
+    )
+
+    if not any([args.all, args.checkpointer, args.database, args.core_agent, args.chats_only, args.list, args.thread, args.chat]) and bulk_filter.is_empty():
         parser.print_help()
         return
     
@@ -408,6 +356,14 @@ async def main():
     try:
         if args.list:
             await cleaner.print_stats()
+
+        elif not bulk_filter.is_empty():
+            progress = await cleaner.clean_threads_bulk(bulk_filter, dry_run=True, batch_size=args.batch_size)
+            if progress and progress.threads_matched and not args.dry_run:
+                if input(f"\n⚠️  Delete {progress.threads_matched} matching threads? (y/N): ").lower() == 'y':
+                    await cleaner.clean_threads_bulk(bulk_filter, batch_size=args.batch_size)
+                else:
+                    logger.info("Cleanup cancelled")
         
         elif args.all:
             await cleaner.print_stats()
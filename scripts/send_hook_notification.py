@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Local stand-in notifier for push-triggered input hooks
+
+Posts change notifications to POST /api/hooks/{hook_name}/notify the way an
+MCP server or mail provider webhook would, optionally as a burst, so the
+coalescing of notifications into a single hook run can be checked locally.
+
+Usage:
+    HOOK_NOTIFY_TOKEN=secret python scripts/send_hook_notification.py gmail --burst 5
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+import httpx
+
+
+def send_notifications(client, hook_name: str, token: str, burst: int = 1,
+                       interval: float = 0.0, source: str = "local-notifier") -> List[Dict[str, Any]]:
+    """Send ``burst`` notifications for a hook and return the responses.
+
+    ``client`` is anything with an httpx-style ``post`` (httpx.Client,
+    FastAPI TestClient).
+    """
+    responses = []
+    for _ in range(burst):
+        response = client.post(
+            f"/api/hooks/{hook_name}/notify",
+            params={"source": source},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        responses.append({"status_code": response.status_code, **response.json()})
+        if interval:
+            time.sleep(interval)
+    return responses
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Send push notifications to a Nova input hook")
+    parser.add_argument("hook_name", help="Hook to notify (e.g. gmail, outlook_email)")
+    parser.add_argument("--burst", type=int, default=1, help="Number of notifications to send")
+    parser.add_argument("--interval", type=float, default=0.0, help="Seconds between notifications")
+    parser.add_argument("--base-url", default=os.getenv("NOVA_API_URL", "http://localhost:8000"))
+    parser.add_argument("--token", default=os.getenv("HOOK_NOTIFY_TOKEN"))
+    args = parser.parse_args()
+
+    if not args.token:
+        print("Set HOOK_NOTIFY_TOKEN or pass --token")
+        return 1
+
+    with httpx.Client(base_url=args.base_url, timeout=10.0) as client:
+        for response in send_notifications(client, args.hook_name, args.token, args.burst, args.interval):
+            print(response)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
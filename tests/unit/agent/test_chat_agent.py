@@ -19,7 +19,8 @@ from typing import List, Any, Optional
 from agent.chat_agent import (
     get_all_tools,
     clear_chat_agent_cache,
-    create_chat_agent
+    create_chat_agent,
+    refresh_tool_permissions
 )
 
 
@@ -267,6 +268,86 @@ class TestToolsManagement:
             assert len(tools) == 3
             assert tools[0].name == "get_tasks"
 
+    @pytest.mark.asyncio
+    async def test_get_all_tools_cached_per_escalation_variant(self, sample_tools):
+        """Test include_escalation reuses a matching cache instead of always reloading."""
+        with patch('agent.chat_agent.get_local_tools') as mock_get_tools, \
+             patch('agent.chat_agent.mcp_manager') as mock_mcp, \
+             patch('agent.chat_agent.wrap_tools_for_approval', side_effect=lambda x: list(x)):
+
+            mock_get_tools.return_value = sample_tools
+            mock_mcp.get_tools = AsyncMock(return_value=[])
+
+            tools1 = await get_all_tools(include_escalation=True)
+            tools2 = await get_all_tools(include_escalation=True)
+            assert tools1 is tools2
+            mock_get_tools.assert_called_once_with(include_escalation=True)
+
+            # Switching variant reloads
+            await get_all_tools(include_escalation=False)
+            assert mock_get_tools.call_count == 2
+
+
+class TestIncrementalPermissionRefresh:
+    """Test re-applying permissions to the cached tool set."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_rewraps_only_affected_tool(self, sample_tools):
+        """Test that a permission flip re-wraps one tool and keeps the rest."""
+        modes = {"get_tasks": "allowed", "create_task": "requires_approval", "get_weather": "requires_approval"}
+
+        with patch('agent.chat_agent.get_local_tools') as mock_get_tools, \
+             patch('agent.chat_agent.mcp_manager') as mock_mcp, \
+             patch('tools.tool_approval_helper.get_tool_approval_mode', side_effect=modes.get), \
+             patch('agent.chat_agent.get_tool_approval_mode', side_effect=modes.get) as mock_mode:
+
+            mock_get_tools.return_value = sample_tools
+            mock_mcp.get_tools = AsyncMock(return_value=[])
+
+            tools = await get_all_tools()
+            get_tasks, create_task, get_weather = sample_tools
+            wrapped_weather = tools[2]
+            assert tools[0] is get_tasks
+            assert tools[1] is not create_task  # wrapped for approval
+
+            # User clicks "always allow" for create_task
+            modes["create_task"] = "allowed"
+            mock_mode.reset_mock()
+            changed = refresh_tool_permissions(["create_task"])
+
+            assert changed == 1
+            mock_mode.assert_called_once_with("create_task")
+            # Same list object, so already-compiled agents see the change
+            assert await get_all_tools() is tools
+            assert tools[1] is create_task
+            assert tools[2] is wrapped_weather
+            # No tool rediscovery
+            mock_get_tools.assert_called_once()
+            mock_mcp.get_tools.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_refresh_handles_newly_denied_tool(self, sample_tools):
+        """Test that a tool moved to the deny list is removed from the cached set."""
+        modes = {"get_tasks": "allowed", "create_task": "allowed", "get_weather": "allowed"}
+
+        with patch('agent.chat_agent.get_local_tools') as mock_get_tools, \
+             patch('agent.chat_agent.mcp_manager') as mock_mcp, \
+             patch('tools.tool_approval_helper.get_tool_approval_mode', side_effect=modes.get), \
+             patch('agent.chat_agent.get_tool_approval_mode', side_effect=modes.get):
+
+            mock_get_tools.return_value = sample_tools
+            mock_mcp.get_tools = AsyncMock(return_value=[])
+
+            tools = await get_all_tools()
+            modes["get_weather"] = "denied"
+
+            assert refresh_tool_permissions() == 1
+            assert [t.name for t in tools] == ["get_tasks", "create_task"]
+
+    def test_refresh_without_cache_is_noop(self):
+        """Test refresh before any tools are loaded."""
+        assert refresh_tool_permissions(["anything"]) == 0
+
 
 class TestChatAgentCreation:
     """Test chat agent creation with real LangGraph integration."""
@@ -0,0 +1,186 @@
+"""
+Tests for conversation context window management
+
+Tests tool result elision, rolling summarization and policy selection for the
+per-turn LLM view of long chat and core agent threads.
+"""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from agent.context_window import (
+    ContextPolicy,
+    build_context_window,
+    elide_tool_results,
+    get_context_policy,
+    recent_window_start,
+)
+
+
+def make_turn(index: int, tool_output_chars: int = 0) -> list:
+    """One user turn, optionally with a tool call and its result."""
+    messages = [HumanMessage(content=f"question {index}", id=f"h{index}")]
+    if tool_output_chars:
+        messages.append(AIMessage(
+            content="",
+            id=f"a{index}-call",
+            tool_calls=[{"name": "search", "args": {"q": str(index)}, "id": f"call{index}"}],
+        ))
+        messages.append(ToolMessage(
+            content="x" * tool_output_chars, tool_call_id=f"call{index}", name="search", id=f"t{index}"
+        ))
+    messages.append(AIMessage(content=f"answer {index}", id=f"a{index}"))
+    return messages
+
+
+def make_thread(turns: int, tool_output_chars: int = 0) -> list:
+    return [m for i in range(turns) for m in make_turn(i, tool_output_chars)]
+
+
+class TestElision:
+    """Test replacement of stale tool results."""
+
+    def test_recent_window_starts_at_human_message(self):
+        """Test that the recent window begins at a turn boundary."""
+        messages = make_thread(4, tool_output_chars=10)
+        start = recent_window_start(messages, 2)
+        assert isinstance(messages[start], HumanMessage)
+        assert messages[start].id == "h2"
+
+    def test_old_results_elided_with_pairing_kept(self):
+        """Test that older tool results become stubs that keep their tool_call_id."""
+        messages = make_thread(4, tool_output_chars=4000)  # ~1000 tokens per result
+        start = recent_window_start(messages, 1)
+
+        view, elided = elide_tool_results(messages, start, budget_tokens=2000, preview_chars=20)
+
+        tool_results = [m for m in view if isinstance(m, ToolMessage)]
+        assert elided == 2
+        assert [m.tool_call_id for m in tool_results] == ["call0", "call1", "call2", "call3"]
+        assert tool_results[0].content.startswith("[Earlier tool result elided")
+        assert tool_results[2].content == "x" * 4000
+        assert tool_results[3].content == "x" * 4000
+        # Original messages are untouched
+        assert messages[2].content == "x" * 4000
+
+
+def make_task_thread(steps: int, tool_output_chars: int) -> list:
+    """Core agent task thread: the two task messages, then one long tool loop."""
+    messages = [
+        HumanMessage(content="**Current Task:** Triage inbox", id="task"),
+        HumanMessage(content="**Task Context:** ...", id="context",
+                     additional_kwargs={"metadata": {"type": "task_context"}}),
+    ]
+    for step in range(steps):
+        messages.append(AIMessage(
+            content="",
+            id=f"a{step}",
+            tool_calls=[{"name": "read_email", "args": {"id": str(step)}, "id": f"call{step}"}],
+        ))
+        messages.append(ToolMessage(
+            content="y" * tool_output_chars, tool_call_id=f"call{step}", name="read_email", id=f"t{step}"
+        ))
+    return messages
+
+
+class TestTaskThreadElision:
+    """Test tool result budgeting inside the recent window of task threads."""
+
+    @pytest.mark.asyncio
+    async def test_long_tool_loop_is_trimmed(self):
+        """Test that a task thread whose whole history is the recent window still saves tokens."""
+        messages = make_task_thread(20, tool_output_chars=11_000)
+        policy = get_context_policy("core_agent_task_123")
+        assert recent_window_start(messages, policy.keep_recent_turns) == 0
+
+        window = await build_context_window(messages, {}, policy)
+
+        tool_results = [m for m in window.messages if isinstance(m, ToolMessage)]
+        assert window.tokens_saved > 0
+        assert [m.tool_call_id for m in tool_results] == [f"call{step}" for step in range(20)]
+        assert tool_results[-1].content == "y" * 11_000
+        assert tool_results[0].content.startswith("[Earlier tool result elided")
+        kept = sum(len(m.content) for m in tool_results if m.content.startswith("y"))
+        assert kept // 4 <= policy.tool_result_budget_tokens + 11_000 // 4
+        assert [m.id for m in window.messages[:2]] == ["task", "context"]
+
+    def test_latest_step_kept_over_budget(self):
+        """Test that the latest step's results are kept even when they exceed the budget."""
+        messages = make_task_thread(3, tool_output_chars=8000)
+
+        view, elided = elide_tool_results(messages, 0, budget_tokens=1000, preview_chars=20)
+
+        assert elided == 2
+        assert view[-1].content == "y" * 8000
+
+
+class TestBuildContextWindow:
+    """Test assembly of the per-turn LLM view."""
+
+    @pytest.mark.asyncio
+    async def test_small_thread_unchanged(self):
+        """Test that a thread within budget is sent verbatim without summarizing."""
+        messages = make_thread(3, tool_output_chars=100)
+
+        async def summarize(previous, transcript):
+            raise AssertionError("should not summarize")
+
+        window = await build_context_window(messages, {}, ContextPolicy(10000, 2, 5000), summarize)
+
+        assert window.messages == messages
+        assert window.summary is None
+        assert window.state_update == {}
+        assert window.tokens_saved == 0
+
+    @pytest.mark.asyncio
+    async def test_summarizes_older_turns_over_budget(self):
+        """Test that turns before the recent window are folded into the summary."""
+        messages = make_thread(6, tool_output_chars=2000)
+        calls = []
+
+        async def summarize(previous, transcript):
+            calls.append((previous, transcript))
+            return "user searched five times"
+
+        window = await build_context_window(messages, {}, ContextPolicy(1000, 2, 100000), summarize)
+
+        assert window.summary == "user searched five times"
+        assert window.messages[0].id == "h4"
+        assert window.state_update == {"context_summary": "user searched five times", "context_summary_through": "a3"}
+        assert window.summarized_messages == 16
+        assert window.tokens_saved > 0
+        assert "User: question 0" in calls[0][1]
+        assert "Assistant called search" in calls[0][1]
+
+    @pytest.mark.asyncio
+    async def test_existing_summary_reused(self):
+        """Test that covered messages are dropped using the stored summary."""
+        messages = make_thread(6)
+        state = {"context_summary": "earlier stuff", "context_summary_through": "a1"}
+
+        window = await build_context_window(messages, state, ContextPolicy(100000, 2, 100000))
+
+        assert window.summary == "earlier stuff"
+        assert window.messages[0].id == "h2"
+        assert window.state_update == {}
+
+    @pytest.mark.asyncio
+    async def test_summarizer_failure_falls_back_to_full_view(self):
+        """Test that a failing summarizer leaves the (elided) history in place."""
+        messages = make_thread(4, tool_output_chars=2000)
+
+        async def summarize(previous, transcript):
+            raise RuntimeError("llm down")
+
+        window = await build_context_window(messages, {}, ContextPolicy(100, 1, 100000), summarize)
+
+        assert len(window.messages) == len(messages)
+        assert window.state_update == {}
+
+
+def test_policy_per_agent_type():
+    """Test that task threads use the core agent budget."""
+    task_policy = get_context_policy("core_agent_task_123")
+    chat_policy = get_context_policy("chat-1")
+    assert task_policy.max_tokens != chat_policy.max_tokens or \
+        task_policy.keep_recent_turns != chat_policy.keep_recent_turns
@@ -0,0 +1,207 @@
+"""
+Tests for per-thread tool result memoization
+
+Tests memo policies, reuse and invalidation of idempotent tool results, and
+that the chat agent's tool node answers repeated calls without re-executing.
+"""
+
+from typing import Any, List, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.tools import StructuredTool
+from langgraph.checkpoint.memory import MemorySaver
+
+from agent.chat_agent import clear_chat_agent_cache, create_chat_agent
+from tools.tool_memoization import (
+    MEMOIZED_METADATA_KEY,
+    ToolMemoPolicy,
+    ToolResultMemo,
+    get_memo_policy,
+)
+
+POLICIES = {
+    "get_tasks": ToolMemoPolicy(idempotent=True, domain="tasks", mutates=[]),
+    "list_events": ToolMemoPolicy(idempotent=True, domain="calendar", mutates=[]),
+    "update_task": ToolMemoPolicy(mutates=["tasks"]),
+    "unknown_writer": ToolMemoPolicy(),
+}
+
+
+def call(name: str, call_id: str, **args) -> dict:
+    return {"name": name, "args": args, "id": call_id, "type": "tool_call"}
+
+
+def result(call_id: str, content: str, status: str = "success") -> ToolMessage:
+    return ToolMessage(content=content, tool_call_id=call_id, status=status)
+
+
+class TestMemoPolicy:
+    """Test how tools declare memo behaviour."""
+
+    def test_metadata_declaration(self):
+        tool = StructuredTool.from_function(
+            func=lambda: "x", name="get_tasks", description="d",
+            metadata={"idempotent": True, "memo_domain": "tasks"},
+        )
+        assert get_memo_policy(tool, tool.name) == ToolMemoPolicy(idempotent=True, domain="tasks", mutates=[])
+
+    def test_mcp_tools_classified_by_name(self):
+        assert get_memo_policy(None, "google_workspace-list_events").idempotent
+        assert get_memo_policy(None, "ms_graph-create_event").mutates == ["calendar"]
+
+    def test_undeclared_tool_mutates_everything(self):
+        assert get_memo_policy(None, "mystery_tool").mutates is None
+
+
+class TestToolResultMemo:
+    """Test reuse, invalidation and stats."""
+
+    def test_repeated_call_served_from_memo(self):
+        memo = ToolResultMemo()
+        first = memo.plan("t1", [call("get_tasks", "c1", status="new")], POLICIES)
+        memo.record("t1", first.to_run, {"c1": result("c1", "3 tasks")}, POLICIES)
+
+        second = memo.plan("t1", [call("get_tasks", "c2", status="new")], POLICIES)
+
+        assert second.to_run == []
+        cached = second.cached["c2"]
+        assert cached.content == "3 tasks"
+        assert cached.tool_call_id == "c2"
+        assert cached.response_metadata[MEMOIZED_METADATA_KEY] is True
+        assert memo.get_stats()["memo_hits"] == 1
+
+    def test_memo_scoped_to_thread_and_args(self):
+        memo = ToolResultMemo()
+        plan = memo.plan("t1", [call("get_tasks", "c1")], POLICIES)
+        memo.record("t1", plan.to_run, {"c1": result("c1", "3 tasks")}, POLICIES)
+
+        assert memo.plan("t2", [call("get_tasks", "c2")], POLICIES).to_run
+        assert memo.plan("t1", [call("get_tasks", "c3", status="done")], POLICIES).to_run
+
+    def test_mutation_invalidates_same_domain_only(self):
+        memo = ToolResultMemo()
+        calls = [call("get_tasks", "c1"), call("list_events", "c2")]
+        plan = memo.plan("t1", calls, POLICIES)
+        memo.record("t1", plan.to_run, {"c1": result("c1", "tasks"), "c2": result("c2", "events")}, POLICIES)
+
+        write = memo.plan("t1", [call("update_task", "c3", id="1")], POLICIES)
+        memo.record("t1", write.to_run, {"c3": result("c3", "updated")}, POLICIES)
+
+        after = memo.plan("t1", [call("get_tasks", "c4"), call("list_events", "c5")], POLICIES)
+        assert [c["id"] for c in after.to_run] == ["c4"]
+        assert "c5" in after.cached
+
+    def test_undeclared_tool_clears_thread(self):
+        memo = ToolResultMemo()
+        plan = memo.plan("t1", [call("list_events", "c1")], POLICIES)
+        memo.record("t1", plan.to_run, {"c1": result("c1", "events")}, POLICIES)
+
+        write = memo.plan("t1", [call("unknown_writer", "c2")], POLICIES)
+        memo.record("t1", write.to_run, {"c2": result("c2", "ok")}, POLICIES)
+
+        assert memo.plan("t1", [call("list_events", "c3")], POLICIES).to_run
+
+    def test_read_next_to_write_in_same_batch_not_reused(self):
+        memo = ToolResultMemo()
+        plan = memo.plan("t1", [call("get_tasks", "c1")], POLICIES)
+        memo.record("t1", plan.to_run, {"c1": result("c1", "old")}, POLICIES)
+
+        batch = memo.plan("t1", [call("update_task", "c2"), call("get_tasks", "c3")], POLICIES)
+        assert [c["id"] for c in batch.to_run] == ["c2", "c3"]
+        memo.record("t1", batch.to_run, {"c2": result("c2", "ok"), "c3": result("c3", "new?")}, POLICIES)
+
+        assert memo.plan("t1", [call("get_tasks", "c4")], POLICIES).to_run
+
+    def test_errors_not_memoized_and_duplicates_in_batch_deduplicated(self):
+        memo = ToolResultMemo()
+        plan = memo.plan("t1", [call("get_tasks", "c1"), call("get_tasks", "c2")], POLICIES)
+        assert [c["id"] for c in plan.to_run] == ["c1"]
+        assert plan.duplicates == {"c2": "c1"}
+
+        memo.record("t1", plan.to_run, {"c1": result("c1", "boom", status="error")}, POLICIES)
+        assert memo.plan("t1", [call("get_tasks", "c3")], POLICIES).to_run
+
+        stats = memo.get_stats()
+        assert stats["calls"] == 3
+        assert stats["batch_duplicates"] == 1
+        assert stats["duplicate_rate"] == round(1 / 3, 4)
+
+    def test_expired_entries_not_reused(self):
+        memo = ToolResultMemo()
+        with patch("tools.tool_memoization.settings.TOOL_MEMO_TTL_SECONDS", 0):
+            plan = memo.plan("t1", [call("get_tasks", "c1")], POLICIES)
+            memo.record("t1", plan.to_run, {"c1": result("c1", "tasks")}, POLICIES)
+
+        assert memo.plan("t1", [call("get_tasks", "c2")], POLICIES).to_run
+
+
+class ScriptedToolCallingModel(BaseChatModel):
+    """Fake chat model that replays a fixed list of AI messages."""
+
+    script: List[AIMessage] = []
+    position: int = 0
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        message = self.script[min(self.position, len(self.script) - 1)]
+        self.position += 1
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def bind_tools(self, tools):
+        return self
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-tool-calling"
+
+
+@pytest.mark.asyncio
+async def test_agent_reuses_repeated_read_only_call():
+    """Test that the tool node answers an identical second call from the memo."""
+    clear_chat_agent_cache()
+    executions = []
+
+    def get_tasks(status: str = "") -> str:
+        executions.append(status)
+        return f"3 {status} tasks"
+
+    tasks_tool = StructuredTool.from_function(
+        func=get_tasks, name="get_tasks", description="List tasks",
+        metadata={"idempotent": True, "memo_domain": "tasks"},
+    )
+    model = ScriptedToolCallingModel(script=[
+        AIMessage(content="", tool_calls=[call("get_tasks", "c1", status="new")]),
+        AIMessage(content="", tool_calls=[call("get_tasks", "c2", status="new")]),
+        AIMessage(content="done"),
+    ])
+
+    with patch("agent.chat_agent.create_chat_llm", return_value=model), \
+         patch("agent.chat_agent.get_local_tools", return_value=[tasks_tool]), \
+         patch("agent.chat_agent.wrap_tools_for_approval", side_effect=lambda tools: tools), \
+         patch("tools.tool_approval_helper.get_tool_approval_mode", return_value="allowed"), \
+         patch("agent.chat_agent.get_nova_system_prompt", return_value="You are Nova."), \
+         patch("agent.chat_agent.get_skill_manager", return_value=MagicMock()), \
+         patch("agent.chat_agent.mcp_manager") as mock_mcp:
+        mock_mcp.get_tools = MagicMock(side_effect=RuntimeError("no mcp"))
+        agent = await create_chat_agent(checkpointer=MemorySaver())
+        state = await agent.ainvoke(
+            {"messages": [HumanMessage(content="what's new?")]},
+            {"configurable": {"thread_id": "memo-thread"}},
+        )
+
+    tool_messages = [m for m in state["messages"] if isinstance(m, ToolMessage)]
+    assert executions == ["new"]
+    assert [m.tool_call_id for m in tool_messages] == ["c1", "c2"]
+    assert tool_messages[1].content == "3 new tasks"
+    assert tool_messages[1].response_metadata[MEMOIZED_METADATA_KEY] is True
+    clear_chat_agent_cache()
@@ -339,3 +339,11 @@ class TestErrorHandling:
         assert response.status_code in [200, 404]
     
     
+
+    def test_bulk_delete_rejects_exclusion_only_filter(self, client):
+        """Test that exclude_prefixes alone is not accepted as a bulk-delete filter."""
+        with patch("services.bulk_thread_deletion.bulk_delete_threads", new_callable=AsyncMock) as bulk_delete:
+            response = client.post("/chat/conversations/bulk-delete", json={"exclude_prefixes": ["x"]})
+
+        assert response.status_code == 400
+        bulk_delete.assert_not_called()
@@ -0,0 +1,141 @@
+"""
+Tests for push-triggered hook runs.
+
+Drives POST /api/hooks/{hook_name}/notify with the local stand-in notifier
+(scripts/send_hook_notification.py) against an in-memory Redis, checking
+authentication, coalescing of bursts and release of the pending marker.
+"""
+
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from backend.api.hooks_endpoints import router
+from input_hooks import push_notifications
+from input_hooks.models import GmailHookConfig
+
+_spec = importlib.util.spec_from_file_location(
+    "send_hook_notification",
+    Path(__file__).parents[3] / "scripts" / "send_hook_notification.py",
+)
+notifier = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(notifier)
+
+TOKEN = "test-notify-token"
+
+
+class InMemoryRedis:
+    """The subset of the sync Redis client used for coalescing."""
+
+    def __init__(self):
+        self.data = {}
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def redis_client():
+    return InMemoryRedis()
+
+
+@pytest.fixture
+def queued(redis_client):
+    """Patch Redis, Celery enqueueing and the hook registry; yield queued runs."""
+    runs = []
+    hook = SimpleNamespace(config=GmailHookConfig(name="gmail", hook_type="gmail"))
+    registry = MagicMock()
+    registry.get_hook.side_effect = lambda name: hook if name == "gmail" else None
+
+    with patch.object(push_notifications, "get_sync_redis", return_value=redis_client), \
+         patch.object(push_notifications, "_queue_run", side_effect=lambda *args: runs.append(args)), \
+         patch("backend.api.hooks_endpoints._ensure_hooks_initialized", return_value=registry), \
+         patch("backend.api.hooks_endpoints.settings.HOOK_NOTIFY_TOKEN", SecretStr(TOKEN)):
+        yield runs
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+class TestNotifyEndpoint:
+    """Test authentication and coalescing of inbound notifications."""
+
+    def test_burst_coalesced_into_single_run(self, client, queued):
+        responses = notifier.send_notifications(client, "gmail", TOKEN, burst=5)
+
+        assert [r["status_code"] for r in responses] == [202] * 5
+        assert [r["status"] for r in responses] == ["queued"] + ["coalesced"] * 4
+        assert len({r["task_id"] for r in responses}) == 1
+        assert len(queued) == 1
+        hook_name, task_id, countdown, queue = queued[0]
+        assert (hook_name, task_id, queue) == ("gmail", responses[0]["task_id"], "hooks")
+
+    def test_run_start_allows_next_notification(self, client, queued):
+        first = notifier.send_notifications(client, "gmail", TOKEN)[0]
+
+        push_notifications.clear_pending_run("gmail", first["task_id"])
+        second = notifier.send_notifications(client, "gmail", TOKEN)[0]
+
+        assert second["status"] == "queued"
+        assert second["task_id"] != first["task_id"]
+        assert len(queued) == 2
+
+    def test_other_runs_do_not_clear_pending_marker(self, client, queued):
+        first = notifier.send_notifications(client, "gmail", TOKEN)[0]
+
+        push_notifications.clear_pending_run("gmail", "beat-run-id")
+
+        assert notifier.send_notifications(client, "gmail", TOKEN)[0]["task_id"] == first["task_id"]
+
+    def test_invalid_token_rejected(self, client, queued):
+        response = notifier.send_notifications(client, "gmail", "wrong")[0]
+
+        assert response["status_code"] == 401
+        assert queued == []
+
+    def test_unknown_hook_returns_404(self, client, queued):
+        assert notifier.send_notifications(client, "nope", TOKEN)[0]["status_code"] == 404
+
+    def test_disabled_without_configured_token(self, client):
+        with patch("backend.api.hooks_endpoints.settings.HOOK_NOTIFY_TOKEN", None):
+            response = client.post("/api/hooks/gmail/notify", headers={"X-Nova-Hook-Token": TOKEN})
+
+        assert response.status_code == 503
+
+
+def test_push_enabled_hook_relaxes_beat_schedule():
+    """Test that push-enabled hooks poll at the safety-net interval."""
+    from input_hooks.hook_registry import InputHookRegistry
+
+    registry = InputHookRegistry()
+    registry._hook_instances = {
+        "gmail": SimpleNamespace(config=GmailHookConfig(
+            name="gmail", hook_type="gmail", polling_interval=60,
+            push_enabled=True, push_safety_polling_interval=1800,
+        )),
+        "calendar": SimpleNamespace(config=GmailHookConfig(name="calendar", hook_type="gmail", polling_interval=60)),
+    }
+
+    schedules = registry.get_celery_schedules()
+
+    assert schedules["process-gmail"]["schedule"] == 1800
+    assert schedules["process-calendar"]["schedule"] == 60
@@ -0,0 +1,126 @@
+"""
+Tests for adaptive hook polling intervals.
+
+Covers interval shortening after productive runs, exponential backoff
+during quiet periods and errors, min/max clamping, business hours, and the
+Redis-backed due check used by scheduled runs.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from backend.input_hooks import adaptive_polling
+from backend.input_hooks.adaptive_polling import (
+    AdaptivePoller,
+    beat_interval,
+    next_interval,
+    within_business_hours,
+)
+from backend.input_hooks.models import AdaptivePollingConfig, BusinessHours, GmailHookConfig
+
+# Wednesday 2026-01-07, 12:00 and 22:00 UTC
+MIDDAY = datetime(2026, 1, 7, 12, 0, tzinfo=timezone.utc)
+NIGHT = datetime(2026, 1, 7, 22, 0, tzinfo=timezone.utc)
+
+
+class InMemoryRedis:
+    """The subset of the sync Redis client used for poll state."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+def _config(**adaptive) -> GmailHookConfig:
+    return GmailHookConfig(
+        name="gmail", hook_type="gmail", polling_interval=300,
+        adaptive_polling=AdaptivePollingConfig(min_interval=60, max_interval=1800, **adaptive),
+    )
+
+
+@pytest.fixture
+def poller():
+    with patch.object(adaptive_polling, "get_sync_redis", return_value=InMemoryRedis()):
+        yield AdaptivePoller()
+
+
+class TestNextInterval:
+    """Test the interval chosen after a run."""
+
+    def test_items_found_drops_to_min_interval(self):
+        assert next_interval(_config().adaptive_polling, 960, items_found=3, error=False, now=MIDDAY) == 60
+
+    def test_quiet_run_backs_off_exponentially(self):
+        adaptive = _config().adaptive_polling
+        intervals = [60]
+        for _ in range(3):
+            intervals.append(next_interval(adaptive, intervals[-1], items_found=0, error=False, now=MIDDAY))
+        assert intervals == [60, 120, 240, 480]
+
+    def test_error_backs_off_and_clamps_to_max(self):
+        assert next_interval(_config().adaptive_polling, 1500, items_found=5, error=True, now=MIDDAY) == 1800
+
+    def test_off_hours_use_off_hours_interval(self):
+        adaptive = _config(business_hours=BusinessHours(start="08:00", end="18:00"), off_hours_interval=3600).adaptive_polling
+        assert next_interval(adaptive, 60, items_found=2, error=False, now=MIDDAY) == 60
+        assert next_interval(adaptive, 60, items_found=2, error=False, now=NIGHT) == 3600
+
+
+def test_business_hours_respect_timezone_and_days():
+    hours = BusinessHours(start="08:00", end="18:00", timezone="America/New_York")
+    assert not within_business_hours(hours, MIDDAY)  # 07:00 in New York
+    assert within_business_hours(hours, datetime(2026, 1, 7, 15, 0, tzinfo=timezone.utc))
+    assert not within_business_hours(hours, datetime(2026, 1, 10, 15, 0, tzinfo=timezone.utc))  # Saturday
+    assert within_business_hours(None, NIGHT)
+
+
+class TestAdaptivePoller:
+    """Test the due check and recorded run outcomes."""
+
+    def test_first_run_is_due_and_schedules_next(self, poller):
+        config = _config()
+        assert poller.is_due("gmail", config)
+
+        state = poller.record_run("gmail", config, items_found=0)
+
+        assert state.interval == 600
+        assert not poller.is_due("gmail", config)
+        assert poller.is_due("gmail", config, now=state.next_run_at)
+        assert poller.effective_interval("gmail", config) == 600
+
+    def test_streaks_track_outcomes(self, poller):
+        config = _config()
+        poller.record_run("gmail", config, items_found=0)
+        poller.record_run("gmail", config, items_found=0, error=True)
+        state = poller.record_run("gmail", config, items_found=0, error=True)
+        assert (state.quiet_runs, state.error_streak, state.interval) == (0, 2, 1800)
+
+        state = poller.record_run("gmail", config, items_found=4)
+        assert (state.last_outcome, state.error_streak, state.interval) == ("items", 0, 60)
+
+    def test_non_adaptive_hooks_are_always_due(self, poller):
+        config = GmailHookConfig(name="gmail", hook_type="gmail", polling_interval=300)
+        assert poller.record_run("gmail", config, items_found=0) is None
+        assert poller.is_due("gmail", config)
+        assert poller.effective_interval("gmail", config) == 300
+
+
+def test_adaptive_hook_beat_ticks_at_min_interval():
+    from backend.input_hooks.hook_registry import InputHookRegistry
+
+    registry = InputHookRegistry()
+    registry._hook_instances = {"gmail": SimpleNamespace(config=_config())}
+
+    schedule = registry.get_celery_schedules()["process-gmail"]
+
+    assert beat_interval(_config()) == 60
+    assert schedule["schedule"] == 60
+    assert schedule["kwargs"] == {"scheduled": True}
@@ -16,6 +16,7 @@ See: tests/integration/test_calendar_memo_integration.py
 Run with: uv run pytest tests/unit/input_hooks/test_calendar_processing_unit.py -v
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timezone, timedelta, date
@@ -543,6 +544,107 @@ class TestCalendarProcessorUnit:
             assert mock_fetcher.fetch_todays_events.call_count == 2
 
 
+
+class TestCalendarProcessorConcurrency:
+    """Bounded concurrency, timeouts and failure isolation of meeting processing."""
+
+    @staticmethod
+    def _config(max_concurrent=2, timeout=5.0):
+        return GoogleCalendarHookConfig(
+            name="concurrency_test",
+            hook_type="google_calendar",
+            enabled=True,
+            polling_interval=86400,
+            create_tasks=True,
+            hook_settings=GoogleCalendarHookSettings(
+                max_concurrent_meetings=max_concurrent,
+                meeting_timeout_seconds=timeout
+            )
+        )
+
+    @staticmethod
+    def _meeting(n):
+        start = datetime.now(timezone.utc) + timedelta(hours=n)
+        return CalendarMeetingInfo(
+            meeting_id=f"meeting_{n}",
+            title=f"Meeting {n}",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            duration_minutes=60
+        )
+
+    def _processor(self, meetings, memo_side_effect):
+        processor = CalendarProcessor()
+        processor.fetcher = Mock()
+        processor.fetcher.fetch_todays_events = AsyncMock(return_value=[{"id": m.meeting_id} for m in meetings])
+        processor.analyzer = Mock()
+        processor.analyzer.analyze_events = Mock(return_value=meetings)
+        processor.memo_generator = Mock()
+        processor.memo_generator.generate_meeting_memo = AsyncMock(side_effect=memo_side_effect)
+        processor.meeting_creator = Mock()
+        processor.meeting_creator.check_prep_meeting_exists = AsyncMock(return_value=False)
+        processor.meeting_creator.format_memo_for_description = Mock(return_value="memo")
+        processor.meeting_creator.create_prep_meeting = AsyncMock(return_value="prep_event")
+        return processor
+
+    @pytest.mark.asyncio
+    async def test_meetings_run_concurrently_up_to_limit(self):
+        meetings = [self._meeting(n) for n in range(5)]
+        in_flight = 0
+        peak = 0
+
+        async def generate(meeting, pg_pool=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "memo", "thread"
+
+        processor = self._processor(meetings, generate)
+        result = await processor.process_daily_meetings(self._config(max_concurrent=2))
+
+        assert peak == 2
+        assert result["prep_meetings_created"] == 5
+        assert [m["meeting_id"] for m in result["meetings"]] == [m.meeting_id for m in meetings]
+        assert all(m["status"] == "created" and m["latency_seconds"] >= 0 for m in result["meetings"])
+
+    @pytest.mark.asyncio
+    async def test_slow_and_failing_meetings_are_isolated(self):
+        meetings = [self._meeting(n) for n in range(3)]
+
+        async def generate(meeting, pg_pool=None):
+            if meeting.meeting_id == "meeting_0":
+                await asyncio.sleep(1)
+            if meeting.meeting_id == "meeting_1":
+                raise RuntimeError("LLM unavailable")
+            return "memo", "thread"
+
+        processor = self._processor(meetings, generate)
+        result = await processor.process_daily_meetings(self._config(max_concurrent=3, timeout=0.05))
+
+        statuses = {m["meeting_id"]: m["status"] for m in result["meetings"]}
+        assert statuses == {"meeting_0": "timeout", "meeting_1": "failed", "meeting_2": "created"}
+        assert result["success"] is True
+        assert result["prep_meetings_created"] == 1
+        assert len(result["errors"]) == 2
+        assert any("timed out" in error for error in result["errors"])
+
+    @pytest.mark.asyncio
+    async def test_existing_prep_meeting_skips_memo_without_updates(self):
+        meetings = [self._meeting(0)]
+        processor = self._processor(meetings, None)
+        processor.memo_generator.generate_meeting_memo = AsyncMock(return_value=("memo", "thread"))
+        processor.meeting_creator.check_prep_meeting_exists = AsyncMock(return_value=True)
+
+        config = self._config()
+        config.update_existing_tasks = False
+        result = await processor.process_daily_meetings(config)
+
+        processor.memo_generator.generate_meeting_memo.assert_not_called()
+        assert result["meetings"][0]["status"] == "skipped"
+
+
 if __name__ == "__main__":
     # Run unit tests
     import subprocess
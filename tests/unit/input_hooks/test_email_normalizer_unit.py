@@ -0,0 +1,209 @@
+"""
+Unit tests for bounded email normalization.
+
+Run with: NOVA_SKIP_DB=1 uv run pytest tests/unit/input_hooks/test_email_normalizer_unit.py -v
+"""
+
+import base64
+from unittest.mock import patch
+
+from backend.input_hooks.email_processing import body_text
+from backend.input_hooks.email_processing.normalizer import EmailNormalizer
+
+
+def _b64(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _gmail_message(parts, headers=None):
+    return {
+        "id": "msg_1",
+        "threadId": "thread_1",
+        "labelIds": ["INBOX"],
+        "payload": {
+            "mimeType": "multipart/mixed",
+            "headers": headers or [
+                {"name": "Subject", "value": "Quarterly numbers"},
+                {"name": "From", "value": "alice@example.com"},
+                {"name": "To", "value": "bob@example.com"},
+                {"name": "Date", "value": "Mon, 12 Jan 2026 10:00:00 +0000"},
+            ],
+            "parts": parts,
+        },
+    }
+
+
+HTML_BODY = """<html><head><style>p { color: red; }</style></head><body>
+<div>Hi Bob,</div><p>Numbers are <b>attached</b>.</p><ul><li>Revenue up</li><li>Costs down</li></ul>
+<div class="gmail_quote"><div>On Sun, Alice wrote:</div><blockquote>Old question<div>nested</div></blockquote></div>
+</body></html>"""
+
+
+GMAIL_FORWARD_HTML = """<div dir="ltr">{note}<br><div class="gmail_quote"><div dir="ltr" class="gmail_attr">
+---------- Forwarded message ---------<br>From: <b>Carol</b> &lt;carol@example.com&gt;<br>
+Date: Mon, 12 Jan 2026 at 09:00<br>Subject: Contract renewal<br>To: Alice &lt;alice@example.com&gt;<br></div><br><br>
+<div dir="ltr">Please sign the renewal by Friday.</div></div></div>"""
+
+PLAIN_FORWARD = """{note}
+
+---------- Forwarded message ---------
+From: Carol <carol@example.com>
+Date: Mon, 12 Jan 2026 at 09:00
+Subject: Contract renewal
+To: Alice <alice@example.com>
+
+Please sign the renewal by Friday.
+"""
+
+
+class TestForwardedContent:
+
+    def test_pure_forward_html_keeps_forwarded_message(self):
+        text = body_text.clean_body_text(GMAIL_FORWARD_HTML.format(note=""), limit=10_000, is_html=True)
+        assert "Forwarded message" in text
+        assert "Please sign the renewal by Friday." in text
+
+    def test_forward_with_note_html_keeps_note_and_message(self):
+        html = GMAIL_FORWARD_HTML.format(note="Can you handle this?")
+        text = body_text.clean_body_text(html, limit=10_000, is_html=True)
+        assert text.startswith("Can you handle this?")
+        assert "Please sign the renewal by Friday." in text
+
+    def test_pure_forward_plain_keeps_forwarded_message(self):
+        text = body_text.clean_body_text(PLAIN_FORWARD.format(note=""), limit=10_000, is_html=False)
+        assert "Please sign the renewal by Friday." in text
+
+    def test_forward_with_note_plain_keeps_note_and_message(self):
+        text = body_text.clean_body_text(PLAIN_FORWARD.format(note="Can you handle this?"), limit=10_000, is_html=False)
+        assert text.startswith("Can you handle this?")
+        assert "Subject: Contract renewal" in text
+        assert "Please sign the renewal by Friday." in text
+
+    def test_outlook_forward_block_kept_and_reply_block_cut(self):
+        header = "________________________________\nFrom: Carol\nSent: Monday, 12 January 2026 09:00\nTo: Alice\nSubject: {subject}\n\nBody below"
+        forward = "FYI\n\n" + header.format(subject="FW: Contract renewal")
+        reply = "Done.\n\n" + header.format(subject="RE: Contract renewal")
+        assert "Body below" in body_text.strip_quoted_text(forward)
+        assert body_text.strip_quoted_text(reply) == "Done."
+
+    def test_apple_mail_forward_blockquote_kept(self):
+        html = "<div>See below</div><div>Begin forwarded message:</div><blockquote type=\"cite\"><div>The forwarded body</div></blockquote>"
+        assert "The forwarded body" in body_text.clean_body_text(html, limit=10_000, is_html=True)
+
+    def test_quote_only_html_falls_back_to_unstripped_text(self):
+        html = "<div>On Sun, Alice wrote:</div><blockquote>Only the quote</blockquote>"
+        assert "Only the quote" in body_text.clean_body_text(html, limit=10_000, is_html=True)
+
+
+class TestBodyText:
+
+    def test_html_to_text_drops_styles_and_quotes(self):
+        text = body_text.html_to_text(HTML_BODY, limit=10_000)
+
+        assert "Hi Bob," in text
+        assert "Numbers are attached." in text
+        assert "- Revenue up" in text
+        assert "color: red" not in text
+        assert "Old question" not in text
+        assert "nested" not in text
+
+    def test_html_to_text_stops_at_limit(self):
+        html = "<div>" + "<p>word word word</p>" * 50_000 + "</div>"
+        text = body_text.html_to_text(html, limit=1_000)
+        assert 1_000 <= len(text) < 1_100
+
+    def test_strip_quoted_text_cuts_reply_chain(self):
+        text = "Sounds good.\n\nOn Mon, Jan 12, 2026 at 10:00 AM Alice <alice@example.com>\nwrote:\n> Shall we meet?\n"
+        assert body_text.strip_quoted_text(text) == "Sounds good."
+
+    def test_strip_quoted_text_cuts_outlook_header_block(self):
+        text = "Done.\n\nFrom: Alice <alice@example.com>\nSent: Monday, 12 January 2026 10:00\nTo: Bob\n\nEarlier"
+        assert body_text.strip_quoted_text(text) == "Done."
+
+    def test_strip_quoted_text_keeps_pure_forward(self):
+        text = "---------- Forwarded message ---------\nFrom: Carol\nThe forwarded body"
+        assert body_text.strip_quoted_text(text) == text
+
+    def test_strip_signature(self):
+        text = "See you there.\n\n-- \nAlice Example\nHead of Things"
+        assert body_text.strip_signature(text) == "See you there."
+        assert body_text.strip_signature("On my way\n\nSent from my iPhone") == "On my way"
+
+    def test_decode_body_data_is_bounded(self):
+        data = _b64("x" * 10_000)
+        assert body_text.decode_body_data(data, 100) == b"x" * 100
+        assert body_text.decode_body_data(_b64("short"), 100) == b"short"
+
+    def test_truncate_text_marks_cut(self):
+        text = body_text.truncate_text("word " * 1000, 100)
+        assert text.endswith(body_text.TRUNCATION_MARKER)
+        assert len(text) <= 100 + len(body_text.TRUNCATION_MARKER)
+
+    def test_summarize_attachments(self):
+        summary = body_text.summarize_attachments([
+            {"filename": "report.pdf", "mime_type": "application/pdf", "size": 1_258_291},
+            {"filename": "notes.txt", "mime_type": "", "size": None},
+        ])
+        assert summary == "report.pdf (application/pdf, 1.2 MB), notes.txt"
+
+
+class TestEmailNormalizer:
+
+    def test_gmail_prefers_plain_text_and_lists_attachments(self):
+        message = _gmail_message([
+            {"mimeType": "multipart/alternative", "parts": [
+                {"mimeType": "text/plain", "body": {"data": _b64("Plain body\n\n> quoted")}},
+                {"mimeType": "text/html", "body": {"data": _b64(HTML_BODY)}},
+            ]},
+            {"mimeType": "application/pdf", "filename": "q4.pdf", "body": {"attachmentId": "a1", "size": 2048}},
+        ])
+
+        normalized = EmailNormalizer().normalize(message)
+
+        assert normalized["content"] == "Plain body"
+        assert normalized["has_attachments"] is True
+        assert normalized["attachments"] == [{"filename": "q4.pdf", "mime_type": "application/pdf", "size": 2048}]
+        assert normalized["subject"] == "Quarterly numbers"
+
+    def test_gmail_html_only(self):
+        message = _gmail_message([{"mimeType": "text/html", "body": {"data": _b64(HTML_BODY)}}])
+
+        normalized = EmailNormalizer().normalize(message)
+
+        assert normalized["content"].startswith("Hi Bob,")
+        assert "Old question" not in normalized["content"]
+        assert normalized["has_attachments"] is False
+
+    def test_gmail_content_respects_budgets(self):
+        message = _gmail_message([{"mimeType": "text/plain", "body": {"data": _b64("line of text\n" * 100_000)}}])
+
+        with patch("backend.input_hooks.email_processing.normalizer.settings") as mock_settings:
+            mock_settings.EMAIL_PART_MAX_BYTES = 50_000
+            mock_settings.EMAIL_CONTENT_MAX_CHARS = 5_000
+            normalized = EmailNormalizer().normalize(message)
+
+        assert len(normalized["content"]) <= 5_000 + len(body_text.TRUNCATION_MARKER)
+        assert normalized["content"].endswith(body_text.TRUNCATION_MARKER)
+
+    def test_gmail_without_text_parts_uses_fallback(self):
+        message = _gmail_message([{"mimeType": "image/png", "filename": "logo.png", "body": {"size": 10}}])
+        assert EmailNormalizer().normalize(message)["content"] == "Content could not be extracted"
+
+    def test_simple_format_html_body_and_attachments(self):
+        normalized = EmailNormalizer().normalize({
+            "id": "m1",
+            "subject": "Hello",
+            "from": "alice@example.com",
+            "body": {"contentType": "html", "content": "<p>Hello there</p><div>On Mon, Bob wrote:</div><blockquote>old</blockquote>"},
+            "attachments": [{"name": "a.docx", "contentType": "application/msword", "size": 10}],
+        })
+
+        assert normalized["content"] == "Hello there"
+        assert normalized["has_attachments"] is True
+        assert normalized["attachments"][0]["filename"] == "a.docx"
+
+    def test_simple_format_plain_body_unchanged(self):
+        normalized = EmailNormalizer().normalize({"id": "m1", "content": "Just text"})
+        assert normalized["content"] == "Just text"
+        assert normalized["has_attachments"] is False
+        assert normalized["attachments"] == []
@@ -0,0 +1,111 @@
+"""
+Tests for concurrent, cached hook health checks.
+
+Checks run concurrently under a per-hook timeout, results are cached in an
+in-memory Redis, and email fetches reuse a recent healthy result instead of
+probing the MCP server.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.input_hooks import health_cache
+from backend.input_hooks.email_processing.fetcher import EmailFetcher
+from backend.input_hooks.hook_registry import InputHookRegistry, settings
+
+
+class InMemoryRedis:
+    """The subset of the sync Redis client used for cached health."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+
+class SlowHook:
+    def __init__(self, name: str, delay: float):
+        self.name = name
+        self.delay = delay
+        self.checks = 0
+
+    async def health_check(self):
+        self.checks += 1
+        await asyncio.sleep(self.delay)
+        return {"hook_name": self.name, "healthy": True}
+
+
+@pytest.fixture(autouse=True)
+def redis_client():
+    with patch.object(health_cache, "get_sync_redis", return_value=InMemoryRedis()):
+        yield
+
+
+def _registry(*hooks) -> InputHookRegistry:
+    registry = InputHookRegistry()
+    registry._hook_instances = {hook.name: hook for hook in hooks}
+    return registry
+
+
+@pytest.mark.asyncio
+async def test_hooks_checked_concurrently():
+    registry = _registry(*(SlowHook(f"hook{i}", 0.2) for i in range(4)))
+
+    started = time.monotonic()
+    results = await registry.health_check_all()
+
+    assert time.monotonic() - started < 0.6
+    assert all(result["healthy"] for result in results.values())
+    assert all("checked_at" in result for result in results.values())
+
+
+@pytest.mark.asyncio
+async def test_slow_hook_times_out_without_blocking_others():
+    registry = _registry(SlowHook("fast", 0), SlowHook("stuck", 5))
+
+    with patch.object(settings, "HOOK_HEALTH_CHECK_TIMEOUT_SECONDS", 0.1):
+        results = await registry.health_check_all()
+
+    assert results["fast"]["healthy"]
+    assert not results["stuck"]["healthy"]
+    assert "timed out" in results["stuck"]["error"]
+
+
+@pytest.mark.asyncio
+async def test_cached_results_reused_within_max_age():
+    fresh, stale = SlowHook("fresh", 0), SlowHook("stale", 0)
+    registry = _registry(fresh, stale)
+    await registry.health_check_all()
+    health_cache.get_sync_redis().data["hook:health:stale"] = (
+        '{"hook_name": "stale", "healthy": true, "checked_at": %f}' % (time.time() - 600)
+    )
+
+    results = await registry.health_check_all(max_age=300)
+
+    assert (fresh.checks, stale.checks) == (1, 2)
+    assert time.time() - results["stale"]["checked_at"] < 5
+
+
+@pytest.mark.asyncio
+async def test_fetch_reuses_recent_healthy_result():
+    fetcher = EmailFetcher()
+    hook_config = SimpleNamespace(
+        name="gmail", enabled=True, polling_interval=60, create_tasks=True,
+        hook_settings=SimpleNamespace(max_per_fetch=10, label_filter=None),
+    )
+    health_cache.hook_health_cache.set("gmail", {"hook_name": "gmail", "healthy": True})
+
+    with patch.object(fetcher, "_health_check", AsyncMock(return_value=True)) as probe, \
+         patch.object(fetcher, "_load_cursor", AsyncMock(side_effect=RuntimeError("stop"))):
+        with pytest.raises(RuntimeError, match="stop"):
+            await fetcher.fetch_new_emails(hook_config)
+
+    probe.assert_not_awaited()
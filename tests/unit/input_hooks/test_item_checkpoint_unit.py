@@ -0,0 +1,209 @@
+"""
+Tests for item-level checkpointing and dead-lettering of hook runs.
+
+Runs the base hook pipeline against an in-memory Redis and a fake
+dead-letter store, checking that retries resume from unfinished items and
+that persistently failing items are set aside.
+"""
+
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.input_hooks import base_hook, item_checkpoint
+from backend.input_hooks.base_hook import BaseInputHook, HookRunInProgress, ItemsPendingRetry
+from backend.input_hooks.models import GmailHookConfig, NormalizedItem
+
+
+class InMemoryRedis:
+    """The subset of the sync Redis client used for checkpoints."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def expire(self, key, ttl):
+        return key in self.data
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class FlakyHook(BaseInputHook):
+    """Hook whose items fail while their id is in ``failing``."""
+
+    def __init__(self, items: List[Dict[str, Any]], failing: set):
+        super().__init__("gmail", GmailHookConfig(name="gmail", hook_type="gmail"))
+        self.items = items
+        self.failing = failing
+        self.fetches = 0
+        self.processed: List[str] = []
+
+    async def fetch_items(self) -> List[Dict[str, Any]]:
+        self.fetches += 1
+        return list(self.items)
+
+    async def normalize_item(self, raw_item: Dict[str, Any]) -> NormalizedItem:
+        raise NotImplementedError
+
+    async def _process_single_item(self, raw_item, result) -> None:
+        self.processed.append(raw_item["id"])
+        if raw_item["id"] in self.failing:
+            raise RuntimeError(f"boom {raw_item['id']}")
+        result.tasks_created += 1
+
+
+@pytest.fixture
+def dead_letters():
+    store = AsyncMock()
+    with patch.object(item_checkpoint, "get_sync_redis", return_value=InMemoryRedis()), \
+         patch.object(base_hook, "dead_letter_store", store), \
+         patch.object(base_hook.settings, "HOOK_ITEM_MAX_ATTEMPTS", 3):
+        yield store
+
+
+ITEMS = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+
+
+@pytest.mark.asyncio
+async def test_retry_resumes_from_unfinished_items(dead_letters):
+    hook = FlakyHook(ITEMS, failing={"b"})
+
+    with pytest.raises(ItemsPendingRetry):
+        await hook.process_items(run_id="task-1")
+
+    hook.failing.clear()
+    result = await hook.process_items(run_id="task-1")
+
+    assert hook.fetches == 1
+    assert hook.processed == ["a", "b", "c", "b"]
+    assert result.items_processed == 1
+    assert item_checkpoint.item_checkpoint_store.load("gmail") is None
+
+
+@pytest.mark.asyncio
+async def test_persistently_failing_item_is_dead_lettered(dead_letters):
+    hook = FlakyHook(ITEMS, failing={"c"})
+
+    for _ in range(2):
+        with pytest.raises(ItemsPendingRetry):
+            await hook.process_items(run_id="task-1")
+    result = await hook.process_items(run_id="task-1")
+
+    assert hook.processed == ["a", "b", "c", "c", "c"]
+    assert result.tasks_created == 0
+    dead_letters.add.assert_awaited_once_with("gmail", "c", {"id": "c"}, "boom c", 3)
+    assert item_checkpoint.item_checkpoint_store.load("gmail") is None
+
+
+@pytest.mark.asyncio
+async def test_new_run_finishes_items_left_by_earlier_run(dead_letters):
+    hook = FlakyHook(ITEMS, failing={"b"})
+    with pytest.raises(ItemsPendingRetry):
+        await hook.process_items(run_id="task-1")
+
+    hook.failing.clear()
+    hook.items = [{"id": "b"}, {"id": "d"}]
+    await hook.process_items(run_id="task-2")
+
+    assert hook.fetches == 2
+    assert hook.processed[3:] == ["b", "d"]
+
+
+@pytest.mark.asyncio
+async def test_interleaved_run_does_not_adopt_in_flight_items(dead_letters):
+    first = FlakyHook(ITEMS, failing=set())
+    second = FlakyHook([{"id": "d"}], failing=set())
+    interleaved = []
+
+    async def process_and_interleave(raw_item, result):
+        if raw_item["id"] == "b" and not interleaved:
+            # A push-triggered run starts while the beat run is mid-batch
+            with pytest.raises(HookRunInProgress):
+                await second.process_items(run_id="task-2")
+            interleaved.append(item_checkpoint.item_checkpoint_store.load("gmail"))
+        await FlakyHook._process_single_item(first, raw_item, result)
+
+    first._process_single_item = process_and_interleave
+    result = await first.process_items(run_id="task-1")
+
+    assert second.fetches == 0 and second.processed == []
+    assert interleaved[0].run_id == "task-1" and interleaved[0].done == ["a"]
+    assert result.tasks_created == 3
+    assert item_checkpoint.item_checkpoint_store.load("gmail") is None
+
+    # Once the first run has released its lease the next run proceeds
+    await second.process_items(run_id="task-2")
+    assert second.processed == ["d"]
+
+
+@pytest.mark.asyncio
+async def test_retry_of_lease_holder_resumes(dead_letters):
+    hook = FlakyHook(ITEMS, failing={"b"})
+    with pytest.raises(ItemsPendingRetry):
+        await hook.process_items(run_id="task-1")
+
+    assert item_checkpoint.item_checkpoint_store.acquire_lease("gmail", "task-9") is True
+    with pytest.raises(HookRunInProgress):
+        await hook.process_items(run_id="task-1")
+    item_checkpoint.item_checkpoint_store.release_lease("gmail", "task-9")
+
+    hook.failing.clear()
+    await hook.process_items(run_id="task-1")
+    assert hook.processed == ["a", "b", "c", "b"]
+
+
+@pytest.mark.asyncio
+async def test_item_failures_not_retried_without_checkpoint():
+    hook = FlakyHook(ITEMS, failing={"b"})
+
+    with patch.object(item_checkpoint, "get_sync_redis", return_value=None):
+        result = await hook.process_items(run_id="task-1")
+
+    assert result.tasks_created == 2
+    assert len(result.errors) == 1
+
+
+def test_dead_letter_api_lists_and_replays():
+    from backend.api.hooks_endpoints import router
+    from input_hooks.dead_letter import dead_letter_store
+
+    item = {
+        "id": "00000000-0000-0000-0000-000000000001", "hook_name": "gmail", "source_id": "c",
+        "item_data": {"id": "c"}, "error": "boom c", "attempts": 3, "status": "dead",
+    }
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    with patch.object(dead_letter_store, "list", AsyncMock(return_value=[item])), \
+         patch.object(dead_letter_store, "get", AsyncMock(side_effect=lambda item_id: item if item_id == item["id"] else None)), \
+         patch("backend.api.hooks_endpoints._replay_dead_letters", AsyncMock(return_value={
+             "hook_name": "gmail", "queued": {item["id"]: "replay-1"}, "queued_at": "2026-01-01T00:00:00+00:00",
+         })) as replay:
+        listed = client.get("/api/hooks/gmail/dead-letter").json()
+        inspected = client.get(f"/api/hooks/gmail/dead-letter/{item['id']}").json()
+        missing = client.get("/api/hooks/gmail/dead-letter/not-an-id")
+        replayed = client.post(f"/api/hooks/gmail/dead-letter/{item['id']}/replay").json()
+        client.post("/api/hooks/gmail/dead-letter/replay")
+
+    assert listed["items"][0]["item_data"] is None
+    assert inspected["item_data"] == {"id": "c"}
+    assert missing.status_code == 404
+    assert replayed["queued"] == {item["id"]: "replay-1"}
+    assert replay.await_args_list[0].args == ("gmail", [item])
+    assert replay.await_args_list[1].args == ("gmail", [item])
@@ -0,0 +1,289 @@
+"""
+Pure Unit Tests for Incremental Mailbox Sync Cursors.
+
+Runs EmailFetcher and OutlookProcessor against a fake mailbox MCP server
+(in-process tools with the same names and argument shapes as the gateway's)
+and an in-memory cursor store.
+
+Components tested:
+- SyncCursor: seen/pending ids, watermark and resync bookkeeping (pure logic)
+- EmailFetcher: reads only new messages, reads unprocessed ones again, uses
+  provider sync tokens, resyncs when a token expires
+- OutlookProcessor: narrows the listing with the cursor watermark
+
+Run with: uv run pytest tests/unit/input_hooks/test_mailbox_sync_cursor_unit.py -v
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_core.tools import StructuredTool
+
+from backend.input_hooks.email_processing.fetcher import EmailFetcher
+from backend.input_hooks.models import GmailHookConfig, GmailHookSettings
+from backend.input_hooks.outlook_processing.processor import OutlookProcessor
+from backend.input_hooks.sync_cursor import SyncCursor
+
+
+class FakeMailbox:
+    """Fake mailbox MCP server exposing list/read email tools."""
+
+    def __init__(self, supports_sync_token: bool = False):
+        self.messages: Dict[str, Dict[str, str]] = {}
+        self.changes: List[str] = []  # message ids in arrival order
+        self.expired_before = 0  # sync tokens below this are rejected
+        self.supports_sync_token = supports_sync_token
+        self.list_calls: List[Optional[str]] = []
+        self.read_calls: List[str] = []
+
+    def deliver(self, message_id: str, day: int = 1) -> None:
+        self.messages[message_id] = {
+            "id": message_id,
+            "subject": f"Subject {message_id}",
+            "from": "sender@example.com",
+            "date": f"Mon, {day:02d} Sep 2025 10:00:00 +0000",
+            "content": "Hello",
+        }
+        self.changes.append(message_id)
+
+    def tools(self) -> List[StructuredTool]:
+        def list_unread(sync_token: Optional[str] = None) -> str:
+            self.list_calls.append(sync_token)
+            if sync_token is None:
+                listed = list(self.messages)
+            elif int(sync_token) < self.expired_before:
+                return json.dumps({"status": "error", "error_message": "historyId too old"})
+            else:
+                listed = self.changes[int(sync_token):]
+            if not self.supports_sync_token:
+                return json.dumps([{"id": i} for i in listed])
+            return json.dumps({"messages": [{"id": i} for i in listed], "next_sync_token": str(len(self.changes))})
+
+        def list_unread_plain() -> str:
+            return list_unread()
+
+        def read_email(email_id: str) -> str:
+            self.read_calls.append(email_id)
+            return json.dumps(self.messages[email_id])
+
+        return [
+            StructuredTool.from_function(
+                func=list_unread if self.supports_sync_token else list_unread_plain,
+                name="google_workspace-get_unread_emails", description="List unread emails",
+            ),
+            StructuredTool.from_function(func=read_email, name="google_workspace-read_email", description="Read email"),
+        ]
+
+
+class InMemoryCursorStore:
+    def __init__(self):
+        self.cursors: Dict[str, SyncCursor] = {}
+        self.processed: set = set()  # ids with a ProcessedItem row
+
+    async def load(self, hook_name: str) -> SyncCursor:
+        stored = self.cursors.get(hook_name)
+        return SyncCursor(**vars(stored)) if stored else SyncCursor(hook_name=hook_name)
+
+    async def save(self, cursor: SyncCursor) -> None:
+        self.cursors[cursor.hook_name] = SyncCursor(**{
+            **vars(cursor), "seen_ids": list(cursor.seen_ids), "pending_ids": list(cursor.pending_ids)
+        })
+
+    async def processed_ids(self, hook_name: str, source_type: str, ids: List[str]) -> List[str]:
+        return [i for i in ids if i in self.processed]
+
+
+@pytest.fixture
+def store():
+    return InMemoryCursorStore()
+
+
+@pytest.fixture
+def hook_config():
+    return GmailHookConfig(name="gmail", hook_type="gmail", hook_settings=GmailHookSettings(max_per_fetch=10))
+
+
+async def poll(mailbox: FakeMailbox, store: InMemoryCursorStore, hook_config, process: bool = True) -> List[str]:
+    """One beat interval: a fresh fetcher, as in a new worker process.
+
+    With ``process`` the hook pipeline records every fetched email as processed.
+    """
+    with patch("backend.input_hooks.email_processing.fetcher.mcp_manager") as mock_mcp, \
+         patch("backend.input_hooks.email_processing.fetcher.sync_cursor_store", store):
+        mock_mcp.get_tools = AsyncMock(return_value=mailbox.tools())
+        emails = await EmailFetcher().fetch_new_emails(hook_config)
+    ids = [email["id"] for email in emails]
+    if process and isinstance(store, InMemoryCursorStore):
+        store.processed.update(ids)
+    return ids
+
+
+class TestSyncCursor:
+    """Pure logic of cursor bookkeeping."""
+
+    def test_complete_listing_prunes_seen_ids(self):
+        cursor = SyncCursor(hook_name="gmail", seen_ids=["a", "b"])
+
+        cursor.advance(["c"], listed_ids=["b", "c"], processed=True)
+
+        assert cursor.seen_ids == ["b", "c"]
+        assert not cursor.full_sync_due
+
+    def test_fetched_ids_wait_as_pending_until_confirmed(self):
+        cursor = SyncCursor(hook_name="gmail")
+
+        cursor.advance(["a", "b"])
+        assert cursor.seen_ids == []
+        assert cursor.pending_ids == ["a", "b"]
+
+        cursor.confirm(["b"])
+        assert cursor.seen_ids == ["b"]
+        assert cursor.pending_ids == ["a"]
+
+    def test_full_sync_stamped_only_after_reset(self):
+        first_sync = datetime.now(timezone.utc) - timedelta(hours=3)
+        cursor = SyncCursor(hook_name="gmail", full_sync_at=first_sync)
+
+        cursor.advance(["a"], listed_ids=["a"])
+        assert cursor.full_sync_at == first_sync
+
+        cursor.reset()
+        cursor.advance(["a"], listed_ids=["a"])
+        assert cursor.full_sync_at > first_sync
+
+    def test_since_date_keeps_margin_and_configured_floor(self):
+        cursor = SyncCursor(hook_name="outlook", last_seen_at=datetime(2025, 9, 10, 8, tzinfo=timezone.utc))
+
+        assert cursor.since_date() == "2025-09-09"
+        assert cursor.since_date("2025-09-30") == "2025-09-30"
+
+    def test_stale_cursor_needs_full_sync(self):
+        cursor = SyncCursor(hook_name="gmail", full_sync_at=datetime.now(timezone.utc) - timedelta(days=2))
+
+        assert cursor.full_sync_due
+
+
+class TestEmailFetcherIncrementalSync:
+    """EmailFetcher against the fake mailbox server."""
+
+    @pytest.mark.asyncio
+    async def test_idle_poll_reads_nothing(self, store, hook_config):
+        """Test that already-read messages are not read again on later polls."""
+        mailbox = FakeMailbox()
+        mailbox.deliver("m1")
+        mailbox.deliver("m2")
+
+        assert await poll(mailbox, store, hook_config) == ["m1", "m2"]
+        assert await poll(mailbox, store, hook_config) == []
+
+        mailbox.deliver("m3")
+        assert await poll(mailbox, store, hook_config) == ["m3"]
+        assert mailbox.read_calls == ["m1", "m2", "m3"]
+
+    @pytest.mark.asyncio
+    async def test_messages_over_limit_left_for_next_poll(self, store, hook_config):
+        """Test that max_per_fetch caps reads without losing the remainder."""
+        hook_config.hook_settings.max_per_fetch = 2
+        mailbox = FakeMailbox()
+        for i in range(3):
+            mailbox.deliver(f"m{i}")
+
+        assert await poll(mailbox, store, hook_config) == ["m0", "m1"]
+        assert await poll(mailbox, store, hook_config) == ["m2"]
+
+    @pytest.mark.asyncio
+    async def test_unprocessed_email_read_again(self, store, hook_config):
+        """Test that an email whose task creation failed is not skipped by later polls."""
+        mailbox = FakeMailbox()
+        mailbox.deliver("m1")
+
+        assert await poll(mailbox, store, hook_config, process=False) == ["m1"]
+        assert await poll(mailbox, store, hook_config) == ["m1"]
+        assert await poll(mailbox, store, hook_config) == []
+        assert store.cursors["gmail"].seen_ids == ["m1"]
+
+    @pytest.mark.asyncio
+    async def test_seen_id_polls_keep_resync_schedule(self, store, hook_config):
+        """Test that polls without a sync token do not postpone the periodic full resync."""
+        mailbox = FakeMailbox()
+        mailbox.deliver("m1")
+        await poll(mailbox, store, hook_config)
+        first_sync = store.cursors["gmail"].full_sync_at
+
+        await poll(mailbox, store, hook_config)
+        assert store.cursors["gmail"].full_sync_at == first_sync
+
+        store.cursors["gmail"].full_sync_at = first_sync - timedelta(days=2)
+        assert await poll(mailbox, store, hook_config) == ["m1"]
+        assert store.cursors["gmail"].full_sync_at > first_sync
+
+    @pytest.mark.asyncio
+    async def test_unprocessed_email_read_again_with_sync_token(self, store, hook_config):
+        """Test that pending ids are read by id when the token listing no longer returns them."""
+        mailbox = FakeMailbox(supports_sync_token=True)
+        mailbox.deliver("m1")
+
+        assert await poll(mailbox, store, hook_config, process=False) == ["m1"]
+        mailbox.deliver("m2")
+        assert await poll(mailbox, store, hook_config) == ["m2", "m1"]
+        assert await poll(mailbox, store, hook_config) == []
+
+    @pytest.mark.asyncio
+    async def test_sync_token_asks_only_for_changes(self, store, hook_config):
+        """Test that a provider sync token is sent back on the next poll."""
+        mailbox = FakeMailbox(supports_sync_token=True)
+        mailbox.deliver("m1")
+
+        assert await poll(mailbox, store, hook_config) == ["m1"]
+        mailbox.deliver("m2")
+        assert await poll(mailbox, store, hook_config) == ["m2"]
+
+        assert mailbox.list_calls == [None, "1"]
+        assert store.cursors["gmail"].token == "2"
+
+    @pytest.mark.asyncio
+    async def test_expired_token_triggers_full_resync(self, store, hook_config):
+        """Test recovery when the provider rejects the stored token."""
+        mailbox = FakeMailbox(supports_sync_token=True)
+        mailbox.deliver("m1")
+        await poll(mailbox, store, hook_config)
+
+        mailbox.deliver("m2")
+        mailbox.expired_before = 5
+        assert await poll(mailbox, store, hook_config) == ["m1", "m2"]
+
+        assert mailbox.list_calls == [None, "1", None]
+        assert store.cursors["gmail"].token == "2"
+
+    @pytest.mark.asyncio
+    async def test_cursor_store_down_falls_back_to_full_listing(self, hook_config):
+        """Test that polling still works without a cursor."""
+        mailbox = FakeMailbox()
+        mailbox.deliver("m1")
+        broken = AsyncMock()
+        broken.load.side_effect = RuntimeError("db down")
+
+        assert await poll(mailbox, broken, hook_config) == ["m1"]
+        assert await poll(mailbox, broken, hook_config) == ["m1"]
+
+
+class TestOutlookWatermark:
+    """OutlookProcessor narrows listings with the cursor watermark."""
+
+    @pytest.mark.asyncio
+    async def test_listing_uses_watermark_after_first_poll(self, store):
+        processor = OutlookProcessor()
+        processor.fetcher.fetch_unprocessed_emails = AsyncMock(return_value=[])
+        store.cursors["outlook"] = SyncCursor(
+            hook_name="outlook",
+            last_seen_at=datetime(2025, 9, 10, tzinfo=timezone.utc),
+            full_sync_at=datetime.now(timezone.utc),
+        )
+
+        with patch("backend.input_hooks.outlook_processing.processor.sync_cursor_store", store):
+            await processor.process_emails(max_emails=5, since_date="2025-01-01", hook_name="outlook")
+
+        assert processor.fetcher.fetch_unprocessed_emails.call_args.kwargs["since_date"] == "2025-09-09"
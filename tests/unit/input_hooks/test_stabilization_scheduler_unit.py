@@ -0,0 +1,155 @@
+"""
+Unit Tests for delayed activation of email thread tasks (ADR-019).
+
+Tests the StabilizationScheduler against an in-memory sorted set and its
+use by EmailThreadConsolidator. Database access is mocked.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.input_hooks.email_processing import stabilization_scheduler as scheduler_module
+from backend.input_hooks.email_processing.stabilization_scheduler import (
+    STABILIZATION_SCHEDULE_KEY,
+    StabilizationScheduler,
+)
+from backend.input_hooks.email_processing.thread_consolidator import EmailThreadConsolidator
+from backend.models.models import Task, TaskStatus
+
+
+class InMemoryRedis:
+    """The subset of the sync Redis client used for the sorted set."""
+
+    def __init__(self):
+        self.sets = {}
+
+    def zadd(self, key, mapping, nx=False):
+        members = self.sets.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if nx and member in members:
+                continue
+            added += member not in members
+            members[member] = score
+        return added
+
+    def zrangebyscore(self, key, low, high):
+        members = self.sets.get(key, {})
+        return [m for m, score in sorted(members.items(), key=lambda item: item[1]) if score <= high]
+
+    def zrem(self, key, member):
+        return 1 if self.sets.get(key, {}).pop(member, None) is not None else 0
+
+
+NOW = datetime(2026, 1, 10, 12, 0)
+
+
+@pytest.fixture
+def redis_client():
+    client = InMemoryRedis()
+    with patch.object(scheduler_module, "get_sync_redis", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def scheduler(redis_client):
+    scheduler = StabilizationScheduler()
+    scheduler._activate = AsyncMock(return_value=True)
+    return scheduler
+
+
+class TestStabilizationScheduler:
+    """Unit tests for holding and releasing thread tasks."""
+
+    @pytest.mark.asyncio
+    async def test_task_released_once_window_ends(self, scheduler):
+        scheduler.schedule("task-1", NOW + timedelta(minutes=15))
+
+        assert await scheduler.release_due(NOW + timedelta(minutes=14)) == []
+        assert await scheduler.release_due(NOW + timedelta(minutes=15)) == ["task-1"]
+        assert await scheduler.release_due(NOW + timedelta(minutes=30)) == []
+        scheduler._activate.assert_awaited_once_with("task-1")
+
+    @pytest.mark.asyncio
+    async def test_extension_moves_release(self, scheduler, redis_client):
+        scheduler.schedule("task-1", NOW + timedelta(minutes=15))
+        scheduler.schedule("task-1", NOW + timedelta(minutes=25))
+
+        assert len(redis_client.sets[STABILIZATION_SCHEDULE_KEY]) == 1
+        assert await scheduler.release_due(NOW + timedelta(minutes=20)) == []
+        assert await scheduler.release_due(NOW + timedelta(minutes=25)) == ["task-1"]
+
+    @pytest.mark.asyncio
+    async def test_competing_releasers_release_once(self, scheduler, redis_client):
+        scheduler.schedule("task-1", NOW)
+        other = StabilizationScheduler()
+        other._activate = AsyncMock(return_value=True)
+        # The other releaser read the due set but lost the ZREM race
+        redis_client.zrem(STABILIZATION_SCHEDULE_KEY, "task-1")
+        redis_client.zrangebyscore = Mock(return_value=["task-1"])
+
+        assert await other.release_due(NOW) == []
+        other._activate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_release_is_retried(self, scheduler):
+        scheduler.schedule("task-1", NOW)
+        scheduler._activate.side_effect = [RuntimeError("db down"), True]
+
+        assert await scheduler.release_due(NOW) == []
+        assert await scheduler.release_due(NOW) == ["task-1"]
+
+
+class TestConsolidatorHoldsThreadTasks:
+    """Test that the consolidator holds thread tasks through the scheduler."""
+
+    @pytest.fixture
+    def consolidator(self):
+        return EmailThreadConsolidator(stabilization_minutes=15)
+
+    @pytest.mark.asyncio
+    async def test_new_thread_task_held_until_window_ends(self, consolidator):
+        with patch('backend.input_hooks.email_processing.thread_consolidator.create_task_tool',
+                   AsyncMock(return_value='Task created successfully: {"id": "task_xyz"}')), \
+             patch.object(consolidator, '_update_task_metadata', new_callable=AsyncMock) as mock_update, \
+             patch('backend.input_hooks.email_processing.thread_consolidator.stabilization_scheduler') as mock_scheduler:
+            await consolidator.create_thread_task("thread_abc", [{"id": "email_1", "content": "Hi"}], "Hello")
+
+        assert mock_update.call_args[1]["status"] == TaskStatus.WAITING
+        task_id, ends_at = mock_scheduler.schedule.call_args[0]
+        assert task_id == "task_xyz"
+        assert timedelta(minutes=14) < ends_at - datetime.utcnow() <= timedelta(minutes=15)
+
+    @pytest.mark.asyncio
+    async def test_reset_window_reschedules_held_task_only(self, consolidator):
+        task = Mock(spec=Task)
+        task.id = uuid4()
+        task.status = TaskStatus.WAITING
+        task.task_metadata = {"is_thread_stabilizing": True}
+
+        with patch.object(consolidator, '_update_task_metadata', new_callable=AsyncMock), \
+             patch('backend.input_hooks.email_processing.thread_consolidator.stabilization_scheduler') as mock_scheduler:
+            await consolidator.reset_stabilization_window(task)
+            task.status = TaskStatus.NEEDS_REVIEW
+            await consolidator.reset_stabilization_window(task)
+
+        assert mock_scheduler.schedule.call_count == 1
+        assert mock_scheduler.schedule.call_args[0][0] == str(task.id)
+
+    @pytest.mark.asyncio
+    async def test_reset_window_leaves_parked_waiting_task_alone(self, consolidator):
+        """A WAITING task the agent parked is not flagged, so reconcile never activates it."""
+        task = Mock(spec=Task)
+        task.id = uuid4()
+        task.status = TaskStatus.WAITING
+        task.task_metadata = {"email_thread_id": "thread_abc", "is_thread_stabilizing": False}
+
+        with patch.object(consolidator, '_update_task_metadata', new_callable=AsyncMock) as mock_update, \
+             patch('backend.input_hooks.email_processing.thread_consolidator.stabilization_scheduler') as mock_scheduler:
+            await consolidator.reset_stabilization_window(task)
+
+        mock_update.assert_not_called()
+        mock_scheduler.schedule.assert_not_called()
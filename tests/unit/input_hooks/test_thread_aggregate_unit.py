@@ -0,0 +1,129 @@
+"""
+Unit tests for incremental email thread aggregates.
+
+Run with: NOVA_SKIP_DB=1 uv run pytest tests/unit/input_hooks/test_thread_aggregate_unit.py -v
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.input_hooks.email_processing.processor import EmailProcessor
+from backend.input_hooks.email_processing.thread_aggregate import ThreadAggregate
+from backend.models.models import Task, TaskStatus
+
+
+def _email(n, sender="alice@example.com", to="bob@example.com"):
+    return {
+        "id": f"email_{n}",
+        "thread_id": "thread_abc",
+        "subject": "Project Discussion",
+        "from": sender,
+        "to": to,
+        "date": f"2026-01-10T10:{n:02d}:00Z",
+        "content": f"Body of message {n}",
+    }
+
+
+class TestThreadAggregate:
+
+    def test_add_message_tracks_count_participants_and_dates(self):
+        aggregate = ThreadAggregate(thread_id="thread_abc")
+
+        aggregate.add_message(_email(1), recent_limit=5, digest_limit=5)
+        aggregate.add_message(_email(2, sender="bob@example.com", to="Alice@example.com, carol@example.com"),
+                              recent_limit=5, digest_limit=5)
+
+        assert aggregate.message_count == 2
+        assert aggregate.subject == "Project Discussion"
+        assert aggregate.participants == ["alice@example.com", "bob@example.com", "carol@example.com"]
+        assert aggregate.first_message_date == "2026-01-10T10:01:00Z"
+        assert aggregate.last_message_date == "2026-01-10T10:02:00Z"
+        assert aggregate.email_ids == ["email_1", "email_2"]
+
+    def test_add_message_ignores_already_recorded_email(self):
+        aggregate = ThreadAggregate(thread_id="thread_abc")
+        assert aggregate.add_message(_email(1), recent_limit=5, digest_limit=5) is True
+        assert aggregate.add_message(_email(1), recent_limit=5, digest_limit=5) is False
+        assert aggregate.message_count == 1
+
+    def test_older_messages_fold_into_bounded_digest(self):
+        aggregate = ThreadAggregate(thread_id="thread_abc")
+        for n in range(1, 8):
+            aggregate.add_message(_email(n), recent_limit=2, digest_limit=3)
+
+        assert aggregate.message_count == 7
+        assert [m["number"] for m in aggregate.recent_messages] == [6, 7]
+        assert len(aggregate.digest) == 3
+        assert aggregate.digest[0].startswith("- Message 3 ")
+        assert "Body of message 5" in aggregate.digest[-1]
+
+    def test_render_description_is_bounded(self):
+        aggregate = ThreadAggregate(thread_id="thread_abc", subject="Project Discussion")
+        for n in range(1, 8):
+            aggregate.add_message(_email(n), recent_limit=2, digest_limit=3)
+
+        description = aggregate.render_description()
+
+        assert "**Messages:** 7" in description
+        assert "2 earlier messages not listed." in description
+        assert "### Message 6" in description
+        assert "### Message 7" in description
+        assert "### Message 5" not in description
+        assert "Body of message 1" not in description
+        assert aggregate.render_title() == "Email Thread: Project Discussion (7 messages)"
+
+    def test_prior_count_is_counted_but_not_listed(self):
+        aggregate = ThreadAggregate(thread_id="thread_abc", subject="Project Discussion", message_count=3)
+        aggregate.add_message(_email(4), recent_limit=5, digest_limit=5)
+
+        assert aggregate.message_count == 4
+        assert aggregate.recent_messages[0]["number"] == 4
+        assert "3 earlier messages not listed." in aggregate.render_description()
+
+    def test_from_emails_orders_by_date(self):
+        aggregate = ThreadAggregate.from_emails("thread_abc", "Project Discussion", [_email(2), _email(1)])
+        assert aggregate.email_ids == ["email_1", "email_2"]
+
+
+class TestAppendEmailToTask:
+
+    @pytest.fixture
+    def held_task(self):
+        task = Mock(spec=Task)
+        task.id = uuid4()
+        task.status = TaskStatus.WAITING
+        task.title = "Email Thread: Project Discussion (1 message)"
+        task.description = "Previous content"
+        task.task_metadata = {"email_thread_id": "thread_abc", "email_count": 1}
+        return task
+
+    @pytest.mark.asyncio
+    async def test_thread_task_is_rendered_from_aggregate(self, held_task):
+        processor = EmailProcessor(thread_consolidation_enabled=True)
+        aggregate = ThreadAggregate.from_emails("thread_abc", "Project Discussion", [_email(1), _email(2)])
+
+        with patch("tools.task_tools.update_task_tool", new_callable=AsyncMock) as mock_update:
+            with patch.object(processor.thread_consolidator, "_update_task_metadata", new_callable=AsyncMock) as mock_meta:
+                await processor._append_email_to_task(held_task, _email(2), aggregate)
+
+        kwargs = mock_update.call_args[1]
+        assert kwargs["title"] == "Email Thread: Project Discussion (2 messages)"
+        assert kwargs["description"] == aggregate.render_description()
+        assert "Previous content" not in kwargs["description"]
+        assert mock_meta.call_args[1]["metadata"] == {"email_count": 2, "email_ids": ["email_1", "email_2"]}
+
+    @pytest.mark.asyncio
+    async def test_continuation_task_appends_to_description(self, held_task):
+        processor = EmailProcessor(thread_consolidation_enabled=True)
+        held_task.task_metadata["previous_task_id"] = str(uuid4())
+        aggregate = ThreadAggregate.from_emails("thread_abc", "Project Discussion", [_email(1), _email(2)])
+
+        with patch("tools.task_tools.update_task_tool", new_callable=AsyncMock) as mock_update:
+            with patch.object(processor.thread_consolidator, "_update_task_metadata", new_callable=AsyncMock):
+                await processor._append_email_to_task(held_task, _email(2), aggregate)
+
+        description = mock_update.call_args[1]["description"]
+        assert description.startswith("Previous content")
+        assert "Body of message 2" in description
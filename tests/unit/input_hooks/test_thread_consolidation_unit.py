@@ -299,8 +299,10 @@ class TestEmailThreadConsolidator:
 
     @pytest.mark.asyncio
     async def test_reset_stabilization_window(self, consolidator, sample_task):
-        """Test resetting the stabilization window."""
-        with patch.object(consolidator, '_update_task_metadata', new_callable=AsyncMock) as mock_update:
+        """Test resetting the stabilization window of a held task."""
+        sample_task.status = TaskStatus.WAITING
+        with patch.object(consolidator, '_update_task_metadata', new_callable=AsyncMock) as mock_update, \
+             patch('backend.input_hooks.email_processing.thread_consolidator.stabilization_scheduler'):
             await consolidator.reset_stabilization_window(sample_task)
 
             mock_update.assert_called_once()
@@ -431,22 +433,25 @@ class TestEmailProcessorThreadConsolidation:
         self, processor, sample_email, hook_config
     ):
         """Test processing first email in a new thread."""
+        aggregate = Mock()
         with patch.object(processor.thread_consolidator, 'find_existing_thread_task', new_callable=AsyncMock) as mock_find:
-            with patch.object(processor.thread_consolidator, 'create_thread_task', new_callable=AsyncMock) as mock_create:
-                with patch.object(processor.task_creator, '_create_metadata', new_callable=AsyncMock) as mock_metadata:
-                    with patch.object(processor, '_mark_email_processed', new_callable=AsyncMock):
-                        mock_find.return_value = None
-                        mock_create.return_value = "new_task_id"
-                        mock_metadata.return_value = Mock()
+            with patch.object(processor.thread_consolidator, 'record_thread_message', new_callable=AsyncMock, return_value=aggregate):
+                with patch.object(processor.thread_consolidator, 'create_thread_task', new_callable=AsyncMock) as mock_create:
+                    with patch.object(processor.task_creator, '_create_metadata', new_callable=AsyncMock) as mock_metadata:
+                        with patch.object(processor, '_mark_email_processed', new_callable=AsyncMock):
+                            mock_find.return_value = None
+                            mock_create.return_value = "new_task_id"
+                            mock_metadata.return_value = Mock()
 
-                        result = await processor._process_with_thread_consolidation(sample_email, hook_config)
+                            result = await processor._process_with_thread_consolidation(sample_email, hook_config)
 
-                        assert result is True
-                        mock_create.assert_called_once_with(
-                            thread_id="thread_abc",
-                            emails=[sample_email],
-                            subject="Project Discussion"
-                        )
+                            assert result is True
+                            mock_create.assert_called_once_with(
+                                thread_id="thread_abc",
+                                emails=[sample_email],
+                                subject="Project Discussion",
+                                aggregate=aggregate
+                            )
 
     @pytest.mark.asyncio
     async def test_process_with_thread_consolidation_supersede_new_task(
@@ -460,20 +465,28 @@ class TestEmailProcessorThreadConsolidation:
         existing_task.title = "Email Thread: Project Discussion (1 message)"
         existing_task.description = "Previous content"
 
+        aggregate = Mock()
         with patch.object(processor.thread_consolidator, 'find_existing_thread_task', new_callable=AsyncMock) as mock_find:
-            with patch.object(processor, '_get_all_thread_emails', new_callable=AsyncMock) as mock_get_all:
+            with patch.object(processor.thread_consolidator, 'record_thread_message', new_callable=AsyncMock) as mock_record:
                 with patch.object(processor.thread_consolidator, 'supersede_unprocessed_task', new_callable=AsyncMock) as mock_supersede:
                     with patch.object(processor.task_creator, '_create_metadata', new_callable=AsyncMock) as mock_metadata:
                         with patch.object(processor, '_mark_email_processed', new_callable=AsyncMock):
                             mock_find.return_value = existing_task
-                            mock_get_all.return_value = [sample_email]
+                            mock_record.return_value = aggregate
                             mock_supersede.return_value = "new_task_id"
                             mock_metadata.return_value = Mock()
 
                             result = await processor._process_with_thread_consolidation(sample_email, hook_config)
 
                             assert result is True
-                            mock_supersede.assert_called_once()
+                            mock_record.assert_called_once_with(
+                                "thread_abc", sample_email, "Project Discussion", existing_task=existing_task
+                            )
+                            mock_supersede.assert_called_once_with(
+                                existing_task=existing_task,
+                                new_emails=[sample_email],
+                                aggregate=aggregate
+                            )
 
     @pytest.mark.asyncio
     async def test_process_with_thread_consolidation_skip_in_progress(
@@ -506,20 +519,21 @@ class TestEmailProcessorThreadConsolidation:
         existing_task.comments = []
 
         with patch.object(processor.thread_consolidator, 'find_existing_thread_task', new_callable=AsyncMock) as mock_find:
-            with patch.object(processor.thread_consolidator, 'create_continuation_task', new_callable=AsyncMock) as mock_continue:
-                with patch.object(processor.task_creator, '_create_metadata', new_callable=AsyncMock) as mock_metadata:
-                    with patch.object(processor, '_mark_email_processed', new_callable=AsyncMock):
-                        mock_find.return_value = existing_task
-                        mock_continue.return_value = "continuation_task_id"
-                        mock_metadata.return_value = Mock()
+            with patch.object(processor.thread_consolidator, 'record_thread_message', new_callable=AsyncMock):
+                with patch.object(processor.thread_consolidator, 'create_continuation_task', new_callable=AsyncMock) as mock_continue:
+                    with patch.object(processor.task_creator, '_create_metadata', new_callable=AsyncMock) as mock_metadata:
+                        with patch.object(processor, '_mark_email_processed', new_callable=AsyncMock):
+                            mock_find.return_value = existing_task
+                            mock_continue.return_value = "continuation_task_id"
+                            mock_metadata.return_value = Mock()
 
-                        result = await processor._process_with_thread_consolidation(sample_email, hook_config)
+                            result = await processor._process_with_thread_consolidation(sample_email, hook_config)
 
-                        assert result is True
-                        mock_continue.assert_called_once_with(
-                            completed_task=existing_task,
-                            new_emails=[sample_email]
-                        )
+                            assert result is True
+                            mock_continue.assert_called_once_with(
+                                completed_task=existing_task,
+                                new_emails=[sample_email]
+                            )
 
 
 class TestCoreAgentStabilizationFilter:
@@ -188,6 +188,38 @@ class TestSkillManager:
         tool_names = [t.name for t in tools]
         assert "test_tool" in tool_names
 
+    @pytest.mark.asyncio
+    async def test_load_skill_cached_until_files_change(self, skills_path):
+        """load_skill should import tools once and reload only when skill files change."""
+        manager = SkillManager(skills_path=skills_path)
+
+        first = await manager.load_skill("test_skill")
+        second = await manager.load_skill("test_skill")
+        assert second is first
+
+        stats = manager.get_load_stats()["test_skill"]
+        assert stats["loads"] == 1
+        assert stats["cache_hits"] == 1
+
+        # Changing a file under the skill directory invalidates the cache
+        instructions = skills_path / "test_skill" / "instructions.md"
+        instructions.write_text("# Updated instructions, now longer than before")
+        third = await manager.load_skill("test_skill")
+
+        assert third is not first
+        assert "Updated instructions" in third.instructions
+        assert manager.get_load_stats()["test_skill"]["loads"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self, skills_path):
+        """invalidate should drop the cached skill."""
+        manager = SkillManager(skills_path=skills_path)
+
+        first = await manager.load_skill("test_skill")
+        manager.invalidate("test_skill")
+
+        assert await manager.load_skill("test_skill") is not first
+
     def test_reload(self, skills_path):
         """reload should rescan skills directory."""
         manager = SkillManager(skills_path=skills_path)
@@ -0,0 +1,176 @@
+"""
+Bulk Thread Deletion Unit Tests
+
+Tests filter-to-SQL translation, batching and progress reporting of bulk
+chat/task thread deletion against a scripted psycopg pool.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from backend.services.bulk_thread_deletion import (
+    ThreadDeletionFilter,
+    build_selection_query,
+    bulk_delete_threads,
+)
+from backend.services.checkpoint_retention import (
+    DELETE_CHAT_METADATA_SQL,
+    DELETE_TOOL_RESULTS_SQL,
+    PURGE_THREAD_SQL,
+)
+
+
+class ScriptedPool:
+    """psycopg-style pool: selection queries page through thread ids, deletes report counts."""
+
+    def __init__(self, thread_ids, rows_per_thread=(3, 2, 4, 1, 2)):
+        self.thread_ids = sorted(thread_ids)
+        self.rows_per_thread = dict(zip(("checkpoints", "writes", "blobs", "metadata", "tool_results"), rows_per_thread))
+        self.calls = []
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield self
+
+    async def execute(self, sql, params):
+        self.calls.append((sql, params))
+        if sql.startswith("SELECT c.thread_id"):
+            remaining = [tid for tid in self.thread_ids if tid > params["after"]]
+            self._rows = [(tid,) for tid in remaining[:params["limit"]]]
+            return
+        table = {
+            PURGE_THREAD_SQL["checkpoints"]: "checkpoints",
+            PURGE_THREAD_SQL["writes"]: "writes",
+            PURGE_THREAD_SQL["blobs"]: "blobs",
+            DELETE_CHAT_METADATA_SQL: "metadata",
+            DELETE_TOOL_RESULTS_SQL: "tool_results",
+        }[sql]
+        deleted = [tid for tid in params["thread_ids"] if tid in self.thread_ids]
+        if table == "checkpoints":
+            self.thread_ids = [tid for tid in self.thread_ids if tid not in deleted]
+        count = len(deleted) * self.rows_per_thread[table]
+        self._rows = [(count, count * 100)]
+
+    async def fetchall(self):
+        return self._rows
+
+    async def fetchone(self):
+        return self._rows[0]
+
+
+class TestSelectionQuery:
+    """Test translation of filters into the selection query."""
+
+    def test_all_criteria_combined(self):
+        """Test that every criterion becomes a condition with escaped LIKE patterns."""
+        sql, params = build_selection_query(ThreadDeletionFilter(
+            prefix="chat_",
+            exclude_prefixes=["chat_keep"],
+            older_than_days=2,
+            task_statuses=["done", "failed"],
+        ))
+
+        assert "c.thread_id LIKE %(prefix_pattern)s" in sql
+        assert "NOT LIKE %(exclude_0)s" in sql
+        assert "HAVING max((c.checkpoint->>'ts')::timestamptz)" in sql
+        assert params["prefix_pattern"] == r"chat\_%"
+        assert params["exclude_0"] == r"chat\_keep%"
+        assert params["older_than_seconds"] == 2 * 86400
+        assert params["task_statuses"] == ["DONE", "FAILED"]
+
+    def test_all_threads_adds_no_condition(self):
+        """Test that selecting every thread filters on neither age nor prefix."""
+        sql, params = build_selection_query(ThreadDeletionFilter(all_threads=True, exclude_prefixes=["chat_keep"]))
+
+        assert "HAVING" not in sql
+        assert "older_than_seconds" not in params
+        assert "c.thread_id > %(after)s AND c.thread_id NOT LIKE %(exclude_0)s GROUP BY" in sql
+
+    def test_unknown_task_status_rejected(self):
+        """Test that an invalid status fails before any query runs."""
+        with pytest.raises(ValueError):
+            build_selection_query(ThreadDeletionFilter(task_statuses=["archived"]))
+
+
+class TestBulkDelete:
+    """Test batched deletion and progress reporting."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_in_batches_with_progress(self):
+        """Test that threads are purged batch by batch with running totals."""
+        pool = ScriptedPool([f"chat-{i}" for i in range(5)])
+        reported = []
+
+        progress = await bulk_delete_threads(
+            pool,
+            ThreadDeletionFilter(prefix="chat-"),
+            batch_size=2,
+            on_progress=lambda p: reported.append(p.threads_deleted),
+        )
+
+        assert reported == [2, 4, 5]
+        assert progress.batches == 3
+        assert progress.threads_deleted == 5
+        assert progress.checkpoints_deleted == 15
+        assert progress.writes_deleted == 10
+        assert progress.blobs_deleted == 20
+        assert progress.metadata_deleted == 5
+        assert progress.tool_results_deleted == 10
+        assert pool.thread_ids == []
+
+    @pytest.mark.asyncio
+    async def test_dry_run_only_counts(self):
+        """Test that a dry run selects threads without issuing deletes."""
+        pool = ScriptedPool(["chat-1", "chat-2", "chat-3"])
+
+        progress = await bulk_delete_threads(pool, ThreadDeletionFilter(prefix="chat-"), batch_size=2, dry_run=True)
+
+        assert progress.threads_matched == 3
+        assert progress.threads_deleted == 0
+        assert all(sql.startswith("SELECT c.thread_id") for sql, _ in pool.calls)
+
+    @pytest.mark.asyncio
+    async def test_explicit_ids_also_clear_metadata_only_threads(self):
+        """Test that named threads without checkpoints still lose their metadata."""
+        pool = ScriptedPool(["chat-1"])
+
+        await bulk_delete_threads(pool, ThreadDeletionFilter(thread_ids=["chat-1", "chat-no-checkpoints"]))
+
+        metadata_deletes = [params for sql, params in pool.calls if sql == DELETE_CHAT_METADATA_SQL]
+        assert metadata_deletes[-1] == {"thread_ids": ["chat-1", "chat-no-checkpoints"]}
+        tool_result_deletes = [params for sql, params in pool.calls if sql == DELETE_TOOL_RESULTS_SQL]
+        assert tool_result_deletes[-1] == {"thread_ids": ["chat-1", "chat-no-checkpoints"]}
+
+    @pytest.mark.asyncio
+    async def test_empty_filter_rejected(self):
+        """Test that deleting without any criterion is refused."""
+        with pytest.raises(ValueError):
+            await bulk_delete_threads(ScriptedPool([]), ThreadDeletionFilter())
+
+    @pytest.mark.asyncio
+    async def test_exclusion_only_filter_rejected(self):
+        """Test that exclude_prefixes alone does not select every other thread."""
+        thread_filter = ThreadDeletionFilter(exclude_prefixes=["chat_keep"])
+        pool = ScriptedPool(["chat-1", "chat-2"])
+
+        assert thread_filter.is_empty()
+        with pytest.raises(ValueError):
+            await bulk_delete_threads(pool, thread_filter)
+        assert pool.calls == []
+
+    @pytest.mark.asyncio
+    async def test_all_threads_with_exclusions_deletes_the_rest(self):
+        """Test that an explicit all_threads selection honours exclude_prefixes."""
+        pool = ScriptedPool(["chat-1", "chat_keep-1", "core_agent_task_1"])
+        thread_filter = ThreadDeletionFilter(all_threads=True, exclude_prefixes=["chat_keep"])
+
+        assert not thread_filter.is_empty()
+        await bulk_delete_threads(pool, thread_filter)
+
+        selection = next(params for sql, params in pool.calls if sql.startswith("SELECT c.thread_id"))
+        assert selection["exclude_0"] == r"chat\_keep%"
@@ -227,6 +227,36 @@ class TestGetApprovedToolCalls:
         assert result == set()
 
 
+class TestBulkAccess:
+    """Test set-based metadata retrieval for many threads."""
+
+    @pytest.mark.asyncio
+    async def test_get_metadata_bulk_uses_one_query(self, service):
+        """Test that metadata for several threads is fetched in a single query."""
+        rows = [_make_metadata("thread-1", title="One"), _make_metadata("thread-2")]
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = rows
+
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = mock_result
+
+        with patch("backend.services.chat_metadata_service.db_manager") as mock_db:
+            mock_db.get_session.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_db.get_session.return_value.__aexit__ = AsyncMock(return_value=False)
+            result = await service.get_metadata_bulk(["thread-1", "thread-2", "thread-3", "thread-1"])
+
+        assert result == {"thread-1": rows[0], "thread-2": rows[1]}
+        mock_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_metadata_bulk_empty_input_skips_query(self, service):
+        """Test that no query is issued for an empty thread list."""
+        with patch("backend.services.chat_metadata_service.db_manager") as mock_db:
+            assert await service.get_metadata_bulk([]) == {}
+
+        mock_db.get_session.assert_not_called()
+
+
 class TestSingletonInstance:
     """Test module-level singleton."""
 
@@ -8,7 +8,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
-from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, ToolMessage
 
 from backend.services.chat_service import ChatService, chat_service
 from backend.models.chat import ChatMessage, ChatRequest
@@ -801,6 +801,222 @@ class TestStreamChatApprovalPersistence:
         )
 
 
+class TestPrepareTurn:
+    """Test the pre-stream setup pipeline."""
+
+    def _checkpointer(self, messages=None, pending_writes=None, exists=True):
+        checkpointer = AsyncMock()
+        snapshot = None
+        if exists:
+            snapshot = MagicMock()
+            snapshot.checkpoint = {"channel_values": {"messages": messages or []}}
+            snapshot.pending_writes = pending_writes or []
+        checkpointer.aget_tuple = AsyncMock(return_value=snapshot)
+        return checkpointer
+
+    def _request(self):
+        return ChatRequest(
+            messages=[ChatMessage(role="user", content="Hi")], thread_id="setup-thread"
+        )
+
+    @pytest.mark.asyncio
+    async def test_first_turn_overlaps_memory_with_agent_acquisition(self, service):
+        import asyncio
+        import time
+
+        agent = AsyncMock()
+        memory_messages = [AIMessage(content="memory"), ToolMessage(content="facts", tool_call_id="memory_search_auto")]
+
+        async def slow_agent():
+            await asyncio.sleep(0.2)
+            return agent
+
+        async def slow_memory(_query):
+            await asyncio.sleep(0.2)
+            return memory_messages
+
+        checkpointer = self._checkpointer(exists=False)
+        with patch.object(service, "inject_memory_context", side_effect=slow_memory):
+            start = time.perf_counter()
+            setup = await service.prepare_turn(self._request(), checkpointer, slow_agent())
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.35
+        assert setup.chat_agent is agent
+        assert setup.is_first_turn is True
+        assert setup.memory_tool_messages == memory_messages
+        assert set(setup.timings_ms) >= {"load_snapshot", "agent_acquire", "memory_context"}
+        checkpointer.aget_tuple.assert_awaited_once()
+        agent.aget_state.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_slow_memory_is_dropped_after_budget(self, service):
+        import asyncio
+
+        async def hung_memory(_query):
+            await asyncio.sleep(10)
+
+        with patch.object(service, "inject_memory_context", side_effect=hung_memory), \
+             patch("config.settings.CHAT_MEMORY_CONTEXT_BUDGET_SECONDS", 0.05):
+            setup = await service.prepare_turn(self._request(), self._checkpointer(exists=False), AsyncMock())
+
+        assert setup.memory_tool_messages == []
+        assert setup.timings_ms["memory_timed_out"] is True
+
+    @pytest.mark.asyncio
+    async def test_failed_agent_acquisition_cancels_memory_search(self, service):
+        import asyncio
+
+        memory_started = asyncio.Event()
+        memory_cancelled = asyncio.Event()
+
+        async def hung_memory(_query):
+            memory_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                memory_cancelled.set()
+                raise
+
+        async def failing_agent():
+            await memory_started.wait()
+            raise RuntimeError("pool exhausted")
+
+        with patch.object(service, "inject_memory_context", side_effect=hung_memory):
+            with pytest.raises(RuntimeError, match="pool exhausted"):
+                await service.prepare_turn(self._request(), self._checkpointer(exists=False), failing_agent())
+            await asyncio.sleep(0)
+
+        assert memory_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_continuing_turn_without_pending_writes_skips_state_and_memory(self, service):
+        agent = AsyncMock()
+        checkpointer = self._checkpointer(messages=[HumanMessage(content="earlier")])
+
+        with patch.object(service, "inject_memory_context", new_callable=AsyncMock) as mock_memory:
+            setup = await service.prepare_turn(self._request(), checkpointer, agent)
+
+        assert setup.is_first_turn is False
+        assert setup.resume_from_interrupt is False
+        agent.aget_state.assert_not_called()
+        mock_memory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_pending_writes_load_interrupt_state_once(self, service):
+        interrupt = MagicMock()
+        interrupt.value = {"type": "tool_approval_request", "tool_call_id": "call_9"}
+        state = MagicMock()
+        state.interrupts = [interrupt]
+        agent = AsyncMock()
+        agent.aget_state = AsyncMock(return_value=state)
+        checkpointer = self._checkpointer(
+            messages=[HumanMessage(content="earlier")], pending_writes=[("task", "__interrupt__", None)]
+        )
+
+        setup = await service.prepare_turn(self._request(), checkpointer, agent)
+
+        agent.aget_state.assert_awaited_once()
+        assert setup.resume_from_interrupt is True
+        assert setup.user_response == "Hi"
+        assert setup.pending_approval_tool_call_id == "call_9"
+
+
+class TestTokenStreaming:
+    """Test the opt-in token-level streaming mode of stream_chat."""
+
+    def _make_agent(self, stream_items):
+        state = MagicMock()
+        state.interrupts = []
+        agent = AsyncMock()
+        agent.aget_state = AsyncMock(return_value=state)
+        agent.stream_modes = []
+
+        async def mock_astream(stream_input, config=None, stream_mode=None):
+            agent.stream_modes.append(stream_mode)
+            for item in stream_items:
+                yield item
+
+        agent.astream = mock_astream
+        return agent
+
+    def _make_checkpointer(self):
+        checkpointer = AsyncMock()
+        checkpointer.aget.return_value = {
+            "channel_values": {"messages": [HumanMessage(content="earlier")]}
+        }
+        return checkpointer
+
+    async def _collect(self, service, agent, stream_tokens):
+        chat_request = ChatRequest(
+            messages=[ChatMessage(role="user", content="What is on my calendar?")],
+            thread_id="token-thread",
+            stream_tokens=stream_tokens,
+        )
+        return [e async for e in service.stream_chat(chat_request, self._make_checkpointer(), agent)]
+
+    @pytest.mark.asyncio
+    async def test_forwards_tokens_tool_deltas_and_tool_lifecycle(self, service):
+        agent_meta = {"langgraph_node": "agent"}
+        final = AIMessage(
+            content="Checking now",
+            tool_calls=[{"name": "list_events", "args": {"day": "today"}, "id": "call_1"}],
+        )
+        tool_result = ToolMessage(content="2 events", tool_call_id="call_1", name="list_events")
+        agent = self._make_agent([
+            ("messages", (AIMessageChunk(content="Checking", id="m1"), agent_meta)),
+            ("messages", (AIMessageChunk(content=" now", id="m1"), agent_meta)),
+            ("messages", (AIMessageChunk(
+                content="", id="m1",
+                tool_call_chunks=[{"name": "list_events", "args": '{"day": ', "id": "call_1", "index": 0}],
+            ), agent_meta)),
+            ("messages", (AIMessageChunk(
+                content="", id="m1",
+                tool_call_chunks=[{"name": None, "args": '"today"}', "id": None, "index": 0}],
+            ), agent_meta)),
+            ("messages", (AIMessageChunk(content="ignored", id="x"), {"langgraph_node": "tools"})),
+            ("updates", {"agent": {"messages": [final]}}),
+            ("updates", {"tools": {"messages": [tool_result]}}),
+        ])
+
+        events = await self._collect(service, agent, stream_tokens=True)
+        types = [e["type"] for e in events]
+
+        assert agent.stream_modes == [["updates", "messages"]]
+        tokens = "".join(e["data"]["content"] for e in events if e["type"] == "token")
+        assert tokens == "Checking now"
+        deltas = [e["data"] for e in events if e["type"] == "tool_call_delta"]
+        assert "".join(d["args_delta"] for d in deltas) == '{"day": "today"}'
+        assert deltas[0]["tool"] == "list_events"
+
+        # Complete message and tool events are the same as in updates mode
+        message_events = [e for e in events if e["type"] == "message"]
+        assert [e["data"]["content"] for e in message_events] == ["Checking now"]
+        assert types.index("tool_call") < types.index("tool_start") < types.index("tool_result") < types.index("tool_end")
+        tool_end = next(e for e in events if e["type"] == "tool_end")
+        assert tool_end["data"]["tool_call_id"] == "call_1"
+        assert tool_end["data"]["duration_ms"] is not None
+
+        metrics = events[-1]["data"]["metrics"]
+        assert events[-1]["type"] == "complete"
+        assert metrics["mode"] == "tokens"
+        assert metrics["token_events"] == 4
+        assert metrics["time_to_first_token_ms"] is not None
+
+    @pytest.mark.asyncio
+    async def test_default_mode_streams_node_updates_only(self, service):
+        agent = self._make_agent([
+            {"agent": {"messages": [AIMessage(content="Hello there")]}},
+        ])
+
+        events = await self._collect(service, agent, stream_tokens=False)
+        types = [e["type"] for e in events]
+
+        assert agent.stream_modes == ["updates"]
+        assert types == ["start", "message", "complete"]
+        assert events[-1]["data"]["metrics"]["mode"] == "updates"
+
+
 class TestGlobalInstance:
     """Test the global chat_service instance."""
 
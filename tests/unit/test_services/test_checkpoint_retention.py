@@ -0,0 +1,163 @@
+"""
+Checkpoint Retention Service Unit Tests
+
+Tests batching, pinning and space reporting of the LangGraph checkpoint
+retention engine against a scripted psycopg pool.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+
+from backend.services import checkpoint_retention as retention_module
+from backend.services.checkpoint_retention import (
+    DELETE_CHAT_METADATA_SQL,
+    DELETE_OLD_CHECKPOINTS_SQL,
+    DELETE_ORPHAN_BLOBS_SQL,
+    DELETE_ORPHAN_WRITES_SQL,
+    DELETE_TOOL_RESULTS_SQL,
+    PURGE_THREAD_SQL,
+    SELECT_COMPACTION_CANDIDATES_SQL,
+    SELECT_DELETED_TASK_THREADS_SQL,
+    CheckpointRetentionService,
+)
+
+
+class FakePool:
+    """psycopg-style pool whose cursors answer from a per-statement script."""
+
+    def __init__(self, responses):
+        self.responses = {sql: list(rows) for sql, rows in responses.items()}
+        self.calls = []
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield self
+
+    async def execute(self, sql, params):
+        self.calls.append((sql, params))
+        queue = self.responses.get(sql, [])
+        self._result = queue.pop(0) if queue else []
+
+    async def fetchall(self):
+        return self._result
+
+    async def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def statements(self, sql):
+        return [params for called_sql, params in self.calls if called_sql == sql]
+
+
+@pytest.fixture(autouse=True)
+def retention_settings():
+    with patch.object(retention_module.settings, "CHECKPOINT_RETENTION_KEEP_LATEST", 5), \
+         patch.object(retention_module.settings, "CHECKPOINT_RETENTION_BATCH_SIZE", 2), \
+         patch.object(retention_module.settings, "CHECKPOINT_RETENTION_BATCH_PAUSE_SECONDS", 0), \
+         patch.object(retention_module.settings, "CHECKPOINT_RETENTION_PINNED_THREADS", "chat-pinned"):
+        yield
+
+
+class TestCompaction:
+    """Test trimming of old checkpoints per thread."""
+
+    @pytest.mark.asyncio
+    async def test_compacts_candidates_in_keyset_batches(self):
+        """Test that candidates are paged by thread id and pinned threads are skipped."""
+        pool = FakePool({
+            SELECT_COMPACTION_CANDIDATES_SQL: [[("chat-a",), ("chat-pinned",)], [("chat-z",)], []],
+            DELETE_OLD_CHECKPOINTS_SQL: [[(10, 1000)], [(3, 300)]],
+            DELETE_ORPHAN_WRITES_SQL: [[(4, 40)], [(0, 0)]],
+            DELETE_ORPHAN_BLOBS_SQL: [[(6, 600)], [(1, 10)]],
+        })
+
+        report = await CheckpointRetentionService().run_once(pool)
+
+        candidates = pool.statements(SELECT_COMPACTION_CANDIDATES_SQL)
+        assert [params["after"] for params in candidates] == ["", "chat-pinned", "chat-z"]
+        deletes = pool.statements(DELETE_OLD_CHECKPOINTS_SQL)
+        assert [params["thread_ids"] for params in deletes] == [["chat-a"], ["chat-z"]]
+        assert all(params["keep"] == 5 for params in deletes)
+
+        assert report.threads_compacted == 2
+        assert report.checkpoints_deleted == 13
+        assert report.writes_deleted == 4
+        assert report.blobs_deleted == 7
+        assert report.bytes_reclaimed == 1950
+        assert report.errors == []
+
+    @pytest.mark.asyncio
+    async def test_keep_latest_never_below_one(self):
+        """Test that a zero retention setting still keeps the latest checkpoint."""
+        pool = FakePool({SELECT_COMPACTION_CANDIDATES_SQL: [[("chat-a",)], []]})
+
+        with patch.object(retention_module.settings, "CHECKPOINT_RETENTION_KEEP_LATEST", 0):
+            await CheckpointRetentionService().run_once(pool)
+
+        assert pool.statements(SELECT_COMPACTION_CANDIDATES_SQL)[0]["keep"] == 1
+        assert pool.statements(DELETE_OLD_CHECKPOINTS_SQL)[0]["keep"] == 1
+
+
+class TestDeletedTaskPurge:
+    """Test purging of threads whose task no longer exists."""
+
+    @pytest.mark.asyncio
+    async def test_purges_all_rows_and_metadata(self):
+        """Test that orphaned task threads lose checkpoints, writes, blobs, metadata and tool results."""
+        thread_id = "core_agent_task_0b6f0c1e-0000-0000-0000-000000000000"
+        pool = FakePool({
+            SELECT_DELETED_TASK_THREADS_SQL: [[(thread_id,)], []],
+            PURGE_THREAD_SQL["checkpoints"]: [[(8, 800)]],
+            PURGE_THREAD_SQL["writes"]: [[(2, 20)]],
+            PURGE_THREAD_SQL["blobs"]: [[(5, 500)]],
+            DELETE_TOOL_RESULTS_SQL: [[(1, 4000)]],
+        })
+
+        report = await CheckpointRetentionService().run_once(pool)
+
+        purge_params = pool.statements(SELECT_DELETED_TASK_THREADS_SQL)[0]
+        assert purge_params["prefix_pattern"] == r"core\_agent\_task\_%"
+        assert thread_id[purge_params["id_offset"] - 1:] == "0b6f0c1e-0000-0000-0000-000000000000"
+        assert pool.statements(DELETE_CHAT_METADATA_SQL) == [{"thread_ids": [thread_id]}]
+        assert pool.statements(DELETE_TOOL_RESULTS_SQL) == [{"thread_ids": [thread_id]}]
+        assert report.task_threads_purged == 1
+        assert report.checkpoints_deleted == 8
+        assert report.bytes_reclaimed == 5320
+
+
+class TestReporting:
+    """Test report bookkeeping across passes."""
+
+    @pytest.mark.asyncio
+    async def test_errors_recorded_and_totals_accumulate(self):
+        """Test that a failing phase is reported without aborting the pass."""
+        service = CheckpointRetentionService()
+
+        class BrokenPool(FakePool):
+            async def execute(self, sql, params):
+                if sql == SELECT_COMPACTION_CANDIDATES_SQL:
+                    raise RuntimeError("connection lost")
+                await super().execute(sql, params)
+
+        first = await service.run_once(BrokenPool({}))
+        await service.run_once(FakePool({
+            SELECT_DELETED_TASK_THREADS_SQL: [[("core_agent_task_x",)], []],
+            PURGE_THREAD_SQL["checkpoints"]: [[(2, 200)]],
+        }))
+
+        assert first.errors == ["compaction: connection lost"]
+        status = service.get_status()
+        assert status["last_run"]["task_threads_purged"] == 1
+        assert status["totals"]["checkpoints_deleted"] == 2
+        assert status["pinned_threads"] == ["chat-pinned"]
+
+    @pytest.mark.asyncio
+    async def test_run_without_pool_raises(self):
+        """Test that a pass cannot run before a pool is configured."""
+        with pytest.raises(RuntimeError):
+            await CheckpointRetentionService().run_once()
@@ -277,6 +277,104 @@ class TestGetHistoryApprovedToolCalls:
         assert "approved" not in assistant_msgs[0].tool_calls[0]
 
 
+class TestHistoryCache:
+    """Test checkpoint-keyed history caching and incremental rebuilds."""
+
+    @staticmethod
+    def make_checkpointer(messages, checkpoint_id):
+        checkpointer = AsyncMock()
+        checkpointer.aget.return_value = {
+            "id": checkpoint_id,
+            "channel_values": {"messages": list(messages)},
+            "ts": f"ts-{checkpoint_id}",
+        }
+        return checkpointer
+
+    @staticmethod
+    def conversation(turns):
+        messages = []
+        for i in range(turns):
+            messages.append(HumanMessage(content=f"question {i}", id=f"h{i}"))
+            messages.append(AIMessage(content=f"answer {i}", id=f"a{i}"))
+        return messages
+
+    @pytest.mark.asyncio
+    async def test_same_checkpoint_served_from_cache(self, service):
+        checkpointer = self.make_checkpointer(self.conversation(3), "cp-1")
+
+        with patch("services.chat_metadata_service.chat_metadata_service.get_approved_tool_calls", new_callable=AsyncMock, return_value=set()) as approved:
+            first = await service.get_history("test-thread", checkpointer)
+            second = await service.get_history("test-thread", checkpointer)
+
+        assert [m.content for m in first] == [m.content for m in second]
+        assert approved.await_count == 1
+        assert service.get_history_cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_new_checkpoint_rebuilds_only_appended_turns(self, service):
+        messages = self.conversation(3)
+        ai_msg = AIMessage(
+            content="Looking it up",
+            id="a-tool",
+            tool_calls=[{"name": "search", "args": {}, "id": "call_1", "type": "tool_call"}],
+        )
+
+        with patch("services.chat_metadata_service.chat_metadata_service.get_approved_tool_calls", new_callable=AsyncMock, return_value={"call_1"}):
+            first = await service.get_history("test-thread", self.make_checkpointer(messages + [ai_msg], "cp-1"))
+            grown = messages + [
+                ai_msg,
+                ToolMessage(content="found it", tool_call_id="call_1", name="search", id="t1"),
+                HumanMessage(content="thanks", id="h-last"),
+            ]
+            with patch.object(service, "_build_turns", wraps=service._build_turns) as build:
+                second = await service.get_history("test-thread", self.make_checkpointer(grown, "cp-2"))
+
+        # Only the last cached turn (still awaiting its tool result) is reprocessed
+        assert build.call_args.args[2] == len(messages) - 1
+        assert second[:5] == first[:5]
+        assert second[-2].tool_calls[0]["result"] == "found it"
+        assert second[-2].tool_calls[0]["approved"] is True
+        assert [m.id for m in second] == [f"test-thread-msg-{i}" for i in range(7)]
+        assert service.get_history_cache_stats()["incremental_builds"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rewritten_history_triggers_full_rebuild(self, service):
+        with patch("services.chat_metadata_service.chat_metadata_service.get_approved_tool_calls", new_callable=AsyncMock, return_value=set()):
+            await service.get_history("test-thread", self.make_checkpointer(self.conversation(3), "cp-1"))
+            rewritten = [HumanMessage(content="summary", id="s0")] + self.conversation(3)[4:]
+            result = await service.get_history("test-thread", self.make_checkpointer(rewritten, "cp-2"))
+
+        assert result[0].content == "summary"
+        assert service.get_history_cache_stats()["full_builds"] == 2
+
+    @pytest.mark.asyncio
+    async def test_replaced_middle_message_triggers_full_rebuild(self, service):
+        with patch("services.chat_metadata_service.chat_metadata_service.get_approved_tool_calls", new_callable=AsyncMock, return_value=set()):
+            await service.get_history("test-thread", self.make_checkpointer(self.conversation(3), "cp-1"))
+            # First message and last-turn boundary unchanged, answer 0 replaced
+            rewritten = self.conversation(3)
+            rewritten[1] = AIMessage(content="edited answer", id="a0-edited")
+            result = await service.get_history("test-thread", self.make_checkpointer(rewritten, "cp-2"))
+
+        assert result[1].content == "edited answer"
+        assert service.get_history_cache_stats()["full_builds"] == 2
+
+    @pytest.mark.asyncio
+    async def test_history_pages_walk_backwards(self, service):
+        checkpointer = self.make_checkpointer(self.conversation(5), "cp-1")
+
+        with patch("services.chat_metadata_service.chat_metadata_service.get_approved_tool_calls", new_callable=AsyncMock, return_value=set()):
+            newest = await service.get_history_page("test-thread", checkpointer, limit=4)
+            older = await service.get_history_page("test-thread", checkpointer, limit=4, before=newest.next_before)
+            oldest = await service.get_history_page("test-thread", checkpointer, limit=4, before=older.next_before)
+
+        assert [m.content for m in newest.messages] == ["question 3", "answer 3", "question 4", "answer 4"]
+        assert newest.total == 10 and newest.has_more and newest.next_before == 6
+        assert older.messages[0].content == "question 1"
+        assert [m.content for m in oldest.messages] == ["question 0", "answer 0"]
+        assert oldest.has_more is False and oldest.next_before is None
+
+
 class TestGetTitle:
     """Test title generation for conversations."""
 
@@ -585,6 +683,66 @@ class TestGetSummary:
         assert result is None
 
 
+class TestGetSummaries:
+    """Test summary building for many threads with batched lookups."""
+
+    @pytest.mark.asyncio
+    async def test_metadata_fetched_once_for_all_threads(self, service):
+        """Test that titles and approvals come from a single bulk lookup."""
+        threads = {
+            "chat-1": [HumanMessage(content="First chat", id="h1"), AIMessage(content="Hi", id="a1")],
+            "chat-2": [HumanMessage(content="Second chat", id="h2")],
+            "chat-empty": [],
+        }
+
+        async def mock_aget(config):
+            thread_id = config["configurable"]["thread_id"]
+            return {"id": f"cp-{thread_id}", "channel_values": {"messages": threads[thread_id]}, "ts": "2025-01-08T10:00:00Z"}
+
+        checkpointer = MagicMock()
+        checkpointer.aget = mock_aget
+        metadata = MagicMock(custom_title="Renamed", approved_tool_calls=[])
+
+        mock_metadata_service = MagicMock()
+        mock_metadata_service.get_metadata_bulk = AsyncMock(return_value={"chat-2": metadata})
+        mock_metadata_service.get_title = AsyncMock(side_effect=AssertionError("per-thread title lookup"))
+        mock_metadata_service.get_approved_tool_calls = AsyncMock(side_effect=AssertionError("per-thread approval lookup"))
+
+        with patch("services.chat_metadata_service.chat_metadata_service", mock_metadata_service):
+            summaries = await service.get_summaries(list(threads), checkpointer)
+
+        mock_metadata_service.get_metadata_bulk.assert_awaited_once()
+        assert [(s.id, s.title) for s in summaries] == [("chat-1", "First chat"), ("chat-2", "Renamed")]
+
+    @pytest.mark.asyncio
+    async def test_task_threads_use_bulk_task_lookup(self, service):
+        """Test that task titles and NEEDS_REVIEW filtering use one task query."""
+        from backend.models.models import TaskStatus
+
+        review_id = "11111111-1111-1111-1111-111111111111"
+        active_id = "22222222-2222-2222-2222-222222222222"
+        thread_ids = [create_task_thread_id(review_id), create_task_thread_id(active_id)]
+
+        async def mock_aget(config):
+            return {"id": "cp", "channel_values": {"messages": [AIMessage(content="Working", id="a")]}, "ts": "ts"}
+
+        checkpointer = MagicMock()
+        checkpointer.aget = mock_aget
+
+        mock_metadata_service = MagicMock()
+        mock_metadata_service.get_metadata_bulk = AsyncMock(return_value={})
+
+        with patch("services.chat_metadata_service.chat_metadata_service", mock_metadata_service), \
+             patch.object(service, "_get_task_info_bulk", new_callable=AsyncMock, return_value={
+                 review_id: ("Review me", TaskStatus.NEEDS_REVIEW),
+                 active_id: ("Ship it", TaskStatus.IN_PROGRESS),
+             }) as task_lookup:
+            summaries = await service.get_summaries(thread_ids, checkpointer)
+
+        task_lookup.assert_awaited_once_with(thread_ids)
+        assert [s.title for s in summaries] == ["Task: Ship it"]
+
+
 class TestDelete:
     """Test conversation deletion."""
 
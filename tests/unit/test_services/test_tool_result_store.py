@@ -0,0 +1,161 @@
+"""
+Tool Result Store Unit Tests
+
+Tests offloading of oversized tool results to the content-addressed
+tool_results table and reading them back by reference.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+
+from sqlalchemy.dialects import postgresql
+
+from backend.services import tool_result_store as store_module
+from backend.services.tool_result_store import (
+    OFFLOADED_METADATA_KEY,
+    ToolResultStore,
+    content_digest,
+    normalize_reference,
+)
+
+
+@pytest.fixture(autouse=True)
+def offload_settings():
+    with patch.object(store_module.settings, "TOOL_RESULT_OFFLOAD_ENABLED", True), \
+         patch.object(store_module.settings, "TOOL_RESULT_OFFLOAD_THRESHOLD_CHARS", 100), \
+         patch.object(store_module.settings, "TOOL_RESULT_PREVIEW_CHARS", 10), \
+         patch.object(store_module.settings, "TOOL_RESULT_READ_PAGE_CHARS", 50):
+        yield
+
+
+@pytest.fixture
+def mock_session():
+    session = AsyncMock()
+    session.add = MagicMock()
+    with patch("backend.services.tool_result_store.db_manager") as mock_db:
+        mock_db.get_session.return_value.__aenter__ = AsyncMock(return_value=session)
+        mock_db.get_session.return_value.__aexit__ = AsyncMock(return_value=False)
+        yield session
+
+
+def _existing(row):
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = row
+    return result
+
+
+def _inserts(session):
+    """(table, compiled SQL, params) of every statement the session executed."""
+    statements = []
+    for call in session.execute.await_args_list:
+        statement = call.args[0]
+        compiled = statement.compile(dialect=postgresql.dialect())
+        statements.append((statement.table.name, str(compiled), compiled.params))
+    return statements
+
+
+class TestOffload:
+    """Test replacement of large tool results by references."""
+
+    @pytest.mark.asyncio
+    async def test_large_result_replaced_by_reference(self, mock_session):
+        """Test that an oversized result is stored once and referenced with a preview."""
+        mock_session.execute.return_value = _existing(None)
+        content = "0123456789" * 30
+        messages = [
+            AIMessage(content="calling"),
+            ToolMessage(content="small", tool_call_id="call-1", name="list_events"),
+            ToolMessage(content=content, tool_call_id="call-2", name="read_email", id="t2"),
+        ]
+
+        result = await ToolResultStore().offload_messages(messages, thread_id="chat-1")
+
+        assert result[:2] == messages[:2]
+        offloaded = result[2]
+        digest = content_digest(content)
+        assert offloaded.tool_call_id == "call-2"
+        assert offloaded.id == "t2"
+        assert digest in offloaded.content
+        assert offloaded.content.endswith("\n0123456789")
+        assert offloaded.response_metadata[OFFLOADED_METADATA_KEY] == {"digest": digest, "chars": 300}
+        (results_table, results_sql, stored), (threads_table, threads_sql, ref) = _inserts(mock_session)
+        assert results_table == "tool_results"
+        assert "ON CONFLICT (digest) DO NOTHING" in results_sql
+        assert stored["digest"] == digest
+        assert stored["content"] == content
+        assert threads_table == "tool_result_threads"
+        assert "ON CONFLICT (digest, thread_id) DO NOTHING" in threads_sql
+        assert ref == {"digest": digest, "thread_id": "chat-1"}
+
+    @pytest.mark.asyncio
+    async def test_identical_content_stored_once(self, mock_session):
+        """Test that repeated results in a thread reuse the known digest without new queries."""
+        store = ToolResultStore()
+        message = ToolMessage(content="x" * 200, tool_call_id="call-1", name="search")
+
+        await store.offload_messages([message], thread_id="chat-1")
+        await store.offload_messages([message.model_copy(update={"tool_call_id": "call-2"})], thread_id="chat-1")
+
+        assert mock_session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_same_content_in_another_thread_records_reference(self, mock_session):
+        """Test that a second thread is recorded so purging the first keeps the result."""
+        store = ToolResultStore()
+        message = ToolMessage(content="x" * 200, tool_call_id="call-1", name="search")
+
+        await store.offload_messages([message], thread_id="chat-1")
+        await store.offload_messages([message], thread_id="chat-2")
+
+        refs = [params for table, _, params in _inserts(mock_session) if table == "tool_result_threads"]
+        assert [ref["thread_id"] for ref in refs] == ["chat-1", "chat-2"]
+
+    @pytest.mark.asyncio
+    async def test_read_tool_result_output_not_offloaded_again(self, mock_session):
+        """Test that pages read back from the store stay inline."""
+        message = ToolMessage(content="x" * 200, tool_call_id="call-1", name="read_tool_result")
+
+        assert await ToolResultStore().offload_messages([message]) == [message]
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_store_failure_keeps_result_inline(self, mock_session):
+        """Test that a database error leaves the original message untouched."""
+        mock_session.execute.side_effect = RuntimeError("db down")
+        message = ToolMessage(content="x" * 200, tool_call_id="call-1", name="search")
+
+        result = await ToolResultStore().offload_messages([message])
+
+        assert result == [message]
+
+
+class TestRead:
+    """Test reading stored results by reference."""
+
+    @pytest.mark.asyncio
+    async def test_read_returns_page(self, mock_session):
+        """Test that reads are sliced by offset and default page size."""
+        content = "a" * 120
+        mock_session.execute.return_value = _existing(content)
+        digest = content_digest(content)
+
+        page = await ToolResultStore().read(f"sha256:{digest}", offset=100)
+
+        assert page.digest == digest
+        assert page.content == "a" * 20
+        assert page.total_chars == 120
+        assert page.has_more is False
+
+    @pytest.mark.asyncio
+    async def test_invalid_reference_skips_query(self, mock_session):
+        """Test that malformed references are rejected without touching the database."""
+        assert await ToolResultStore().read("not-a-digest") is None
+        mock_session.execute.assert_not_called()
+
+    def test_normalize_reference_accepts_prefix(self):
+        """Test that prefixed and bare digests normalize to the digest."""
+        digest = content_digest("hello")
+        assert normalize_reference(f"sha256:{digest}") == digest
+        assert normalize_reference(digest.upper()) == digest
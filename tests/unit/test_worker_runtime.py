@@ -0,0 +1,87 @@
+"""
+Worker Runtime Unit Tests
+
+Tests the persistent per-process event loop used by Celery hook tasks:
+loop reuse across runs, restart after fork, cleanup and the fallback to a
+fresh loop per run.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tasks.worker_runtime import WorkerRuntime
+
+
+@pytest.fixture
+def runtime():
+    """WorkerRuntime with warm-up and cleanup replaced (no database or gateway)."""
+    rt = WorkerRuntime()
+    with patch.object(WorkerRuntime, "_warm_up", AsyncMock()) as warm_up, \
+         patch.object(WorkerRuntime, "_shut_down", AsyncMock()) as shut_down:
+        rt.warm_up, rt.shut_down = warm_up, shut_down
+        yield rt
+        rt.stop()
+
+
+async def current_loop():
+    return asyncio.get_running_loop()
+
+
+class TestWorkerRuntime:
+    """Test the lifecycle of the worker event loop."""
+
+    def test_runs_share_one_loop(self, runtime):
+        """Test that consecutive runs execute on the same warm loop."""
+        first = runtime.run(current_loop())
+        second = runtime.run(current_loop())
+
+        assert first is second
+        assert runtime.warm_up.await_count == 1
+        stats = runtime.get_stats()
+        assert stats["runs"] == 2
+        assert stats["running"] is True
+
+    def test_errors_propagate_and_loop_survives(self, runtime):
+        """Test that a failing run raises in the caller without killing the loop."""
+        async def boom():
+            raise ValueError("hook failed")
+
+        with pytest.raises(ValueError, match="hook failed"):
+            runtime.run(boom())
+        assert runtime.run(asyncio.sleep(0, result="ok")) == "ok"
+
+    def test_loop_inherited_across_fork_is_replaced(self, runtime):
+        """Test that a child process starts its own loop instead of reusing the parent's."""
+        parent_loop = runtime.run(current_loop())
+
+        with patch("tasks.worker_runtime.os.getpid", return_value=-1):
+            child_loop = runtime.run(current_loop())
+
+        assert child_loop is not parent_loop
+        assert runtime.warm_up.await_count == 2
+        with patch("tasks.worker_runtime.os.getpid", return_value=-1):
+            runtime.stop()
+        # Clean up the parent's loop thread, which a real fork would not have
+        parent_loop.call_soon_threadsafe(parent_loop.stop)
+
+    def test_stop_releases_resources(self, runtime):
+        """Test that stop cleans up on the loop and stops it."""
+        loop = runtime.run(current_loop())
+
+        runtime.stop()
+
+        runtime.shut_down.assert_awaited_once()
+        assert runtime.running is False
+        assert loop.is_closed()
+
+    def test_disabled_runs_each_call_in_fresh_loop(self, runtime):
+        """Test the fallback to a new event loop per run."""
+        with patch("tasks.worker_runtime.settings.CELERY_PERSISTENT_LOOP_ENABLED", False):
+            first = runtime.run(current_loop())
+            second = runtime.run(current_loop())
+
+        assert first is not second
+        assert runtime.running is False
+        runtime.warm_up.assert_not_awaited()
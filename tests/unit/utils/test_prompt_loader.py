@@ -0,0 +1,131 @@
+"""
+Tests for segmented system prompt assembly.
+
+Verifies that:
+1. The assembled prompt equals plain template processing
+2. The static prefix stays byte-identical across users and clock ticks
+3. The prefix is rebuilt when the prompt file or skills change
+4. The clock is rounded to the configured granularity
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import utils.prompt_loader as prompt_loader
+from models.user_settings import UserSettingsModel
+
+TEMPLATE = """You are Nova.
+{available_skills_section}
+**Tool Usage:** use tools wisely ({{not a field}}).
+
+---
+
+**Your User:**
+You are currently assisting {user_full_name}.
+- Email: {user_email}
+- Timezone: {user_timezone}
+- Current Time: {current_time_user_tz}
+- Notes: {user_notes_section}
+"""
+
+
+@pytest.fixture(autouse=True)
+def reset_prompt_cache(monkeypatch):
+    monkeypatch.setattr(prompt_loader, "_stats", prompt_loader.PromptBuildStats())
+    prompt_loader.clear_prompt_cache()
+    yield
+    prompt_loader.clear_prompt_cache()
+
+
+@pytest.fixture
+def env():
+    """Patch the prompt manager, config version, skills and user settings."""
+    manager = MagicMock()
+    manager.get_config.return_value = TEMPLATE
+    manager.get_processed_config.side_effect = lambda **kw: TEMPLATE.format(**kw)
+    skill_manager = MagicMock()
+    skill_manager.get_skill_summaries.return_value = {"time_tracking": "Track time"}
+    user = UserSettingsModel(full_name="Ada", email="ada@example.com", timezone="UTC", notes="n")
+
+    with patch.object(prompt_loader.config_registry, "get_manager", return_value=manager), \
+         patch("utils.prompt_loader.get_config_version", return_value=1) as version, \
+         patch("utils.prompt_loader.get_skill_manager", return_value=skill_manager), \
+         patch("database.database.UserSettingsService.get_user_settings", new_callable=AsyncMock, return_value=user) as settings:
+        yield MagicMock(manager=manager, version=version, skills=skill_manager, settings=settings)
+
+
+def prefix_of(prompt: str) -> str:
+    return prompt[:prompt.index("You are currently assisting")]
+
+
+class TestSegmentedAssembly:
+
+    @pytest.mark.asyncio
+    async def test_matches_unsegmented_processing(self, env):
+        prompt = await prompt_loader.load_nova_system_prompt()
+
+        expected = TEMPLATE.format(
+            available_skills_section=prompt_loader._build_available_skills_section({"time_tracking": "Track time"}),
+            user_full_name="Ada",
+            user_email="ada@example.com",
+            user_timezone="UTC",
+            current_time_user_tz=prompt_loader._format_current_time("UTC"),
+            user_notes_section="n",
+        )
+        assert prompt == expected
+
+    @pytest.mark.asyncio
+    async def test_prefix_stable_across_users_and_time(self, env):
+        first = await prompt_loader.load_nova_system_prompt()
+        env.settings.return_value = UserSettingsModel(full_name="Grace", timezone="Europe/Berlin")
+        with patch("utils.prompt_loader.time.time", return_value=4_000_000_000):
+            second = await prompt_loader.load_nova_system_prompt()
+
+        assert first != second
+        assert prefix_of(first) == prefix_of(second)
+        stats = prompt_loader.get_prompt_build_stats()
+        assert stats["prefix_builds"] == 1
+        assert stats["prefix_cache_hits"] == 1
+        assert stats["prefix_chars"] == len(prefix_of(first))
+
+    @pytest.mark.asyncio
+    async def test_prefix_rebuilt_on_prompt_version_change(self, env):
+        await prompt_loader.load_nova_system_prompt()
+        env.manager.get_config.return_value = TEMPLATE.replace("You are Nova.", "You are Nova 2.")
+        env.version.return_value = 2
+
+        prompt = await prompt_loader.load_nova_system_prompt()
+
+        assert prompt.startswith("You are Nova 2.")
+        stats = prompt_loader.get_prompt_build_stats()
+        assert stats["prefix_builds"] == 2
+        assert stats["prefix_changes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prefix_rebuilt_on_skill_change(self, env):
+        await prompt_loader.load_nova_system_prompt()
+        env.skills.get_skill_summaries.return_value = {"new_skill": "Does things"}
+
+        prompt = await prompt_loader.load_nova_system_prompt()
+
+        assert "new_skill" in prefix_of(prompt)
+        assert "time_tracking" not in prompt
+
+
+class TestClockGranularity:
+
+    def test_time_rounded_down_to_granularity(self):
+        with patch.object(prompt_loader.settings, "SYSTEM_PROMPT_CLOCK_GRANULARITY_SECONDS", 900), \
+             patch("utils.prompt_loader.time.time", return_value=1_700_000_999):
+            formatted = prompt_loader._format_current_time("UTC")
+
+        # 1_700_000_999 floored to 15 minutes is 2023-11-14 22:15:00 UTC
+        assert formatted == "2023-11-14 22:15 UTC"
+
+    def test_seconds_kept_below_one_minute(self):
+        with patch.object(prompt_loader.settings, "SYSTEM_PROMPT_CLOCK_GRANULARITY_SECONDS", 1), \
+             patch("utils.prompt_loader.time.time", return_value=1_700_000_999):
+            formatted = prompt_loader._format_current_time("Not/AZone")
+
+        assert formatted == "2023-11-14 22:29:59 UTC"
@@ -0,0 +1,160 @@
+"""
+Tests for SSE encoding and coalescing.
+
+Verifies that:
+1. Frames are valid SSE and decode to the original events
+2. Bursts of events share one write; slow events are written separately
+3. Heartbeats are emitted while the source is idle, without cancelling it
+4. A chat-shaped response needs far fewer writes than events
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from utils.sse import HEARTBEAT_FRAME, SSEStreamStats, encode_event, sse_stream
+
+
+def parse_frames(chunks):
+    """Decode written chunks back into events, ignoring comment frames."""
+    body = b"".join(chunks).decode()
+    return [json.loads(frame[len("data: "):]) for frame in body.split("\n\n") if frame.startswith("data: ")]
+
+
+async def scripted_events(events, delays=None):
+    for index, event in enumerate(events):
+        if delays:
+            await asyncio.sleep(delays[index])
+        yield event
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def make_stream_events(tokens: int):
+    """A response shaped like a chat stream: start, many token deltas, tool traffic, complete."""
+    events = [{"type": "start", "data": {"thread_id": "chat-1", "timestamp": datetime.now().isoformat()}}]
+    for i in range(tokens):
+        events.append({"type": "message", "data": {"role": "assistant", "content": f"token{i} ", "chunk": True}})
+        if i % 50 == 0:
+            events.append({"type": "tool_call", "data": {"tool": "search", "args": {"q": f"query {i}"}, "tool_call_id": str(uuid4())}})
+    events.append({"type": "complete", "data": {"timestamp": datetime.now().isoformat(), "metrics": {"tokens": tokens}}})
+    return events
+
+
+class TestEncoding:
+    """Frame format compatibility."""
+
+    def test_frame_matches_json_dumps_semantics(self):
+        event = {"type": "message", "data": {"content": "héllo \"quoted\"\nline", "n": 1.5, "ok": True, "none": None}}
+        frame = encode_event(event)
+
+        assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+        assert json.loads(frame[6:]) == json.loads(json.dumps(event))
+
+    def test_non_json_values_are_stringified(self):
+        event_id = uuid4()
+        frame = encode_event({"id": event_id, "at": datetime(2024, 1, 2, 3, 4, 5), 1: {"x"}})
+        decoded = json.loads(frame[6:])
+
+        assert decoded["id"] == str(event_id)
+        assert decoded["at"].startswith("2024-01-02T03:04:05")
+        assert decoded["1"] == str({"x"})
+
+
+class TestCoalescing:
+    """Batching of bursts into writes."""
+
+    @pytest.mark.asyncio
+    async def test_burst_coalesced_into_single_write(self):
+        events = [{"type": "message", "data": {"content": str(i)}} for i in range(20)]
+        stats = SSEStreamStats()
+
+        chunks = await collect(sse_stream(scripted_events(events), coalesce_ms=50, heartbeat_seconds=None, stats=stats))
+
+        assert len(chunks) == 1
+        assert parse_frames(chunks) == events
+        assert stats.events == 20 and stats.writes == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_events_written_separately(self):
+        events = [{"n": 1}, {"n": 2}, {"n": 3}]
+
+        chunks = await collect(sse_stream(
+            scripted_events(events, delays=[0, 0.05, 0.05]), coalesce_ms=5, heartbeat_seconds=None
+        ))
+
+        assert len(chunks) == 3
+        assert parse_frames(chunks) == events
+
+    @pytest.mark.asyncio
+    async def test_batch_flushed_at_size_limit(self):
+        events = [{"content": "x" * 100} for _ in range(10)]
+
+        chunks = await collect(sse_stream(scripted_events(events), coalesce_ms=1000, max_batch_bytes=200, heartbeat_seconds=None))
+
+        assert len(chunks) == 5
+        assert parse_frames(chunks) == events
+
+    @pytest.mark.asyncio
+    async def test_zero_window_writes_every_event(self):
+        events = [{"n": i} for i in range(5)]
+
+        chunks = await collect(sse_stream(scripted_events(events), coalesce_ms=0, heartbeat_seconds=None))
+
+        assert len(chunks) == 5
+
+
+class TestHeartbeat:
+    """Idle connections receive heartbeat comments."""
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_while_source_idle(self):
+        events = [{"n": 1}, {"n": 2}]
+        stats = SSEStreamStats()
+
+        chunks = await collect(sse_stream(
+            scripted_events(events, delays=[0, 0.12]), coalesce_ms=1, heartbeat_seconds=0.05, stats=stats
+        ))
+
+        # The slow event is delivered intact: the heartbeat timeout does not cancel the source
+        assert parse_frames(chunks) == events
+        assert HEARTBEAT_FRAME in chunks
+        assert stats.heartbeats >= 1
+
+    @pytest.mark.asyncio
+    async def test_source_closed_when_consumer_stops(self):
+        closed = asyncio.Event()
+
+        async def endless():
+            try:
+                while True:
+                    yield {"n": 1}
+                    await asyncio.sleep(0.01)
+            finally:
+                closed.set()
+
+        stream = sse_stream(endless(), coalesce_ms=0, heartbeat_seconds=None)
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert closed.is_set()
+
+
+class TestWritesPerResponse:
+    """Writes per response for a chat-shaped stream (timings: scripts/benchmark_sse.py)."""
+
+    @pytest.mark.asyncio
+    async def test_token_burst_coalesced_into_few_writes(self):
+        events = make_stream_events(2000)
+
+        stats = SSEStreamStats()
+        chunks = await collect(sse_stream(scripted_events(events), coalesce_ms=5, heartbeat_seconds=None, stats=stats))
+
+        assert parse_frames(chunks) == events
+        assert stats.events == len(events)
+        assert stats.writes < len(events) / 10
@@ -0,0 +1,203 @@
+"""
+Tests for the compiled tool-permission matcher.
+
+Verifies that:
+1. CompiledToolPermissions gives the same answers as the per-pattern reference
+   matchers (_matches_tool_pattern / _matches_pattern)
+2. Rules are compiled once per config version and swapped on change
+3. Microbenchmark: thousands of rules x thousands of tools
+"""
+
+import random
+import time
+from unittest.mock import patch
+
+import pytest
+
+from models.tool_permissions_config import ToolPermissionsConfig, ToolPermissions, ToolPermissionSettings
+from utils.tool_permissions_manager import (
+    CompiledToolPermissions,
+    ToolApprovalInterceptor,
+    ToolPermissionConfig,
+)
+
+
+def make_rules(count: int, seed: int = 42) -> list[str]:
+    """Generate a realistic mix of exact, wildcard, prefix and argument rules."""
+    rng = random.Random(seed)
+    rules = []
+    for i in range(count):
+        kind = rng.random()
+        if kind < 0.5:
+            rules.append(f"tool_{i}")
+        elif kind < 0.65:
+            rules.append(f"mcp_tool_{i}(*)")
+        elif kind < 0.75:
+            rules.append(f"_skill_{i}__*")
+        else:
+            rules.append(f"tool_{rng.randrange(count)}(status={rng.choice(['done', 'new', 'waiting'])})")
+    return rules
+
+
+def make_calls(count: int, rule_count: int, seed: int = 7) -> list[tuple[str, dict]]:
+    """Generate tool calls that hit and miss the generated rules."""
+    rng = random.Random(seed)
+    prefixes = ["tool_", "mcp_tool_", "_skill_", "other_"]
+    calls = []
+    for _ in range(count):
+        name = f"{rng.choice(prefixes)}{rng.randrange(rule_count * 2)}"
+        if name.startswith("_skill_"):
+            name += "__action"
+        args = {}
+        if rng.random() < 0.5:
+            args["status"] = rng.choice(["done", "new", "waiting", "in_progress"])
+        if rng.random() < 0.3:
+            args["id"] = str(rng.randrange(1000))
+        calls.append((name, args))
+    return calls
+
+
+def make_config(allow, deny, default_secure=True) -> ToolPermissionsConfig:
+    return ToolPermissionsConfig(
+        permissions=ToolPermissions(allow=list(allow), deny=list(deny)),
+        settings=ToolPermissionSettings(default_secure=default_secure),
+    )
+
+
+class TestCompiledMatcherEquivalence:
+    """Compiled matcher must agree with the per-pattern reference implementation."""
+
+    def test_tool_name_matching_matches_reference(self):
+        rules = make_rules(500) + ["*", "exact_tool"]
+        calls = make_calls(2000, 500) + [("exact_tool", {}), ("", {})]
+        reference = ToolPermissionConfig()
+        compiled = CompiledToolPermissions(allow=rules, deny=[])
+
+        for name, _ in calls:
+            expected = any(reference._matches_tool_pattern(name, p) for p in rules)
+            assert compiled.is_tool_explicitly_allowed(name) == expected, name
+
+    def test_tool_call_matching_matches_reference(self):
+        rules = make_rules(300) + [
+            "update_task(status=done)",
+            "get_task",  # legacy substring rule
+            "update_task()",
+        ]
+        calls = make_calls(2000, 300) + [
+            ("update_task", {"status": "done", "id": "1"}),
+            ("update_task", {"status": "new"}),
+            ("get_tasks", {}),
+            ("x_update_task", {"status": "done"}),
+        ]
+        config = ToolPermissionConfig()
+        interceptor = ToolApprovalInterceptor(config)
+        compiled = CompiledToolPermissions(allow=rules, deny=[])
+
+        for name, args in calls:
+            expected = interceptor._matches_any_pattern(name, args, rules)
+            assert compiled.is_call_allowed(name, args) == expected, (name, args)
+
+    def test_empty_rules_match_nothing(self):
+        compiled = CompiledToolPermissions(allow=[], deny=[])
+        assert compiled.is_tool_explicitly_allowed("anything") is False
+        assert compiled.is_call_allowed("anything", {"a": 1}) is False
+
+
+class TestMatcherVersioning:
+    """Rules are compiled once per config version."""
+
+    def test_matcher_reused_while_config_unchanged(self):
+        config_model = make_config(["get_tasks"], [])
+        with patch("utils.tool_permissions_manager.get_config", return_value=config_model), \
+             patch("utils.tool_permissions_manager.get_config_version", return_value=1):
+            config = ToolPermissionConfig()
+            first = config.get_matcher()
+            assert config.is_tool_allowed("get_tasks") is True
+            assert config.get_matcher() is first
+
+    def test_matcher_swapped_on_version_change(self):
+        config_model = make_config(["get_tasks"], [])
+        with patch("utils.tool_permissions_manager.get_config", return_value=config_model), \
+             patch("utils.tool_permissions_manager.get_config_version", return_value=1) as mock_version:
+            config = ToolPermissionConfig()
+            first = config.get_matcher()
+            assert config.is_tool_allowed("create_task") is False
+
+            config_model.permissions.allow.append("create_task")
+            mock_version.return_value = 2
+
+            assert config.get_matcher() is not first
+            assert config.is_tool_allowed("create_task") is True
+
+    @pytest.mark.asyncio
+    async def test_add_permission_invalidates_matcher(self):
+        config_model = make_config(["get_tasks"], [])
+        with patch("utils.tool_permissions_manager.get_config", return_value=config_model), \
+             patch("utils.tool_permissions_manager.save_config"), \
+             patch("utils.tool_permissions_manager.get_config_version", return_value=None):
+            config = ToolPermissionConfig()
+            assert config.is_tool_allowed("create_task") is False
+
+            await config.add_permission("create_task")
+
+            assert config.is_tool_allowed("create_task") is True
+
+
+@pytest.mark.slow
+class TestMatcherBenchmark:
+    """Microbenchmark: compiled matcher vs per-pattern scanning."""
+
+    RULE_COUNT = 2000
+    CALL_COUNT = 2000
+
+    def test_compiled_matcher_faster_than_linear_scan(self):
+        rules = make_rules(self.RULE_COUNT)
+        calls = make_calls(self.CALL_COUNT, self.RULE_COUNT)
+        reference = ToolPermissionConfig()
+
+        start = time.perf_counter()
+        compiled = CompiledToolPermissions(allow=rules, deny=rules[::7])
+        compile_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        compiled_results = [compiled.is_tool_explicitly_allowed(name) for name, _ in calls]
+        compiled_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        linear_results = [
+            any(reference._matches_tool_pattern(name, p) for p in rules)
+            for name, _ in calls
+        ]
+        linear_time = time.perf_counter() - start
+
+        print(
+            f"\n{self.RULE_COUNT} rules x {self.CALL_COUNT} tools: "
+            f"compile={compile_time * 1000:.1f}ms "
+            f"compiled={compiled_time * 1000:.1f}ms linear={linear_time * 1000:.1f}ms"
+        )
+
+        assert compiled_results == linear_results
+        assert compiled_time * 10 < linear_time
+
+    def test_compiled_call_matcher_faster_than_linear_scan(self):
+        rules = make_rules(self.RULE_COUNT)
+        calls = make_calls(500, self.RULE_COUNT)
+        interceptor = ToolApprovalInterceptor(ToolPermissionConfig())
+        compiled = CompiledToolPermissions(allow=rules, deny=[])
+        compiled.is_call_allowed("warmup", {})  # build the lazy call index
+
+        start = time.perf_counter()
+        compiled_results = [compiled.is_call_allowed(name, args) for name, args in calls]
+        compiled_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        linear_results = [interceptor._matches_any_pattern(name, args, rules) for name, args in calls]
+        linear_time = time.perf_counter() - start
+
+        print(
+            f"\n{self.RULE_COUNT} rules x {len(calls)} calls: "
+            f"compiled={compiled_time * 1000:.1f}ms linear={linear_time * 1000:.1f}ms"
+        )
+
+        assert compiled_results == linear_results
+        assert compiled_time < linear_time
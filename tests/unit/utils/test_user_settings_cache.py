@@ -0,0 +1,208 @@
+"""
+Tests for the in-process user settings cache.
+
+Verifies that:
+1. Async reads hit the database once and then serve the cached snapshot
+2. Sync reads on a warm cache create no threads or event loops
+3. Loads that race with an invalidation are discarded
+4. Settings-change events reload the cache without emptying it first;
+   other events are ignored
+"""
+
+import time
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import utils.user_settings_cache as cache_module
+from database.database import UserSettingsService
+from models.user_settings import UserSettingsModel
+from utils.user_settings_cache import UserSettingsCache, handle_settings_event
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Give each test a fresh process-wide cache."""
+    fresh = UserSettingsCache()
+    monkeypatch.setattr(cache_module, "user_settings_cache", fresh)
+    return fresh
+
+
+def mock_db_returning(*rows):
+    """Patch db_manager.get_session so each query returns the next row."""
+    results = iter(rows)
+    calls = {"count": 0}
+
+    @asynccontextmanager
+    async def get_session():
+        calls["count"] += 1
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = next(results)
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+        yield session
+
+    return patch("database.database.db_manager.get_session", get_session), calls
+
+
+class TestAsyncReads:
+
+    @pytest.mark.asyncio
+    async def test_second_read_served_from_cache(self, cache):
+        db_patch, calls = mock_db_returning(UserSettingsModel(full_name="Ada", timezone="Europe/London"))
+        with db_patch:
+            first = await UserSettingsService.get_user_settings()
+            second = await UserSettingsService.get_user_settings()
+            memory = await UserSettingsService.get_memory_settings()
+
+        assert calls["count"] == 1
+        assert first is second
+        assert first.timezone == "Europe/London"
+        assert memory["memory_search_limit"] == first.memory_search_limit
+
+    @pytest.mark.asyncio
+    async def test_missing_row_is_cached_as_none(self, cache):
+        db_patch, calls = mock_db_returning(None)
+        with db_patch:
+            assert await UserSettingsService.get_user_settings() is None
+            assert await UserSettingsService.get_llm_settings() == {}
+
+        assert calls["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_session_reads_bypass_cache(self, cache):
+        cache.store(UserSettingsModel(full_name="Cached"))
+        orm_row = SimpleNamespace(full_name="Tracked")
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = orm_row
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+
+        assert await UserSettingsService.get_user_settings(session) is orm_row
+
+
+class TestSyncReads:
+
+    def test_warm_cache_creates_no_thread_or_loop(self, cache):
+        cache.store(UserSettingsModel(chat_llm_model="cached-model"))
+
+        with patch("asyncio.run", side_effect=AssertionError("loop created")), \
+             patch("concurrent.futures.ThreadPoolExecutor", side_effect=AssertionError("thread created")):
+            llm_settings = UserSettingsService.get_llm_settings_sync()
+            user_settings = UserSettingsService.get_user_settings_sync()
+
+        assert llm_settings["chat_llm_model"] == "cached-model"
+        assert user_settings.chat_llm_model == "cached-model"
+
+    def test_cold_cache_without_loop_loads_once(self, cache):
+        db_patch, calls = mock_db_returning(UserSettingsModel(memory_search_limit=42))
+        with db_patch:
+            assert UserSettingsService.get_memory_settings_sync()["memory_search_limit"] == 42
+            assert UserSettingsService.get_memory_settings_sync()["memory_search_limit"] == 42
+
+        assert calls["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_snapshot_served_while_refreshing(self, cache):
+        cache.store(UserSettingsModel(chat_llm_model="old"))
+        cache._loaded_at = time.monotonic() - cache.ttl_seconds - 1
+
+        db_patch, calls = mock_db_returning(UserSettingsModel(chat_llm_model="new"))
+        with db_patch, \
+             patch("concurrent.futures.ThreadPoolExecutor", side_effect=AssertionError("thread created")):
+            assert UserSettingsService.get_llm_settings_sync()["chat_llm_model"] == "old"
+            await cache._refresh_task
+
+        assert calls["count"] == 1
+        assert UserSettingsService.get_llm_settings_sync()["chat_llm_model"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_refresh_keeps_serving_snapshot_until_reloaded(self, cache):
+        cache.store(UserSettingsModel(chat_llm_model="old"))
+        reads_during_load = []
+
+        @asynccontextmanager
+        async def get_session():
+            reads_during_load.append(UserSettingsService.get_llm_settings_sync()["chat_llm_model"])
+            result = MagicMock()
+            result.scalar_one_or_none.return_value = UserSettingsModel(chat_llm_model="new")
+            session = MagicMock()
+            session.execute = AsyncMock(return_value=result)
+            yield session
+
+        with patch("database.database.db_manager.get_session", get_session), \
+             patch("concurrent.futures.ThreadPoolExecutor", side_effect=AssertionError("thread created")):
+            refreshed = await UserSettingsService.refresh_user_settings()
+
+        assert reads_during_load == ["old"]
+        assert refreshed.chat_llm_model == "new"
+        assert cache.peek()[1].chat_llm_model == "new"
+
+
+class TestVersioning:
+
+    def test_load_started_before_invalidation_is_discarded(self, cache):
+        version = cache.begin_load()
+        cache.invalidate(reason="test")
+
+        assert cache.store(UserSettingsModel(full_name="Stale"), expected_version=version) is False
+        assert cache.peek() == (False, None)
+
+    def test_store_bumps_version(self, cache):
+        before = cache.version
+        cache.store(UserSettingsModel())
+        assert cache.version == before + 1
+
+
+class TestSettingsEvents:
+
+    @pytest.mark.asyncio
+    async def test_settings_event_reloads_cache(self, cache):
+        cache.store(UserSettingsModel(chat_llm_model="old"))
+        db_patch, calls = mock_db_returning(UserSettingsModel(chat_llm_model="new"))
+
+        with db_patch:
+            handled = await handle_settings_event(SimpleNamespace(type="llm_settings_updated"))
+
+        assert handled is True
+        assert calls["count"] == 1
+        found, snapshot = cache.peek()
+        assert found and snapshot.chat_llm_model == "new"
+
+    @pytest.mark.asyncio
+    async def test_settings_event_keeps_serving_snapshot_while_reloading(self, cache):
+        cache.store(UserSettingsModel(chat_llm_model="old"))
+        reads_during_load = []
+
+        @asynccontextmanager
+        async def get_session():
+            reads_during_load.append(cache.peek())
+            result = MagicMock()
+            result.scalar_one_or_none.return_value = UserSettingsModel(chat_llm_model="new")
+            session = MagicMock()
+            session.execute = AsyncMock(return_value=result)
+            yield session
+
+        with patch("database.database.db_manager.get_session", get_session):
+            await handle_settings_event(SimpleNamespace(type="llm_settings_updated"))
+
+        assert [(found, snapshot.chat_llm_model) for found, snapshot in reads_during_load] == [(True, "old")]
+        assert cache.peek()[1].chat_llm_model == "new"
+
+    @pytest.mark.asyncio
+    async def test_failed_reload_drops_snapshot(self, cache):
+        cache.store(UserSettingsModel(chat_llm_model="old"))
+
+        with patch("database.database.db_manager.get_session", side_effect=RuntimeError("db down")):
+            assert await handle_settings_event(SimpleNamespace(type="llm_settings_updated")) is True
+
+        assert cache.peek() == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_unrelated_event_ignored(self, cache):
+        cache.store(UserSettingsModel(chat_llm_model="kept"))
+
+        assert await handle_settings_event(SimpleNamespace(type="task_updated")) is False
+        assert cache.peek()[1].chat_llm_model == "kept"